@@ -9,9 +9,11 @@ from Piece import Piece
 class Advisor(Piece):
     """Represents an advisor piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 1], [-1, 1], [-1, -1], [1, -1]]
-
-        Piece.__init__(self, color, "A", possible_moves)
+        Piece.__init__(self, color, "A", self.POSSIBLE_MOVES)
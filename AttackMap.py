@@ -0,0 +1,178 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines attack maps of a game of Xiangqi, the pieces of each color attacking every square, kept up to
+#              date move by move.
+
+
+class AttackMap:
+    """
+    Represents the squares attacked by each color in a game of Xiangqi. For every square and color it keeps the set of
+    squares of the pieces of that color attacking it, as given by XiangqiGame.generate_attack_square, so attackers_of
+    and get_attack_count answer in constant time. Creating a map attaches it to the game, and every move made with
+    make_move updates it. Only the pieces that can see a changed square are recomputed: the pieces on the changed
+    squares, the Chariots and Cannons on its file and rank, the Horses next to it, whose leg it may be, and the
+    Elephants diagonally next to it, whose eye it may be. Soldiers, Advisors and Generals attack the same squares
+    whatever stands around them.
+    """
+
+    COLOR_ARRAY = ["red", "black"]
+
+    # steps from a changed square to the Horses whose leg and the Elephants whose eye it may be
+    HORSE_STEP_ARRAY = [[1, 0], [-1, 0], [0, 1], [0, -1]]
+    ELEPHANT_STEP_ARRAY = [[1, 1], [1, -1], [-1, -1], [-1, 1]]
+
+    def __init__(self, game):
+        """Initializes the map with the attacks of the current position of the passed game and attaches it."""
+
+        self.__game = game
+        self.__attack_dict = {}
+        self.__attacker_dict = {}
+        self.__attacked_count_dict = {}
+
+        self.rebuild()
+        game.add_observer(self)
+
+    def get_game(self):
+        """Getter for game."""
+
+        return self.__game
+
+    def attackers_of(self, square, color):
+        """
+        Returns the set of squares of the pieces of the passed color attacking the passed square. The set belongs to the
+        map and must not be changed.
+        """
+
+        return self.__attacker_dict[color][square]
+
+    def get_attack_count(self, square, color):
+        """Returns the number of pieces of the passed color attacking the passed square."""
+
+        return len(self.__attacker_dict[color][square])
+
+    def get_attacked_square_count(self, color):
+        """Returns the number of squares attacked by at least one piece of the passed color."""
+
+        return self.__attacked_count_dict[color]
+
+    def get_threatened_square_array(self, color):
+        """Returns the sorted squares of the pieces of the passed color that are attacked by the other color."""
+
+        other_attacker_array = self.__attacker_dict[self.__game.opposing_player_color(color)]
+
+        return sorted(square for square, (piece_color, _) in self.__attack_dict.items()
+                      if piece_color == color and other_attacker_array[square])
+
+    def rebuild(self):
+        """Recomputes the attacks of every piece on the board of the game."""
+
+        point_array = self.__game.get_board().get_point_array()
+
+        self.__attack_dict = {}
+        self.__attacker_dict = {color: [set() for _ in point_array] for color in self.COLOR_ARRAY}
+        self.__attacked_count_dict = {color: 0 for color in self.COLOR_ARRAY}
+
+        for square in range(len(point_array)):
+            if point_array[square].get_piece() is not None:
+                self.add_piece(square)
+
+        return None
+
+    def add_piece(self, square):
+        """Records the attacks of the piece at the passed square."""
+
+        color = self.__game.get_board().get_point_with_square(square).get_piece().get_color()
+        attacked_square_array = list(self.__game.generate_attack_square(square))
+        attacker_array = self.__attacker_dict[color]
+
+        self.__attack_dict[square] = (color, attacked_square_array)
+
+        for attacked_square in attacked_square_array:
+            attacker_set = attacker_array[attacked_square]
+
+            if not attacker_set:
+                self.__attacked_count_dict[color] += 1
+
+            attacker_set.add(square)
+
+        return None
+
+    def remove_piece(self, square):
+        """Removes the attacks recorded for the piece at the passed square, if there are any."""
+
+        attack = self.__attack_dict.pop(square, None)
+
+        if attack is None:
+            return None
+
+        color, attacked_square_array = attack
+        attacker_array = self.__attacker_dict[color]
+
+        for attacked_square in attacked_square_array:
+            attacker_set = attacker_array[attacked_square]
+            attacker_set.discard(square)
+
+            if not attacker_set:
+                self.__attacked_count_dict[color] -= 1
+
+        return None
+
+    def get_affected_square_set(self, square):
+        """
+        Returns the set of squares of the pieces whose attacks may change when the piece at the passed square changes,
+        not including the passed square.
+        """
+
+        board = self.__game.get_board()
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
+        file_index, rank_index = board.get_index_pair(square)
+        affected_square_set = set()
+
+        # every Chariot and Cannon on the file and rank, since other squares of the same move may change what they see
+        line_square_array = [other_file_index * rank_count + rank_index for other_file_index in range(file_count)] + \
+            [file_index * rank_count + other_rank_index for other_rank_index in range(rank_count)]
+
+        for other_square in line_square_array:
+            piece = point_array[other_square].get_piece()
+
+            if piece is not None and other_square != square and piece.get_symbol() in ("R", "C"):
+                affected_square_set.add(other_square)
+
+        for step_array, piece_symbol in ((self.HORSE_STEP_ARRAY, "H"), (self.ELEPHANT_STEP_ARRAY, "E")):
+            for file_step, rank_step in step_array:
+                other_file_index = file_index + file_step
+                other_rank_index = rank_index + rank_step
+
+                if not (0 <= other_file_index < file_count and 0 <= other_rank_index < rank_count):
+                    continue
+
+                other_square = other_file_index * rank_count + other_rank_index
+                piece = point_array[other_square].get_piece()
+
+                if piece is not None and piece.get_symbol() == piece_symbol:
+                    affected_square_set.add(other_square)
+
+        return affected_square_set
+
+    def update(self, square_array):
+        """
+        Updates the attacks after the pieces on the passed squares changed on the board, for example the start and end
+        squares of a move or of a move taken back. Moves made with make_move of the game are updated automatically.
+        """
+
+        point_array = self.__game.get_board().get_point_array()
+        changed_square_set = set(square_array)
+        affected_square_set = set(changed_square_set)
+
+        for square in changed_square_set:
+            affected_square_set.update(self.get_affected_square_set(square))
+
+        for square in affected_square_set:
+            self.remove_piece(square)
+
+            if point_array[square].get_piece() is not None:
+                self.add_piece(square)
+
+        return None
@@ -0,0 +1,90 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for AttackMap
+
+import random
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from AttackMap import AttackMap
+from Engine import Engine
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for AttackMap.py"""
+
+    @staticmethod
+    def get_attacker_set_array(game, color):
+        """Returns the attackers of every square for the passed color of the passed game, found from scratch."""
+
+        point_array = game.get_board().get_point_array()
+        attacker_set_array = [set() for _ in point_array]
+
+        for square in range(len(point_array)):
+            piece = point_array[square].get_piece()
+
+            if piece is not None and piece.get_color() == color:
+                for attacked_square in game.generate_attack_square(square):
+                    attacker_set_array[attacked_square].add(square)
+
+        return attacker_set_array
+
+    def test_start_position(self):
+        """Tests attackers, counts and threatened pieces of the starting position."""
+
+        game = XiangqiGame()
+        attack_map = AttackMap(game)
+        square = game.get_board().get_square_from_pos
+
+        self.assertIn(attack_map, game.get_observer_array())
+
+        # the red Cannon on h3 attacks the black Horse on h10 over the black Cannon on h8
+        self.assertEqual({square("h3")}, attack_map.attackers_of(square("h10"), "red"))
+        self.assertEqual({square(a_pos) for a_pos in ("a1", "b1", "c1", "h3")},
+                         attack_map.attackers_of(square("a3"), "red"))
+        self.assertEqual(3, attack_map.get_attack_count(square("e2"), "red"))
+        self.assertEqual(0, attack_map.get_attack_count(square("e5"), "black"))
+        self.assertEqual([square("b10"), square("h10")], attack_map.get_threatened_square_array("black"))
+
+    def test_incremental_updates(self):
+        """Tests that the map after moves and taken back moves is the same as a map built from scratch."""
+
+        game = XiangqiGame()
+        attack_map = AttackMap(game)
+        board = game.get_board()
+        a_random = random.Random(7)
+
+        for _ in range(60):
+            move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not move_array:
+                break
+
+            # a move made on the board directly is updated by the caller
+            move = a_random.choice(move_array)
+            square_array = [board.get_square_from_pos(a_pos) for a_pos in move]
+            undo = Engine.make(game, move)
+            attack_map.update(square_array)
+            Engine.unmake(game, undo)
+            attack_map.update(square_array)
+
+            self.assertTrue(game.make_move(*a_random.choice(move_array)))
+
+            for color in AttackMap.COLOR_ARRAY:
+                attacker_set_array = self.get_attacker_set_array(game, color)
+
+                self.assertEqual(attacker_set_array, [attack_map.attackers_of(square, color) for square in range(90)])
+                self.assertEqual(len([attacker_set for attacker_set in attacker_set_array if attacker_set]),
+                                 attack_map.get_attacked_square_count(color))
+
+    def test_attack_squares(self):
+        """Tests that a Cannon only attacks past its screen and that a Horse does not attack past a blocked leg."""
+
+        game = XiangqiGame()
+        square = game.get_board().get_square_from_pos
+
+        self.assertEqual([square("a3"), square("h9"), square("h10")], list(game.generate_attack_square(square("h3"))))
+        self.assertEqual([square("c3"), square("a3")], list(game.generate_attack_square(square("b1"))))
+
+
+if __name__ == '__main__':
+    unittest.main()
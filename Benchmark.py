@@ -0,0 +1,228 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a benchmark suite for the hot operations of XiangqiGame over opening, middlegame, endgame and
+#              in check positions. Results are saved as JSON and compared with a saved baseline to catch regressions.
+
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from Board import Board
+from PositionCodec import PositionCodec
+
+
+class Benchmark:
+    """
+    Represents the benchmark suite. Every metric is the best mean time in seconds of one operation over a number of
+    repeats, so one slow repeat caused by the machine does not count. A repeat runs the operation until it takes at
+    least min_time seconds. Metric names are the operation followed by the phase and piece symbol where they apply, for
+    example valid_end_pos/endgame/R for get_valid_end_pos_array and generate_end_pos/endgame/R for generate_end_pos.
+    """
+
+    POSITION_DICT = {"opening": PositionCodec.START_FEN,
+                     "middlegame": "r1bakab1r/9/1cn3nc1/p1p1p3p/6p2/2P6/P3P1P1P/1CN1C1N2/9/R1BAKAB1R w - - 0 1",
+                     "endgame": "3k5/4a4/4b4/9/2p6/9/9/4B4/4A4/3AK1R2 w - - 0 1",
+                     "check": "rnbakabnr/9/1c7/p1p3p1p/4c4/9/P1P1P1P1P/1C5C1/9/RNBAKABNR w - - 0 1"}
+
+    DEFAULT_THRESHOLD = 0.25
+
+    def __init__(self, repeat=3, min_time=0.05, name_filter=None):
+        """
+        Initializes the suite with the passed number of repeats and minimum seconds per repeat. If a name_filter is
+        passed only the metrics whose name contains it are run.
+        """
+
+        self.__repeat = repeat
+        self.__min_time = min_time
+        self.__name_filter = name_filter
+
+    def measure(self, function, setup=None):
+        """
+        Returns the best mean seconds per call of the passed function. If a setup function is passed it is called
+        before every call, untimed, and its result is passed to the function.
+        """
+
+        perf_counter = time.perf_counter
+        best_time = None
+
+        for _ in range(self.__repeat):
+            elapsed = 0.0
+            number = 0
+
+            while elapsed < self.__min_time or number == 0:
+                argument = setup() if setup is not None else None
+                start_time = perf_counter()
+
+                if setup is not None:
+                    function(argument)
+                else:
+                    function()
+
+                elapsed += perf_counter() - start_time
+                number += 1
+
+            if best_time is None or elapsed / number < best_time:
+                best_time = elapsed / number
+
+        return best_time
+
+    def get_case_array(self):
+        """
+        Returns an array of (name, function, setup) tuples for every metric of the suite, where setup is None if the
+        function takes no argument.
+        """
+
+        case_array = [("board_init", Board, None)]
+
+        board = Board()
+        pos_array = [point.get_pos() for point in board.get_point_array()]
+        case_array.append(("get_point_with_pos", lambda: [board.get_point_with_pos(a_pos) for a_pos in pos_array],
+                           None))
+
+        for phase, fen in self.POSITION_DICT.items():
+            game = PositionCodec.decode_fen(fen)
+            player_color = game.get_current_player().get_color()
+            symbol_dict = {}
+
+            for start_pos in game.all_pieces_pos_array(player_color):
+                symbol = game.get_board().get_point_with_pos(start_pos).get_symbol()
+                symbol_dict.setdefault(symbol, []).append(start_pos)
+
+            for symbol in sorted(symbol_dict):
+                case_array.append(("valid_end_pos/" + phase + "/" + symbol,
+                                   self.get_valid_end_pos_function(game, symbol, symbol_dict[symbol]), None))
+                case_array.append(("generate_end_pos/" + phase + "/" + symbol,
+                                   self.get_generate_end_pos_function(game, symbol, symbol_dict[symbol]), None))
+
+            case_array.append(("is_in_check/" + phase, lambda game=game, color=player_color: game.is_in_check(color),
+                               None))
+            case_array.append(("game_end/" + phase, game.update_game_state, None))
+            case_array.append(("legal_moves/" + phase,
+                               lambda game=game, color=player_color: game.get_legal_square_move_array(color), None))
+
+            # make_move changes the position, so every call gets a fresh game
+            move = game.get_legal_move_array(player_color)[0]
+            case_array.append(("move_error/" + phase,
+                               lambda game=game, move=move, color=player_color: game.get_move_error(move[0], move[1],
+                                                                                                    color), None))
+            case_array.append(("make_move/" + phase, lambda new_game, move=move: new_game.make_move(move[0], move[1]),
+                               lambda fen=fen: PositionCodec.decode_fen(fen)))
+
+        if self.__name_filter is not None:
+            case_array = [case for case in case_array if self.__name_filter in case[0]]
+
+        return case_array
+
+    @staticmethod
+    def get_valid_end_pos_function(game, symbol, start_pos_array):
+        """Returns a function generating the end positions of the pieces at the passed start_pos_array."""
+
+        def function():
+            for start_pos in start_pos_array:
+                game.get_valid_end_pos_array(start_pos, symbol)
+
+        return function
+
+    @staticmethod
+    def get_generate_end_pos_function(game, symbol, start_pos_array):
+        """Returns a function consuming every end position generated for the pieces at the passed start_pos_array."""
+
+        def function():
+            for start_pos in start_pos_array:
+                for _ in game.generate_end_pos(start_pos, symbol):
+                    pass
+
+        return function
+
+    def run(self):
+        """Returns the result dictionary with the environment and the seconds per call of every metric."""
+
+        metric_dict = {}
+
+        for name, function, setup in self.get_case_array():
+            metric_dict[name] = self.measure(function, setup)
+
+        return {"python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": self.__repeat,
+                "min_time": self.__min_time,
+                "metrics": metric_dict}
+
+    @staticmethod
+    def save(result, path):
+        """Writes the passed result dictionary to the passed path as JSON."""
+
+        with open(path, "w") as result_file:
+            json.dump(result, result_file, indent=2, sort_keys=True)
+
+        return None
+
+    @staticmethod
+    def load(path):
+        """Returns the result dictionary saved at the passed path."""
+
+        with open(path) as result_file:
+            return json.load(result_file)
+
+    @staticmethod
+    def compare(result, baseline, threshold=DEFAULT_THRESHOLD):
+        """
+        Returns an array of (name, baseline_seconds, seconds, ratio) tuples for the metrics of the passed result that
+        are slower than in the passed baseline by more than the passed threshold, where 0.25 allows 25% slower. Metrics
+        that are missing from either result are not compared.
+        """
+
+        regression_array = []
+        baseline_metric_dict = baseline["metrics"]
+
+        for name, seconds in sorted(result["metrics"].items()):
+            baseline_seconds = baseline_metric_dict.get(name)
+
+            if not baseline_seconds:
+                continue
+
+            ratio = seconds / baseline_seconds
+
+            if ratio > 1 + threshold:
+                regression_array.append((name, baseline_seconds, seconds, ratio))
+
+        return regression_array
+
+
+def main():
+    """Runs the suite, prints every metric and exits with status 1 if a metric regressed beyond the threshold."""
+
+    parser = argparse.ArgumentParser(description="Benchmarks XiangqiGame operations over curated positions.")
+    parser.add_argument("--save", default=None, help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="compare the results with this saved JSON file")
+    parser.add_argument("--threshold", type=float, default=Benchmark.DEFAULT_THRESHOLD,
+                        help="allowed slowdown versus the baseline, 0.25 allows 25%% slower")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--filter", default=None, help="only run metrics whose name contains this text")
+    args = parser.parse_args()
+
+    result = Benchmark(args.repeat, args.min_time, args.filter).run()
+
+    for name, seconds in result["metrics"].items():
+        print("{:<32} {:>12.1f} us".format(name, seconds * 1000000))
+
+    if args.save is not None:
+        Benchmark.save(result, args.save)
+
+    if args.baseline is not None:
+        regression_array = Benchmark.compare(result, Benchmark.load(args.baseline), args.threshold)
+
+        for name, baseline_seconds, seconds, ratio in regression_array:
+            print("REGRESSION {}: {:.1f} us -> {:.1f} us ({:.2f}x)".format(name, baseline_seconds * 1000000,
+                                                                        seconds * 1000000, ratio))
+
+        if regression_array:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
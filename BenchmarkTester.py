@@ -0,0 +1,62 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for Benchmark
+
+import os
+import tempfile
+import unittest
+from Benchmark import Benchmark
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for Benchmark.py"""
+
+    def test_case_names(self):
+        """Tests that every phase has per piece, check, game end and make_move metrics and that filtering works."""
+
+        name_array = [case[0] for case in Benchmark().get_case_array()]
+
+        self.assertIn("board_init", name_array)
+        self.assertIn("get_point_with_pos", name_array)
+
+        for phase in Benchmark.POSITION_DICT:
+            self.assertIn("valid_end_pos/" + phase + "/R", name_array)
+            self.assertIn("is_in_check/" + phase, name_array)
+            self.assertIn("game_end/" + phase, name_array)
+            self.assertIn("make_move/" + phase, name_array)
+
+        self.assertNotIn("valid_end_pos/endgame/H", name_array)
+        self.assertEqual(["valid_end_pos/endgame/A", "generate_end_pos/endgame/A", "valid_end_pos/endgame/E",
+                          "generate_end_pos/endgame/E", "valid_end_pos/endgame/G", "generate_end_pos/endgame/G",
+                          "valid_end_pos/endgame/R", "generate_end_pos/endgame/R", "is_in_check/endgame",
+                          "game_end/endgame", "legal_moves/endgame", "move_error/endgame", "make_move/endgame"],
+                         [case[0] for case in Benchmark(name_filter="endgame").get_case_array()])
+
+    def test_run_and_save(self):
+        """Tests a small run and that saved results load back unchanged."""
+
+        result = Benchmark(repeat=1, min_time=0.0, name_filter="/endgame").run()
+
+        self.assertIn("make_move/endgame", result["metrics"])
+        self.assertNotIn("board_init", result["metrics"])
+        self.assertTrue(all(seconds > 0 for seconds in result["metrics"].values()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            Benchmark.save(result, path)
+
+            self.assertEqual(result, Benchmark.load(path))
+
+    def test_compare(self):
+        """Tests that only metrics slower than the threshold are reported."""
+
+        baseline = {"metrics": {"board_init": 1.0, "make_move/opening": 2.0, "removed": 1.0}}
+        result = {"metrics": {"board_init": 1.2, "make_move/opening": 3.0, "added": 5.0}}
+
+        self.assertEqual([("make_move/opening", 2.0, 3.0, 1.5)], Benchmark.compare(result, baseline))
+        self.assertEqual(2, len(Benchmark.compare(result, baseline, threshold=0.1)))
+        self.assertEqual([], Benchmark.compare(result, baseline, threshold=1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,38 +14,63 @@ from Soldier import Soldier
 
 
 class Board:
-    """Represents a board in the game Xiangqi."""
+    """
+    Represents a board in the game Xiangqi. The layout of the board, its files, ranks, sides, castles and squares, is
+    the same for every board, so it is built once and shared. Only the points, which hold the pieces, belong to a board.
+    """
+
+    __slots__ = ("__file_array", "__rank_array", "__red_castle_array", "__black_castle_array", "__red_side_array",
+                 "__black_side_array", "__point_array", "__square_dict", "__red_castle_square_array",
+                 "__black_castle_square_array")
+
+    # shared layout, built by the first board
+    __layout = None
 
     def __init__(self):
         """
         Initializes the points on the board and sets up special board areas red_side, black_side and castles. Sets up
-        the starting pieces on the board.
+        the starting pieces on the board. A square is the index of a point in point_array, which is
+        file_index * 10 + rank_index.
         """
 
-        self.__file_array = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
-        self.__rank_array = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
-        self.__red_castle_array = ["d1", "e1", "f1", "d2", "e2", "f2", "d3", "e3", "f3"]
-        self.__black_castle_array = ["d8", "e8", "f8", "d9", "e9", "f9", "d10", "e10", "f10"]
-        self.__red_side_array = []
-        self.__black_side_array = []
-        self.__point_array = []
+        if Board.__layout is None:
+            Board.__layout = Board.build_layout()
+
+        (self.__file_array, self.__rank_array, self.__red_castle_array, self.__black_castle_array,
+         self.__red_side_array, self.__black_side_array, self.__square_dict, self.__red_castle_square_array,
+         self.__black_castle_square_array) = Board.__layout
 
         # Append points to point array
-        for file in self.__file_array:
-            for rank in self.__rank_array:
-                self.__point_array.append(Point(file, rank))
+        self.__point_array = [Point(file, rank) for file in self.__file_array for rank in self.__rank_array]
 
-        # Append positions of red side points to red_side_array
-        for file in self.__file_array:
-            for rank in self.__rank_array[:5]:
-                self.__red_side_array.append(file + rank)
+        self.reset_pieces()
 
-        # Append positions of black side points to black_side_array
-        for file in self.__file_array:
-            for rank in self.__rank_array[5:]:
-                self.__black_side_array.append(file + rank)
+    @staticmethod
+    def build_layout():
+        """
+        Returns a tuple of the file_array, rank_array, red_castle_array, black_castle_array, red_side_array,
+        black_side_array, square_dict, red_castle_square_array and black_castle_square_array shared by every board.
+        """
 
-        self.reset_pieces()
+        file_array = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
+        rank_array = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
+        red_castle_array = ["d1", "e1", "f1", "d2", "e2", "f2", "d3", "e3", "f3"]
+        black_castle_array = ["d8", "e8", "f8", "d9", "e9", "f9", "d10", "e10", "f10"]
+        square_dict = {}
+
+        for file in file_array:
+            for rank in rank_array:
+                square_dict[file + rank] = len(square_dict)
+
+        red_castle_square_array = [square_dict[a_pos] for a_pos in red_castle_array]
+        black_castle_square_array = [square_dict[a_pos] for a_pos in black_castle_array]
+
+        # positions of the red side and black side points
+        red_side_array = [file + rank for file in file_array for rank in rank_array[:5]]
+        black_side_array = [file + rank for file in file_array for rank in rank_array[5:]]
+
+        return (file_array, rank_array, red_castle_array, black_castle_array, red_side_array, black_side_array,
+                square_dict, red_castle_square_array, black_castle_square_array)
 
     def clear_board(self):
         """Removes all pieces for the board."""
@@ -142,14 +167,45 @@ class Board:
 
         return self.__point_array
 
+    def get_red_castle_square_array(self):
+        """Getter for red_castle_square_array."""
+
+        return self.__red_castle_square_array
+
+    def get_black_castle_square_array(self):
+        """Getter for black_castle_square_array."""
+
+        return self.__black_castle_square_array
+
+    def get_square_from_pos(self, a_pos):
+        """Returns the square of the passed position. Returns None if the position does not exist."""
+
+        return self.__square_dict.get(a_pos)
+
+    def get_pos_from_square(self, square):
+        """Returns the position of the passed square."""
+
+        return self.__point_array[square].get_pos()
+
+    def get_square(self, file_index, rank_index):
+        """Returns the square of the passed file_index and rank_index."""
+
+        return file_index * len(self.__rank_array) + rank_index
+
+    def get_index_pair(self, square):
+        """Returns a tuple of the file_index and rank_index of the passed square."""
+
+        return divmod(square, len(self.__rank_array))
+
+    def get_point_with_square(self, square):
+        """Returns the point at the passed square."""
+
+        return self.__point_array[square]
+
     def get_point(self, file, rank):
         """Return Point corresponding to passed file and rank. Returns None if point does not exist."""
 
-        for a_point in self.__point_array:
-            if (a_point.get_file() == file) and (a_point.get_rank() == rank):
-                return a_point
-
-        return None
+        return self.get_point_with_pos(file + rank)
 
     def get_point_with_pos(self, a_pos):
         """
@@ -157,14 +213,12 @@ class Board:
         exist.
         """
 
-        file = a_pos[0]
+        square = self.__square_dict.get(a_pos)
 
-        if len(a_pos) == 2:
-            rank = a_pos[1]
-        else:
-            rank = a_pos[1] + a_pos[2]
+        if square is None:
+            return None
 
-        return self.get_point(file, rank)
+        return self.__point_array[square]
 
     def display(self):
         """Displays board with pieces and coordinates."""
@@ -0,0 +1,229 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a text renderer for the board of a game of Xiangqi that caches its rendering and only redraws
+#              the rows changed by each move, in ASCII, Unicode Chinese character and compact single line styles.
+
+
+import argparse
+
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+
+
+class BoardRenderer:
+    """
+    Represents a text rendering of the board of a game. The renderer observes the game, so a move made with make_move
+    only marks the rows of its start and end squares as changed, and render redraws those rows and reuses the others.
+    The rendering of the current position is kept until the next move, so rendering it for many spectators costs one
+    string. The ascii style is the same text Board.display prints, the unicode style draws pieces as Chinese characters,
+    red 帥仕相傌俥炮兵 and black 將士象馬車砲卒, and the compact style is a single line, the board field of a FEN.
+    """
+
+    STYLE_ARRAY = ["ascii", "unicode", "compact"]
+
+    UNICODE_SYMBOL_DICT = {"red": {"G": "帥", "A": "仕", "E": "相", "H": "傌", "R": "俥", "C": "炮", "S": "兵"},
+                           "black": {"G": "將", "A": "士", "E": "象", "H": "馬", "R": "車", "C": "砲", "S": "卒"}}
+    UNICODE_EMPTY_SYMBOL = "十"
+
+    # lines below each rank, from rank 10 down to rank 1, and the file coordinates
+    ASCII_GAP_ARRAY = ["    | | | |\\|/| | | |", "    | | | |/|\\| | | |", "    | | | | | | | | |",
+                       "    | | | | | | | | |", "    |               |", "    | | | | | | | | |",
+                       "    | | | | | | | | |", "    | | | |\\|/| | | |", "    | | | |/|\\| | | |",
+                       "                     "]
+    ASCII_FILE_LINE = "    a b c d e f g h i"
+    UNICODE_GAP_ARRAY = ["    ｜ ｜ ｜ ｜ ｜ ｜ ｜ ｜ ｜"] * 4 + ["    ｜　楚河　　　　　漢界　｜"] + \
+        ["    ｜ ｜ ｜ ｜ ｜ ｜ ｜ ｜ ｜"] * 4 + [""]
+    UNICODE_FILE_LINE = "    ａ ｂ ｃ ｄ ｅ ｆ ｇ ｈ ｉ"
+
+    def __init__(self, game, style="ascii"):
+        """Initializes the renderer of the passed game in the passed style and makes it observe the game."""
+
+        if style not in self.STYLE_ARRAY:
+            raise ValueError("unknown style " + str(style))
+
+        self.__game = game
+        self.__style = style
+        self.__row_array = [None] * len(game.get_board().get_rank_array())
+        self.__text = None
+
+        game.add_observer(self)
+
+    def get_game(self):
+        """Getter for game."""
+
+        return self.__game
+
+    def get_style(self):
+        """Getter for style."""
+
+        return self.__style
+
+    def update(self, square_array):
+        """
+        Marks the rows of the passed squares as changed, so they are redrawn by the next render. Moves made with
+        make_move of the game are marked automatically. Call it after changing the board directly.
+        """
+
+        rank_count = len(self.__row_array)
+
+        for square in square_array:
+            self.__row_array[square % rank_count] = None
+
+        self.__text = None
+
+        return None
+
+    def invalidate(self):
+        """Marks every row as changed."""
+
+        self.update(range(len(self.__row_array)))
+
+        return None
+
+    def render_row(self, rank_index):
+        """Returns the row of the passed rank_index, with its rank coordinate unless the style is compact."""
+
+        board = self.__game.get_board()
+        point_array = board.get_point_array()
+        rank_count = len(self.__row_array)
+        square_array = range(rank_index, len(point_array), rank_count)
+
+        if self.__style == "compact":
+            return self.get_compact_row(square_array)
+
+        if self.__style == "ascii":
+            symbol_array = [point_array[square].get_symbol() for square in square_array]
+            separator = "-"
+        else:
+            symbol_array = []
+
+            for square in square_array:
+                piece = point_array[square].get_piece()
+
+                if piece is None:
+                    symbol_array.append(self.UNICODE_EMPTY_SYMBOL)
+                else:
+                    symbol_array.append(self.UNICODE_SYMBOL_DICT[piece.get_color()][piece.get_symbol()])
+
+            separator = "─"
+
+        return board.get_rank_array()[rank_index].rjust(2) + "  " + separator.join(symbol_array)
+
+    def get_compact_row(self, square_array):
+        """Returns the FEN row of the passed squares of one rank, as PositionCodec.encode_fen writes it."""
+
+        point_array = self.__game.get_board().get_point_array()
+        row = ""
+        empty_count = 0
+
+        for square in square_array:
+            piece = point_array[square].get_piece()
+
+            if piece is None:
+                empty_count += 1
+                continue
+
+            if empty_count > 0:
+                row += str(empty_count)
+                empty_count = 0
+
+            letter = PositionCodec.FEN_LETTER_DICT[piece.get_symbol()]
+
+            if piece.get_color() == "black":
+                letter = letter.lower()
+
+            row += letter
+
+        if empty_count > 0:
+            row += str(empty_count)
+
+        return row
+
+    def render(self):
+        """Returns the rendering of the current position, redrawing only the rows changed since the last render."""
+
+        if self.__text is not None:
+            return self.__text
+
+        row_array = self.__row_array
+        rank_count = len(row_array)
+
+        for rank_index in range(rank_count):
+            if row_array[rank_index] is None:
+                row_array[rank_index] = self.render_row(rank_index)
+
+        # rows are drawn from rank 10 down to rank 1
+        if self.__style == "compact":
+            self.__text = "/".join(reversed(row_array))
+            return self.__text
+
+        if self.__style == "ascii":
+            gap_array = self.ASCII_GAP_ARRAY
+            file_line = self.ASCII_FILE_LINE
+        else:
+            gap_array = self.UNICODE_GAP_ARRAY
+            file_line = self.UNICODE_FILE_LINE
+
+        line_array = []
+
+        for rank_index in range(rank_count - 1, -1, -1):
+            line_array.append(row_array[rank_index])
+            line_array.append(gap_array[rank_count - 1 - rank_index])
+
+        line_array.append(file_line)
+        self.__text = "\n".join(line_array)
+
+        return self.__text
+
+    @staticmethod
+    def render_game(move_array, style="ascii", validate=True):
+        """
+        Generator that yields the rendering of the start position and of the position after each move of the passed
+        move_array, for replay feeds. Each move only redraws its two rows. If validate is True moves are played with
+        make_move and a ValueError is raised for an illegal move, otherwise they are applied to the board directly,
+        as GameArchive.replay does for trusted archives.
+        """
+
+        game = XiangqiGame()
+        board = game.get_board()
+        renderer = BoardRenderer(game, style)
+
+        yield renderer.render()
+
+        for ply, (start_pos, end_pos) in enumerate(move_array):
+            if validate:
+                if not game.make_move(start_pos, end_pos):
+                    raise ValueError("illegal move " + start_pos + "-" + end_pos + " at ply " + str(ply))
+            else:
+                game.move_piece(start_pos, end_pos)
+                game.switch_current_player()
+                renderer.update([board.get_square_from_pos(start_pos), board.get_square_from_pos(end_pos)])
+
+            yield renderer.render()
+
+
+def main():
+    """Prints the position after every move of a game from an archive, or the starting position."""
+
+    parser = argparse.ArgumentParser(description="Renders the positions of a Xiangqi game as text.")
+    parser.add_argument("--style", choices=BoardRenderer.STYLE_ARRAY, default="ascii")
+    parser.add_argument("--archive", default=None, help="text game archive to read the game from")
+    parser.add_argument("--game-id", default=None, help="game to render, the first game of the archive by default")
+    args = parser.parse_args()
+
+    move_array = []
+
+    if args.archive is not None:
+        for game_id, _, game_move_array in GameArchive(args.archive).read_games():
+            if args.game_id is None or str(game_id) == args.game_id:
+                move_array = game_move_array
+                break
+
+    for text in BoardRenderer.render_game(move_array, args.style, validate=False):
+        print(text)
+        print()
+
+
+if __name__ == "__main__":
+    main()
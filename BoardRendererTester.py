@@ -0,0 +1,90 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for BoardRenderer
+
+import contextlib
+import io
+import random
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from BoardRenderer import BoardRenderer
+from PositionCodec import PositionCodec
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for BoardRenderer.py"""
+
+    @staticmethod
+    def get_display_text(game):
+        """Returns the text Board.display prints for the board of the passed game, without its last line break."""
+
+        buffer = io.StringIO()
+
+        with contextlib.redirect_stdout(buffer):
+            game.get_board().display()
+
+        return buffer.getvalue()[:-1]
+
+    def test_styles(self):
+        """Tests the three styles of the starting position and that an unknown style is rejected."""
+
+        game = XiangqiGame()
+
+        self.assertEqual(self.get_display_text(game), BoardRenderer(game).render())
+        self.assertEqual(PositionCodec.START_FEN.split(" ")[0], BoardRenderer(game, "compact").render())
+
+        line_array = BoardRenderer(game, "unicode").render().split("\n")
+        self.assertEqual("10  車─馬─象─士─將─士─象─馬─車", line_array[0])
+        self.assertEqual(" 1  俥─傌─相─仕─帥─仕─相─傌─俥", line_array[18])
+        self.assertIn("楚河", line_array[9])
+
+        with self.assertRaises(ValueError):
+            BoardRenderer(game, "svg")
+
+    def test_incremental_render(self):
+        """Tests that rendering after every move is the same as rendering the position from scratch."""
+
+        game = XiangqiGame()
+        renderer_array = [BoardRenderer(game, style) for style in BoardRenderer.STYLE_ARRAY]
+        a_random = random.Random(11)
+
+        for _ in range(80):
+            move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not move_array:
+                break
+
+            self.assertTrue(game.make_move(*a_random.choice(move_array)))
+
+            for renderer in renderer_array:
+                self.assertEqual(self.render_from_scratch(game, renderer.get_style()), renderer.render())
+
+            self.assertEqual(self.get_display_text(game), renderer_array[0].render())
+            self.assertEqual(PositionCodec.encode_fen(game).split(" ")[0], renderer_array[2].render())
+
+    @staticmethod
+    def render_from_scratch(game, style):
+        """Returns the rendering of the passed game by a renderer that redraws every row."""
+
+        renderer = BoardRenderer(game, style)
+        game.remove_observer(renderer)
+
+        return renderer.render()
+
+    def test_render_game(self):
+        """Tests that a replay yields the start position and one rendering per move, and rejects illegal moves."""
+
+        move_array = [("h3", "e3"), ("h10", "g8"), ("h1", "g3")]
+        text_array = list(BoardRenderer.render_game(move_array, "compact"))
+
+        self.assertEqual(4, len(text_array))
+        self.assertEqual(PositionCodec.START_FEN.split(" ")[0], text_array[0])
+        self.assertEqual("rnbakab1r/9/1c4nc1/p1p1p1p1p/9/9/P1P1P1P1P/1C2C1N2/9/RNBAKAB1R", text_array[3])
+        self.assertEqual(text_array, list(BoardRenderer.render_game(move_array, "compact", validate=False)))
+
+        with self.assertRaises(ValueError):
+            list(BoardRenderer.render_game([("h3", "h5"), ("a10", "a5")]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -106,6 +106,27 @@ class TestProduct(unittest.TestCase):
         self.assertEqual(first_point, a_board.get_point_with_pos(first_point_file + first_point_rank))
         self.assertEqual(last_point, a_board.get_point_with_pos(last_point_file + last_point_rank))
 
+    def test_squares(self):
+        """Tests conversion between positions, squares and file and rank index pairs."""
+
+        a_board = Board()
+
+        for square in range(len(a_board.get_point_array())):
+            a_pos = a_board.get_pos_from_square(square)
+            file_index, rank_index = a_board.get_index_pair(square)
+
+            self.assertEqual(square, a_board.get_square_from_pos(a_pos))
+            self.assertEqual(square, a_board.get_square(file_index, rank_index))
+            self.assertEqual(a_board.get_point_with_pos(a_pos), a_board.get_point_with_square(square))
+            self.assertEqual(a_board.get_file_index_from_pos(a_pos), file_index)
+            self.assertEqual(a_board.get_rank_index_from_pos(a_pos), rank_index)
+
+        self.assertEqual(49, a_board.get_square_from_pos("e10"))
+        self.assertEqual(None, a_board.get_square_from_pos("j1"))
+        self.assertEqual(None, a_board.get_point_with_pos("a11"))
+        self.assertEqual([a_board.get_square_from_pos(a_pos) for a_pos in a_board.get_red_castle_array()],
+                         a_board.get_red_castle_square_array())
+
 
 if __name__ == '__main__':
     unittest.main()
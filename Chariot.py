@@ -9,29 +9,37 @@ from Piece import Piece
 class Chariot(Piece):
     """Represents a chariot piece in the game Xiangqi."""
 
+    __slots__ = ()
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
+        Piece.__init__(self, color, "R", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
+
+    @staticmethod
+    def build_moves():
+        """Returns a tuple of the possible moves and the possible jumps, shared by every Chariot."""
+
         possible_moves = []
         possible_jumps = []
 
         for num in range(9):
-            possible_moves.append([num + 1, 0])
-            possible_jumps.append(self.find_jumps(num + 1, 0))
+            possible_moves.append((num + 1, 0))
+            possible_jumps.append(Chariot.find_jumps(num + 1, 0))
 
         for num in range(9):
-            possible_moves.append([-1 - num, 0])
-            possible_jumps.append(self.find_jumps(-1 - num, 0))
+            possible_moves.append((-1 - num, 0))
+            possible_jumps.append(Chariot.find_jumps(-1 - num, 0))
 
         for num in range(9):
-            possible_moves.append([0, num + 1])
-            possible_jumps.append(self.find_jumps(0, num + 1))
+            possible_moves.append((0, num + 1))
+            possible_jumps.append(Chariot.find_jumps(0, num + 1))
 
         for num in range(9):
-            possible_moves.append([0, -1 - num])
-            possible_jumps.append(self.find_jumps(0, -1 - num))
+            possible_moves.append((0, -1 - num))
+            possible_jumps.append(Chariot.find_jumps(0, -1 - num))
 
-        Piece.__init__(self, color, "R", possible_moves, possible_jumps)
+        return tuple(possible_moves), tuple(tuple(tuple(jump) for jump in jumps) for jumps in possible_jumps)
 
     @staticmethod
     def find_jumps(file_index, rank_index):
@@ -76,3 +84,6 @@ class Chariot(Piece):
             return jumps
 
         return None
+
+
+Chariot.POSSIBLE_MOVES, Chariot.POSSIBLE_JUMPS = Chariot.build_moves()
@@ -9,10 +9,12 @@ from Piece import Piece
 class Elephant(Piece):
     """Represents an elephant piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((2, 2), (2, -2), (-2, 2), (-2, -2))
+    POSSIBLE_JUMPS = (((1, 1),), ((1, -1),), ((-1, 1),), ((-1, -1),))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[2, 2], [2, -2], [-2, 2], [-2, -2]]
-        possible_jumps = [[[1, 1]], [[1, -1]], [[-1, 1]], [[-1, -1]]]
-
-        Piece.__init__(self, color, "E", possible_moves, possible_jumps)
+        Piece.__init__(self, color, "E", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
@@ -0,0 +1,461 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an engine that chooses moves in the game Xiangqi by alpha-beta search over XiangqiGame positions
+#              with a material evaluation.
+
+
+import json
+import time
+
+from Zobrist import Zobrist
+
+
+class Engine:
+    """
+    Represents a Xiangqi engine. Positions are searched by negamax alpha-beta with iterative deepening. Moves are
+    generated with generate_end_pos and made on the board with move_piece, so searching never changes the game
+    state. Scores are from the point of view of the side to move. A search can be limited by depth, by nodes or by
+    setting a stop event from another thread, in which case the last completed iteration is returned. Results are kept
+    in a transposition table keyed by the canonical Zobrist hash, so a position and its mirror image share one entry,
+    which is shared by the lines of a multi-PV analysis and kept between searches.
+    """
+
+    MATE_SCORE = 100000
+    MAX_DEPTH = 64
+    MAX_PLY = 256
+    TABLE_SIZE = 1 << 20
+
+    # transposition table flags
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+    PIECE_VALUE_DICT = {"G": 0, "A": 200, "E": 200, "H": 400, "R": 900, "C": 450, "S": 100}
+    CROSSED_SOLDIER_BONUS = 100
+
+    def __init__(self, depth=2, piece_value_dict=None, crossed_soldier_bonus=None, table_size=None, param_path=None):
+        """
+        Initializes the engine with the passed default search depth in plies, piece values by symbol, bonus for a
+        Soldier across the river and number of transposition table entries. If param_path is passed, piece values and
+        the bonus are loaded from that parameter file, as written by EvalTuner, before the passed values are applied.
+        Values that are not passed use the defaults.
+        """
+
+        self.__depth = depth
+        self.__piece_value_dict = dict(self.PIECE_VALUE_DICT)
+
+        if param_path is not None:
+            param_dict = Engine.load_params(param_path)
+            self.__piece_value_dict.update(param_dict.get("piece_value_dict", {}))
+
+            if crossed_soldier_bonus is None:
+                crossed_soldier_bonus = param_dict.get("crossed_soldier_bonus")
+
+        if piece_value_dict is not None:
+            self.__piece_value_dict.update(piece_value_dict)
+
+        if crossed_soldier_bonus is None:
+            self.__crossed_soldier_bonus = self.CROSSED_SOLDIER_BONUS
+        else:
+            self.__crossed_soldier_bonus = crossed_soldier_bonus
+
+        self.__table_size = table_size if table_size is not None else self.TABLE_SIZE
+        self.__table = {}
+        self.__node_count = 0
+        self.__node_limit = None
+        self.__stop_event = None
+        self.__aborted = False
+
+    @staticmethod
+    def load_params(param_path):
+        """
+        Returns the dictionary of the JSON parameter file at the passed param_path, with piece_value_dict and
+        crossed_soldier_bonus keys. Raises ValueError for an unknown key or piece symbol.
+        """
+
+        with open(param_path) as param_file:
+            param_dict = json.load(param_file)
+
+        for key in param_dict:
+            if key not in ("piece_value_dict", "crossed_soldier_bonus"):
+                raise ValueError("unknown engine parameter " + key + " in " + param_path)
+
+        for symbol in param_dict.get("piece_value_dict", {}):
+            if symbol not in Engine.PIECE_VALUE_DICT:
+                raise ValueError("unknown piece symbol " + symbol + " in " + param_path)
+
+        return param_dict
+
+    def get_depth(self):
+        """Getter for depth."""
+
+        return self.__depth
+
+    def get_piece_value_dict(self):
+        """Getter for piece_value_dict."""
+
+        return self.__piece_value_dict
+
+    def get_crossed_soldier_bonus(self):
+        """Getter for crossed_soldier_bonus."""
+
+        return self.__crossed_soldier_bonus
+
+    def get_node_count(self):
+        """Returns the number of positions visited by the last search."""
+
+        return self.__node_count
+
+    def get_table_entry_count(self):
+        """Returns the number of entries in the transposition table."""
+
+        return len(self.__table)
+
+    def clear_table(self):
+        """Empties the transposition table."""
+
+        self.__table.clear()
+
+        return None
+
+    def evaluate(self, game):
+        """Returns the material score of the passed game for the side to move."""
+
+        board = game.get_board()
+        player_color = game.get_current_player().get_color()
+        red_side_array = board.get_red_side_array()
+        score = 0
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is None:
+                continue
+
+            symbol = piece.get_symbol()
+            value = self.__piece_value_dict[symbol]
+
+            # a Soldier across the river can also move sideways
+            if symbol == "S" and (point.get_pos() in red_side_array) != (piece.get_color() == "red"):
+                value += self.__crossed_soldier_bonus
+
+            if piece.get_color() == player_color:
+                score += value
+            else:
+                score -= value
+
+        return score
+
+    def get_move_array(self, game):
+        """
+        Returns an array of (start_pos, end_pos) tuples for the moves of the side to move that obey every restriction
+        except leaving the own General in check. Captures of the most valuable pieces come first.
+        """
+
+        board = game.get_board()
+        player_color = game.get_current_player().get_color()
+        capture_array = []
+        quiet_move_array = []
+
+        for start_pos in game.all_pieces_pos_array(player_color):
+            piece = board.get_point_with_pos(start_pos).get_piece()
+
+            for end_pos in game.generate_end_pos(start_pos, piece.get_symbol()):
+                end_piece = board.get_point_with_pos(end_pos).get_piece()
+
+                if end_piece is None:
+                    quiet_move_array.append((start_pos, end_pos))
+                else:
+                    capture_array.append((self.__piece_value_dict[end_piece.get_symbol()], (start_pos, end_pos)))
+
+        capture_array.sort(key=lambda capture: -capture[0])
+
+        return [capture[1] for capture in capture_array] + quiet_move_array
+
+    @staticmethod
+    def make(game, move):
+        """Makes the passed move on the board of the passed game and switches the player. Returns the undo tuple."""
+
+        board = game.get_board()
+        start_point = board.get_point_with_pos(move[0])
+        end_point = board.get_point_with_pos(move[1])
+        undo = (start_point, start_point.get_piece(), end_point, end_point.get_piece())
+
+        game.move_piece(move[0], move[1])
+        game.switch_current_player()
+
+        return undo
+
+    @staticmethod
+    def unmake(game, undo):
+        """Reverses a move made with make using the passed undo tuple."""
+
+        game.reverse_move(*undo)
+        game.switch_current_player()
+
+        return None
+
+    def score_to_table(self, score, ply):
+        """Returns the passed score made relative to the current node, so mate distances stay right in the table."""
+
+        if score > self.MATE_SCORE - self.MAX_PLY:
+            return score + ply
+
+        if score < -self.MATE_SCORE + self.MAX_PLY:
+            return score - ply
+
+        return score
+
+    def score_from_table(self, score, ply):
+        """Returns the passed table score made relative to the root again."""
+
+        if score > self.MATE_SCORE - self.MAX_PLY:
+            return score - ply
+
+        if score < -self.MATE_SCORE + self.MAX_PLY:
+            return score + ply
+
+        return score
+
+    def store(self, hash_pair, depth, score, flag, move):
+        """
+        Stores the passed search result of the position with the passed hash pair in the transposition table under its
+        canonical hash, emptying the table once it is full.
+        """
+
+        if len(self.__table) >= self.__table_size:
+            self.__table.clear()
+
+        hash_value, mirrored = Zobrist.canonicalize(hash_pair)
+
+        if move is not None:
+            move = Zobrist.canonicalize_move(move, mirrored)
+
+        self.__table[hash_value] = (depth, score, flag, move)
+
+        return None
+
+    def negamax(self, game, depth, alpha, beta, ply, pv_array, hash_pair, excluded_move_set=None):
+        """
+        Returns the score of the passed game with the passed hash_pair searched to the passed depth within the alpha
+        and beta window. The principal variation from this position replaces the contents of the passed pv_array. Moves
+        in excluded_move_set are skipped, which lets the root be searched again for the next best line.
+        """
+
+        # unwind without a score once the search is stopped, the caller discards the unfinished iteration
+        if self.__aborted or (self.__stop_event is not None and self.__stop_event.is_set()) or \
+                (self.__node_limit is not None and self.__node_count >= self.__node_limit):
+            self.__aborted = True
+            return 0
+
+        self.__node_count += 1
+
+        if depth <= 0:
+            return self.evaluate(game)
+
+        original_alpha = alpha
+        table_move = None
+        hash_value, mirrored = Zobrist.canonicalize(hash_pair)
+        entry = self.__table.get(hash_value)
+
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, table_move = entry
+            entry_score = self.score_from_table(entry_score, ply)
+
+            if table_move is not None:
+                table_move = Zobrist.canonicalize_move(table_move, mirrored)
+
+            # the root always searches so that it returns a full principal variation
+            if ply > 0 and entry_depth >= depth and (entry_flag == self.EXACT or
+                                                     (entry_flag == self.LOWER_BOUND and entry_score >= beta) or
+                                                     (entry_flag == self.UPPER_BOUND and entry_score <= alpha)):
+                pv_array[:] = [table_move] if table_move is not None else []
+                return entry_score
+
+        move_array = self.get_move_array(game)
+
+        # try the best move of an earlier search first
+        if table_move in move_array:
+            move_array.remove(table_move)
+            move_array.insert(0, table_move)
+
+        player_color = game.get_current_player().get_color()
+        legal_move_count = 0
+        best_move = None
+
+        for move in move_array:
+            # excluded root moves were legal in an earlier search, so the position is not a mate
+            if excluded_move_set and move in excluded_move_set:
+                legal_move_count += 1
+                continue
+
+            child_hash_pair = Zobrist.get_child_hash_pair(game, hash_pair, move)
+            undo = self.make(game, move)
+
+            # the move is illegal if it leaves the own General in check
+            if game.is_in_check(player_color):
+                self.unmake(game, undo)
+                continue
+
+            legal_move_count += 1
+            child_pv_array = []
+            score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1, child_pv_array, child_hash_pair)
+            self.unmake(game, undo)
+
+            if self.__aborted:
+                return 0
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+                pv_array[:] = [move] + child_pv_array
+
+                if alpha >= beta:
+                    break
+
+        # a player without legal moves loses, whether in check or not
+        if legal_move_count == 0:
+            pv_array[:] = []
+            alpha = -self.MATE_SCORE + ply
+            self.store(hash_pair, self.MAX_PLY, self.score_to_table(alpha, ply), self.EXACT, None)
+            return alpha
+
+        if not excluded_move_set:
+            if alpha <= original_alpha:
+                flag = self.UPPER_BOUND
+            elif alpha >= beta:
+                flag = self.LOWER_BOUND
+            else:
+                flag = self.EXACT
+
+            self.store(hash_pair, depth, self.score_to_table(alpha, ply), flag, best_move)
+
+        return alpha
+
+    def find_legal_move(self, game):
+        """Returns the first legal move of the side to move in the passed game, or None if there is none."""
+
+        player_color = game.get_current_player().get_color()
+
+        for move in self.get_move_array(game):
+            undo = self.make(game, move)
+            in_check = game.is_in_check(player_color)
+            self.unmake(game, undo)
+
+            if not in_check:
+                return move
+
+        return None
+
+    def search(self, game, depth=None, nodes=None, stop_event=None, info_callback=None):
+        """
+        Returns a dictionary with the best move, score, depth, node count, time in seconds and principal variation of
+        the passed game, searching one ply deeper each iteration. The search ends after the passed depth, after the
+        passed number of nodes or once the passed threading.Event is set. Without any limit the default depth is used.
+        info_callback is called with the result of every completed iteration. The move is None if the side to move has
+        no legal moves.
+        """
+
+        if depth is None:
+            if nodes is None and stop_event is None:
+                depth = self.__depth
+            else:
+                depth = self.MAX_DEPTH
+
+        self.__node_count = 0
+        self.__node_limit = nodes
+        self.__stop_event = stop_event
+        self.__aborted = False
+
+        start_time = time.perf_counter()
+        hash_pair = Zobrist.hash_game_pair(game)
+        result = {"move": None, "score": 0, "depth": 0, "nodes": 0, "time": 0.0, "pv": []}
+
+        for iteration_depth in range(1, depth + 1):
+            pv_array = []
+            score = self.negamax(game, iteration_depth, -self.MATE_SCORE - 1, self.MATE_SCORE + 1, 0, pv_array,
+                                 hash_pair)
+
+            if self.__aborted:
+                # a stopped first iteration still returns its best move so far, or any legal move
+                if result["move"] is None and pv_array:
+                    result["move"] = pv_array[0]
+                    result["pv"] = list(pv_array)
+                elif result["move"] is None:
+                    result["move"] = self.find_legal_move(game)
+
+                break
+
+            result = {"move": pv_array[0] if pv_array else None, "score": score, "depth": iteration_depth,
+                      "nodes": self.__node_count, "time": time.perf_counter() - start_time, "pv": list(pv_array)}
+
+            if info_callback is not None:
+                info_callback(result)
+
+            # stop deepening once a forced mate is found
+            if abs(score) >= self.MATE_SCORE - iteration_depth:
+                break
+
+        result["nodes"] = self.__node_count
+        result["time"] = time.perf_counter() - start_time
+        self.__stop_event = None
+        self.__node_limit = None
+
+        return result
+
+    def analyze(self, game, multipv=3, depth=None, nodes=None, stop_event=None):
+        """
+        Generator that yields the multipv best lines of the passed game after every completed iteration of deepening.
+        Each result is a dictionary with the depth, node count, time in seconds and an array of lines, each a
+        dictionary with the move, score and principal variation, best line first. Every line searches the root again
+        without the moves of the lines before it, so the lines share the transposition table and only the first one
+        pays full price. Limits work as in search. Fewer lines are returned if the side to move has fewer legal moves.
+        """
+
+        if depth is None:
+            if nodes is None and stop_event is None:
+                depth = self.__depth
+            else:
+                depth = self.MAX_DEPTH
+
+        self.__node_count = 0
+        self.__node_limit = nodes
+        self.__stop_event = stop_event
+        self.__aborted = False
+
+        start_time = time.perf_counter()
+        hash_pair = Zobrist.hash_game_pair(game)
+
+        try:
+            for iteration_depth in range(1, depth + 1):
+                line_array = []
+                excluded_move_set = set()
+
+                while len(line_array) < multipv:
+                    pv_array = []
+                    score = self.negamax(game, iteration_depth, -self.MATE_SCORE - 1, self.MATE_SCORE + 1, 0,
+                                         pv_array, hash_pair, excluded_move_set)
+
+                    # an empty principal variation means that every legal move is already a line
+                    if self.__aborted or not pv_array:
+                        break
+
+                    line_array.append({"move": pv_array[0], "score": score, "pv": list(pv_array)})
+                    excluded_move_set.add(pv_array[0])
+
+                if self.__aborted or not line_array:
+                    return
+
+                yield {"depth": iteration_depth, "nodes": self.__node_count, "time": time.perf_counter() - start_time,
+                       "lines": line_array}
+
+                # deeper iterations cannot change a forced mate in the best line
+                if abs(line_array[0]["score"]) >= self.MATE_SCORE - iteration_depth:
+                    return
+        finally:
+            self.__stop_event = None
+            self.__node_limit = None
+
+    def choose_move(self, game):
+        """Returns the best move of the passed game at the default depth, or None if there is no legal move."""
+
+        return self.search(game)["move"]
@@ -0,0 +1,99 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for the transposition table and multi-PV analysis of Engine
+
+import unittest
+from Engine import Engine
+from PositionCodec import PositionCodec
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for Engine.py"""
+
+    ROOK_FEN = "3k5/4a4/9/9/9/9/9/9/2R6/4K4 w - - 0 1"
+
+    def test_analyze_lines(self):
+        """Tests that every iteration yields distinct lines, best first, and that the first line matches search."""
+
+        game = PositionCodec.decode_fen(self.ROOK_FEN)
+        result_array = list(Engine().analyze(game, multipv=4, depth=2))
+
+        self.assertEqual([1, 2], [result["depth"] for result in result_array])
+
+        for result in result_array:
+            line_array = result["lines"]
+            move_array = [line["move"] for line in line_array]
+            score_array = [line["score"] for line in line_array]
+
+            self.assertEqual(4, len(line_array))
+            self.assertEqual(4, len(set(move_array)))
+            self.assertEqual(sorted(score_array, reverse=True), score_array)
+            self.assertEqual(move_array, [line["pv"][0] for line in line_array])
+
+        search_result = Engine().search(game, depth=2)
+        self.assertEqual(search_result["score"], result_array[-1]["lines"][0]["score"])
+        self.assertEqual(self.ROOK_FEN, PositionCodec.encode_fen(game))
+
+    def test_analyze_fewer_legal_moves(self):
+        """Tests that analysis returns one line per legal move when there are fewer legal moves than lines."""
+
+        # only the General can move and the d file is covered by the black General
+        game = PositionCodec.decode_fen("3k5/9/9/9/9/9/9/9/9/4K4 w - - 0 1")
+        result = next(Engine().analyze(game, multipv=5, depth=1))
+
+        self.assertEqual({("e1", "e2"), ("e1", "f1")}, set(line["move"] for line in result["lines"]))
+
+    def test_analyze_node_limit(self):
+        """Tests that a node limited analysis stops streaming without yielding an unfinished iteration."""
+
+        game = PositionCodec.decode_fen(self.ROOK_FEN)
+        result_array = list(Engine().analyze(game, multipv=2, nodes=300))
+
+        self.assertTrue(result_array)
+        self.assertLess(result_array[-1]["nodes"], 300)
+
+    def test_table_reuse(self):
+        """Tests that searching the same position again visits fewer nodes and that clear_table empties the table."""
+
+        game = PositionCodec.decode_fen(self.ROOK_FEN)
+        engine = Engine()
+
+        first_result = engine.search(game, depth=2)
+        second_result = engine.search(game, depth=2)
+
+        self.assertEqual(first_result["move"], second_result["move"])
+        self.assertEqual(first_result["score"], second_result["score"])
+        self.assertLess(second_result["nodes"], first_result["nodes"])
+        self.assertGreater(engine.get_table_entry_count(), 0)
+
+        engine.clear_table()
+        self.assertEqual(0, engine.get_table_entry_count())
+
+    def test_mirrored_table_reuse(self):
+        """Tests that the table entries of a position are reused, with mirrored moves, by its mirror image."""
+
+        game = PositionCodec.decode_fen(self.ROOK_FEN)
+        mirrored_game = PositionCodec.mirror_game(game)
+        engine = Engine()
+
+        first_result = engine.search(game, depth=2)
+        mirrored_result = engine.search(mirrored_game, depth=2)
+        fresh_result = Engine().search(mirrored_game, depth=2)
+
+        self.assertEqual(PositionCodec.mirror_move(first_result["move"]), mirrored_result["move"])
+        self.assertEqual(fresh_result["score"], mirrored_result["score"])
+        self.assertLess(mirrored_result["nodes"], fresh_result["nodes"])
+        self.assertTrue(mirrored_game.make_move(*mirrored_result["move"]))
+
+    def test_table_size(self):
+        """Tests that the table never grows past its size."""
+
+        game = PositionCodec.decode_fen(self.ROOK_FEN)
+        engine = Engine(table_size=8)
+        engine.search(game, depth=2)
+
+        self.assertLessEqual(engine.get_table_entry_count(), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines Texel tuning of the evaluation parameters of Engine, fitting piece values and the crossed Soldier
+#              bonus to the results of played games with vectorized NumPy loss and gradient computations.
+
+
+import argparse
+import json
+import math
+import time
+
+import numpy
+
+from Engine import Engine
+from GameArchive import GameArchive
+from FeatureExporter import FeatureExporter
+
+
+class EvalTuner:
+    """
+    Represents a Texel tuning of the evaluation of Engine. Engine.evaluate is linear in its parameters, the values of
+    the Advisor, Elephant, Horse, Chariot, Cannon and Soldier and the bonus of a Soldier across the river, so every
+    position is loaded once as a row of feature counts, own pieces minus opposing pieces for the side to move, and the
+    evaluation of all positions is one matrix product. The predicted score of a position is the logistic function of
+    scale times its evaluation, the target is the game result for the side to move, 1 for a win, 0.5 for a draw and 0
+    for a loss, and the loss is the mean logistic loss. The scale is fitted first with the starting parameters, then
+    the parameters are optimized by gradient descent with Adam.
+    """
+
+    SYMBOL_ARRAY = ["A", "E", "H", "R", "C", "S"]
+    PARAMETER_COUNT = 7
+
+    # planes of the red and black Advisor to Soldier in FeatureExporter piece code order
+    RED_PLANE_SLICE = slice(1, 7)
+    BLACK_PLANE_SLICE = slice(8, 14)
+    RED_SOLDIER_PLANE = 6
+    BLACK_SOLDIER_PLANE = 13
+
+    # positions turned into features at a time
+    BLOCK_SIZE = 65536
+
+    def __init__(self, feature_matrix, target_array):
+        """Initializes the tuning with the passed (N, 7) feature_matrix and N targets."""
+
+        self.__feature_matrix = numpy.asarray(feature_matrix, dtype=numpy.float64)
+        self.__target_array = numpy.asarray(target_array, dtype=numpy.float64)
+
+    def get_feature_matrix(self):
+        """Getter for feature_matrix."""
+
+        return self.__feature_matrix
+
+    def get_target_array(self):
+        """Getter for target_array."""
+
+        return self.__target_array
+
+    @staticmethod
+    def features_from_planes(planes, labels):
+        """
+        Returns a tuple of the feature matrix and the target array of the passed FeatureExporter planes and labels.
+        Ranks 6 to 10 are across the river for red Soldiers and ranks 1 to 5 for black Soldiers.
+        """
+
+        count_matrix = planes.sum(axis=(2, 3), dtype=numpy.int32)
+        red_crossed_array = planes[:, EvalTuner.RED_SOLDIER_PLANE, 5:, :].sum(axis=(1, 2), dtype=numpy.int32)
+        black_crossed_array = planes[:, EvalTuner.BLACK_SOLDIER_PLANE, :5, :].sum(axis=(1, 2), dtype=numpy.int32)
+
+        difference_matrix = numpy.empty((len(planes), EvalTuner.PARAMETER_COUNT), dtype=numpy.float64)
+        difference_matrix[:, :6] = count_matrix[:, EvalTuner.RED_PLANE_SLICE] - \
+            count_matrix[:, EvalTuner.BLACK_PLANE_SLICE]
+        difference_matrix[:, 6] = red_crossed_array - black_crossed_array
+
+        # features and targets are for the side to move
+        sign_array = numpy.where(labels["side"] == 0, 1.0, -1.0)
+
+        return difference_matrix * sign_array[:, None], (labels["result"] * sign_array + 1) / 2
+
+    @staticmethod
+    def from_chunks(output_dir):
+        """Returns a tuning of the positions of the FeatureExporter chunks in the passed output_dir."""
+
+        feature_matrix_array = []
+        target_array_array = []
+
+        for planes, labels in FeatureExporter.load_chunks(output_dir):
+            for start in range(0, len(labels), EvalTuner.BLOCK_SIZE):
+                stop = start + EvalTuner.BLOCK_SIZE
+                feature_matrix, target_array = EvalTuner.features_from_planes(planes[start:stop], labels[start:stop])
+                feature_matrix_array.append(feature_matrix)
+                target_array_array.append(target_array)
+
+        return EvalTuner.concatenate(feature_matrix_array, target_array_array)
+
+    @staticmethod
+    def from_archives(archive_path_array, validate=True):
+        """Returns a tuning of the positions of the finished games in the passed archives."""
+
+        game_array = []
+
+        for archive_path in archive_path_array:
+            for _, result, move_array in GameArchive(archive_path).read_games():
+                if result in FeatureExporter.RESULT_VALUE_DICT and move_array:
+                    game_array.append((result, move_array))
+
+        code_matrix, label_array = FeatureExporter.encode_game_array(game_array, validate)
+        feature_matrix_array = []
+        target_array_array = []
+
+        for start in range(0, len(label_array), EvalTuner.BLOCK_SIZE):
+            stop = start + EvalTuner.BLOCK_SIZE
+            planes = FeatureExporter.to_planes(code_matrix[start:stop])
+            feature_matrix, target_array = EvalTuner.features_from_planes(planes, label_array[start:stop])
+            feature_matrix_array.append(feature_matrix)
+            target_array_array.append(target_array)
+
+        return EvalTuner.concatenate(feature_matrix_array, target_array_array)
+
+    @staticmethod
+    def concatenate(feature_matrix_array, target_array_array):
+        """Returns a tuning of the passed blocks of features and targets."""
+
+        if not feature_matrix_array:
+            return EvalTuner(numpy.empty((0, EvalTuner.PARAMETER_COUNT)), numpy.empty(0))
+
+        return EvalTuner(numpy.concatenate(feature_matrix_array), numpy.concatenate(target_array_array))
+
+    @staticmethod
+    def get_engine_params(engine=None):
+        """Returns the parameter array of the passed engine, or of an engine with the default parameters."""
+
+        if engine is None:
+            engine = Engine()
+
+        piece_value_dict = engine.get_piece_value_dict()
+
+        return numpy.array([piece_value_dict[symbol] for symbol in EvalTuner.SYMBOL_ARRAY] +
+                           [engine.get_crossed_soldier_bonus()], dtype=numpy.float64)
+
+    def get_evaluation_array(self, param_array):
+        """Returns the evaluation of every position with the passed parameters, as Engine.evaluate scores it."""
+
+        return self.__feature_matrix @ param_array
+
+    def get_loss(self, param_array, scale):
+        """Returns the mean logistic loss of the passed parameters and scale."""
+
+        logit_array = scale * self.get_evaluation_array(param_array)
+
+        return float(numpy.mean(numpy.logaddexp(0.0, logit_array) - self.__target_array * logit_array))
+
+    def get_gradient(self, param_array, scale):
+        """Returns the gradient of the mean logistic loss with respect to the passed parameters."""
+
+        logit_array = scale * self.get_evaluation_array(param_array)
+
+        # the logistic function written with tanh so large evaluations do not overflow
+        prediction_array = 0.5 * (1.0 + numpy.tanh(0.5 * logit_array))
+
+        return scale * (self.__feature_matrix.T @ (prediction_array - self.__target_array)) / len(self.__target_array)
+
+    def fit_scale(self, param_array, low=1e-5, high=1e-1, iterations=60):
+        """
+        Returns the scale between the passed low and high bounds minimizing the loss of the passed parameters, found by
+        a golden section search over the logarithm of the scale.
+        """
+
+        ratio = (math.sqrt(5) - 1) / 2
+        low = math.log(low)
+        high = math.log(high)
+
+        for _ in range(iterations):
+            left = high - ratio * (high - low)
+            right = low + ratio * (high - low)
+
+            if self.get_loss(param_array, math.exp(left)) < self.get_loss(param_array, math.exp(right)):
+                high = right
+            else:
+                low = left
+
+        return math.exp((low + high) / 2)
+
+    def tune(self, param_array=None, iterations=1000, learning_rate=2.0, scale=None):
+        """
+        Optimizes the passed starting parameters, the engine defaults if None, with Adam for the passed number of
+        iterations and learning_rate in centipawns. Fits the scale first unless one is passed. Returns the report
+        dictionary with the tuned parameters, the scale and the loss before and after.
+        """
+
+        start_time = time.perf_counter()
+
+        if param_array is None:
+            param_array = EvalTuner.get_engine_params()
+
+        param_array = numpy.array(param_array, dtype=numpy.float64)
+
+        if scale is None:
+            scale = self.fit_scale(param_array)
+
+        loss_before = self.get_loss(param_array, scale)
+        first_moment_array = numpy.zeros_like(param_array)
+        second_moment_array = numpy.zeros_like(param_array)
+        beta_one = 0.9
+        beta_two = 0.999
+
+        for iteration in range(1, iterations + 1):
+            gradient_array = self.get_gradient(param_array, scale)
+            first_moment_array = beta_one * first_moment_array + (1 - beta_one) * gradient_array
+            second_moment_array = beta_two * second_moment_array + (1 - beta_two) * gradient_array ** 2
+            corrected_first_array = first_moment_array / (1 - beta_one ** iteration)
+            corrected_second_array = second_moment_array / (1 - beta_two ** iteration)
+            param_array -= learning_rate * corrected_first_array / (numpy.sqrt(corrected_second_array) + 1e-12)
+
+        return {"positions": len(self.__target_array),
+                "scale": scale,
+                "loss_before": loss_before,
+                "loss_after": self.get_loss(param_array, scale),
+                "params": EvalTuner.to_config(param_array),
+                "elapsed_s": time.perf_counter() - start_time}
+
+    @staticmethod
+    def to_config(param_array):
+        """Returns the passed parameters as Engine keyword arguments, with values rounded to whole centipawns."""
+
+        value_array = [int(round(value)) for value in param_array]
+
+        return {"piece_value_dict": dict(zip(EvalTuner.SYMBOL_ARRAY, value_array[:6])),
+                "crossed_soldier_bonus": value_array[6]}
+
+    @staticmethod
+    def write(param_path, config):
+        """Writes the passed Engine keyword arguments to the parameter file at param_path, for Engine to load."""
+
+        with open(param_path, "w") as param_file:
+            json.dump(config, param_file, indent=2, sort_keys=True)
+            param_file.write("\n")
+
+        return None
+
+
+def main():
+    """Tunes the evaluation from FeatureExporter chunks or game archives and writes the parameter file."""
+
+    parser = argparse.ArgumentParser(description="Tunes Xiangqi engine evaluation parameters on played games.")
+    parser.add_argument("param_path", help="parameter file to write, loaded by Engine(param_path=...)")
+    parser.add_argument("archives", nargs="*", help="archives to load positions from")
+    parser.add_argument("--chunks", default=None, help="FeatureExporter output directory to load positions from")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--learning-rate", type=float, default=2.0)
+    parser.add_argument("--trusted", action="store_true", help="skip move validation while replaying archives")
+    args = parser.parse_args()
+
+    if args.chunks is not None:
+        tuner = EvalTuner.from_chunks(args.chunks)
+    else:
+        tuner = EvalTuner.from_archives(args.archives, not args.trusted)
+
+    report = tuner.tune(iterations=args.iterations, learning_rate=args.learning_rate)
+    EvalTuner.write(args.param_path, report["params"])
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for EvalTuner and Engine parameter files
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from Engine import Engine
+
+try:
+    import numpy
+    from EvalTuner import EvalTuner
+    from FeatureExporter import FeatureExporter
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for EvalTuner.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with an archive of random games."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        a_random = random.Random(19)
+        game_array = []
+
+        for game_number in range(12):
+            game = XiangqiGame()
+            move_array = []
+
+            for _ in range(a_random.randint(1, 80)):
+                legal_move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+                if game.get_game_state() != "UNFINISHED" or not legal_move_array:
+                    break
+
+                move_array.append(a_random.choice(legal_move_array))
+                game.make_move(*move_array[-1])
+
+            game_array.append((game_number, a_random.choice(["RED_WON", "BLACK_WON", "DRAW"]), move_array))
+
+        GameArchive(self.archive_path).write_games(game_array)
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_features(self):
+        """Tests that the vectorized evaluation of every position is Engine.evaluate and that chunks load the same."""
+
+        tuner = EvalTuner.from_archives([self.archive_path])
+        engine = Engine()
+        evaluation_array = []
+        target_array = []
+
+        for _, result, move_array in GameArchive(self.archive_path).read_games():
+            game = XiangqiGame()
+
+            for start_pos, end_pos in move_array:
+                evaluation_array.append(engine.evaluate(game))
+                red_to_move = game.get_current_player().get_color() == "red"
+
+                if result == "DRAW":
+                    target_array.append(0.5)
+                else:
+                    target_array.append(1.0 if (result == "RED_WON") == red_to_move else 0.0)
+
+                self.assertTrue(game.make_move(start_pos, end_pos))
+
+        self.assertEqual(evaluation_array, list(tuner.get_evaluation_array(EvalTuner.get_engine_params(engine))))
+        self.assertEqual(target_array, list(tuner.get_target_array()))
+
+        output_dir = os.path.join(self.directory, "features")
+        FeatureExporter(output_dir, chunk_size=100, workers=1).run([self.archive_path])
+        chunk_tuner = EvalTuner.from_chunks(output_dir)
+
+        self.assertTrue(numpy.array_equal(tuner.get_feature_matrix(), chunk_tuner.get_feature_matrix()))
+        self.assertTrue(numpy.array_equal(tuner.get_target_array(), chunk_tuner.get_target_array()))
+
+    def test_tune(self):
+        """Tests that tuning on results drawn from known parameters finds them again."""
+
+        generator = numpy.random.default_rng(0)
+        true_param_array = numpy.array([180, 220, 420, 950, 430, 90, 70], dtype=numpy.float64)
+        feature_matrix = generator.integers(-2, 3, size=(20000, 7)).astype(numpy.float64)
+        win_probability_array = 1 / (1 + numpy.exp(-0.004 * (feature_matrix @ true_param_array)))
+        target_array = (generator.random(20000) < win_probability_array).astype(numpy.float64)
+
+        report = EvalTuner(feature_matrix, target_array).tune(iterations=300, learning_rate=5.0)
+        piece_value_dict = report["params"]["piece_value_dict"]
+        tuned_param_array = numpy.array([piece_value_dict[symbol] for symbol in EvalTuner.SYMBOL_ARRAY] +
+                                        [report["params"]["crossed_soldier_bonus"]])
+
+        self.assertLess(report["loss_after"], report["loss_before"])
+        self.assertLess(numpy.abs(tuned_param_array / true_param_array - 1).max(), 0.15)
+
+    def test_param_file(self):
+        """Tests that Engine loads a written parameter file and rejects unknown parameters."""
+
+        param_path = os.path.join(self.directory, "params.json")
+        EvalTuner.write(param_path, {"piece_value_dict": {"A": 190, "E": 210, "H": 410, "R": 920, "C": 440, "S": 95},
+                                     "crossed_soldier_bonus": 80})
+
+        engine = Engine(param_path=param_path)
+        self.assertEqual(410, engine.get_piece_value_dict()["H"])
+        self.assertEqual(0, engine.get_piece_value_dict()["G"])
+        self.assertEqual(80, engine.get_crossed_soldier_bonus())
+        self.assertEqual(60, Engine(crossed_soldier_bonus=60, param_path=param_path).get_crossed_soldier_bonus())
+
+        with open(param_path, "w") as param_file:
+            json.dump({"piece_value_dict": {"X": 1}}, param_file)
+
+        with self.assertRaises(ValueError):
+            Engine(param_path=param_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an external merge sort of fixed size binary records, for building indexes of game archives that
+#              do not fit in memory.
+
+
+import heapq
+import os
+import tempfile
+
+
+class ExternalSort:
+    """
+    Represents an external merge sort of record tuples packed with a struct.Struct. Records are sorted in memory
+    chunk_size at a time and written to temporary run files, which are merged while the sorted records are read, so
+    memory use is bounded by chunk_size whatever the number of records. Records sort as tuples, by their first field,
+    then their second, and so on.
+    """
+
+    # records read at a time from a sorted run while merging
+    RUN_READ_COUNT = 4096
+
+    def __init__(self, record_struct, chunk_size=1000000, directory=None):
+        """
+        Initializes the sort of records packed with the passed record_struct. Runs are written to the passed directory,
+        or to the default temporary directory if it is None.
+        """
+
+        self.__record_struct = record_struct
+        self.__chunk_size = chunk_size
+        self.__directory = directory
+
+    def get_record_struct(self):
+        """Getter for record_struct."""
+
+        return self.__record_struct
+
+    def get_chunk_size(self):
+        """Getter for chunk_size."""
+
+        return self.__chunk_size
+
+    def write_run(self, record_array):
+        """Sorts the passed records, writes them to a new temporary file and returns its path."""
+
+        record_array.sort()
+        file_descriptor, run_path = tempfile.mkstemp(suffix=".run", dir=self.__directory)
+
+        with os.fdopen(file_descriptor, "wb") as run_file:
+            run_file.write(b"".join(self.__record_struct.pack(*record) for record in record_array))
+
+        return run_path
+
+    def read_run(self, run_path):
+        """Generator that yields the records of the sorted run at the passed path, reading a block at a time."""
+
+        block_size = self.__record_struct.size * self.RUN_READ_COUNT
+
+        with open(run_path, "rb") as run_file:
+            while True:
+                block = run_file.read(block_size)
+
+                if not block:
+                    return
+
+                yield from self.__record_struct.iter_unpack(block)
+
+    def sort(self, record_iterable):
+        """
+        Generator that yields the records of the passed iterable in sorted order. The whole iterable is read before the
+        first record is yielded. Records fitting in one chunk are sorted in memory without writing a run. The runs are
+        removed once the sorted records are read or the generator is closed.
+        """
+
+        record_array = []
+        run_path_array = []
+
+        try:
+            for record in record_iterable:
+                record_array.append(record)
+
+                if len(record_array) >= self.__chunk_size:
+                    run_path_array.append(self.write_run(record_array))
+                    record_array = []
+
+            if not run_path_array:
+                record_array.sort()
+                yield from record_array
+                return
+
+            if record_array:
+                run_path_array.append(self.write_run(record_array))
+                record_array = []
+
+            yield from heapq.merge(*[self.read_run(run_path) for run_path in run_path_array])
+        finally:
+            for run_path in run_path_array:
+                os.remove(run_path)
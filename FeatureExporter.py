@@ -0,0 +1,242 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an exporter of machine learning features for the game Xiangqi, streaming the positions of game
+#              archives as NumPy piece planes and labels into chunked .npy files on a process pool.
+
+
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy
+from numpy.lib.format import open_memmap
+
+from Board import Board
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+
+
+class FeatureExporter:
+    """
+    Represents an export of the positions of finished archived games. Every position a move was played from becomes
+    14 piece planes of 10 ranks by 9 files, plane c - 1 marking the squares of piece code c, ranks from rank 1 up, and
+    a label with the side to move, 0 for red and 1 for black, the move code played and the game result, 1 if red won,
+    0 for a draw and -1 if black won. Positions are kept as piece code arrays updated move by move and turned into
+    planes for a whole chunk at once. Games are split into chunks of about chunk_size positions, each written by a
+    worker process to chunk-<index>-planes.npy and chunk-<index>-labels.npy through memory mapped arrays.
+    """
+
+    PLANE_COUNT = 14
+    RANK_COUNT = 10
+    FILE_COUNT = 9
+    LABEL_DTYPE = numpy.dtype([("side", "u1"), ("move", "<u2"), ("result", "i1")])
+    RESULT_VALUE_DICT = {"RED_WON": 1, "DRAW": 0, "BLACK_WON": -1}
+
+    # positions turned into planes at a time while a chunk is written
+    WRITE_BLOCK_SIZE = 4096
+
+    # set once the class is defined
+    START_CODE_ARRAY = None
+
+    def __init__(self, output_dir, chunk_size=16384, workers=None, validate=True):
+        """
+        Initializes the export to the passed output_dir with about chunk_size positions per chunk, written by the
+        passed number of worker processes, all cores if None and the calling process if 1. If validate is True the
+        moves of every game are checked with make_move and an illegal move raises ValueError.
+        """
+
+        self.__output_dir = output_dir
+        self.__chunk_size = chunk_size
+        self.__workers = workers
+        self.__validate = validate
+
+    def get_output_dir(self):
+        """Getter for output_dir."""
+
+        return self.__output_dir
+
+    def get_chunk_size(self):
+        """Getter for chunk_size."""
+
+        return self.__chunk_size
+
+    @staticmethod
+    def get_chunk_path(output_dir, chunk_index, kind):
+        """Returns the path of the passed kind of file, 'planes' or 'labels', of the passed chunk."""
+
+        return os.path.join(output_dir, "chunk-%05d-%s.npy" % (chunk_index, kind))
+
+    @staticmethod
+    def encode_game_array(game_array, validate=True):
+        """
+        Returns a tuple of an (N, 90) array of the piece codes of every position a move was played from in the passed
+        array of (result, move_array) games, in square id order, and the array of their N labels.
+        """
+
+        position_count = sum(len(move_array) for _, move_array in game_array)
+        code_matrix = numpy.empty((position_count, PositionCodec.SQUARE_COUNT), dtype=numpy.uint8)
+        label_array = numpy.empty(position_count, dtype=FeatureExporter.LABEL_DTYPE)
+        row = 0
+
+        for result, move_array in game_array:
+            if validate:
+                for _ in GameArchive.replay(move_array):
+                    pass
+
+            code_array = bytearray(FeatureExporter.START_CODE_ARRAY)
+            result_value = FeatureExporter.RESULT_VALUE_DICT[result]
+
+            for ply, (start_pos, end_pos) in enumerate(move_array):
+                start_square = PositionCodec.encode_square(start_pos)
+                end_square = PositionCodec.encode_square(end_pos)
+
+                code_matrix[row] = numpy.frombuffer(code_array, dtype=numpy.uint8)
+                label_array[row] = (ply % 2, (start_square << 7) | end_square, result_value)
+                row += 1
+
+                code_array[end_square] = code_array[start_square]
+                code_array[start_square] = 0
+
+        return code_matrix, label_array
+
+    @staticmethod
+    def to_planes(code_matrix):
+        """Returns the (N, 14, 10, 9) piece planes of the passed (N, 90) array of piece codes."""
+
+        rank_file_matrix = code_matrix.reshape(-1, FeatureExporter.FILE_COUNT, FeatureExporter.RANK_COUNT)
+        rank_file_matrix = rank_file_matrix.transpose(0, 2, 1)
+        piece_code_array = numpy.arange(1, FeatureExporter.PLANE_COUNT + 1, dtype=numpy.uint8)
+
+        return (rank_file_matrix[:, None, :, :] == piece_code_array[None, :, None, None]).astype(numpy.uint8)
+
+    @staticmethod
+    def write_chunk(task):
+        """
+        Writes the chunk of the passed (output_dir, chunk_index, game_array, validate) task in a worker process and
+        returns a tuple of its number of games and positions.
+        """
+
+        output_dir, chunk_index, game_array, validate = task
+        code_matrix, label_array = FeatureExporter.encode_game_array(game_array, validate)
+        position_count = len(label_array)
+
+        plane_map = open_memmap(FeatureExporter.get_chunk_path(output_dir, chunk_index, "planes"), mode="w+",
+                                dtype=numpy.uint8, shape=(position_count, FeatureExporter.PLANE_COUNT,
+                                                          FeatureExporter.RANK_COUNT, FeatureExporter.FILE_COUNT))
+
+        for start in range(0, position_count, FeatureExporter.WRITE_BLOCK_SIZE):
+            stop = start + FeatureExporter.WRITE_BLOCK_SIZE
+            plane_map[start:stop] = FeatureExporter.to_planes(code_matrix[start:stop])
+
+        plane_map.flush()
+        del plane_map
+
+        numpy.save(FeatureExporter.get_chunk_path(output_dir, chunk_index, "labels"), label_array)
+
+        return len(game_array), position_count
+
+    def generate_tasks(self, archive_path_array):
+        """
+        Generator that yields a write_chunk task for every chunk of the finished games in the passed archives, reading
+        the archives as the tasks are taken.
+        """
+
+        chunk_index = 0
+        game_array = []
+        position_count = 0
+
+        for archive_path in archive_path_array:
+            for _, result, move_array in GameArchive(archive_path).read_games():
+                if result not in self.RESULT_VALUE_DICT or not move_array:
+                    continue
+
+                game_array.append((result, move_array))
+                position_count += len(move_array)
+
+                if position_count >= self.__chunk_size:
+                    yield self.__output_dir, chunk_index, game_array, self.__validate
+                    chunk_index += 1
+                    game_array = []
+                    position_count = 0
+
+        if game_array:
+            yield self.__output_dir, chunk_index, game_array, self.__validate
+
+    def run(self, archive_path_array):
+        """Exports the passed archives and returns the report dictionary with the throughput in positions per second."""
+
+        os.makedirs(self.__output_dir, exist_ok=True)
+        start_time = time.perf_counter()
+        game_count = 0
+        position_count = 0
+        chunk_count = 0
+        task_iterator = self.generate_tasks(archive_path_array)
+
+        if self.__workers == 1:
+            count_pair_array = [FeatureExporter.write_chunk(task) for task in task_iterator]
+        else:
+            count_pair_array = []
+            pending_set = set()
+
+            # keep the pool busy without reading the whole archive into memory
+            in_flight_limit = 2 * (self.__workers or os.cpu_count() or 1)
+
+            with ProcessPoolExecutor(self.__workers) as executor:
+                for task in task_iterator:
+                    if len(pending_set) >= in_flight_limit:
+                        done_set, pending_set = wait(pending_set, return_when=FIRST_COMPLETED)
+                        count_pair_array += [future.result() for future in done_set]
+
+                    pending_set.add(executor.submit(FeatureExporter.write_chunk, task))
+
+                count_pair_array += [future.result() for future in pending_set]
+
+        for chunk_game_count, chunk_position_count in count_pair_array:
+            game_count += chunk_game_count
+            position_count += chunk_position_count
+            chunk_count += 1
+
+        elapsed = time.perf_counter() - start_time
+
+        return {"games": game_count,
+                "positions": position_count,
+                "chunks": chunk_count,
+                "elapsed_s": elapsed,
+                "positions_per_second": position_count / elapsed if elapsed > 0 else 0.0}
+
+    @staticmethod
+    def load_chunks(output_dir):
+        """
+        Generator that yields a tuple of the planes and labels of every chunk in the passed output_dir, in chunk order.
+        The planes are memory mapped, so only the slices used are read.
+        """
+
+        for plane_path in sorted(glob.glob(os.path.join(output_dir, "chunk-*-planes.npy"))):
+            label_path = plane_path[:-len("planes.npy")] + "labels.npy"
+
+            yield numpy.load(plane_path, mmap_mode="r"), numpy.load(label_path)
+
+
+FeatureExporter.START_CODE_ARRAY = bytes(PositionCodec.encode_board(Board()))
+
+
+def main():
+    """Exports the features of game archives from the command line and prints the report."""
+
+    parser = argparse.ArgumentParser(description="Exports Xiangqi archive positions as NumPy feature planes.")
+    parser.add_argument("output_dir")
+    parser.add_argument("archives", nargs="+")
+    parser.add_argument("--chunk-size", type=int, default=16384, help="positions per chunk file")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--trusted", action="store_true", help="skip move validation while replaying archives")
+    args = parser.parse_args()
+
+    exporter = FeatureExporter(args.output_dir, args.chunk_size, args.workers, not args.trusted)
+    print(json.dumps(exporter.run(args.archives), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for FeatureExporter
+
+import os
+import shutil
+import tempfile
+import unittest
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+
+try:
+    import numpy
+    from FeatureExporter import FeatureExporter
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for FeatureExporter.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with a small archive."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        self.output_dir = os.path.join(self.directory, "features")
+
+        GameArchive(self.archive_path).write_games([
+            ("g1", "RED_WON", [("h3", "e3"), ("h10", "g8"), ("h1", "g3")]),
+            ("g2", "BLACK_WON", [("h3", "e3"), ("b10", "c8")]),
+            ("g3", "UNFINISHED", [("b3", "e3"), ("h10", "g8")]),
+            ("g4", "DRAW", [("h3", "h10"), ("i10", "h10")])])
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_planes(self):
+        """Tests the piece planes of the starting position."""
+
+        planes = FeatureExporter.to_planes(numpy.frombuffer(FeatureExporter.START_CODE_ARRAY, dtype=numpy.uint8))
+
+        self.assertEqual((1, 14, 10, 9), planes.shape)
+        self.assertEqual(32, planes.sum())
+
+        # red Chariots on a1 and i1, black Soldiers on rank 7, the black General on e10
+        self.assertEqual([1, 0, 0, 0, 0, 0, 0, 0, 1], list(planes[0, 4, 0]))
+        self.assertEqual([1, 0, 1, 0, 1, 0, 1, 0, 1], list(planes[0, 13, 6]))
+        self.assertEqual(1, planes[0, 7, 9, 4])
+        self.assertEqual(1, planes[0, 7].sum())
+
+    def test_export(self):
+        """Tests that finished games are exported with their labels and that unfinished games are skipped."""
+
+        report = FeatureExporter(self.output_dir, chunk_size=3, workers=1).run([self.archive_path])
+
+        self.assertEqual(3, report["games"])
+        self.assertEqual(7, report["positions"])
+        self.assertEqual(2, report["chunks"])
+
+        chunk_array = list(FeatureExporter.load_chunks(self.output_dir))
+        planes = numpy.concatenate([chunk_planes for chunk_planes, _ in chunk_array])
+        labels = numpy.concatenate([chunk_labels for _, chunk_labels in chunk_array])
+
+        self.assertEqual((7, 14, 10, 9), planes.shape)
+        self.assertEqual([0, 1, 0, 0, 1, 0, 1], list(labels["side"]))
+        self.assertEqual([1, 1, 1, -1, -1, 0, 0], list(labels["result"]))
+        self.assertEqual(PositionCodec.encode_move("h1", "g3"), labels["move"][2])
+
+        # after h3-e3 the red Cannon plane has e3 and b3 and the black Horse on h10 is still there
+        self.assertEqual(1, planes[1, 5, 2, 4])
+        self.assertEqual(0, planes[1, 5, 2, 7])
+        self.assertEqual(2, planes[1, 5].sum())
+        self.assertEqual(1, planes[1, 10, 9, 7])
+
+        # the last position of g4, after the red Cannon took the black Horse on h10
+        self.assertEqual(1, planes[6, 5, 9, 7])
+        self.assertEqual(0, planes[6, 10, 9, 7])
+        self.assertEqual(31, planes[6].sum())
+
+    def test_worker_pool(self):
+        """Tests that an export on a process pool writes the same files as an export in the calling process."""
+
+        pool_dir = os.path.join(self.directory, "pool")
+
+        FeatureExporter(self.output_dir, chunk_size=2, workers=1).run([self.archive_path])
+        FeatureExporter(pool_dir, chunk_size=2, workers=2, validate=False).run([self.archive_path])
+
+        self.assertEqual(sorted(os.listdir(self.output_dir)), sorted(os.listdir(pool_dir)))
+
+        for name in os.listdir(self.output_dir):
+            with open(os.path.join(self.output_dir, name), "rb") as one_file, \
+                    open(os.path.join(pool_dir, name), "rb") as other_file:
+                self.assertEqual(one_file.read(), other_file.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
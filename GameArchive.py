@@ -0,0 +1,103 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines reading, writing and replaying of text game archives for the game Xiangqi.
+
+
+from XiangqiGameWithImports import XiangqiGame
+
+
+class GameArchive:
+    """
+    Represents a text game archive. Each line holds one game as tab separated game_id, result and moves, where result is
+    'RED_WON', 'BLACK_WON', 'DRAW' or 'UNFINISHED' and moves are space separated start and end positions joined by a
+    dash, for example 'h3-e3 h10-g8'. Empty lines and lines starting with # are ignored.
+    """
+
+    RESULT_ARRAY = ["RED_WON", "BLACK_WON", "DRAW", "UNFINISHED"]
+
+    def __init__(self, path):
+        """Initializes the archive stored at the passed path."""
+
+        self.__path = path
+
+    def get_path(self):
+        """Getter for path."""
+
+        return self.__path
+
+    def read_games(self):
+        """Yields a tuple of game_id, result and an array of (start_pos, end_pos) moves for each game in the archive."""
+
+        with open(self.__path) as archive_file:
+            for line in archive_file:
+                line = line.strip()
+
+                if not line or line.startswith("#"):
+                    continue
+
+                yield self.parse_line(line)
+
+    def write_games(self, game_array):
+        """Writes the passed array of (game_id, result, move_array) tuples to the archive, replacing its contents."""
+
+        with open(self.__path, "w") as archive_file:
+            for game_id, result, move_array in game_array:
+                archive_file.write(self.format_line(game_id, result, move_array) + "\n")
+
+        return None
+
+    def append_game(self, game_id, result, move_array):
+        """Appends a game with the passed game_id, result and move_array to the archive."""
+
+        with open(self.__path, "a") as archive_file:
+            archive_file.write(self.format_line(game_id, result, move_array) + "\n")
+
+        return None
+
+    @staticmethod
+    def parse_line(line):
+        """Returns a tuple of game_id, result and move_array for the passed archive line."""
+
+        field_array = line.split("\t")
+
+        if len(field_array) < 2 or field_array[1] not in GameArchive.RESULT_ARRAY:
+            raise ValueError("invalid archive line: " + line)
+
+        move_array = []
+
+        if len(field_array) > 2:
+            for move in field_array[2].split():
+                start_pos, end_pos = move.split("-")
+                move_array.append((start_pos, end_pos))
+
+        return field_array[0], field_array[1], move_array
+
+    @staticmethod
+    def format_line(game_id, result, move_array):
+        """Returns the archive line for the passed game_id, result and move_array."""
+
+        return str(game_id) + "\t" + result + "\t" + " ".join(start + "-" + end for start, end in move_array)
+
+    @staticmethod
+    def replay(move_array, max_ply=None, validate=True):
+        """
+        Yields a tuple of the game, the ply and the move about to be played before each move of the passed move_array,
+        then plays the move. The same game object is yielded every time. If validate is True moves are played with
+        make_move and a ValueError is raised for an illegal move, otherwise they are applied to the board directly,
+        which is much faster for trusted archives.
+        """
+
+        game = XiangqiGame()
+
+        for ply, (start_pos, end_pos) in enumerate(move_array):
+            if max_ply is not None and ply >= max_ply:
+                return
+
+            yield game, ply, (start_pos, end_pos)
+
+            if validate:
+                if not game.make_move(start_pos, end_pos):
+                    raise ValueError("illegal archive move " + start_pos + "-" + end_pos + " at ply " + str(ply))
+            else:
+                game.move_piece(start_pos, end_pos)
+                game.switch_current_player()
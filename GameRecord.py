@@ -0,0 +1,405 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a compact binary game record format for the game Xiangqi, storing moves as 16 bit move codes or
+#              as entropy coded indices into the legal move list, and a converter from text game archives.
+
+
+import argparse
+import json
+import os
+import struct
+import time
+
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+
+
+class GameRecord:
+    """
+    Represents a binary game record file. The file is a header followed by one record per game, each prefixed with its
+    length as a varint so games can be skipped without decoding their moves. A record starts with a flag byte holding
+    the result index in GameArchive.RESULT_ARRAY, the move encoding and whether a start FEN and metadata follow, then
+    the number of moves, the game id, the optional start FEN and metadata key value pairs, and finally the moves.
+
+    With CODE_ENCODING every move is its 16 bit PositionCodec move code. With INDEX_ENCODING every move is its index in
+    the legal moves of its position sorted by move code, and the indices of a game are arithmetic coded as one mixed
+    radix integer, each index a digit in the base of the number of legal moves, which is optimal when every legal move
+    is equally likely. A forced move takes no space. The integer has a leading digit of 1 above the indices, so a
+    truncated or extended record leaves a different leading digit and is rejected. Encoding indices checks every move,
+    and decoding them replays the game to count the legal moves, so CODE_ENCODING is faster and INDEX_ENCODING about
+    three times smaller.
+    """
+
+    HEADER = struct.Struct(">4sI")
+    MAGIC = b"XQGR"
+    VERSION = 2
+
+    CODE_ENCODING = 0
+    INDEX_ENCODING = 1
+    ENCODING_DICT = {"codes": CODE_ENCODING, "indices": INDEX_ENCODING}
+
+    # flag byte bits above the two bits of the result index
+    INDEX_FLAG = 0x04
+    FEN_FLAG = 0x08
+    METADATA_FLAG = 0x10
+
+    # positions of the square ids and square ids of the positions, so moves are converted without searching
+    SQUARE_POS_ARRAY = [PositionCodec.decode_square(square) for square in range(PositionCodec.SQUARE_COUNT)]
+    POS_SQUARE_DICT = {a_pos: square for square, a_pos in enumerate(SQUARE_POS_ARRAY)}
+
+    def __init__(self, path):
+        """Initializes the record file stored at the passed path."""
+
+        self.__path = path
+
+    def get_path(self):
+        """Getter for path."""
+
+        return self.__path
+
+    @staticmethod
+    def encode_varint(value):
+        """
+        Returns the passed non negative integer as a varint, seven bits per byte from the lowest, with the high bit set
+        on every byte but the last.
+        """
+
+        data = bytearray()
+
+        while value > 0x7F:
+            data.append((value & 0x7F) | 0x80)
+            value >>= 7
+
+        data.append(value)
+
+        return bytes(data)
+
+    @staticmethod
+    def decode_varint(data, offset):
+        """Returns a tuple of the varint in the passed data at the passed offset and the offset after it."""
+
+        value = 0
+        shift = 0
+
+        while True:
+            if offset >= len(data):
+                raise ValueError("truncated game record")
+
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+            if byte < 0x80:
+                return value, offset
+
+    @staticmethod
+    def encode_text(text):
+        """Returns the passed string as its varint length followed by its UTF-8 bytes."""
+
+        data = text.encode("utf-8")
+
+        return GameRecord.encode_varint(len(data)) + data
+
+    @staticmethod
+    def decode_text(data, offset):
+        """Returns a tuple of the string in the passed data at the passed offset and the offset after it."""
+
+        length, offset = GameRecord.decode_varint(data, offset)
+
+        if offset + length > len(data):
+            raise ValueError("truncated game record")
+
+        return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+
+    @staticmethod
+    def get_start_game(fen):
+        """Returns a XiangqiGame set to the passed start FEN, or to the starting position if fen is None."""
+
+        if fen is None:
+            return XiangqiGame()
+
+        return PositionCodec.decode_fen(fen)
+
+    @staticmethod
+    def get_legal_code_array(game):
+        """Returns the sorted array of the move codes of the legal moves of the side to move in the passed game."""
+
+        return sorted((start_square << 7) | end_square
+                      for start_square, end_square in
+                      game.get_legal_square_move_array(game.get_current_player().get_color()))
+
+    @staticmethod
+    def encode_indices(code_array, fen=None):
+        """
+        Returns the passed move codes played from the passed start FEN as the bytes of their mixed radix integer of
+        legal move indices. Raises ValueError if a move is not legal.
+        """
+
+        game = GameRecord.get_start_game(fen)
+        index_array = []
+        radix_array = []
+
+        for ply, move_code in enumerate(code_array):
+            legal_code_array = GameRecord.get_legal_code_array(game)
+
+            try:
+                index_array.append(legal_code_array.index(move_code))
+            except ValueError:
+                start_pos, end_pos = PositionCodec.decode_move(move_code)
+                raise ValueError("illegal move " + start_pos + "-" + end_pos + " at ply " + str(ply))
+
+            radix_array.append(len(legal_code_array))
+
+            # the move is legal, so it is applied without checking it again
+            game.move_piece_square(move_code >> 7, move_code & 0x7F)
+            game.switch_current_player()
+
+        # the first index is the lowest digit and the leading 1 marks the end of the indices
+        value = 1
+
+        for index, radix in zip(reversed(index_array), reversed(radix_array)):
+            value = value * radix + index
+
+        return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+    @staticmethod
+    def decode_indices(data, move_count, fen=None):
+        """
+        Returns the array of move codes of the passed bytes of move_count legal move indices. See encode_indices. Raises
+        ValueError if the bytes are not exactly the encoding of move_count indices.
+        """
+
+        # encode_indices never writes a leading zero byte
+        if not data or data[0] == 0:
+            raise ValueError("corrupt game record")
+
+        game = GameRecord.get_start_game(fen)
+        value = int.from_bytes(data, "big")
+        code_array = []
+
+        for _ in range(move_count):
+            legal_code_array = GameRecord.get_legal_code_array(game)
+
+            if not legal_code_array:
+                raise ValueError("game record moves past the end of the game")
+
+            value, index = divmod(value, len(legal_code_array))
+            move_code = legal_code_array[index]
+            code_array.append(move_code)
+
+            game.move_piece_square(move_code >> 7, move_code & 0x7F)
+            game.switch_current_player()
+
+        if value != 1:
+            raise ValueError("corrupt game record")
+
+        return code_array
+
+    @staticmethod
+    def encode_game(game_id, result, move_array, encoding=INDEX_ENCODING, fen=None, metadata=None):
+        """
+        Returns the record bytes, without the length prefix, of the game with the passed game_id, result and array of
+        (start_pos, end_pos) moves played from the passed start FEN, or the starting position if None, with the passed
+        dictionary of metadata strings. Raises ValueError for an unknown result or position or, with INDEX_ENCODING,
+        an illegal move.
+        """
+
+        if result not in GameArchive.RESULT_ARRAY:
+            raise ValueError("invalid result: " + str(result))
+
+        flags = GameArchive.RESULT_ARRAY.index(result)
+        pos_square_dict = GameRecord.POS_SQUARE_DICT
+
+        try:
+            code_array = [(pos_square_dict[start_pos] << 7) | pos_square_dict[end_pos]
+                          for start_pos, end_pos in move_array]
+        except KeyError as error:
+            raise ValueError("invalid position: " + str(error.args[0]))
+
+        if encoding == GameRecord.INDEX_ENCODING:
+            flags |= GameRecord.INDEX_FLAG
+
+        if fen is not None:
+            flags |= GameRecord.FEN_FLAG
+
+        if metadata:
+            flags |= GameRecord.METADATA_FLAG
+
+        data = bytearray([flags])
+        data += GameRecord.encode_varint(len(code_array))
+        data += GameRecord.encode_text(str(game_id))
+
+        if fen is not None:
+            data += GameRecord.encode_text(fen)
+
+        if metadata:
+            data += GameRecord.encode_varint(len(metadata))
+
+            for key, value in metadata.items():
+                data += GameRecord.encode_text(str(key))
+                data += GameRecord.encode_text(str(value))
+
+        if encoding == GameRecord.INDEX_ENCODING:
+            data += GameRecord.encode_indices(code_array, fen)
+        else:
+            data += struct.pack(">%dH" % len(code_array), *code_array)
+
+        return bytes(data)
+
+    @staticmethod
+    def decode_game(data):
+        """
+        Returns a dictionary with game_id, result, moves, fen and metadata for the passed record bytes. fen is None for
+        a game played from the starting position and metadata is empty if none was stored.
+        """
+
+        if not data:
+            raise ValueError("truncated game record")
+
+        flags = data[0]
+        move_count, offset = GameRecord.decode_varint(data, 1)
+        game_id, offset = GameRecord.decode_text(data, offset)
+        fen = None
+        metadata = {}
+
+        if flags & GameRecord.FEN_FLAG:
+            fen, offset = GameRecord.decode_text(data, offset)
+
+        if flags & GameRecord.METADATA_FLAG:
+            pair_count, offset = GameRecord.decode_varint(data, offset)
+
+            for _ in range(pair_count):
+                key, offset = GameRecord.decode_text(data, offset)
+                metadata[key], offset = GameRecord.decode_text(data, offset)
+
+        if flags & GameRecord.INDEX_FLAG:
+            code_array = GameRecord.decode_indices(data[offset:], move_count, fen)
+        else:
+            if len(data) - offset != 2 * move_count:
+                raise ValueError("truncated game record")
+
+            code_array = struct.unpack_from(">%dH" % move_count, data, offset)
+
+        square_pos_array = GameRecord.SQUARE_POS_ARRAY
+
+        return {"game_id": game_id,
+                "result": GameArchive.RESULT_ARRAY[flags & 0x03],
+                "moves": [(square_pos_array[move_code >> 7], square_pos_array[move_code & 0x7F])
+                          for move_code in code_array],
+                "fen": fen,
+                "metadata": metadata}
+
+    def read_records(self):
+        """Yields the record dictionary of every game in the file, in file order. See decode_game."""
+
+        with open(self.__path, "rb") as record_file:
+            header = record_file.read(self.HEADER.size)
+
+            if len(header) != self.HEADER.size or self.HEADER.unpack(header) != (self.MAGIC, self.VERSION):
+                raise ValueError("not a game record file: " + self.__path)
+
+            data = record_file.read()
+
+        offset = 0
+
+        while offset < len(data):
+            length, offset = self.decode_varint(data, offset)
+
+            if offset + length > len(data):
+                raise ValueError("truncated game record")
+
+            yield self.decode_game(data[offset:offset + length])
+            offset += length
+
+    def read_games(self):
+        """
+        Yields a tuple of game_id, result and an array of (start_pos, end_pos) moves for each game in the file, like
+        GameArchive.read_games.
+        """
+
+        for record in self.read_records():
+            yield record["game_id"], record["result"], record["moves"]
+
+    def write_games(self, game_array, encoding=INDEX_ENCODING):
+        """
+        Writes the passed array of (game_id, result, move_array) tuples to the file with the passed encoding, replacing
+        its contents. Returns the number of bytes written.
+        """
+
+        with open(self.__path, "wb") as record_file:
+            record_file.write(self.HEADER.pack(self.MAGIC, self.VERSION))
+
+            for game_id, result, move_array in game_array:
+                self.write_record(record_file, self.encode_game(game_id, result, move_array, encoding))
+
+            return record_file.tell()
+
+    def append_game(self, game_id, result, move_array, encoding=INDEX_ENCODING, fen=None, metadata=None):
+        """Appends a game with the passed game_id, result, move_array, start FEN and metadata to the file."""
+
+        with open(self.__path, "ab") as record_file:
+            if record_file.tell() == 0:
+                record_file.write(self.HEADER.pack(self.MAGIC, self.VERSION))
+
+            self.write_record(record_file, self.encode_game(game_id, result, move_array, encoding, fen, metadata))
+
+        return None
+
+    @staticmethod
+    def write_record(record_file, record):
+        """Writes the passed record bytes to the passed file, prefixed with their length."""
+
+        record_file.write(GameRecord.encode_varint(len(record)))
+        record_file.write(record)
+
+        return None
+
+    @staticmethod
+    def convert(archive_path_array, record_path, encoding=INDEX_ENCODING):
+        """
+        Converts the passed text archives into one game record file at the passed record_path and returns the report
+        dictionary with the sizes of the archives and the record file and their ratio.
+        """
+
+        start_time = time.perf_counter()
+        game_count = 0
+
+        with open(record_path, "wb") as record_file:
+            record_file.write(GameRecord.HEADER.pack(GameRecord.MAGIC, GameRecord.VERSION))
+
+            for archive_path in archive_path_array:
+                for game_id, result, move_array in GameArchive(archive_path).read_games():
+                    GameRecord.write_record(record_file, GameRecord.encode_game(game_id, result, move_array, encoding))
+                    game_count += 1
+
+            record_size = record_file.tell()
+
+        archive_size = sum(os.path.getsize(archive_path) for archive_path in archive_path_array)
+        elapsed = time.perf_counter() - start_time
+
+        return {"games": game_count,
+                "archive_bytes": archive_size,
+                "record_bytes": record_size,
+                "ratio": archive_size / record_size,
+                "elapsed_s": elapsed,
+                "games_per_second": game_count / elapsed if elapsed > 0 else 0.0}
+
+
+def main():
+    """Converts text game archives into a game record file from the command line and prints the report."""
+
+    parser = argparse.ArgumentParser(description="Converts Xiangqi text archives into a compact binary record file.")
+    parser.add_argument("record")
+    parser.add_argument("archives", nargs="+")
+    parser.add_argument("--encoding", choices=sorted(GameRecord.ENCODING_DICT), default="indices",
+                        help="store moves as 16 bit codes or as entropy coded legal move indices")
+    args = parser.parse_args()
+
+    report = GameRecord.convert(args.archives, args.record, GameRecord.ENCODING_DICT[args.encoding])
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for GameRecord
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from GameRecord import GameRecord
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for GameRecord.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with an archive of random games."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        self.record_path = os.path.join(self.directory, "games.xqr")
+        a_random = random.Random(23)
+        self.game_array = []
+
+        for game_number in range(10):
+            game = XiangqiGame()
+            move_array = []
+
+            for _ in range(a_random.randint(0, 120)):
+                legal_move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+                if game.get_game_state() != "UNFINISHED" or not legal_move_array:
+                    break
+
+                move_array.append(a_random.choice(legal_move_array))
+                self.assertTrue(game.make_move(*move_array[-1]))
+
+            self.game_array.append(("g" + str(game_number), a_random.choice(GameArchive.RESULT_ARRAY), move_array))
+
+        GameArchive(self.archive_path).write_games(self.game_array)
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Tests that games written with either encoding are read back unchanged and that indices are smaller."""
+
+        size_array = []
+
+        for encoding in (GameRecord.CODE_ENCODING, GameRecord.INDEX_ENCODING):
+            record = GameRecord(self.record_path)
+            size_array.append(record.write_games(self.game_array, encoding))
+
+            self.assertEqual(self.game_array, list(record.read_games()))
+
+        self.assertLess(2 * size_array[1], size_array[0])
+
+    def test_fen_and_metadata(self):
+        """Tests games appended from a start FEN with metadata and the varints of their lengths."""
+
+        record = GameRecord(self.record_path)
+        fen = "3k5/4a4/9/9/9/9/9/9/2R6/4K4 w - - 0 1"
+        metadata = {"event": "Club match", "red": "Wang", "round": "3"}
+
+        record.append_game("e1", "RED_WON", [("c2", "c10")], GameRecord.INDEX_ENCODING, fen, metadata)
+        record.append_game("e2", "UNFINISHED", [("c2", "d2"), ("d10", "e10")], GameRecord.CODE_ENCODING, fen)
+        record.append_game("e3", "DRAW", [])
+
+        record_array = list(record.read_records())
+
+        self.assertEqual({"game_id": "e1", "result": "RED_WON", "moves": [("c2", "c10")], "fen": fen,
+                          "metadata": metadata}, record_array[0])
+        self.assertEqual(([("c2", "d2"), ("d10", "e10")], {}), (record_array[1]["moves"], record_array[1]["metadata"]))
+        self.assertEqual(("e3", None), (record_array[2]["game_id"], record_array[2]["fen"]))
+
+        for value in (0, 127, 128, 300, 2 ** 40):
+            self.assertEqual((value, len(GameRecord.encode_varint(value))),
+                             GameRecord.decode_varint(GameRecord.encode_varint(value), 0))
+
+    def test_convert(self):
+        """Tests that a converted archive is at least five times smaller with indices and reads back the same."""
+
+        report = GameRecord.convert([self.archive_path], self.record_path)
+
+        self.assertEqual(10, report["games"])
+        self.assertEqual(os.path.getsize(self.record_path), report["record_bytes"])
+        self.assertGreater(report["ratio"], 5)
+        self.assertEqual(self.game_array, list(GameRecord(self.record_path).read_games()))
+
+    def test_rejects_bad_input(self):
+        """Tests that illegal moves, unknown results, truncated or extended records and other files are rejected."""
+
+        self.assertRaises(ValueError, GameRecord.encode_game, "x", "RED_WON", [("h3", "h9")])
+        self.assertRaises(ValueError, GameRecord.encode_game, "x", "WON", [])
+        self.assertRaises(ValueError, GameRecord.decode_game,
+                          GameRecord.encode_game("x", "DRAW", [("h3", "e3")], GameRecord.CODE_ENCODING)[:-1])
+
+        # a truncated or extended index encoded record must not decode into other moves
+        game_id, result, move_array = max(self.game_array, key=lambda game: len(game[2]))
+        data = GameRecord.encode_game(game_id, result, move_array, GameRecord.INDEX_ENCODING)
+
+        for corrupt_data in (data[:-1], data + b"\x00", data + b"\x01"):
+            self.assertRaises(ValueError, GameRecord.decode_game, corrupt_data)
+
+        self.assertRaises(ValueError, GameRecord.decode_game,
+                          GameRecord.encode_game("x", "DRAW", [], GameRecord.INDEX_ENCODING) + b"\x00")
+
+        with self.assertRaises(ValueError):
+            list(GameRecord(self.archive_path).read_games())
+
+
+if __name__ == '__main__':
+    unittest.main()
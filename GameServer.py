@@ -0,0 +1,349 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an asyncio server that hosts many games of Xiangqi in one process. Clients connect over plain
+#              TCP and send one JSON request per line. Expensive game operations run in an executor so the event loop
+#              keeps serving other clients while a move is being checked for checkmate or stalemate. Games can be
+#              persisted with a MoveJournal and measured with a MetricsRegistry.
+
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from XiangqiGameWithImports import XiangqiGame
+from MetricsRegistry import MetricsRegistry
+
+
+class GameServer:
+    """
+    Represents a server hosting many concurrent games of Xiangqi. Each request is a JSON object on a single line with an
+    "op" key and an optional "id" key that is echoed back in the response. Supported ops are new_game, make_move,
+    is_in_check, get_game_state and close_game.
+    """
+
+    OP_ARRAY = ["new_game", "make_move", "is_in_check", "get_game_state", "close_game"]
+
+    def __init__(self, host="127.0.0.1", port=0, max_workers=None, journal=None, metrics=None):
+        """
+        Initializes the server with the passed host, port and max_workers. A port of 0 lets the operating system pick a
+        free port. max_workers limits the executor used for make_move and is_in_check. If a MoveJournal is passed,
+        games are recovered from it on start and every new game, accepted move and closed game is appended to it. If a
+        MetricsRegistry is passed, the latency of every request is recorded in it as request_<op>, including the wait
+        for the game lock.
+        """
+
+        self.__host = host
+        self.__port = port
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__server = None
+        self.__game_dict = {}
+        self.__lock_dict = {}
+        self.__shard_lock_dict = {}
+        self.__next_game_id = 1
+        self.__journal = journal
+        self.__metrics = metrics
+
+    def get_port(self):
+        """Returns the port the server is listening on. Returns the configured port if the server is not started."""
+
+        if self.__server is None:
+            return self.__port
+
+        return self.__server.sockets[0].getsockname()[1]
+
+    def get_game_count(self):
+        """Returns the number of games currently hosted."""
+
+        return len(self.__game_dict)
+
+    def get_game(self, game_id):
+        """Returns the XiangqiGame with the passed game_id. Returns None if the game does not exist."""
+
+        return self.__game_dict.get(game_id)
+
+    def add_game(self, game=None):
+        """Hosts the passed game, or a new XiangqiGame if no game is passed, and returns its game_id."""
+
+        if game is None:
+            game = XiangqiGame()
+
+        game_id = self.__next_game_id
+        self.__next_game_id += 1
+
+        self.__game_dict[game_id] = game
+        self.__lock_dict[game_id] = asyncio.Lock()
+
+        return game_id
+
+    def remove_game(self, game_id):
+        """Stops hosting the game with the passed game_id. Returns True if the game existed, False otherwise."""
+
+        if game_id not in self.__game_dict:
+            return False
+
+        del self.__game_dict[game_id]
+        del self.__lock_dict[game_id]
+
+        return True
+
+    async def start(self):
+        """Recovers games from the journal if there is one and starts listening for clients."""
+
+        if self.__journal is not None:
+            for game_id, game in self.__journal.recover().items():
+                self.__game_dict[game_id] = game
+                self.__lock_dict[game_id] = asyncio.Lock()
+                self.__next_game_id = max(self.__next_game_id, game_id + 1)
+
+        self.__server = await asyncio.start_server(self.handle_client, self.__host, self.__port)
+
+        return None
+
+    async def serve_forever(self):
+        """Starts the server if needed and serves clients until cancelled."""
+
+        if self.__server is None:
+            await self.start()
+
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self):
+        """Stops listening for clients and shuts down the executor."""
+
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+        self.__executor.shutdown(wait=False)
+
+        if self.__journal is not None:
+            self.__journal.close()
+
+        return None
+
+    async def handle_client(self, reader, writer):
+        """Reads requests from the passed reader until the client disconnects and writes a response to each."""
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                response = await self.handle_line(line)
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            writer.close()
+
+        return None
+
+    async def handle_line(self, line):
+        """Returns the response dictionary for the passed raw request line."""
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "invalid json"}
+
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be an object"}
+
+        start_time = time.perf_counter()
+
+        # a failing request is answered with an error instead of dropping the connection of the client
+        try:
+            response = await self.dispatch(request)
+        except Exception as error:
+            response = {"ok": False, "error": "internal error: " + type(error).__name__}
+
+        # unknown ops are not recorded so that clients cannot create metrics
+        if self.__metrics is not None and request.get("op") in self.OP_ARRAY:
+            self.__metrics.record("request_" + request["op"], time.perf_counter() - start_time)
+
+        if "id" in request:
+            response["id"] = request["id"]
+
+        return response
+
+    async def dispatch(self, request):
+        """Returns the response dictionary for the passed request dictionary."""
+
+        op = request.get("op")
+
+        if op == "new_game":
+            game_id = self.add_game()
+
+            if self.__journal is not None:
+                # a snapshot of the shard must not be written while the new game is only in the journal it replaces
+                async with self.get_shard_lock(self.__journal.get_shard(game_id)):
+                    await self.run_locked(game_id, self.__journal.append_new_game, game_id)
+
+            return {"ok": True, "game_id": game_id}
+
+        game_id = request.get("game_id")
+
+        # bool is a subclass of int but True is not a game id
+        if not isinstance(game_id, int) or isinstance(game_id, bool):
+            return {"ok": False, "error": "game_id must be an integer"}
+
+        if game_id not in self.__game_dict:
+            return {"ok": False, "error": "unknown game"}
+
+        game = self.__game_dict[game_id]
+
+        if op == "get_game_state":
+            return {"ok": True, "result": game.get_game_state()}
+
+        if op == "close_game":
+            async with self.__lock_dict[game_id]:
+                if self.__journal is not None:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(self.__executor, self.__journal.append_close_game, game_id)
+
+                return {"ok": self.remove_game(game_id)}
+
+        if op == "make_move":
+            start_pos = request.get("start")
+            end_pos = request.get("end")
+
+            if not isinstance(start_pos, str) or not isinstance(end_pos, str):
+                return {"ok": False, "error": "start and end must be positions"}
+
+            result, move_error = await self.run_locked(game_id, self.make_move, game_id, start_pos, end_pos)
+
+            if self.__journal is not None and self.__journal.needs_snapshot(self.__journal.get_shard(game_id)):
+                await self.write_snapshot(self.__journal.get_shard(game_id))
+
+            response = {"ok": True, "result": result, "game_state": game.get_game_state()}
+
+            if not result:
+                response["reason"] = move_error
+
+            return response
+
+        if op == "is_in_check":
+            color = request.get("color")
+
+            if color not in ("red", "black"):
+                return {"ok": False, "error": "color must be red or black"}
+
+            result = await self.run_locked(game_id, game.is_in_check, color)
+
+            return {"ok": True, "result": result}
+
+        return {"ok": False, "error": "unknown op"}
+
+    def make_move(self, game_id, start_pos, end_pos):
+        """
+        Makes the passed move in the game with the passed game_id and appends it to the journal if it was accepted.
+        Returns a tuple of the result of make_move and the reason the move was rejected, or None if it was accepted.
+        """
+
+        game = self.__game_dict.get(game_id)
+
+        # the game may have been closed while waiting for its lock
+        if game is None:
+            return False, "NO_GAME"
+
+        result = game.make_move(start_pos, end_pos)
+
+        if result and self.__journal is not None:
+            self.__journal.append_move(game_id, start_pos, end_pos)
+
+        return result, game.get_last_move_error()
+
+    async def write_snapshot(self, shard):
+        """
+        Writes a journal snapshot of the passed shard in the executor. The locks of all games in the shard are held
+        while the snapshot is written so that no move of the shard is in progress or appended, and the lock of the shard
+        is held so that no new game of the shard is appended.
+        """
+
+        loop = asyncio.get_running_loop()
+        journal = self.__journal
+        held_lock_dict = {}
+
+        async with self.get_shard_lock(shard):
+            try:
+                while True:
+                    game_id_array = [game_id for game_id in self.__game_dict if journal.get_shard(game_id) == shard]
+                    new_game_id_array = [game_id for game_id in game_id_array if game_id not in held_lock_dict]
+
+                    # games may be created while waiting for locks, so repeat until every game of the shard is locked
+                    if not new_game_id_array:
+                        break
+
+                    for game_id in new_game_id_array:
+                        if game_id in self.__lock_dict:
+                            lock = self.__lock_dict[game_id]
+                            await lock.acquire()
+                            held_lock_dict[game_id] = lock
+
+                if journal.needs_snapshot(shard):
+                    game_dict = {game_id: self.__game_dict[game_id] for game_id in game_id_array}
+                    await loop.run_in_executor(self.__executor, journal.write_snapshot, shard, game_dict)
+
+            finally:
+                for lock in held_lock_dict.values():
+                    lock.release()
+
+        return None
+
+    def get_shard_lock(self, shard):
+        """Returns the asyncio lock of the passed journal shard, creating it if needed."""
+
+        if shard not in self.__shard_lock_dict:
+            self.__shard_lock_dict[shard] = asyncio.Lock()
+
+        return self.__shard_lock_dict[shard]
+
+    async def run_locked(self, game_id, function, *args):
+        """
+        Runs the passed function with the passed args in the executor while holding the lock of the game with the passed
+        game_id, so that two requests never touch the same game at once. Returns the result of the function.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        async with self.__lock_dict[game_id]:
+            return await loop.run_in_executor(self.__executor, function, *args)
+
+
+def main():
+    """Runs a GameServer from the command line."""
+
+    parser = argparse.ArgumentParser(description="Hosts games of Xiangqi over line-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--metrics-port", type=int, default=None, help="serve Prometheus metrics on this port")
+    args = parser.parse_args()
+
+    metrics = None
+
+    if args.metrics_port is not None:
+        metrics = MetricsRegistry()
+        metrics.instrument()
+        metrics.start_http_server(args.metrics_port, args.host)
+
+    server = GameServer(args.host, args.port, args.workers, metrics=metrics)
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
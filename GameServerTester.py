@@ -0,0 +1,187 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for GameServer and LoadGenerator
+
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from GameServer import GameServer
+from LoadGenerator import LoadGenerator
+from MoveJournal import MoveJournal
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for GameServer.py"""
+
+    @staticmethod
+    async def send(reader, writer, request):
+        """Sends the passed request and returns the response dictionary."""
+
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+
+        return json.loads(await reader.readline())
+
+    def test_game_requests(self):
+        """Tests new_game, make_move, is_in_check, get_game_state and close_game over a connection."""
+
+        async def run():
+            server = GameServer()
+            await server.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.get_port())
+
+            response = await self.send(reader, writer, {"id": 7, "op": "new_game"})
+            self.assertTrue(response["ok"])
+            self.assertEqual(7, response["id"])
+            game_id = response["game_id"]
+
+            response = await self.send(reader, writer, {"op": "make_move", "game_id": game_id, "start": "c1",
+                                                        "end": "e3"})
+            self.assertEqual(True, response["result"])
+
+            response = await self.send(reader, writer, {"op": "make_move", "game_id": game_id, "start": "e7",
+                                                        "end": "e5"})
+            self.assertEqual(False, response["result"])
+            self.assertEqual("ILLEGAL_MOVE", response["reason"])
+
+            response = await self.send(reader, writer, {"op": "is_in_check", "game_id": game_id, "color": "black"})
+            self.assertEqual(False, response["result"])
+
+            response = await self.send(reader, writer, {"op": "get_game_state", "game_id": game_id})
+            self.assertEqual("UNFINISHED", response["result"])
+
+            response = await self.send(reader, writer, {"op": "close_game", "game_id": game_id})
+            self.assertTrue(response["ok"])
+            self.assertEqual(0, server.get_game_count())
+
+            writer.close()
+            await server.close()
+
+        asyncio.run(run())
+
+    def test_invalid_requests(self):
+        """Tests that malformed and unknown requests are answered with errors."""
+
+        async def run():
+            server = GameServer()
+
+            self.assertFalse((await server.handle_line(b"not json\n"))["ok"])
+            self.assertFalse((await server.handle_line(b"[1, 2]\n"))["ok"])
+            self.assertFalse((await server.dispatch({"op": "get_game_state", "game_id": 99}))["ok"])
+
+            game_id = server.add_game()
+
+            self.assertFalse((await server.dispatch({"op": "fly", "game_id": game_id}))["ok"])
+            self.assertFalse((await server.dispatch({"op": "is_in_check", "game_id": game_id, "color": "blue"}))["ok"])
+            self.assertFalse((await server.dispatch({"op": "make_move", "game_id": game_id, "start": 3}))["ok"])
+
+            # game ids that are not integers are rejected rather than used as keys
+            for bad_game_id in ([1], {"a": 1}, True, str(game_id)):
+                line = json.dumps({"op": "get_game_state", "game_id": bad_game_id, "id": 7}).encode()
+                self.assertEqual({"ok": False, "error": "game_id must be an integer", "id": 7},
+                                 await server.handle_line(line))
+
+            await server.close()
+
+        asyncio.run(run())
+
+    def test_failing_request(self):
+        """Tests that an exception while handling a request is answered with an error."""
+
+        class FailingServer(GameServer):
+            """Game server whose requests all fail."""
+
+            async def dispatch(self, request):
+                """Raises for every request."""
+
+                raise KeyError("boom")
+
+        async def run():
+            server = FailingServer()
+            response = await server.handle_line(b'{"op": "new_game", "id": 1}\n')
+
+            self.assertEqual({"ok": False, "error": "internal error: KeyError", "id": 1}, response)
+
+            await server.close()
+
+        asyncio.run(run())
+
+    def test_snapshot_off_event_loop(self):
+        """Tests that requests for another game are answered while a journal snapshot is being written."""
+
+        class SlowJournal(MoveJournal):
+            """Move journal whose snapshots take half a second."""
+
+            started = threading.Event()
+
+            def write_snapshot(self, shard, game_dict):
+                """Waits half a second before writing the snapshot."""
+
+                self.started.set()
+                time.sleep(0.5)
+
+                return super().write_snapshot(shard, game_dict)
+
+        directory = tempfile.mkdtemp()
+
+        async def run():
+            journal = SlowJournal(directory, shard_count=2, snapshot_interval=2)
+            server = GameServer(journal=journal)
+            await server.start()
+
+            first_id = (await server.handle_line(b'{"op": "new_game"}'))["game_id"]
+            second_id = (await server.handle_line(b'{"op": "new_game"}'))["game_id"]
+            move_task = asyncio.create_task(server.handle_line(json.dumps(
+                {"op": "make_move", "game_id": first_id, "start": "c1", "end": "e3"})))
+
+            while not journal.started.is_set():
+                await asyncio.sleep(0.01)
+
+            response = await server.handle_line(json.dumps({"op": "is_in_check", "game_id": second_id,
+                                                            "color": "red"}))
+
+            self.assertEqual(False, response["result"])
+            self.assertFalse(move_task.done())
+            self.assertEqual(True, (await move_task)["result"])
+            self.assertEqual([first_id, second_id], sorted(journal.recover()))
+
+            await server.close()
+
+        try:
+            asyncio.run(run())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_load_generator(self):
+        """Tests that the load generator plays its clients without errors and reports every op."""
+
+        async def run():
+            server = GameServer()
+            await server.start()
+
+            generator = LoadGenerator("127.0.0.1", server.get_port(), client_count=5, moves_per_client=2)
+            report = await generator.run()
+
+            self.assertEqual(0, report["errors"])
+            self.assertEqual(5 * (2 + 2 * 3), report["requests"])
+            self.assertEqual(10, report["ops"]["make_move"]["count"])
+            self.assertEqual(0, server.get_game_count())
+
+            await server.close()
+
+        asyncio.run(run())
+
+    def test_percentile(self):
+        """Tests nearest rank percentiles."""
+
+        self.assertEqual(0.0, LoadGenerator.percentile([], 99))
+        self.assertEqual(99, LoadGenerator.percentile(list(range(1, 101)), 99))
+        self.assertEqual(50, LoadGenerator.percentile(list(range(1, 101)), 50))
+
+
+if __name__ == '__main__':
+    unittest.main()
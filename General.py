@@ -9,9 +9,11 @@ from Piece import Piece
 class General(Piece):
     """Represents a general piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 0], [-1, 0], [0, 1], [0, -1]]
-
-        Piece.__init__(self, color, "G", possible_moves)
+        Piece.__init__(self, color, "G", self.POSSIBLE_MOVES)
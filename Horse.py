@@ -9,10 +9,12 @@ from Piece import Piece
 class Horse(Piece):
     """Represents a horse piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+    POSSIBLE_JUMPS = (((1, 0),), ((0, 1),), ((0, 1),), ((-1, 0),), ((-1, 0),), ((0, -1),), ((0, -1),), ((1, 0),))
+
     def __init__(self, color):
         """Initializes the piece with the passed color.."""
 
-        possible_moves = [[2, 1], [1, 2], [-1, 2], [-2, 1], [-2, -1], [-1, -2], [1, -2], [2, -1]]
-        possible_jumps = [[[1, 0]], [[0, 1]], [[0, 1]], [[-1, 0]], [[-1, 0]], [[0, -1]], [[0, -1]], [[1, 0]]]
-
-        Piece.__init__(self, color, "H", possible_moves, possible_jumps)
+        Piece.__init__(self, color, "H", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
@@ -0,0 +1,141 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a fixed bucket latency histogram with a bounded relative error, in the style of HDR histograms.
+
+
+import threading
+
+
+class LatencyHistogram:
+    """
+    Represents a histogram of latencies in whole microseconds. Values below 32 have one bucket each. Every larger power
+    of two range is split into 16 equal buckets, so a bucket is never wider than 1/16 of its values and a percentile is
+    off by at most about 6%. The buckets are fixed, which makes recording a few integer operations and lets histograms
+    be merged by adding counts.
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+    # values above about 19 hours are counted in the last bucket
+    MAX_SHIFT = 32
+    BUCKET_COUNT = (MAX_SHIFT + 2) * SUB_BUCKET_COUNT
+    MAX_VALUE = (2 * SUB_BUCKET_COUNT << MAX_SHIFT) - 1
+
+    def __init__(self):
+        """Initializes an empty histogram."""
+
+        self.__count_array = [0] * self.BUCKET_COUNT
+        self.__count = 0
+        self.__sum = 0.0
+        self.__max = 0.0
+        self.__lock = threading.Lock()
+
+    def get_count(self):
+        """Getter for count."""
+
+        return self.__count
+
+    def get_sum(self):
+        """Returns the sum of the recorded latencies in seconds."""
+
+        return self.__sum
+
+    def get_max(self):
+        """Returns the largest recorded latency in seconds."""
+
+        return self.__max
+
+    def get_count_array(self):
+        """Returns a copy of the count of every bucket."""
+
+        with self.__lock:
+            return list(self.__count_array)
+
+    @staticmethod
+    def get_index(value):
+        """Returns the bucket index of the passed value in microseconds."""
+
+        if value > LatencyHistogram.MAX_VALUE:
+            value = LatencyHistogram.MAX_VALUE
+
+        shift = value.bit_length() - LatencyHistogram.SUB_BUCKET_BITS - 1
+
+        if shift <= 0:
+            return value
+
+        return shift * LatencyHistogram.SUB_BUCKET_COUNT + (value >> shift)
+
+    @staticmethod
+    def get_upper_bound(index):
+        """Returns the largest value in microseconds of the bucket with the passed index."""
+
+        if index < 2 * LatencyHistogram.SUB_BUCKET_COUNT:
+            return index
+
+        shift = index // LatencyHistogram.SUB_BUCKET_COUNT - 1
+        sub_bucket = index - shift * LatencyHistogram.SUB_BUCKET_COUNT
+
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds):
+        """Adds the passed latency in seconds."""
+
+        index = self.get_index(int(seconds * 1000000))
+
+        with self.__lock:
+            self.__count_array[index] += 1
+            self.__count += 1
+            self.__sum += seconds
+
+            if seconds > self.__max:
+                self.__max = seconds
+
+        return None
+
+    def merge(self, other):
+        """Adds the counts of the passed histogram to this histogram."""
+
+        other_count_array = other.get_count_array()
+
+        with self.__lock:
+            for index in range(self.BUCKET_COUNT):
+                self.__count_array[index] += other_count_array[index]
+
+            self.__count += other.get_count()
+            self.__sum += other.get_sum()
+            self.__max = max(self.__max, other.get_max())
+
+        return None
+
+    def reset(self):
+        """Removes every recorded latency."""
+
+        with self.__lock:
+            self.__count_array = [0] * self.BUCKET_COUNT
+            self.__count = 0
+            self.__sum = 0.0
+            self.__max = 0.0
+
+        return None
+
+    def percentile(self, percent):
+        """
+        Returns the passed percent percentile in seconds using the nearest rank, as the upper bound of its bucket but no
+        more than the largest recorded latency. Returns 0.0 if nothing was recorded.
+        """
+
+        with self.__lock:
+            if self.__count == 0:
+                return 0.0
+
+            rank = max(1, -(-percent * self.__count // 100))
+            seen = 0
+
+            for index in range(self.BUCKET_COUNT):
+                seen += self.__count_array[index]
+
+                if seen >= rank:
+                    return min(self.get_upper_bound(index) / 1000000, self.__max)
+
+        return self.__max
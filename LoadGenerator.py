@@ -0,0 +1,144 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a load generator for GameServer. Simulates many concurrent clients that each play a game over
+#              the line-delimited JSON protocol and reports throughput and latency percentiles.
+
+
+import argparse
+import asyncio
+import json
+import time
+
+
+class LoadGenerator:
+    """Represents a load generator that drives many simulated clients against a running GameServer."""
+
+    # opening moves played by every simulated client, alternating red and black
+    OPENING_MOVE_ARRAY = [("h3", "e3"), ("h10", "g8"), ("h1", "g3"), ("i10", "h10"), ("i1", "h1"), ("b10", "c8")]
+
+    def __init__(self, host, port, client_count=1000, moves_per_client=4, connect_limit=200):
+        """
+        Initializes the load generator with the passed host and port of the server, the number of simulated clients,
+        the number of moves each client plays and the number of clients allowed to connect at the same time.
+        """
+
+        self.__host = host
+        self.__port = port
+        self.__client_count = client_count
+        self.__moves_per_client = min(moves_per_client, len(self.OPENING_MOVE_ARRAY))
+        self.__connect_semaphore = None
+        self.__connect_limit = connect_limit
+        self.__latency_dict = {}
+        self.__error_count = 0
+
+    def get_latency_dict(self):
+        """Getter for latency_dict. Maps each op to an array of request latencies in seconds."""
+
+        return self.__latency_dict
+
+    async def request(self, reader, writer, request):
+        """Sends the passed request, records its latency and returns the response dictionary."""
+
+        start_time = time.perf_counter()
+
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+
+        latency = time.perf_counter() - start_time
+        self.__latency_dict.setdefault(request["op"], []).append(latency)
+
+        response = json.loads(line)
+
+        if not response.get("ok"):
+            self.__error_count += 1
+
+        return response
+
+    async def run_client(self):
+        """Runs a single simulated client: creates a game, plays the opening moves and closes the game."""
+
+        async with self.__connect_semaphore:
+            reader, writer = await asyncio.open_connection(self.__host, self.__port)
+
+        try:
+            response = await self.request(reader, writer, {"op": "new_game"})
+            game_id = response["game_id"]
+
+            for start_pos, end_pos in self.OPENING_MOVE_ARRAY[:self.__moves_per_client]:
+                await self.request(reader, writer, {"op": "make_move", "game_id": game_id, "start": start_pos,
+                                                    "end": end_pos})
+                await self.request(reader, writer, {"op": "is_in_check", "game_id": game_id, "color": "red"})
+                await self.request(reader, writer, {"op": "get_game_state", "game_id": game_id})
+
+            await self.request(reader, writer, {"op": "close_game", "game_id": game_id})
+
+        finally:
+            writer.close()
+
+        return None
+
+    async def run(self):
+        """Runs all simulated clients concurrently and returns the report dictionary."""
+
+        self.__connect_semaphore = asyncio.Semaphore(self.__connect_limit)
+        self.__latency_dict = {}
+        self.__error_count = 0
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*[self.run_client() for _ in range(self.__client_count)])
+        elapsed = time.perf_counter() - start_time
+
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        """Returns a dictionary with throughput and latency percentiles for the passed elapsed run time in seconds."""
+
+        request_count = 0
+        op_dict = {}
+
+        for op, latency_array in self.__latency_dict.items():
+            request_count += len(latency_array)
+            op_dict[op] = {"count": len(latency_array),
+                           "p50_ms": self.percentile(latency_array, 50) * 1000,
+                           "p99_ms": self.percentile(latency_array, 99) * 1000}
+
+        all_latency_array = [latency for array in self.__latency_dict.values() for latency in array]
+
+        return {"clients": self.__client_count,
+                "requests": request_count,
+                "errors": self.__error_count,
+                "elapsed_s": elapsed,
+                "requests_per_s": request_count / elapsed if elapsed > 0 else 0.0,
+                "p99_ms": self.percentile(all_latency_array, 99) * 1000,
+                "ops": op_dict}
+
+    @staticmethod
+    def percentile(value_array, percent):
+        """Returns the passed percent percentile of the passed value_array using the nearest rank. Returns 0.0 if empty."""
+
+        if not value_array:
+            return 0.0
+
+        sorted_array = sorted(value_array)
+        rank = max(1, -(-percent * len(sorted_array) // 100))
+
+        return sorted_array[int(rank) - 1]
+
+
+def main():
+    """Runs a LoadGenerator from the command line and prints its report."""
+
+    parser = argparse.ArgumentParser(description="Drives simulated clients against a GameServer.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--moves", type=int, default=4)
+    args = parser.parse_args()
+
+    generator = LoadGenerator(args.host, args.port, args.clients, args.moves)
+    print(json.dumps(asyncio.run(generator.run()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a match runner that plays games between two engine configurations on a process pool and stops
+#              early once a sequential probability ratio test decides which configuration is stronger.
+
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from XiangqiGameWithImports import XiangqiGame
+from Engine import Engine
+from GameArchive import GameArchive
+from Sprt import Sprt
+
+
+class MatchRunner:
+    """
+    Represents a match between engine configuration A and engine configuration B. Each configuration is a dictionary of
+    keyword arguments for Engine. Every opening is played twice with the colors swapped so that the openings stay
+    balanced. Results are reported from the point of view of configuration A.
+
+    Engine is deterministic, so replaying an opening with the same colors replays the same game. Every pair of games
+    therefore continues its opening with random_plies random legal moves drawn from a generator seeded with seed and
+    the pair number, giving every pair its own start position while keeping matches reproducible. With no random plies
+    the match stops after one pass over the openings, since more games would only repeat results the SPRT has counted.
+    """
+
+    OPENING_ARRAY = [[("h3", "e3"), ("h10", "g8")],
+                     [("h3", "e3"), ("b8", "e8")],
+                     [("c1", "e3"), ("h8", "e8")],
+                     [("h1", "g3"), ("g7", "g6")],
+                     [("c4", "c5"), ("b10", "c8")],
+                     [("g4", "g5"), ("c7", "c6")],
+                     [("b3", "d3"), ("h10", "g8")],
+                     [("b1", "c3"), ("h8", "e8")]]
+
+    def __init__(self, config_a, config_b, opening_array=None, workers=None, max_games=1000, max_plies=200, elo0=0.0,
+                 elo1=10.0, alpha=0.05, beta=0.05, archive_path=None, random_plies=4, seed=0):
+        """
+        Initializes the match with the passed engine configurations, openings and number of worker processes. At most
+        max_games games are played, a game reaching max_plies is adjudicated a draw and the SPRT uses the passed Elo
+        hypotheses and error rates. Finished games are appended to the archive at archive_path if one is passed. Each
+        opening is followed by random_plies random moves chosen with the passed seed.
+        """
+
+        self.__config_a = config_a
+        self.__config_b = config_b
+
+        if opening_array is None:
+            opening_array = self.OPENING_ARRAY
+
+        self.__opening_array = opening_array
+        self.__workers = workers
+        self.__max_games = max_games
+        self.__max_plies = max_plies
+        self.__sprt = Sprt(elo0, elo1, alpha, beta)
+        self.__archive_path = archive_path
+        self.__random_plies = random_plies
+        self.__seed = seed
+
+    def get_sprt(self):
+        """Getter for sprt."""
+
+        return self.__sprt
+
+    def get_task(self, game_index):
+        """
+        Returns the play_game task of the game with the passed game_index. Both games of a pair, with the colors
+        swapped, get the same opening and random plies.
+        """
+
+        pair_index = game_index // 2
+        opening = self.__opening_array[pair_index % len(self.__opening_array)]
+        a_is_red = game_index % 2 == 0
+
+        return (self.__config_a, self.__config_b, opening, a_is_red, self.__max_plies, self.__random_plies,
+                self.__seed * 1000003 + pair_index)
+
+    def get_game_limit(self):
+        """
+        Returns the number of games the match plays at most. Without random plies only one pass over the openings
+        plays distinct games.
+        """
+
+        if self.__random_plies > 0:
+            return self.__max_games
+
+        return min(self.__max_games, 2 * len(self.__opening_array))
+
+    @staticmethod
+    def play_game(task):
+        """
+        Plays the game described by the passed (config_a, config_b, opening, a_is_red, max_plies, random_plies, seed)
+        task and returns a dictionary with the score of configuration A, the result and the moves. The opening is
+        followed by random_plies random legal moves chosen by a generator seeded with seed.
+        """
+
+        config_a, config_b, opening, a_is_red, max_plies, random_plies, seed = task
+
+        game = XiangqiGame()
+        engine_a = Engine(**config_a)
+        engine_b = Engine(**config_b)
+        move_array = []
+
+        for start_pos, end_pos in opening:
+            if not game.make_move(start_pos, end_pos):
+                raise ValueError("illegal opening move " + start_pos + "-" + end_pos)
+
+            move_array.append((start_pos, end_pos))
+
+        a_random = random.Random(seed)
+
+        for _ in range(random_plies):
+            legal_move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not legal_move_array or len(move_array) >= max_plies:
+                break
+
+            move = a_random.choice(legal_move_array)
+            game.make_move(move[0], move[1])
+            move_array.append(move)
+
+        while game.get_game_state() == "UNFINISHED" and len(move_array) < max_plies:
+            red_to_move = game.get_current_player().get_color() == "red"
+
+            if red_to_move == a_is_red:
+                move = engine_a.choose_move(game)
+            else:
+                move = engine_b.choose_move(game)
+
+            if move is None or not game.make_move(move[0], move[1]):
+                raise ValueError("engine returned no legal move in an unfinished game")
+
+            move_array.append(move)
+
+        game_state = game.get_game_state()
+
+        if game_state == "UNFINISHED":
+            result = "DRAW"
+            score = 0.5
+        else:
+            result = game_state
+            score = 1.0 if (game_state == "RED_WON") == a_is_red else 0.0
+
+        return {"score": score, "result": result, "moves": move_array, "a_is_red": a_is_red}
+
+    def run(self):
+        """
+        Plays the match until the SPRT decides or the game limit is reached and returns the report dictionary. See
+        get_game_limit.
+        """
+
+        sprt = self.__sprt
+        archive = None if self.__archive_path is None else GameArchive(self.__archive_path)
+        start_time = time.perf_counter()
+        game_index = 0
+        game_count = 0
+        game_limit = self.get_game_limit()
+        pending_set = set()
+
+        # keep the pool busy without queueing games that an early stop would waste
+        in_flight_limit = 2 * (self.__workers or os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(self.__workers) as executor:
+            while True:
+                while sprt.get_decision() is None and game_index < game_limit and \
+                        len(pending_set) < in_flight_limit:
+                    pending_set.add(executor.submit(MatchRunner.play_game, self.get_task(game_index)))
+                    game_index += 1
+
+                if not pending_set:
+                    break
+
+                done_set, pending_set = wait(pending_set, return_when=FIRST_COMPLETED)
+
+                for future in done_set:
+                    game_result = future.result()
+                    sprt.add_result(game_result["score"])
+                    game_count += 1
+
+                    if archive is not None:
+                        archive.append_game(game_count, game_result["result"], game_result["moves"])
+
+                if sprt.get_decision() is not None:
+                    for future in pending_set:
+                        future.cancel()
+
+                    break
+
+        return self.report(time.perf_counter() - start_time, game_count, game_count >= game_limit)
+
+    def report(self, elapsed, game_count, limit_reached=False):
+        """
+        Returns the report dictionary for the passed elapsed time in seconds and number of finished games. The match is
+        inconclusive if limit_reached is True and the SPRT has not decided.
+        """
+
+        sprt = self.__sprt
+        wins, draws, losses = sprt.get_counts()
+        lower_bound, upper_bound = sprt.get_bounds()
+
+        return {"games": game_count,
+                "wins": wins,
+                "draws": draws,
+                "losses": losses,
+                "score": sprt.get_score(),
+                "elo": sprt.get_elo(),
+                "llr": sprt.get_llr(),
+                "bounds": [lower_bound, upper_bound],
+                "decision": sprt.get_decision(),
+                "inconclusive": limit_reached and sprt.get_decision() is None,
+                "elapsed_s": elapsed,
+                "games_per_minute": 60 * game_count / elapsed if elapsed > 0 else 0.0}
+
+
+def main():
+    """Runs a match from the command line and prints its report."""
+
+    parser = argparse.ArgumentParser(description="Plays an SPRT match between two Xiangqi engine configurations.")
+    parser.add_argument("--config-a", default="{}", help="JSON keyword arguments for Engine")
+    parser.add_argument("--config-b", default="{}", help="JSON keyword arguments for Engine")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--max-plies", type=int, default=200)
+    parser.add_argument("--elo0", type=float, default=0.0)
+    parser.add_argument("--elo1", type=float, default=10.0)
+    parser.add_argument("--archive", default=None)
+    parser.add_argument("--random-plies", type=int, default=4, help="random moves played after each opening")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    runner = MatchRunner(json.loads(args.config_a), json.loads(args.config_b), workers=args.workers,
+                         max_games=args.games, max_plies=args.max_plies, elo0=args.elo0, elo1=args.elo1,
+                         archive_path=args.archive, random_plies=args.random_plies, seed=args.seed)
+    print(json.dumps(runner.run(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
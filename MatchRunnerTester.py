@@ -0,0 +1,131 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for Engine, Sprt and MatchRunner
+
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from Engine import Engine
+from MatchRunner import MatchRunner
+from Sprt import Sprt
+from General import General
+from Chariot import Chariot
+from Soldier import Soldier
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for Engine.py, Sprt.py and MatchRunner.py"""
+
+    def test_engine_finds_mate(self):
+        """Tests that the engine finds a mate in one and scores it as a mate."""
+
+        game = XiangqiGame()
+        board = game.get_board()
+        board.clear_board()
+
+        board.get_point_with_pos("e1").set_piece(General("red"))
+        board.get_point_with_pos("d10").set_piece(General("black"))
+        board.get_point_with_pos("a9").set_piece(Chariot("red"))
+        board.get_point_with_pos("h8").set_piece(Chariot("red"))
+
+        result = Engine(depth=2).search(game)
+
+        self.assertEqual(Engine.MATE_SCORE - 1, result["score"])
+        self.assertEqual(2, result["depth"])
+        self.assertGreater(result["nodes"], 1)
+
+        game.make_move(result["move"][0], result["move"][1])
+        self.assertEqual("RED_WON", game.get_game_state())
+
+    def test_engine_leaves_game_unchanged(self):
+        """Tests that searching does not change the board or the player to move."""
+
+        game = XiangqiGame()
+        before_array = [point.get_symbol() for point in game.get_board().get_point_array()]
+
+        Engine(depth=1).search(game)
+
+        self.assertEqual(before_array, [point.get_symbol() for point in game.get_board().get_point_array()])
+        self.assertEqual("red", game.get_current_player().get_color())
+
+    def test_engine_values(self):
+        """Tests evaluation with custom piece values and the crossed Soldier bonus."""
+
+        game = XiangqiGame()
+        board = game.get_board()
+        board.clear_board()
+
+        board.get_point_with_pos("e1").set_piece(General("red"))
+        board.get_point_with_pos("d10").set_piece(General("black"))
+        board.get_point_with_pos("a7").set_piece(Soldier("red"))
+
+        self.assertEqual(150 + 50, Engine(piece_value_dict={"S": 150}, crossed_soldier_bonus=50).evaluate(game))
+
+    def test_sprt(self):
+        """Tests the SPRT bounds, score and decisions."""
+
+        sprt = Sprt(0, 10, 0.05, 0.05)
+        self.assertAlmostEqual(-2.944, sprt.get_bounds()[0], places=3)
+        self.assertAlmostEqual(2.944, sprt.get_bounds()[1], places=3)
+        self.assertIsNone(sprt.get_decision())
+
+        for _ in range(300):
+            sprt.add_result(1)
+            sprt.add_result(0.5)
+            sprt.add_result(0)
+
+        self.assertEqual((300, 300, 300), sprt.get_counts())
+        self.assertEqual(0.5, sprt.get_score())
+        self.assertAlmostEqual(0.0, sprt.get_elo())
+        self.assertLess(sprt.get_llr(), 0)
+
+        for _ in range(100):
+            sprt.add_result(1)
+
+        self.assertEqual("H1", sprt.get_decision())
+
+    def test_play_game(self):
+        """Tests that a game is played from its opening and adjudicated a draw at the ply limit."""
+
+        task = ({"depth": 1}, {"depth": 1}, MatchRunner.OPENING_ARRAY[0], False, 3, 0, 0)
+        game_result = MatchRunner.play_game(task)
+
+        self.assertEqual(0.5, game_result["score"])
+        self.assertEqual("DRAW", game_result["result"])
+        self.assertEqual(3, len(game_result["moves"]))
+        self.assertEqual(MatchRunner.OPENING_ARRAY[0], game_result["moves"][:2])
+
+    def test_random_plies(self):
+        """Tests that both games of a pair share their random plies and that repeated openings differ."""
+
+        runner = MatchRunner({"depth": 1}, {"depth": 1}, max_plies=6)
+        opening_count = len(MatchRunner.OPENING_ARRAY)
+
+        def get_moves(game_index):
+            """Returns the moves of the passed game without the engine moves."""
+
+            return MatchRunner.play_game(runner.get_task(game_index))["moves"][:6]
+
+        self.assertEqual(get_moves(0), get_moves(1))
+        self.assertEqual(MatchRunner.OPENING_ARRAY[0], get_moves(0)[:2])
+        self.assertEqual(MatchRunner.OPENING_ARRAY[0], get_moves(2 * opening_count)[:2])
+        self.assertNotEqual(get_moves(0), get_moves(2 * opening_count))
+
+        # deterministic games only play one pass over the openings
+        self.assertEqual(1000, runner.get_game_limit())
+        self.assertEqual(2 * opening_count, MatchRunner({}, {}, random_plies=0).get_game_limit())
+
+    def test_run(self):
+        """Tests that a short match on the process pool reports every game."""
+
+        runner = MatchRunner({"depth": 1}, {"depth": 1}, workers=2, max_games=2, max_plies=3)
+        report = runner.run()
+
+        self.assertEqual(2, report["games"])
+        self.assertEqual(2, report["draws"])
+        self.assertIsNone(report["decision"])
+        self.assertTrue(report["inconclusive"])
+        self.assertGreater(report["games_per_minute"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
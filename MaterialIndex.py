@@ -0,0 +1,239 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a material index over game archives for the game Xiangqi, storing every position with its
+#              material signature grouped by signature, so positions and games matching a material pattern are streamed
+#              without decoding the others.
+
+
+import argparse
+import mmap
+import os
+import struct
+
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from ExternalSort import ExternalSort
+from PositionCodec import PositionCodec
+from MaterialSignature import MaterialSignature
+
+
+class MaterialIndex:
+    """
+    Represents a material index file. The file is a header, fixed size records sorted by material signature, game
+    number and ply, a directory with the first record and the record count of every signature, and the game ids of the
+    indexed games, one per line, in game number order. A record holds the signature, the game number, the ply and the
+    compact position bytes of PositionCodec.encode_game. A query matches the pattern against the directory once per
+    signature and reads only the records of the matching signatures.
+    """
+
+    HEADER = struct.Struct(">4sIIII")
+    RECORD = struct.Struct(">IIH" + str(PositionCodec.POSITION_SIZE) + "s")
+    DIRECTORY_ENTRY = struct.Struct(">III")
+    MAGIC = b"XQMI"
+    VERSION = 1
+
+    def __init__(self, path):
+        """Opens the index stored at the passed path for reading."""
+
+        self.__path = path
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_count, signature_count, game_count = self.HEADER.unpack_from(self.__map, 0)
+
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("not a material index: " + path)
+
+        self.__record_count = record_count
+        directory_offset = self.HEADER.size + record_count * self.RECORD.size
+        game_id_offset = directory_offset + signature_count * self.DIRECTORY_ENTRY.size
+        self.__directory_array = list(self.DIRECTORY_ENTRY.iter_unpack(self.__map[directory_offset:game_id_offset]))
+        self.__game_id_array = self.__map[game_id_offset:].decode("utf-8").split("\n")[:game_count]
+
+    def get_record_count(self):
+        """Getter for record_count."""
+
+        return self.__record_count
+
+    def get_directory_array(self):
+        """Getter for directory_array, an array of (signature, first record index, record count) tuples."""
+
+        return self.__directory_array
+
+    def get_game_id_array(self):
+        """Getter for game_id_array."""
+
+        return self.__game_id_array
+
+    def close(self):
+        """Closes the index."""
+
+        self.__map.close()
+        self.__file.close()
+
+        return None
+
+    def __enter__(self):
+        """Returns the index for use in a with statement."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the index at the end of a with statement."""
+
+        self.close()
+
+    def get_material_count_dict(self):
+        """Returns a dictionary mapping the material set of every indexed signature to its number of positions."""
+
+        return {MaterialSignature.to_material(signature): count for signature, _, count in self.__directory_array}
+
+    def find_entries(self, pattern):
+        """Returns the directory entries of the signatures matching the passed pattern. See MaterialSignature."""
+
+        parsed_pattern = MaterialSignature.parse_pattern(pattern)
+
+        return [entry for entry in self.__directory_array if MaterialSignature.matches(entry[0], parsed_pattern)]
+
+    def count(self, pattern):
+        """Returns the number of indexed positions matching the passed pattern."""
+
+        return sum(count for _, _, count in self.find_entries(pattern))
+
+    def generate_positions(self, pattern):
+        """
+        Generator that yields a tuple of game_id, ply and position bytes for every indexed position matching the passed
+        pattern, in signature, game number then ply order. PositionCodec.decode_game turns the bytes into a game.
+        """
+
+        record = self.RECORD
+        record_size = record.size
+        header_size = self.HEADER.size
+        game_id_array = self.__game_id_array
+
+        for _, first_index, count in self.find_entries(pattern):
+            start = header_size + first_index * record_size
+            block = self.__map[start:start + count * record_size]
+
+            for _, game_number, ply, position in record.iter_unpack(block):
+                yield game_id_array[game_number], ply, position
+
+    def find_games(self, pattern):
+        """Returns an array of the ids of the games reaching a position matching the passed pattern, in game order."""
+
+        game_number_set = set()
+        game_number_struct = struct.Struct(">I")
+        record_size = self.RECORD.size
+        header_size = self.HEADER.size
+
+        # only the game number of each record is read, which follows its 4 byte signature
+        for _, first_index, count in self.find_entries(pattern):
+            offset = header_size + first_index * record_size + 4
+
+            for _ in range(count):
+                game_number_set.add(game_number_struct.unpack_from(self.__map, offset)[0])
+                offset += record_size
+
+        return [self.__game_id_array[game_number] for game_number in sorted(game_number_set)]
+
+    @staticmethod
+    def generate_records(archive_path_array, game_id_array, validate=True):
+        """
+        Generator that yields a record tuple of signature, game number, ply and position bytes for every position of
+        every game in the passed archives, appending the id of each game to the passed game_id_array as its number is
+        used. The signature is updated move by move.
+        """
+
+        start_game = XiangqiGame()
+        start_signature = MaterialSignature.signature_of_game(start_game)
+        start_position = PositionCodec.encode_game(start_game)
+
+        for archive_path in archive_path_array:
+            for game_id, _, move_array in GameArchive(archive_path).read_games():
+                game_number = len(game_id_array)
+                game_id_array.append(game_id)
+                game = None
+                ply = -1
+                signature = start_signature
+
+                for game, ply, move in GameArchive.replay(move_array, None, validate):
+                    yield signature, game_number, ply, PositionCodec.encode_game(game)
+                    signature = MaterialSignature.get_child_signature(game, signature, move)
+
+                # replay plays the last move after yielding, so the game now holds the final position
+                if game is None:
+                    yield start_signature, game_number, 0, start_position
+                else:
+                    yield signature, game_number, ply + 1, PositionCodec.encode_game(game)
+
+    @staticmethod
+    def build(archive_path_array, index_path, chunk_size=1000000, validate=True, temp_dir=None):
+        """
+        Builds an index at the passed index_path from the passed archives with an ExternalSort. Records are sorted in
+        memory chunk_size at a time and runs are written to temp_dir, or next to the index by default. Returns the
+        number of records written.
+        """
+
+        if temp_dir is None:
+            temp_dir = os.path.dirname(os.path.abspath(index_path))
+
+        game_id_array = []
+        directory_array = []
+        record_count = 0
+        record_iterable = MaterialIndex.generate_records(archive_path_array, game_id_array, validate)
+
+        with open(index_path, "wb") as index_file:
+            # the counts are known once every record is sorted, so the header is written again at the end
+            index_file.write(MaterialIndex.HEADER.pack(MaterialIndex.MAGIC, MaterialIndex.VERSION, 0, 0, 0))
+
+            for record in ExternalSort(MaterialIndex.RECORD, chunk_size, temp_dir).sort(record_iterable):
+                index_file.write(MaterialIndex.RECORD.pack(*record))
+
+                if directory_array and directory_array[-1][0] == record[0]:
+                    directory_array[-1][2] += 1
+                else:
+                    directory_array.append([record[0], record_count, 1])
+
+                record_count += 1
+
+            for entry in directory_array:
+                index_file.write(MaterialIndex.DIRECTORY_ENTRY.pack(*entry))
+
+            index_file.write("\n".join(game_id_array).encode("utf-8"))
+            index_file.seek(0)
+            index_file.write(MaterialIndex.HEADER.pack(MaterialIndex.MAGIC, MaterialIndex.VERSION, record_count,
+                                                       len(directory_array), len(game_id_array)))
+
+        return record_count
+
+
+def main():
+    """Builds a material index, or queries one with a material pattern."""
+
+    parser = argparse.ArgumentParser(description="Builds or queries an index of the material of Xiangqi archives.")
+    parser.add_argument("index")
+    parser.add_argument("archives", nargs="*", help="archives to build the index from")
+    parser.add_argument("--pattern", default=None, help="material pattern to look up, for example 'R+C vs R+A+A'")
+    parser.add_argument("--games", action="store_true", help="print the matching games instead of the positions")
+    parser.add_argument("--chunk-size", type=int, default=1000000, help="records sorted in memory at a time")
+    parser.add_argument("--trusted", action="store_true", help="skip move validation while replaying archives")
+    args = parser.parse_args()
+
+    if args.archives:
+        record_count = MaterialIndex.build(args.archives, args.index, args.chunk_size, not args.trusted)
+        print("wrote " + str(record_count) + " records to " + args.index)
+
+    if args.pattern is not None:
+        with MaterialIndex(args.index) as material_index:
+            if args.games:
+                for game_id in material_index.find_games(args.pattern):
+                    print(game_id)
+            else:
+                for game_id, ply, position in material_index.generate_positions(args.pattern):
+                    print(game_id + "\tply " + str(ply) + "\t" +
+                          PositionCodec.encode_fen(PositionCodec.decode_game(position)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for MaterialSignature, MaterialIndex and ExternalSort
+
+import os
+import random
+import shutil
+import struct
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+from MaterialSignature import MaterialSignature
+from MaterialIndex import MaterialIndex
+from ExternalSort import ExternalSort
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for MaterialSignature.py, MaterialIndex.py and ExternalSort.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with a small archive."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        self.index_path = os.path.join(self.directory, "material.idx")
+
+        # g1 trades both Cannons for Horses, in g2 each side takes a Horse with a Cannon
+        GameArchive(self.archive_path).write_games([
+            ("g1", "UNFINISHED", [("h3", "h10"), ("i10", "h10"), ("b3", "b10"), ("a10", "b10")]),
+            ("g2", "UNFINISHED", [("h3", "h10"), ("b8", "b1")]),
+            ("g3", "UNFINISHED", [])])
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_signature(self):
+        """Tests signatures, their incremental updates and material patterns."""
+
+        game = PositionCodec.decode_fen("3ak4/4a4/9/9/9/9/9/9/4r4/2C1K1R2 w - - 0 1")
+        signature = MaterialSignature.signature_of_game(game)
+
+        self.assertEqual("GRC-GAAR", MaterialSignature.to_material(signature))
+        self.assertEqual(2, MaterialSignature.get_count(signature, "black", "A"))
+        self.assertEqual(0, MaterialSignature.get_count(signature, "red", "S"))
+
+        for pattern in ("R+C vs R+A+A", "GRC-GRAA", "cr vs aar", "R* vs *", "* - R*"):
+            self.assertTrue(MaterialSignature.matches(signature, MaterialSignature.parse_pattern(pattern)), pattern)
+
+        for pattern in ("R vs R+A+A", "R+C vs R+A", "R+C+C* vs *"):
+            self.assertFalse(MaterialSignature.matches(signature, MaterialSignature.parse_pattern(pattern)), pattern)
+
+        self.assertRaises(ValueError, MaterialSignature.parse_pattern, "R+C")
+        self.assertRaises(ValueError, MaterialSignature.parse_pattern, "R+X vs R")
+
+        # the signature kept move by move is the signature counted from scratch
+        game = XiangqiGame()
+        signature = MaterialSignature.signature_of_game(game)
+        a_random = random.Random(13)
+
+        for _ in range(120):
+            move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not move_array:
+                break
+
+            move = a_random.choice(move_array)
+            signature = MaterialSignature.get_child_signature(game, signature, move)
+            self.assertTrue(game.make_move(*move))
+            self.assertEqual(MaterialSignature.signature_of_game(game), signature)
+
+    def test_index(self):
+        """Tests the positions and games found for material patterns."""
+
+        self.assertEqual(9, MaterialIndex.build([self.archive_path], self.index_path))
+
+        with MaterialIndex(self.index_path) as material_index:
+            self.assertEqual(9, material_index.count("* vs *"))
+            self.assertEqual({"GAAEEHHRRCCSSSSS-GAAEEHHRRCCSSSSS": 3, "GAAEEHHRRCCSSSSS-GAAEEHRRCCSSSSS": 2,
+                              "GAAEEHHRRCSSSSS-GAAEEHRRCCSSSSS": 1, "GAAEEHHRRCSSSSS-GAAEERRCCSSSSS": 1,
+                              "GAAEEHHRRSSSSS-GAAEERRCCSSSSS": 1, "GAAEEHRRCCSSSSS-GAAEEHRRCCSSSSS": 1},
+                             material_index.get_material_count_dict())
+
+            self.assertEqual(["g1", "g2", "g3"], material_index.find_games("* vs R+R+C+C*"))
+            self.assertEqual(["g1"], material_index.find_games("AAEEHHRRSSSSS vs AAEERRCCSSSSS"))
+            self.assertEqual(["g2"], material_index.find_games("AAEEHRRCCSSSSS-*"))
+            self.assertEqual([], material_index.find_games("R+C vs R+A+A"))
+
+            position_array = list(material_index.generate_positions("AAEEHRRCCSSSSS-*"))
+            self.assertEqual(1, len(position_array))
+            self.assertEqual(("g2", 2), position_array[0][:2])
+
+            game = PositionCodec.decode_game(position_array[0][2])
+            self.assertEqual("black", game.get_board().get_point_with_pos("b1").get_piece().get_color())
+            self.assertEqual("red", game.get_current_player().get_color())
+
+    def test_external_sort(self):
+        """Tests that records sorted through many runs are in order and that the runs are removed."""
+
+        record_struct = struct.Struct(">IH")
+        a_random = random.Random(17)
+        record_array = [(a_random.getrandbits(32), a_random.getrandbits(16)) for _ in range(1000)]
+
+        self.assertEqual(sorted(record_array),
+                         list(ExternalSort(record_struct, 64, self.directory).sort(iter(record_array))))
+        self.assertEqual(sorted(record_array), list(ExternalSort(record_struct).sort(record_array)))
+        self.assertEqual(["games.txt"], os.listdir(self.directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
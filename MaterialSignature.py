@@ -0,0 +1,178 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines material signatures of positions in the game Xiangqi, the number of pieces of each kind and color
+#              packed into one integer, and patterns matching them such as 'R+C vs R+A+A'.
+
+
+from PositionCodec import PositionCodec
+
+
+class MaterialSignature:
+    """
+    Packs the material of a position into a 28 bit integer. Every piece kind of every color has a field holding its
+    count, one bit for the General, three bits for the Soldiers and two bits for the others, red in the low 14 bits and
+    black in the high 14 bits. A capture subtracts the unit of the captured piece, so the signature is kept up to date
+    move by move with get_child_signature, the way Zobrist.get_child_hash_pair keeps the Zobrist hash pair.
+
+    A pattern names the pieces of red and of black other than the General, separated by 'vs' or a dash, for example
+    'R+C vs R+A+A' or 'RC-RAA', with an optional General as in Tablebase material sets. A side ending in '*' matches
+    those pieces and possibly more, and a side that is only '*' matches any material.
+    """
+
+    # piece symbols in the order of PositionCodec.PIECE_SYMBOL_ARRAY, so fields follow piece codes
+    SYMBOL_ORDER = "GAEHRCS"
+    FIELD_WIDTH_ARRAY = [1, 2, 2, 2, 2, 2, 3]
+    SIDE_WIDTH = 14
+    COLOR_ARRAY = ["red", "black"]
+
+    # set from FIELD_WIDTH_ARRAY once the class is defined
+    SHIFT_ARRAY = None
+    PIECE_UNIT_ARRAY = None
+
+    @staticmethod
+    def build_units():
+        """
+        Returns a tuple of the shift array, indexed by color index then symbol index, and the unit added to a signature
+        by one piece, indexed by piece code.
+        """
+
+        shift_array = []
+
+        for color_index in range(len(MaterialSignature.COLOR_ARRAY)):
+            shift = color_index * MaterialSignature.SIDE_WIDTH
+            color_shift_array = []
+
+            for width in MaterialSignature.FIELD_WIDTH_ARRAY:
+                color_shift_array.append(shift)
+                shift += width
+
+            shift_array.append(color_shift_array)
+
+        piece_unit_array = [0] + [1 << shift for color_shift_array in shift_array for shift in color_shift_array]
+
+        return shift_array, piece_unit_array
+
+    @staticmethod
+    def signature_of_board(board):
+        """Returns the signature of the pieces on the passed board."""
+
+        piece_unit_array = MaterialSignature.PIECE_UNIT_ARRAY
+        signature = 0
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None:
+                signature += piece_unit_array[PositionCodec.encode_piece(piece)]
+
+        return signature
+
+    @staticmethod
+    def signature_of_game(game):
+        """Returns the signature of the current position of the passed game."""
+
+        return MaterialSignature.signature_of_board(game.get_board())
+
+    @staticmethod
+    def get_child_signature(game, signature, move):
+        """Returns the signature of the position reached by the passed move from the passed game with signature."""
+
+        captured_piece = game.get_board().get_point_with_pos(move[1]).get_piece()
+
+        if captured_piece is None:
+            return signature
+
+        return signature - MaterialSignature.PIECE_UNIT_ARRAY[PositionCodec.encode_piece(captured_piece)]
+
+    @staticmethod
+    def get_count(signature, color, symbol):
+        """Returns the number of pieces with the passed color and symbol in the passed signature."""
+
+        color_index = MaterialSignature.COLOR_ARRAY.index(color)
+        symbol_index = MaterialSignature.SYMBOL_ORDER.index(symbol)
+        shift = MaterialSignature.SHIFT_ARRAY[color_index][symbol_index]
+
+        return (signature >> shift) & ((1 << MaterialSignature.FIELD_WIDTH_ARRAY[symbol_index]) - 1)
+
+    @staticmethod
+    def get_count_array(signature):
+        """Returns an array of the piece counts of the passed signature, red then black, in SYMBOL_ORDER."""
+
+        count_array = []
+
+        for color_shift_array in MaterialSignature.SHIFT_ARRAY:
+            for shift, width in zip(color_shift_array, MaterialSignature.FIELD_WIDTH_ARRAY):
+                count_array.append((signature >> shift) & ((1 << width) - 1))
+
+        return count_array
+
+    @staticmethod
+    def to_material(signature):
+        """Returns the passed signature as a Tablebase material set, for example 'GRC-GRAA'."""
+
+        count_array = MaterialSignature.get_count_array(signature)
+        symbol_count = len(MaterialSignature.SYMBOL_ORDER)
+        side_array = []
+
+        for color_index in range(len(MaterialSignature.COLOR_ARRAY)):
+            side_count_array = count_array[color_index * symbol_count:(color_index + 1) * symbol_count]
+            side_array.append("".join(symbol * count for symbol, count in zip(MaterialSignature.SYMBOL_ORDER,
+                                                                             side_count_array)))
+
+        return side_array[0] + "-" + side_array[1]
+
+    @staticmethod
+    def parse_pattern(pattern):
+        """
+        Returns the passed pattern as an array of a (count_array, exact) tuple for red and for black, where count_array
+        holds the count of every symbol but the General in SYMBOL_ORDER. Raises ValueError for a malformed pattern.
+        """
+
+        if " vs " in pattern.lower():
+            side_array = pattern.lower().split(" vs ")
+        else:
+            side_array = pattern.split("-")
+
+        if len(side_array) != 2:
+            raise ValueError("pattern must be red pieces and black pieces separated by 'vs' or a dash: " + pattern)
+
+        parsed_array = []
+
+        for side in side_array:
+            side = side.replace("+", "").replace(" ", "").upper()
+            exact = not side.endswith("*")
+            side = side.rstrip("*")
+            count_array = [0] * (len(MaterialSignature.SYMBOL_ORDER) - 1)
+
+            for symbol in side:
+                if symbol not in MaterialSignature.SYMBOL_ORDER:
+                    raise ValueError("unknown piece symbol " + symbol + " in pattern: " + pattern)
+
+                if symbol != "G":
+                    count_array[MaterialSignature.SYMBOL_ORDER.index(symbol) - 1] += 1
+
+            parsed_array.append((count_array, exact))
+
+        return parsed_array
+
+    @staticmethod
+    def matches(signature, parsed_pattern):
+        """Returns True if the passed signature matches the passed pattern, as returned by parse_pattern."""
+
+        count_array = MaterialSignature.get_count_array(signature)
+        symbol_count = len(MaterialSignature.SYMBOL_ORDER)
+
+        for color_index, (pattern_count_array, exact) in enumerate(parsed_pattern):
+            # the General is not part of a pattern
+            side_count_array = count_array[color_index * symbol_count + 1:(color_index + 1) * symbol_count]
+
+            if exact:
+                if side_count_array != pattern_count_array:
+                    return False
+            elif any(count < pattern_count for count, pattern_count in zip(side_count_array, pattern_count_array)):
+                return False
+
+        return True
+
+
+MaterialSignature.SHIFT_ARRAY, MaterialSignature.PIECE_UNIT_ARRAY = MaterialSignature.build_units()
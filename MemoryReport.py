@@ -0,0 +1,108 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a memory report for live games of Xiangqi, measuring the bytes every game holds with tracemalloc
+#              and the size of the objects a game is built from.
+
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from XiangqiGameWithImports import XiangqiGame
+from Board import Board
+from Point import Point
+from Player import Player
+from Chariot import Chariot
+
+
+class MemoryReport:
+    """
+    Represents a memory report. Pieces are shared flyweights and Point, Piece and Player use __slots__, so a game holds
+    its 90 points, its board and its players and nothing else. The report measures the bytes a live game allocates,
+    which is the number that limits how many games a server can host. The bytes per game before pieces were shared
+    are kept in BASELINE_BYTES_PER_GAME so every report compares the current layout with the old one.
+    """
+
+    # bytes per live game of the layout with a new piece, move lists and dict per object, measured by
+    # measure_game_bytes with 200 games on Python 3.11 before pieces were made flyweights
+    BASELINE_BYTES_PER_GAME = 188478
+
+    def __init__(self, game_count=200):
+        """Initializes the report with the passed number of games to create."""
+
+        self.__game_count = game_count
+
+    def get_game_count(self):
+        """Getter for game_count."""
+
+        return self.__game_count
+
+    def measure_game_bytes(self):
+        """Returns the mean bytes allocated by a live game, measured over game_count games with tracemalloc."""
+
+        # the first game builds the shared pieces and board layout, which later games do not allocate
+        XiangqiGame()
+        gc.collect()
+
+        was_tracing = tracemalloc.is_tracing()
+
+        if not was_tracing:
+            tracemalloc.start()
+
+        before = tracemalloc.get_traced_memory()[0]
+        game_array = [XiangqiGame() for _ in range(self.__game_count)]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+
+        if not was_tracing:
+            tracemalloc.stop()
+
+        del game_array
+
+        return (after - before) / self.__game_count
+
+    @staticmethod
+    def get_object_size_dict():
+        """Returns a dictionary of the shallow size in bytes of one object of every class a game is built from."""
+
+        return {"XiangqiGame": sys.getsizeof(XiangqiGame()),
+                "Board": sys.getsizeof(Board()),
+                "Point": sys.getsizeof(Point("a", "1")),
+                "Player": sys.getsizeof(Player("red")),
+                "Piece": sys.getsizeof(Chariot("red"))}
+
+    def run(self):
+        """
+        Returns the result dictionary with the bytes per game, the baseline bytes per game, the baseline divided by the
+        current bytes and the size of every object.
+        """
+
+        bytes_per_game = self.measure_game_bytes()
+
+        return {"games": self.__game_count,
+                "bytes_per_game": bytes_per_game,
+                "baseline_bytes_per_game": self.BASELINE_BYTES_PER_GAME,
+                "reduction": self.BASELINE_BYTES_PER_GAME / bytes_per_game if bytes_per_game > 0 else 0.0,
+                "objects": self.get_object_size_dict()}
+
+
+def main():
+    """Prints the memory report."""
+
+    parser = argparse.ArgumentParser(description="Reports the memory held by live XiangqiGame objects.")
+    parser.add_argument("--games", type=int, default=200, help="number of games to create")
+    args = parser.parse_args()
+
+    result = MemoryReport(args.games).run()
+
+    print("{:<16} {:>10.0f} bytes".format("per game", result["bytes_per_game"]))
+    print("{:<16} {:>10.0f} bytes".format("baseline", result["baseline_bytes_per_game"]))
+    print("{:<16} {:>10.1f} x".format("reduction", result["reduction"]))
+
+    for name, size in result["objects"].items():
+        print("{:<16} {:>10} bytes".format(name, size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for MemoryReport, flyweight pieces and __slots__
+
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from Board import Board
+from Point import Point
+from Player import Player
+from Chariot import Chariot
+from Cannon import Cannon
+from Horse import Horse
+from MemoryReport import MemoryReport
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for MemoryReport.py"""
+
+    def test_flyweight_pieces(self):
+        """Tests that pieces of the same class and color are one shared object on every board."""
+
+        self.assertIs(Chariot("red"), Chariot("red"))
+        self.assertIsNot(Chariot("red"), Chariot("black"))
+        self.assertIsNot(Chariot("red"), Cannon("red"))
+        self.assertEqual("black", Chariot("black").get_color())
+        self.assertEqual(36, len(Cannon("red").get_possible_moves()))
+        self.assertEqual(((1, 0), (2, 0)), Chariot("red").get_possible_jumps()[2])
+
+        board_one = Board()
+        board_two = Board()
+
+        self.assertIs(board_one.get_point("b", "1").get_piece(), board_two.get_point("h", "1").get_piece())
+        self.assertIs(Horse("red"), board_one.get_point("b", "1").get_piece())
+        self.assertIs(board_one.get_file_array(), board_two.get_file_array())
+        self.assertIsNot(board_one.get_point_array(), board_two.get_point_array())
+
+        # moving a piece on one game does not change another game
+        game_one = XiangqiGame()
+        game_two = XiangqiGame()
+        self.assertTrue(game_one.make_move("h3", "e3"))
+        self.assertEqual("C", game_two.get_board().get_point_with_pos("h3").get_symbol())
+        self.assertIsNone(game_one.get_board().get_point_with_pos("h3").get_piece())
+
+    def test_slots(self):
+        """Tests that points, pieces, players and boards have no instance dictionary."""
+
+        for an_object in (Point("a", "1"), Chariot("red"), Player("red"), Board()):
+            self.assertFalse(hasattr(an_object, "__dict__"))
+
+    def test_report(self):
+        """Tests that a live game stays well below the 180 KB it held before pieces were shared."""
+
+        result = MemoryReport(50).run()
+
+        self.assertEqual(50, result["games"])
+        self.assertLess(result["bytes_per_game"], 20000)
+        self.assertEqual(MemoryReport.BASELINE_BYTES_PER_GAME, result["baseline_bytes_per_game"])
+        self.assertAlmostEqual(result["baseline_bytes_per_game"] / result["bytes_per_game"], result["reduction"])
+        self.assertGreater(result["reduction"], 9)
+        self.assertEqual({"XiangqiGame", "Board", "Point", "Player", "Piece"}, set(result["objects"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,258 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a registry of operation latency histograms for a process hosting games of Xiangqi, with export in
+#              the Prometheus text format to a file or a local HTTP endpoint.
+
+
+import argparse
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from XiangqiGameWithImports import XiangqiGame
+from LatencyHistogram import LatencyHistogram
+
+
+class MetricsRegistry:
+    """
+    Represents the latency metrics of one process. Every operation name has a LatencyHistogram that all games and
+    threads record into. instrument() wraps make_move and update_game_state, the game end detection, of the XiangqiGame
+    class so every game is measured without changes to the callers. is_in_check is left out because make_move calls it
+    many times internally, which would mix internal calls into its histogram and slow every move; GameServer records
+    the is_in_check requests of clients itself. Other code can record its own operations with record. The export has
+    p50, p90 and p99, the sum and count of every operation and the throughput since the registry was created.
+    """
+
+    METRIC_PREFIX = "xiangqi"
+    PERCENT_ARRAY = [50, 90, 99]
+    INSTRUMENTED_ARRAY = ["make_move", "update_game_state"]
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    # only one registry can own the class methods at a time
+    __active = None
+
+    def __init__(self):
+        """Initializes a registry without histograms."""
+
+        self.__histogram_dict = {}
+        self.__lock = threading.Lock()
+        self.__start_time = time.monotonic()
+        self.__original_dict = {}
+        self.__http_server = None
+
+    def get_histogram(self, operation):
+        """Returns the histogram of the passed operation name, creating it if needed."""
+
+        histogram = self.__histogram_dict.get(operation)
+
+        if histogram is None:
+            with self.__lock:
+                histogram = self.__histogram_dict.setdefault(operation, LatencyHistogram())
+
+        return histogram
+
+    def get_operation_array(self):
+        """Returns the sorted names of the operations with a histogram."""
+
+        with self.__lock:
+            return sorted(self.__histogram_dict)
+
+    def record(self, operation, seconds):
+        """Adds the passed latency in seconds to the histogram of the passed operation name."""
+
+        self.get_histogram(operation).record(seconds)
+
+        return None
+
+    def wrap(self, operation, original):
+        """Returns a wrapper of the passed original method that records its latency under the passed operation name."""
+
+        histogram = self.get_histogram(operation)
+        perf_counter = time.perf_counter
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            start_time = perf_counter()
+
+            try:
+                return original(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter() - start_time)
+
+        return wrapper
+
+    def is_instrumented(self):
+        """Returns True if the registry is recording the methods of XiangqiGame. Returns False otherwise."""
+
+        return MetricsRegistry.__active is self
+
+    def instrument(self):
+        """
+        Starts recording the latency of the INSTRUMENTED_ARRAY methods of every XiangqiGame. Raises ValueError if
+        another registry is instrumenting or one of the methods is already wrapped, for example by a StageProfiler,
+        since the wrappers could not be removed in any order.
+        """
+
+        if MetricsRegistry.__active is self:
+            return None
+
+        if MetricsRegistry.__active is not None:
+            raise ValueError("another MetricsRegistry is instrumenting XiangqiGame")
+
+        for operation in self.INSTRUMENTED_ARRAY:
+            if hasattr(XiangqiGame.__dict__[operation], "__wrapped__"):
+                raise ValueError("XiangqiGame." + operation + " is already wrapped")
+
+        for operation in self.INSTRUMENTED_ARRAY:
+            original = XiangqiGame.__dict__[operation]
+            self.__original_dict[operation] = original
+            setattr(XiangqiGame, operation, self.wrap(operation, original))
+
+        MetricsRegistry.__active = self
+
+        return None
+
+    def uninstrument(self):
+        """Puts the original methods of XiangqiGame back. Recorded latencies are kept."""
+
+        if MetricsRegistry.__active is not self:
+            return None
+
+        for operation, original in self.__original_dict.items():
+            setattr(XiangqiGame, operation, original)
+
+        self.__original_dict = {}
+        MetricsRegistry.__active = None
+
+        return None
+
+    def to_prometheus(self):
+        """Returns every histogram in the Prometheus text exposition format."""
+
+        prefix = self.METRIC_PREFIX
+        uptime = time.monotonic() - self.__start_time
+        line_array = ["# HELP " + prefix + "_operation_latency_seconds Latency of Xiangqi operations.",
+                      "# TYPE " + prefix + "_operation_latency_seconds summary"]
+        rate_line_array = []
+        max_line_array = []
+
+        for operation in self.get_operation_array():
+            histogram = self.get_histogram(operation)
+            label = 'operation="' + operation + '"'
+            count = histogram.get_count()
+
+            for percent in self.PERCENT_ARRAY:
+                line_array.append(prefix + "_operation_latency_seconds{" + label + ',quantile="' +
+                                  str(percent / 100) + '"} ' + repr(histogram.percentile(percent)))
+
+            line_array.append(prefix + "_operation_latency_seconds_sum{" + label + "} " + repr(histogram.get_sum()))
+            line_array.append(prefix + "_operation_latency_seconds_count{" + label + "} " + str(count))
+            max_line_array.append(prefix + "_operation_latency_max_seconds{" + label + "} " +
+                                  repr(histogram.get_max()))
+            rate_line_array.append(prefix + "_operations_per_second{" + label + "} " +
+                                   repr(count / uptime if uptime > 0 else 0.0))
+
+        line_array += ["# HELP " + prefix + "_operation_latency_max_seconds Largest latency of Xiangqi operations.",
+                       "# TYPE " + prefix + "_operation_latency_max_seconds gauge"] + max_line_array
+        line_array += ["# HELP " + prefix + "_operations_per_second Mean operations per second since start.",
+                       "# TYPE " + prefix + "_operations_per_second gauge"] + rate_line_array
+        line_array += ["# HELP " + prefix + "_uptime_seconds Seconds since the metrics registry was created.",
+                       "# TYPE " + prefix + "_uptime_seconds gauge",
+                       prefix + "_uptime_seconds " + repr(uptime)]
+
+        return "\n".join(line_array) + "\n"
+
+    def write_file(self, path):
+        """Writes the Prometheus text to the passed path, replacing the file at once so readers never see half of it."""
+
+        tmp_path = path + ".tmp"
+
+        with open(tmp_path, "w") as metrics_file:
+            metrics_file.write(self.to_prometheus())
+
+        os.replace(tmp_path, path)
+
+        return None
+
+    def start_http_server(self, port=0, host="127.0.0.1"):
+        """
+        Serves the Prometheus text at /metrics on the passed host and port from a background thread. A port of 0 lets
+        the operating system pick a free port. Returns the port.
+        """
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """Answers GET /metrics with the Prometheus text of the registry."""
+
+            def do_GET(self):
+                """Sends the metrics, or 404 for any other path."""
+
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return None
+
+                body = registry.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", MetricsRegistry.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+                return None
+
+            def log_message(self, message_format, *args):
+                """Keeps scrapes out of stderr."""
+
+                return None
+
+        self.stop_http_server()
+        self.__http_server = ThreadingHTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(target=self.__http_server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        return self.__http_server.server_address[1]
+
+    def stop_http_server(self):
+        """Stops the HTTP endpoint if it is running."""
+
+        if self.__http_server is not None:
+            self.__http_server.shutdown()
+            self.__http_server.server_close()
+            self.__http_server = None
+
+        return None
+
+
+def main():
+    """Plays the passed moves with the registry instrumenting every game and prints or writes the metrics."""
+
+    parser = argparse.ArgumentParser(description="Measures XiangqiGame operation latency over a sequence of moves.")
+    parser.add_argument("moves", nargs="*", default=["h3-e3", "h10-g8", "h1-g3", "i10-h10"],
+                        help="moves written as start-end, for example h3-e3")
+    parser.add_argument("--file", default=None, help="write the metrics to this file instead of printing them")
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    registry.instrument()
+    game = XiangqiGame()
+
+    for move in args.moves:
+        start_pos, end_pos = move.split("-")
+
+        if not game.make_move(start_pos, end_pos):
+            raise ValueError("illegal move " + move)
+
+    registry.uninstrument()
+
+    if args.file is None:
+        print(registry.to_prometheus(), end="")
+    else:
+        registry.write_file(args.file)
+
+
+if __name__ == "__main__":
+    main()
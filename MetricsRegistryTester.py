@@ -0,0 +1,157 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for MetricsRegistry and LatencyHistogram
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from XiangqiGameWithImports import XiangqiGame
+from GameServer import GameServer
+from LatencyHistogram import LatencyHistogram
+from MetricsRegistry import MetricsRegistry
+from StageProfiler import StageProfiler
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for MetricsRegistry.py"""
+
+    def test_histogram_buckets(self):
+        """Tests that bucket indices are continuous and every bucket stays within 1/16 of its values."""
+
+        self.assertEqual(31, LatencyHistogram.get_index(31))
+        self.assertEqual(32, LatencyHistogram.get_index(32))
+        self.assertEqual(32, LatencyHistogram.get_index(33))
+        self.assertEqual(LatencyHistogram.BUCKET_COUNT - 1, LatencyHistogram.get_index(10 ** 15))
+
+        for index in range(1, LatencyHistogram.BUCKET_COUNT):
+            lower_bound = LatencyHistogram.get_upper_bound(index - 1) + 1
+            upper_bound = LatencyHistogram.get_upper_bound(index)
+
+            self.assertEqual(index, LatencyHistogram.get_index(lower_bound))
+            self.assertEqual(index, LatencyHistogram.get_index(upper_bound))
+            self.assertLessEqual(upper_bound - lower_bound, lower_bound / 16)
+
+    def test_histogram_percentiles(self):
+        """Tests percentiles, merging and reset."""
+
+        histogram = LatencyHistogram()
+        self.assertEqual(0.0, histogram.percentile(99))
+
+        for value in range(1, 101):
+            histogram.record(value / 1000)
+
+        self.assertEqual(100, histogram.get_count())
+        self.assertAlmostEqual(5.05, histogram.get_sum())
+        self.assertAlmostEqual(0.050, histogram.percentile(50), delta=0.050 / 16)
+        self.assertAlmostEqual(0.099, histogram.percentile(99), delta=0.099 / 16)
+        self.assertEqual(0.1, histogram.percentile(100))
+
+        other = LatencyHistogram()
+        other.record(2.0)
+        histogram.merge(other)
+
+        self.assertEqual(101, histogram.get_count())
+        self.assertEqual(2.0, histogram.percentile(100))
+
+        histogram.reset()
+        self.assertEqual(0, histogram.get_count())
+
+    def test_instrument_and_export(self):
+        """Tests that instrumented games are recorded and exported in the Prometheus text format."""
+
+        original = XiangqiGame.__dict__["make_move"]
+        registry = MetricsRegistry()
+        registry.instrument()
+
+        try:
+            game = XiangqiGame()
+            self.assertTrue(game.make_move("h3", "e3"))
+            self.assertFalse(game.make_move("h3", "e3"))
+        finally:
+            registry.uninstrument()
+
+        self.assertIs(original, XiangqiGame.__dict__["make_move"])
+        self.assertEqual(2, registry.get_histogram("make_move").get_count())
+        self.assertEqual(1, registry.get_histogram("update_game_state").get_count())
+
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE xiangqi_operation_latency_seconds summary", text)
+        self.assertIn('xiangqi_operation_latency_seconds{operation="make_move",quantile="0.99"} ', text)
+        self.assertIn('xiangqi_operation_latency_seconds_count{operation="make_move"} 2\n', text)
+        self.assertIn('xiangqi_operations_per_second{operation="update_game_state"} ', text)
+
+        # the checks make_move runs internally are not timed
+        self.assertNotIn('operation="is_in_check"', text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "xiangqi.prom")
+            registry.write_file(path)
+
+            with open(path) as metrics_file:
+                self.assertIn("xiangqi_uptime_seconds ", metrics_file.read())
+
+    def test_single_instrumenter(self):
+        """Tests that only one registry instruments at a time and that it cannot nest with a StageProfiler."""
+
+        original = XiangqiGame.__dict__["make_move"]
+        registry = MetricsRegistry()
+        registry.instrument()
+
+        try:
+            self.assertTrue(registry.is_instrumented())
+            self.assertRaises(ValueError, MetricsRegistry().instrument)
+            self.assertRaises(ValueError, StageProfiler(["make_move"]).enable)
+            registry.instrument()
+        finally:
+            registry.uninstrument()
+
+        self.assertIs(original, XiangqiGame.__dict__["make_move"])
+        self.assertFalse(registry.is_instrumented())
+
+        with StageProfiler(["make_move"]):
+            self.assertRaises(ValueError, registry.instrument)
+
+        self.assertIs(original, XiangqiGame.__dict__["make_move"])
+
+    def test_http_endpoint(self):
+        """Tests that the metrics are served at /metrics and other paths are not found."""
+
+        registry = MetricsRegistry()
+        registry.record("make_move", 0.25)
+        port = registry.start_http_server()
+
+        try:
+            with urllib.request.urlopen("http://127.0.0.1:" + str(port) + "/metrics") as response:
+                body = response.read().decode()
+
+            self.assertIn('xiangqi_operation_latency_seconds{operation="make_move",quantile="0.5"} 0.25', body)
+            self.assertRaises(urllib.error.HTTPError, urllib.request.urlopen, "http://127.0.0.1:" + str(port) + "/")
+        finally:
+            registry.stop_http_server()
+
+    def test_game_server_requests(self):
+        """Tests that GameServer records the latency of known ops only."""
+
+        registry = MetricsRegistry()
+
+        async def run():
+            server = GameServer(metrics=registry)
+            await server.start()
+
+            await server.handle_line(json.dumps({"op": "new_game"}))
+            await server.handle_line(json.dumps({"op": "make_move", "game_id": 1, "start": "h3", "end": "e3"}))
+            await server.handle_line(json.dumps({"op": "no_such_op", "game_id": 1}))
+
+            await server.close()
+
+        asyncio.run(run())
+
+        self.assertEqual(["request_make_move", "request_new_game"], registry.get_operation_array())
+
+
+if __name__ == '__main__':
+    unittest.main()
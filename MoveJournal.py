@@ -0,0 +1,390 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an append-only move journal with periodic position snapshots. Games are spread over shards by
+#              game_id. Each accepted move is appended to the journal of its shard as a 6 byte record and journals are
+#              fsynced in batches. After a crash all games are recovered by loading the latest snapshot of each shard
+#              and replaying the journal written after it through XiangqiGame.
+
+
+import argparse
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import weakref
+
+from XiangqiGameWithImports import XiangqiGame
+from PositionCodec import PositionCodec
+
+
+class MoveJournal:
+    """
+    Represents the move journal and snapshots of many games stored in a directory. Files are named
+    shard-<shard>-<generation>.journal and shard-<shard>-<generation>.snapshot. Writing a snapshot starts a new
+    generation, so a snapshot only needs the journal of its own generation to be replayed on recovery.
+
+    A background flusher thread wakes every half sync_interval and syncs the shards whose buffer has waited since their
+    last sync for at least that long, so records of a shard that goes idle are still fsynced within sync_interval of
+    being appended. The thread only holds a weak reference to the journal and stops when it is closed or collected.
+    """
+
+    RECORD = struct.Struct("<IH")
+    SNAPSHOT_HEADER = struct.Struct("<4sII")
+    SNAPSHOT_MAGIC = b"XQSN"
+
+    # special move codes, real move codes are at most 89 << 7 | 89
+    NEW_GAME_CODE = 0xFFFF
+    CLOSE_GAME_CODE = 0xFFFE
+
+    def __init__(self, directory, shard_count=16, sync_interval=0.05, buffer_size=64 * 1024, snapshot_interval=10000):
+        """
+        Initializes the journal stored in the passed directory. Appended records are buffered and written with a single
+        fsync within sync_interval seconds, or as soon as buffer_size bytes are waiting. needs_snapshot reports a shard
+        once snapshot_interval records were appended to it since its last snapshot.
+        """
+
+        self.__directory = directory
+        self.__shard_count = shard_count
+        self.__sync_interval = sync_interval
+        self.__buffer_size = buffer_size
+        self.__snapshot_interval = snapshot_interval
+        self.__lock_array = [threading.Lock() for _ in range(shard_count)]
+        self.__buffer_array = [bytearray() for _ in range(shard_count)]
+        self.__last_sync_array = [time.monotonic()] * shard_count
+        self.__record_count_array = [0] * shard_count
+        self.__generation_array = [0] * shard_count
+        self.__file_array = [None] * shard_count
+
+        os.makedirs(directory, exist_ok=True)
+
+        for shard in range(shard_count):
+            self.__generation_array[shard] = max(self.find_generations(shard, "journal") +
+                                                 self.find_generations(shard, "snapshot") + [0])
+            self.__file_array[shard] = open(self.get_path(shard, self.__generation_array[shard], "journal"), "ab")
+
+        self.__stop_event = threading.Event()
+        self.__flusher = threading.Thread(target=MoveJournal.run_flusher,
+                                          args=(weakref.ref(self), self.__stop_event, sync_interval / 2))
+        self.__flusher.daemon = True
+        self.__flusher.start()
+
+    def get_shard_count(self):
+        """Getter for shard_count."""
+
+        return self.__shard_count
+
+    def get_shard(self, game_id):
+        """Returns the shard that stores the game with the passed game_id."""
+
+        return game_id % self.__shard_count
+
+    def get_path(self, shard, generation, extension):
+        """Returns the path of the file with the passed shard, generation and extension."""
+
+        return os.path.join(self.__directory, "shard-" + str(shard) + "-" + str(generation) + "." + extension)
+
+    def find_generations(self, shard, extension):
+        """Returns a sorted array of the generations of the existing files with the passed shard and extension."""
+
+        generation_array = []
+        prefix = "shard-" + str(shard) + "-"
+        suffix = "." + extension
+
+        for file_name in os.listdir(self.__directory):
+            if file_name.startswith(prefix) and file_name.endswith(suffix):
+                generation = file_name[len(prefix):-len(suffix)]
+
+                if generation.isdigit():
+                    generation_array.append(int(generation))
+
+        return sorted(generation_array)
+
+    def append_new_game(self, game_id):
+        """Appends a record for a new game starting from the starting position with the passed game_id."""
+
+        self.append(game_id, self.NEW_GAME_CODE)
+
+    def append_close_game(self, game_id):
+        """Appends a record for the closed game with the passed game_id. Closed games are not recovered."""
+
+        self.append(game_id, self.CLOSE_GAME_CODE)
+
+    def append_move(self, game_id, start_pos, end_pos):
+        """Appends a record for the accepted move from the passed start_pos to end_pos of the passed game_id."""
+
+        self.append(game_id, PositionCodec.encode_move(start_pos, end_pos))
+
+    def append(self, game_id, move_code):
+        """Appends a record with the passed game_id and move_code to the buffer of its shard, syncing if due."""
+
+        shard = self.get_shard(game_id)
+
+        with self.__lock_array[shard]:
+            self.__buffer_array[shard] += self.RECORD.pack(game_id, move_code)
+            self.__record_count_array[shard] += 1
+
+            if (len(self.__buffer_array[shard]) >= self.__buffer_size or
+                    time.monotonic() - self.__last_sync_array[shard] >= self.__sync_interval):
+                self.sync_shard(shard)
+
+        return None
+
+    def sync_shard(self, shard):
+        """Writes and fsyncs the buffer of the passed shard. The caller must hold the lock of the shard."""
+
+        buffer = self.__buffer_array[shard]
+
+        if buffer:
+            journal_file = self.__file_array[shard]
+            journal_file.write(buffer)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+            buffer.clear()
+
+        self.__last_sync_array[shard] = time.monotonic()
+
+        return None
+
+    @staticmethod
+    def run_flusher(journal_ref, stop_event, wait_interval):
+        """
+        Syncs the due shards of the journal behind the passed weak reference every wait_interval seconds until the
+        passed stop_event is set or the journal is collected. Runs on the flusher thread.
+        """
+
+        while not stop_event.wait(wait_interval):
+            journal = journal_ref()
+
+            if journal is None:
+                break
+
+            journal.sync_due(wait_interval)
+            journal = None
+
+        return None
+
+    def sync_due(self, min_age):
+        """
+        Writes and fsyncs the buffers of the shards last synced at least min_age seconds ago. A record waits at most two
+        wake ups of the flusher, so half sync_interval keeps every record within sync_interval.
+        """
+
+        for shard in range(self.__shard_count):
+            # an unlocked look first, so idle shards cost the flusher no lock
+            if not self.__buffer_array[shard]:
+                continue
+
+            with self.__lock_array[shard]:
+                if time.monotonic() - self.__last_sync_array[shard] >= min_age:
+                    self.sync_shard(shard)
+
+        return None
+
+    def flush(self):
+        """Writes and fsyncs the buffers of all shards."""
+
+        for shard in range(self.__shard_count):
+            with self.__lock_array[shard]:
+                self.sync_shard(shard)
+
+        return None
+
+    def close(self):
+        """Stops the flusher thread, flushes all shards and closes the journal files."""
+
+        self.__stop_event.set()
+        self.__flusher.join()
+
+        self.flush()
+
+        for journal_file in self.__file_array:
+            journal_file.close()
+
+        return None
+
+    def needs_snapshot(self, shard):
+        """Returns True if snapshot_interval records were appended to the passed shard since its last snapshot."""
+
+        return self.__record_count_array[shard] >= self.__snapshot_interval
+
+    def write_snapshot(self, shard, game_dict):
+        """
+        Writes a snapshot of the passed shard from the passed game_dict, mapping game_id to XiangqiGame for every live
+        game of the shard, and starts a new journal generation. No move of the shard may be appended while the snapshot
+        is written.
+        """
+
+        with self.__lock_array[shard]:
+            self.sync_shard(shard)
+
+            generation = self.__generation_array[shard] + 1
+            path = self.get_path(shard, generation, "snapshot")
+
+            # write to a temporary file first so a crash never leaves a partial snapshot
+            with open(path + ".tmp", "wb") as snapshot_file:
+                snapshot_file.write(self.SNAPSHOT_HEADER.pack(self.SNAPSHOT_MAGIC, generation, len(game_dict)))
+
+                for game_id, game in game_dict.items():
+                    snapshot_file.write(struct.pack("<I", game_id) + PositionCodec.encode_game(game))
+
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+
+            os.replace(path + ".tmp", path)
+
+            self.__file_array[shard].close()
+            self.__file_array[shard] = open(self.get_path(shard, generation, "journal"), "ab")
+            self.__generation_array[shard] = generation
+            self.__record_count_array[shard] = 0
+
+            # older files are covered by the new snapshot
+            for extension in ("journal", "snapshot"):
+                for old_generation in self.find_generations(shard, extension):
+                    if old_generation < generation:
+                        os.remove(self.get_path(shard, old_generation, extension))
+
+        return None
+
+    def load_snapshot(self, shard):
+        """
+        Returns a tuple of the generation and a dictionary mapping game_id to position bytes from the latest snapshot of
+        the passed shard. Returns generation 0 and an empty dictionary if the shard has no snapshot.
+        """
+
+        generation_array = self.find_generations(shard, "snapshot")
+
+        if not generation_array:
+            return 0, {}
+
+        position_dict = {}
+        record_size = 4 + PositionCodec.POSITION_SIZE
+
+        with open(self.get_path(shard, generation_array[-1], "snapshot"), "rb") as snapshot_file:
+            data = snapshot_file.read()
+
+        magic, generation, game_count = self.SNAPSHOT_HEADER.unpack_from(data, 0)
+
+        if magic != self.SNAPSHOT_MAGIC:
+            raise ValueError("not a snapshot file")
+
+        offset = self.SNAPSHOT_HEADER.size
+
+        for _ in range(game_count):
+            game_id = struct.unpack_from("<I", data, offset)[0]
+            position_dict[game_id] = data[offset + 4:offset + record_size]
+            offset += record_size
+
+        return generation, position_dict
+
+    def recover(self):
+        """
+        Returns a dictionary mapping game_id to XiangqiGame for every live game, built from the latest snapshot of each
+        shard and the journals written after it. A torn record at the end of a journal is ignored.
+        """
+
+        self.flush()
+
+        game_dict = {}
+
+        for shard in range(self.__shard_count):
+            snapshot_generation, position_dict = self.load_snapshot(shard)
+
+            for game_id, position in position_dict.items():
+                game_dict[game_id] = PositionCodec.decode_game(position)
+
+            for generation in self.find_generations(shard, "journal"):
+                if generation >= snapshot_generation:
+                    self.replay(self.get_path(shard, generation, "journal"), game_dict)
+
+        return game_dict
+
+    def replay(self, path, game_dict):
+        """Replays the journal at the passed path into the passed game_dict."""
+
+        with open(path, "rb") as journal_file:
+            data = journal_file.read()
+
+        record_size = self.RECORD.size
+        end = len(data) - len(data) % record_size
+
+        for game_id, move_code in self.RECORD.iter_unpack(data[:end]):
+            if move_code == self.NEW_GAME_CODE:
+                game_dict[game_id] = XiangqiGame()
+
+            elif move_code == self.CLOSE_GAME_CODE:
+                game_dict.pop(game_id, None)
+
+            elif game_id in game_dict:
+                start_pos, end_pos = PositionCodec.decode_move(move_code)
+
+                if not game_dict[game_id].make_move(start_pos, end_pos):
+                    raise ValueError("journal move " + start_pos + end_pos + " rejected for game " + str(game_id))
+
+        return None
+
+
+def benchmark_recovery(game_count, moves_per_game, snapshot_fraction, shard_count):
+    """
+    Writes a journal of game_count games playing moves_per_game opening moves, snapshots the passed snapshot_fraction of
+    the moves and returns a dictionary with the time taken to recover all games.
+    """
+
+    move_array = [("h3", "e3"), ("h10", "g8"), ("h1", "g3"), ("i10", "h10"), ("i1", "h1"), ("b10", "c8")]
+    move_array = move_array[:moves_per_game]
+    snapshot_move_count = int(len(move_array) * snapshot_fraction)
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        journal = MoveJournal(directory, shard_count=shard_count, sync_interval=1.0, buffer_size=1 << 20)
+
+        # every game plays the same moves, so one game supplies the snapshot position
+        snapshot_game = XiangqiGame()
+
+        for start_pos, end_pos in move_array[:snapshot_move_count]:
+            snapshot_game.make_move(start_pos, end_pos)
+
+        for shard in range(shard_count):
+            game_dict = {}
+
+            for game_id in range(shard, game_count, shard_count):
+                game_dict[game_id] = snapshot_game
+
+            journal.write_snapshot(shard, game_dict)
+
+        for game_id in range(game_count):
+            for start_pos, end_pos in move_array[snapshot_move_count:]:
+                journal.append_move(game_id, start_pos, end_pos)
+
+        journal.close()
+
+        start_time = time.perf_counter()
+        recovered_game_dict = MoveJournal(directory, shard_count=shard_count).recover()
+        elapsed = time.perf_counter() - start_time
+
+    finally:
+        shutil.rmtree(directory)
+
+    return {"games": len(recovered_game_dict),
+            "replayed_moves": game_count * (len(move_array) - snapshot_move_count),
+            "elapsed_s": elapsed,
+            "games_per_s": len(recovered_game_dict) / elapsed if elapsed > 0 else 0.0}
+
+
+def main():
+    """Runs the recovery benchmark from the command line and prints its result."""
+
+    parser = argparse.ArgumentParser(description="Benchmarks recovery of games from a MoveJournal.")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--moves", type=int, default=4)
+    parser.add_argument("--snapshot-fraction", type=float, default=0.75)
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    print(benchmark_recovery(args.games, args.moves, args.snapshot_fraction, args.shards))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for PositionCodec and MoveJournal
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from PositionCodec import PositionCodec
+from MoveJournal import MoveJournal
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for PositionCodec.py and MoveJournal.py"""
+
+    def setUp(self):
+        """Creates a temporary journal directory."""
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Removes the temporary journal directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_encode_square_and_move(self):
+        """Tests that square ids follow the point_array order and that move codes round trip."""
+
+        game = XiangqiGame()
+        point_array = game.get_board().get_point_array()
+
+        for square in range(90):
+            self.assertEqual(square, PositionCodec.encode_square(point_array[square].get_pos()))
+            self.assertEqual(point_array[square].get_pos(), PositionCodec.decode_square(square))
+
+        self.assertEqual(("b3", "b10"), PositionCodec.decode_move(PositionCodec.encode_move("b3", "b10")))
+        self.assertLess(PositionCodec.encode_move("i10", "i10"), MoveJournal.CLOSE_GAME_CODE)
+
+    def test_encode_game(self):
+        """Tests that a game position round trips through its compact encoding."""
+
+        game = XiangqiGame()
+        game.make_move("h3", "e3")
+
+        data = PositionCodec.encode_game(game)
+        self.assertEqual(PositionCodec.POSITION_SIZE, len(data))
+
+        decoded_game = PositionCodec.decode_game(data)
+        self.assertEqual("black", decoded_game.get_current_player().get_color())
+        self.assertEqual("UNFINISHED", decoded_game.get_game_state())
+        self.assertEqual(data, PositionCodec.encode_game(decoded_game))
+        self.assertEqual("C", decoded_game.get_board().get_point_with_pos("e3").get_symbol())
+        self.assertEqual("+", decoded_game.get_board().get_point_with_pos("h3").get_symbol())
+
+    def test_recover_from_journal(self):
+        """Tests recovery of games from journals only, including closed games and a torn final record."""
+
+        journal = MoveJournal(self.directory, shard_count=2)
+        journal.append_new_game(1)
+        journal.append_new_game(2)
+        journal.append_new_game(3)
+        journal.append_move(1, "h3", "e3")
+        journal.append_move(2, "b3", "e3")
+        journal.append_close_game(3)
+        journal.close()
+
+        # simulate a crash in the middle of writing a record
+        with open(os.path.join(self.directory, "shard-1-0.journal"), "ab") as journal_file:
+            journal_file.write(b"\x01\x00")
+
+        game_dict = MoveJournal(self.directory, shard_count=2).recover()
+
+        self.assertEqual([1, 2], sorted(game_dict))
+        self.assertEqual("C", game_dict[1].get_board().get_point_with_pos("e3").get_symbol())
+        self.assertEqual("+", game_dict[2].get_board().get_point_with_pos("b3").get_symbol())
+        self.assertEqual("black", game_dict[1].get_current_player().get_color())
+
+    def test_idle_shard_is_synced(self):
+        """Tests that the records of an idle shard are written within sync_interval without another append."""
+
+        journal = MoveJournal(self.directory, shard_count=1, sync_interval=0.1)
+        path = os.path.join(self.directory, "shard-0-0.journal")
+
+        journal.append_new_game(1)
+        journal.append_move(1, "h3", "e3")
+        time.sleep(0.3)
+
+        self.assertEqual(2 * MoveJournal.RECORD.size, os.path.getsize(path))
+
+        journal.close()
+        self.assertEqual(2 * MoveJournal.RECORD.size, os.path.getsize(path))
+
+    def test_recover_from_snapshot(self):
+        """Tests recovery from a snapshot followed by the journal tail and removal of covered files."""
+
+        journal = MoveJournal(self.directory, shard_count=1, snapshot_interval=2)
+        game = XiangqiGame()
+
+        journal.append_new_game(5)
+        game.make_move("h3", "e3")
+        journal.append_move(5, "h3", "e3")
+        self.assertTrue(journal.needs_snapshot(0))
+
+        journal.write_snapshot(0, {5: game})
+        self.assertFalse(journal.needs_snapshot(0))
+        self.assertEqual(["shard-0-1.journal", "shard-0-1.snapshot"], sorted(os.listdir(self.directory)))
+
+        journal.append_move(5, "h10", "g8")
+        journal.close()
+
+        game_dict = MoveJournal(self.directory, shard_count=1).recover()
+
+        self.assertEqual([5], list(game_dict))
+        self.assertEqual("C", game_dict[5].get_board().get_point_with_pos("e3").get_symbol())
+        self.assertEqual("H", game_dict[5].get_board().get_point_with_pos("g8").get_symbol())
+        self.assertEqual("red", game_dict[5].get_current_player().get_color())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a binary opening book for the game Xiangqi. The book is built from game archives and probed
+#              through mmap, so every process reading the same book shares one copy of it in the page cache.
+
+
+import argparse
+import mmap
+import struct
+
+from GameArchive import GameArchive
+from PositionCodec import PositionCodec
+from Zobrist import Zobrist
+
+
+class OpeningBook:
+    """
+    Represents an opening book file. The file is a header followed by fixed size records sorted by position hash and
+    move code. Each record holds the position hash, the move code, a weight and the win, draw and loss counts of the
+    move from the point of view of the player making it. Positions are stored under their canonical hash, so games
+    reaching mirror images of a position share its records, and the moves of a mirrored position are stored mirrored.
+    """
+
+    HEADER = struct.Struct(">4sII")
+    RECORD = struct.Struct(">QHHIII")
+    MAGIC = b"XQBK"
+    VERSION = 2
+
+    def __init__(self, path):
+        """Opens the book stored at the passed path for reading."""
+
+        self.__path = path
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_count = self.HEADER.unpack_from(self.__map, 0)
+
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("not an opening book: " + path)
+
+        self.__record_count = record_count
+
+    def get_record_count(self):
+        """Getter for record_count."""
+
+        return self.__record_count
+
+    def close(self):
+        """Closes the book."""
+
+        self.__map.close()
+        self.__file.close()
+
+        return None
+
+    def __enter__(self):
+        """Returns the book for use in a with statement."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the book at the end of a with statement."""
+
+        self.close()
+
+    def get_record(self, index):
+        """Returns the record tuple at the passed index."""
+
+        return self.RECORD.unpack_from(self.__map, self.HEADER.size + index * self.RECORD.size)
+
+    def find_first(self, hash_value):
+        """Returns the index of the first record with a position hash not less than the passed hash_value."""
+
+        low = 0
+        high = self.__record_count
+        record_size = self.RECORD.size
+        header_size = self.HEADER.size
+        book_map = self.__map
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if struct.unpack_from(">Q", book_map, header_size + middle * record_size)[0] < hash_value:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def probe_hash(self, hash_value):
+        """
+        Returns an array of dictionaries with move, weight, wins, draws and losses for every book move of the position
+        with the passed hash_value. Returns an empty array if the position is not in the book.
+        """
+
+        entry_array = []
+        index = self.find_first(hash_value)
+
+        while index < self.__record_count:
+            record_hash, move_code, weight, wins, draws, losses = self.get_record(index)
+
+            if record_hash != hash_value:
+                break
+
+            entry_array.append({"move": PositionCodec.decode_move(move_code), "weight": weight, "wins": wins,
+                                "draws": draws, "losses": losses})
+            index += 1
+
+        return entry_array
+
+    def probe(self, game):
+        """
+        Returns the book moves for the current position of the passed game, including those played from its mirror
+        image. See probe_hash.
+        """
+
+        hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+        entry_array = self.probe_hash(hash_value)
+
+        for entry in entry_array:
+            entry["move"] = Zobrist.canonicalize_move(entry["move"], mirrored)
+
+        return entry_array
+
+    def choose_move(self, game, a_random=None):
+        """
+        Returns a book move for the current position of the passed game, chosen with probability proportional to its
+        weight if a_random is passed and the highest weighted move otherwise. Returns None if the position is not in the
+        book.
+        """
+
+        entry_array = [entry for entry in self.probe(game) if entry["weight"] > 0]
+
+        if not entry_array:
+            return None
+
+        if a_random is None:
+            return max(entry_array, key=lambda entry: entry["weight"])["move"]
+
+        return a_random.choices(entry_array, weights=[entry["weight"] for entry in entry_array])[0]["move"]
+
+    @staticmethod
+    def count_games(archive_path_array, max_ply=20, validate=True):
+        """
+        Returns a dictionary mapping (canonical position hash, move code) to [wins, draws, losses] for every move played
+        within the first max_ply plies of the games in the passed archives. Unfinished games are skipped.
+        """
+
+        count_dict = {}
+
+        for archive_path in archive_path_array:
+            for game_id, result, move_array in GameArchive(archive_path).read_games():
+                if result == "UNFINISHED":
+                    continue
+
+                for game, ply, (start_pos, end_pos) in GameArchive.replay(move_array, max_ply, validate):
+                    player_color = game.get_current_player().get_color()
+                    hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+                    move = Zobrist.canonicalize_move((start_pos, end_pos), mirrored)
+                    key = (hash_value, PositionCodec.encode_move(*move))
+                    counts = count_dict.setdefault(key, [0, 0, 0])
+
+                    if result == "DRAW":
+                        counts[1] += 1
+                    elif (result == "RED_WON") == (player_color == "red"):
+                        counts[0] += 1
+                    else:
+                        counts[2] += 1
+
+        return count_dict
+
+    @staticmethod
+    def build(archive_path_array, book_path, max_ply=20, min_games=1, validate=True):
+        """
+        Builds a book at the passed book_path from the passed archives. Moves played in fewer than min_games games are
+        left out. A move is weighted by two points per win and one per draw. Returns the number of records written.
+        """
+
+        record_array = []
+
+        for (hash_value, move_code), (wins, draws, losses) in OpeningBook.count_games(archive_path_array, max_ply,
+                                                                                      validate).items():
+            if wins + draws + losses >= min_games:
+                weight = min(0xFFFF, 2 * wins + draws)
+                record_array.append((hash_value, move_code, weight, wins, draws, losses))
+
+        record_array.sort()
+
+        with open(book_path, "wb") as book_file:
+            book_file.write(OpeningBook.HEADER.pack(OpeningBook.MAGIC, OpeningBook.VERSION, len(record_array)))
+
+            for record in record_array:
+                book_file.write(OpeningBook.RECORD.pack(*record))
+
+        return len(record_array)
+
+
+def main():
+    """Builds an opening book from the command line."""
+
+    parser = argparse.ArgumentParser(description="Builds a Xiangqi opening book from game archives.")
+    parser.add_argument("book")
+    parser.add_argument("archives", nargs="+")
+    parser.add_argument("--max-ply", type=int, default=20)
+    parser.add_argument("--min-games", type=int, default=1)
+    parser.add_argument("--trusted", action="store_true", help="skip move validation while replaying archives")
+    args = parser.parse_args()
+
+    record_count = OpeningBook.build(args.archives, args.book, args.max_ply, args.min_games, not args.trusted)
+    print("wrote " + str(record_count) + " records to " + args.book)
+
+
+if __name__ == "__main__":
+    main()
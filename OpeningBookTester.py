@@ -0,0 +1,131 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for GameArchive, Zobrist and OpeningBook
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from OpeningBook import OpeningBook
+from PositionCodec import PositionCodec
+from Zobrist import Zobrist
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for GameArchive.py, Zobrist.py and OpeningBook.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with a small archive."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        self.book_path = os.path.join(self.directory, "book.bin")
+
+        GameArchive(self.archive_path).write_games([
+            ("g1", "RED_WON", [("h3", "e3"), ("h10", "g8"), ("h1", "g3")]),
+            ("g2", "BLACK_WON", [("h3", "e3"), ("b10", "c8")]),
+            ("g3", "DRAW", [("b3", "e3"), ("h10", "g8")]),
+            ("g4", "UNFINISHED", [("c1", "e3")])])
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_archive_round_trip(self):
+        """Tests that archive lines are written and read back unchanged."""
+
+        game_array = list(GameArchive(self.archive_path).read_games())
+
+        self.assertEqual(4, len(game_array))
+        self.assertEqual(("g2", "BLACK_WON", [("h3", "e3"), ("b10", "c8")]), game_array[1])
+        self.assertRaises(ValueError, GameArchive.parse_line, "g5\tWON\th3-e3")
+
+    def test_replay_rejects_illegal_move(self):
+        """Tests that a validated replay raises on an illegal move."""
+
+        with self.assertRaises(ValueError):
+            for _ in GameArchive.replay([("h3", "h9")]):
+                pass
+
+    def test_hash_depends_on_side_to_move(self):
+        """Tests that the same board hashes differently with a different side to move."""
+
+        game = XiangqiGame()
+        red_hash = Zobrist.hash_game(game)
+        game.switch_current_player()
+
+        self.assertEqual(red_hash ^ Zobrist.BLACK_TO_MOVE_KEY, Zobrist.hash_game(game))
+
+    def test_mirror_hash_pair(self):
+        """Tests that hash pairs kept move by move match hashes of the position and of its mirror image."""
+
+        game = XiangqiGame()
+        hash_pair = Zobrist.hash_game_pair(game)
+        a_random = random.Random(7)
+
+        self.assertEqual((hash_pair[0], False), Zobrist.canonicalize(hash_pair))
+
+        for _ in range(60):
+            move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not move_array:
+                break
+
+            move = a_random.choice(move_array)
+            hash_pair = Zobrist.get_child_hash_pair(game, hash_pair, move)
+            self.assertTrue(game.make_move(*move))
+
+            mirrored_game = PositionCodec.mirror_game(game)
+            self.assertEqual(Zobrist.hash_game_pair(game), hash_pair)
+            self.assertEqual(hash_pair[::-1], Zobrist.hash_game_pair(mirrored_game))
+            self.assertEqual(Zobrist.canonicalize(hash_pair)[0], Zobrist.canonicalize(hash_pair[::-1])[0])
+
+    def test_build_and_probe(self):
+        """Tests the counts, ordering and move choice of a built book."""
+
+        record_count = OpeningBook.build([self.archive_path], self.book_path, validate=False)
+        self.assertEqual(5, record_count)
+
+        with OpeningBook(self.book_path) as book:
+            self.assertEqual(5, book.get_record_count())
+
+            game = XiangqiGame()
+            entry_dict = {tuple(entry["move"]): entry for entry in book.probe(game)}
+
+            self.assertEqual({"move": ("h3", "e3"), "weight": 2, "wins": 1, "draws": 0, "losses": 1},
+                             entry_dict[("h3", "e3")])
+            self.assertEqual({"move": ("b3", "e3"), "weight": 1, "wins": 0, "draws": 1, "losses": 0},
+                             entry_dict[("b3", "e3")])
+            self.assertEqual(("h3", "e3"), book.choose_move(game))
+            self.assertIn(book.choose_move(game, random.Random(1)), [("h3", "e3"), ("b3", "e3")])
+
+            game.make_move("h3", "e3")
+            entry_array = book.probe(game)
+            self.assertEqual(2, len(entry_array))
+
+            # g3 reached the mirror image of this position with b3-e3 and played the mirror image of b10-c8
+            for entry in entry_array:
+                if entry["move"] == ("b10", "c8"):
+                    self.assertEqual((1, 1, 0), (entry["wins"], entry["draws"], entry["losses"]))
+
+            mirrored_game = XiangqiGame()
+            mirrored_game.make_move("b3", "e3")
+            self.assertEqual(sorted(PositionCodec.mirror_move(entry["move"]) for entry in entry_array),
+                             sorted(entry["move"] for entry in book.probe(mirrored_game)))
+
+            game.make_move("i10", "i9")
+            self.assertEqual([], book.probe(game))
+            self.assertIsNone(book.choose_move(game))
+
+    def test_rejects_other_files(self):
+        """Tests that a file that is not a book is rejected."""
+
+        self.assertRaises(ValueError, OpeningBook, self.archive_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,27 @@
 
 
 class Piece:
-    """Represents a general piece in the game Xiangqi."""
+    """
+    Represents a general piece in the game Xiangqi. Pieces are flyweights: constructing a piece class with a color
+    returns the one instance of that class and color, which every board shares. Pieces are never changed after they are
+    created and their possible moves and jumps are tuples.
+    """
+
+    __slots__ = ("__color", "__symbol", "__possible_moves", "__possible_jumps")
+
+    # shared instances by piece class and color
+    __instance_dict = {}
+
+    def __new__(cls, color, *args):
+        """Returns the shared instance of the piece class with the passed color, creating it the first time."""
+
+        instance = Piece.__instance_dict.get((cls, color))
+
+        if instance is None:
+            instance = object.__new__(cls)
+            Piece.__instance_dict[(cls, color)] = instance
+
+        return instance
 
     def __init__(self, color, symbol, possible_moves, possible_jumps=None):
         """Initializes the piece with the passed color, symbol, possible_moves and possible_jumps."""
@@ -6,6 +6,8 @@
 class Player:
     """Represents a player in the game Xiangqi."""
 
+    __slots__ = ("__color",)
+
     def __init__(self, color):
         """Initialize the Player with the passed color."""
 
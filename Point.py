@@ -6,6 +6,8 @@
 class Point:
     """Represents a point in the game Xiangqi."""
 
+    __slots__ = ("__file", "__rank", "__piece")
+
     def __init__(self, file, rank):
         """Initializes the point with the passed file and rank. Set the piece at point to None."""
 
@@ -0,0 +1,283 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines compact binary encodings and FEN strings for squares, moves and positions in the game Xiangqi.
+
+
+from XiangqiGameWithImports import XiangqiGame
+from General import General
+from Advisor import Advisor
+from Horse import Horse
+from Chariot import Chariot
+from Elephant import Elephant
+from Cannon import Cannon
+from Soldier import Soldier
+
+
+class PositionCodec:
+    """
+    Encodes and decodes squares, moves and positions. A square id is file_index * 10 + rank_index, the index of the
+    point in Board.get_point_array(). A move code packs the start square id and end square id into 16 bits. A position
+    packs the side to move, the game state and one 4 bit piece code per square into 47 bytes. Positions can also be
+    written as FEN strings, with red pieces in upper case and ranks listed from rank 10 down to rank 1.
+    """
+
+    FILE_ARRAY = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
+    RANK_ARRAY = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
+    SQUARE_COUNT = 90
+    POSITION_SIZE = 47
+
+    # piece codes are 1-7 for red and 8-14 for black, 0 is an empty square
+    PIECE_SYMBOL_ARRAY = ["G", "A", "E", "H", "R", "C", "S"]
+    PIECE_CLASS_DICT = {"G": General, "A": Advisor, "E": Elephant, "H": Horse, "R": Chariot, "C": Cannon,
+                        "S": Soldier}
+    COLOR_ARRAY = ["red", "black"]
+    GAME_STATE_ARRAY = ["UNFINISHED", "RED_WON", "BLACK_WON"]
+
+    START_FEN = "rnbakabnr/9/1c5c1/p1p1p1p1p/9/9/P1P1P1P1P/1C5C1/9/RNBAKABNR w - - 0 1"
+    FEN_LETTER_DICT = {"G": "K", "A": "A", "E": "B", "H": "N", "R": "R", "C": "C", "S": "P"}
+    FEN_SYMBOL_DICT = {"K": "G", "G": "G", "A": "A", "B": "E", "E": "E", "N": "H", "H": "H", "R": "R", "C": "C",
+                       "P": "S", "S": "S"}
+
+    @staticmethod
+    def encode_square(a_pos):
+        """Returns the square id for the passed position."""
+
+        file_index = PositionCodec.FILE_ARRAY.index(a_pos[0])
+        rank_index = PositionCodec.RANK_ARRAY.index(a_pos[1:])
+
+        return file_index * 10 + rank_index
+
+    @staticmethod
+    def decode_square(square):
+        """Returns the position for the passed square id."""
+
+        return PositionCodec.FILE_ARRAY[square // 10] + PositionCodec.RANK_ARRAY[square % 10]
+
+    @staticmethod
+    def encode_move(start_pos, end_pos):
+        """Returns the 16 bit move code for the passed start_pos and end_pos."""
+
+        return (PositionCodec.encode_square(start_pos) << 7) | PositionCodec.encode_square(end_pos)
+
+    @staticmethod
+    def decode_move(move_code):
+        """Returns a tuple of start_pos and end_pos for the passed move code."""
+
+        return PositionCodec.decode_square(move_code >> 7), PositionCodec.decode_square(move_code & 0x7F)
+
+    @staticmethod
+    def mirror_square(square):
+        """Returns the square id of the mirror image of the passed square id, reflected across the e file."""
+
+        return (8 - square // 10) * 10 + square % 10
+
+    @staticmethod
+    def mirror_pos(a_pos):
+        """Returns the mirror image of the passed position, reflected across the e file, so a3 becomes i3."""
+
+        return PositionCodec.FILE_ARRAY[8 - PositionCodec.FILE_ARRAY.index(a_pos[0])] + a_pos[1:]
+
+    @staticmethod
+    def mirror_move(move):
+        """Returns the mirror image of the passed (start_pos, end_pos) move."""
+
+        return PositionCodec.mirror_pos(move[0]), PositionCodec.mirror_pos(move[1])
+
+    @staticmethod
+    def mirror_move_code(move_code):
+        """Returns the move code of the mirror image of the move with the passed move code."""
+
+        return (PositionCodec.mirror_square(move_code >> 7) << 7) | PositionCodec.mirror_square(move_code & 0x7F)
+
+    @staticmethod
+    def mirror_game(game, mirrored_game=None):
+        """
+        Returns a XiangqiGame set to the mirror image of the current position of the passed game, with the same side to
+        move and game state. If mirrored_game is passed its board is overwritten instead of creating a new game.
+        """
+
+        if mirrored_game is None:
+            mirrored_game = XiangqiGame()
+
+        code_array = PositionCodec.encode_board(game.get_board())
+        point_array = mirrored_game.get_board().get_point_array()
+
+        for square in range(PositionCodec.SQUARE_COUNT):
+            point_array[PositionCodec.mirror_square(square)].set_piece(PositionCodec.decode_piece(code_array[square]))
+
+        mirrored_game.set_current_player(game.get_current_player().get_color())
+        mirrored_game.set_game_state(game.get_game_state())
+
+        return mirrored_game
+
+    @staticmethod
+    def encode_piece(piece):
+        """Returns the piece code for the passed piece. Returns 0 if piece is None."""
+
+        if piece is None:
+            return 0
+
+        color_index = PositionCodec.COLOR_ARRAY.index(piece.get_color())
+        symbol_index = PositionCodec.PIECE_SYMBOL_ARRAY.index(piece.get_symbol())
+
+        return color_index * 7 + symbol_index + 1
+
+    @staticmethod
+    def decode_piece(piece_code):
+        """Returns a new piece for the passed piece code. Returns None if piece_code is 0."""
+
+        if piece_code == 0:
+            return None
+
+        color = PositionCodec.COLOR_ARRAY[(piece_code - 1) // 7]
+        symbol = PositionCodec.PIECE_SYMBOL_ARRAY[(piece_code - 1) % 7]
+
+        return PositionCodec.PIECE_CLASS_DICT[symbol](color)
+
+    @staticmethod
+    def encode_board(board):
+        """Returns a bytearray of one piece code per square for the passed board, in square id order."""
+
+        code_array = bytearray(PositionCodec.SQUARE_COUNT)
+        square = 0
+
+        for point in board.get_point_array():
+            code_array[square] = PositionCodec.encode_piece(point.get_piece())
+            square += 1
+
+        return code_array
+
+    @staticmethod
+    def encode_game(game):
+        """Returns the compact position bytes for the passed game."""
+
+        color_index = PositionCodec.COLOR_ARRAY.index(game.get_current_player().get_color())
+        state_index = PositionCodec.GAME_STATE_ARRAY.index(game.get_game_state())
+        code_array = PositionCodec.encode_board(game.get_board())
+
+        data = bytearray([color_index, state_index])
+
+        # pack two squares per byte
+        for square in range(0, PositionCodec.SQUARE_COUNT, 2):
+            data.append((code_array[square] << 4) | code_array[square + 1])
+
+        return bytes(data)
+
+    @staticmethod
+    def decode_game(data, game=None):
+        """
+        Returns a XiangqiGame set to the position in the passed compact position bytes. If a game is passed its board
+        is overwritten instead of creating a new game.
+        """
+
+        if len(data) != PositionCodec.POSITION_SIZE:
+            raise ValueError("position data must be " + str(PositionCodec.POSITION_SIZE) + " bytes")
+
+        if game is None:
+            game = XiangqiGame()
+
+        game.set_current_player(PositionCodec.COLOR_ARRAY[data[0]])
+        game.set_game_state(PositionCodec.GAME_STATE_ARRAY[data[1]])
+
+        point_array = game.get_board().get_point_array()
+
+        for byte_index in range(PositionCodec.SQUARE_COUNT // 2):
+            packed = data[2 + byte_index]
+            point_array[byte_index * 2].set_piece(PositionCodec.decode_piece(packed >> 4))
+            point_array[byte_index * 2 + 1].set_piece(PositionCodec.decode_piece(packed & 0x0F))
+
+        return game
+
+    @staticmethod
+    def encode_fen(game):
+        """Returns the FEN string of the current position of the passed game."""
+
+        point_array = game.get_board().get_point_array()
+        row_array = []
+
+        for rank_index in range(9, -1, -1):
+            row = ""
+            empty_count = 0
+
+            for file_index in range(9):
+                piece = point_array[file_index * 10 + rank_index].get_piece()
+
+                if piece is None:
+                    empty_count += 1
+                    continue
+
+                if empty_count > 0:
+                    row += str(empty_count)
+                    empty_count = 0
+
+                letter = PositionCodec.FEN_LETTER_DICT[piece.get_symbol()]
+
+                if piece.get_color() == "black":
+                    letter = letter.lower()
+
+                row += letter
+
+            if empty_count > 0:
+                row += str(empty_count)
+
+            row_array.append(row)
+
+        if game.get_current_player().get_color() == "red":
+            side = "w"
+        else:
+            side = "b"
+
+        return "/".join(row_array) + " " + side + " - - 0 1"
+
+    @staticmethod
+    def decode_fen(fen, game=None):
+        """
+        Returns a XiangqiGame set to the position of the passed FEN string. If a game is passed its board is overwritten
+        instead of creating a new game. Raises ValueError for a malformed FEN string.
+        """
+
+        field_array = fen.split()
+
+        if not field_array:
+            raise ValueError("empty FEN")
+
+        row_array = field_array[0].split("/")
+
+        if len(row_array) != 10:
+            raise ValueError("FEN must have 10 ranks: " + fen)
+
+        if game is None:
+            game = XiangqiGame()
+
+        board = game.get_board()
+        point_array = board.get_point_array()
+        board.clear_board()
+
+        for row_index, row in enumerate(row_array):
+            rank_index = 9 - row_index
+            file_index = 0
+
+            for letter in row:
+                if letter.isdigit():
+                    file_index += int(letter)
+                    continue
+
+                if letter.upper() not in PositionCodec.FEN_SYMBOL_DICT or file_index > 8:
+                    raise ValueError("invalid FEN rank " + row + ": " + fen)
+
+                color = "red" if letter.isupper() else "black"
+                symbol = PositionCodec.FEN_SYMBOL_DICT[letter.upper()]
+                point_array[file_index * 10 + rank_index].set_piece(PositionCodec.PIECE_CLASS_DICT[symbol](color))
+                file_index += 1
+
+            if file_index != 9:
+                raise ValueError("FEN rank " + row + " does not cover 9 files: " + fen)
+
+        if len(field_array) > 1 and field_array[1] == "b":
+            game.set_current_player("black")
+        else:
+            game.set_current_player("red")
+
+        game.set_game_state("UNFINISHED")
+
+        return game
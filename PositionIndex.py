@@ -0,0 +1,228 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a position index over game archives for the game Xiangqi, answering which archived games passed
+#              through a position. The index is built with an external sort and probed through mmap.
+
+
+import argparse
+import mmap
+import os
+import struct
+
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from ExternalSort import ExternalSort
+from PositionCodec import PositionCodec
+from Zobrist import Zobrist
+
+
+class PositionIndex:
+    """
+    Represents a position index file. The file is a header, fixed size records sorted by position hash, game number
+    and ply, and the game ids of the indexed games, one per line, in game number order. A record is written for every
+    position of every game, from the starting position at ply 0 to the final position, so a position is found by a
+    binary search on its hash. Records are stored under the canonical hash of the position with a flag set if the game
+    reached it mirrored, so one search finds a position and its mirror image.
+    """
+
+    HEADER = struct.Struct(">4sIII")
+    RECORD = struct.Struct(">QIHB")
+    MAGIC = b"XQPI"
+    VERSION = 2
+
+    def __init__(self, path):
+        """Opens the index stored at the passed path for reading."""
+
+        self.__path = path
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_count, game_count = self.HEADER.unpack_from(self.__map, 0)
+
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("not a position index: " + path)
+
+        self.__record_count = record_count
+        game_id_offset = self.HEADER.size + record_count * self.RECORD.size
+        self.__game_id_array = self.__map[game_id_offset:].decode("utf-8").split("\n")[:game_count]
+
+    def get_record_count(self):
+        """Getter for record_count."""
+
+        return self.__record_count
+
+    def get_game_id_array(self):
+        """Getter for game_id_array."""
+
+        return self.__game_id_array
+
+    def close(self):
+        """Closes the index."""
+
+        self.__map.close()
+        self.__file.close()
+
+        return None
+
+    def __enter__(self):
+        """Returns the index for use in a with statement."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the index at the end of a with statement."""
+
+        self.close()
+
+    def get_record(self, index):
+        """Returns the record tuple of canonical position hash, game number, ply and mirrored at the passed index."""
+
+        return self.RECORD.unpack_from(self.__map, self.HEADER.size + index * self.RECORD.size)
+
+    def find_first(self, hash_value):
+        """Returns the index of the first record with a position hash not less than the passed hash_value."""
+
+        low = 0
+        high = self.__record_count
+        record_size = self.RECORD.size
+        header_size = self.HEADER.size
+        index_map = self.__map
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if struct.unpack_from(">Q", index_map, header_size + middle * record_size)[0] < hash_value:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def probe_hash(self, hash_value):
+        """
+        Returns an array of (game_id, ply, mirrored) tuples for every time an indexed game reached the position with
+        the passed canonical hash_value, in game number then ply order, with mirrored True if the game reached it
+        mirrored. Returns an empty array if no game reached it.
+        """
+
+        result_array = []
+        index = self.find_first(hash_value)
+
+        while index < self.__record_count:
+            record_hash, game_number, ply, mirrored = self.get_record(index)
+
+            if record_hash != hash_value:
+                break
+
+            result_array.append((self.__game_id_array[game_number], ply, mirrored == 1))
+            index += 1
+
+        return result_array
+
+    def probe(self, game, include_mirror=True):
+        """
+        Returns an array of (game_id, ply, mirrored) tuples for every time an indexed game reached the current position
+        of the passed game. If include_mirror is True games reaching the mirror image of the position, reflected across
+        the e file, are included with mirrored True. A symmetric position is only listed once.
+        """
+
+        hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+        result_array = []
+
+        # a game reached the position itself if it was mirrored the same way
+        for game_id, ply, record_mirrored in self.probe_hash(hash_value):
+            if include_mirror or record_mirrored == mirrored:
+                result_array.append((game_id, ply, record_mirrored != mirrored))
+
+        # games reaching the position itself first, then games reaching its mirror image
+        return sorted(result_array, key=lambda result: result[2])
+
+    def probe_fen(self, fen, include_mirror=True):
+        """Returns the games reaching the position of the passed FEN string. See probe."""
+
+        return self.probe(PositionCodec.decode_fen(fen), include_mirror)
+
+    @staticmethod
+    def generate_records(archive_path_array, game_id_array, validate=True):
+        """
+        Generator that yields a record tuple of canonical position hash, game number, ply and mirrored for every
+        position of every game in the passed archives, appending the id of each game to the passed game_id_array as its
+        number is used.
+        """
+
+        start_hash_value, start_mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(XiangqiGame()))
+
+        for archive_path in archive_path_array:
+            for game_id, _, move_array in GameArchive(archive_path).read_games():
+                game_number = len(game_id_array)
+                game_id_array.append(game_id)
+                game = None
+                ply = -1
+
+                for game, ply, _ in GameArchive.replay(move_array, None, validate):
+                    hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+                    yield hash_value, game_number, ply, int(mirrored)
+
+                # replay plays the last move after yielding, so the game now holds the final position
+                if game is None:
+                    yield start_hash_value, game_number, 0, int(start_mirrored)
+                else:
+                    hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+                    yield hash_value, game_number, ply + 1, int(mirrored)
+
+    @staticmethod
+    def build(archive_path_array, index_path, chunk_size=1000000, validate=True, temp_dir=None):
+        """
+        Builds an index at the passed index_path from the passed archives with an ExternalSort, so archives larger than
+        memory can be indexed. Records are sorted in memory chunk_size at a time and runs are written to temp_dir, or
+        next to the index by default. Returns the number of records written.
+        """
+
+        if temp_dir is None:
+            temp_dir = os.path.dirname(os.path.abspath(index_path))
+
+        game_id_array = []
+        record_count = 0
+        record_iterable = PositionIndex.generate_records(archive_path_array, game_id_array, validate)
+
+        with open(index_path, "wb") as index_file:
+            # the counts are known once every record is sorted, so the header is written again at the end
+            index_file.write(PositionIndex.HEADER.pack(PositionIndex.MAGIC, PositionIndex.VERSION, 0, 0))
+
+            for record in ExternalSort(PositionIndex.RECORD, chunk_size, temp_dir).sort(record_iterable):
+                index_file.write(PositionIndex.RECORD.pack(*record))
+                record_count += 1
+
+            index_file.write("\n".join(game_id_array).encode("utf-8"))
+            index_file.seek(0)
+            index_file.write(PositionIndex.HEADER.pack(PositionIndex.MAGIC, PositionIndex.VERSION, record_count,
+                                                       len(game_id_array)))
+
+        return record_count
+
+
+def main():
+    """Builds a position index, or queries one with a FEN string."""
+
+    parser = argparse.ArgumentParser(description="Builds or queries an index of the positions of Xiangqi archives.")
+    parser.add_argument("index")
+    parser.add_argument("archives", nargs="*", help="archives to build the index from")
+    parser.add_argument("--fen", default=None, help="position to look up in the index")
+    parser.add_argument("--no-mirror", action="store_true", help="do not include mirrored positions in the lookup")
+    parser.add_argument("--chunk-size", type=int, default=1000000, help="records sorted in memory at a time")
+    parser.add_argument("--trusted", action="store_true", help="skip move validation while replaying archives")
+    args = parser.parse_args()
+
+    if args.archives:
+        record_count = PositionIndex.build(args.archives, args.index, args.chunk_size, not args.trusted)
+        print("wrote " + str(record_count) + " records to " + args.index)
+
+    if args.fen is not None:
+        with PositionIndex(args.index) as position_index:
+            for game_id, ply, mirrored in position_index.probe_fen(args.fen, not args.no_mirror):
+                print(game_id + "\tply " + str(ply) + ("\tmirrored" if mirrored else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for PositionIndex
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from PositionIndex import PositionIndex
+from Zobrist import Zobrist
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for PositionIndex.py"""
+
+    def setUp(self):
+        """Creates a temporary directory with a small archive."""
+
+        self.directory = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.directory, "games.txt")
+        self.index_path = os.path.join(self.directory, "positions.idx")
+
+        GameArchive(self.archive_path).write_games([
+            ("g1", "RED_WON", [("h3", "e3"), ("h10", "g8"), ("h1", "g3")]),
+            ("g2", "BLACK_WON", [("h3", "e3"), ("b10", "c8")]),
+            ("g3", "DRAW", [("b3", "e3"), ("h10", "g8")]),
+            ("g4", "UNFINISHED", [])])
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_probe(self):
+        """Tests the games and plies found for positions of the archive, including mirrored positions."""
+
+        self.assertEqual(11, PositionIndex.build([self.archive_path], self.index_path))
+
+        with PositionIndex(self.index_path) as position_index:
+            self.assertEqual(["g1", "g2", "g3", "g4"], position_index.get_game_id_array())
+
+            game = XiangqiGame()
+            self.assertEqual([("g1", 0, False), ("g2", 0, False), ("g3", 0, False), ("g4", 0, False)],
+                             position_index.probe(game))
+
+            # h3-e3 and b3-e3 reach mirror images of the same position
+            self.assertTrue(game.make_move("h3", "e3"))
+            self.assertEqual([("g1", 1, False), ("g2", 1, False), ("g3", 1, True)], position_index.probe(game))
+            hash_value, mirrored = Zobrist.canonicalize(Zobrist.hash_game_pair(game))
+            self.assertEqual([("g1", 1, mirrored), ("g2", 1, mirrored), ("g3", 1, not mirrored)],
+                             position_index.probe_hash(hash_value))
+            self.assertEqual([("g1", 1, False), ("g2", 1, False)], position_index.probe(game, False))
+
+            self.assertTrue(game.make_move("h10", "g8"))
+            self.assertTrue(game.make_move("h1", "g3"))
+            self.assertEqual([("g1", 3, False)], position_index.probe(game))
+            self.assertEqual([], position_index.probe_fen("4k4/9/9/9/9/9/9/9/9/4K4 w - - 0 1"))
+
+    def test_external_sort(self):
+        """Tests that an index merged from many sorted runs is the same file as one sorted in memory."""
+
+        a_random = random.Random(3)
+        game_array = []
+
+        for game_number in range(20):
+            game = XiangqiGame()
+            move_array = []
+
+            for _ in range(a_random.randint(0, 40)):
+                legal_move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+                if game.get_game_state() != "UNFINISHED" or not legal_move_array:
+                    break
+
+                move_array.append(a_random.choice(legal_move_array))
+                self.assertTrue(game.make_move(*move_array[-1]))
+
+            game_array.append(("r" + str(game_number), "UNFINISHED", move_array))
+
+        GameArchive(self.archive_path).write_games(game_array)
+        merged_path = os.path.join(self.directory, "merged.idx")
+
+        record_count = PositionIndex.build([self.archive_path], self.index_path)
+        self.assertEqual(record_count, PositionIndex.build([self.archive_path], merged_path, chunk_size=37))
+        self.assertEqual(sum(len(move_array) + 1 for _, _, move_array in game_array), record_count)
+
+        with open(self.index_path, "rb") as index_file, open(merged_path, "rb") as merged_file:
+            self.assertEqual(index_file.read(), merged_file.read())
+
+        # the temporary runs are removed
+        self.assertEqual(["games.txt", "merged.idx", "positions.idx"], sorted(os.listdir(self.directory)))
+
+    def test_rejects_other_files(self):
+        """Tests that a file that is not a position index is rejected."""
+
+        with self.assertRaises(ValueError):
+            PositionIndex(self.archive_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,9 +9,11 @@ from Piece import Piece
 class Soldier(Piece):
     """Represents a soldier piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 0], [-1, 0], [0, 1], [0, -1]]
-
-        Piece.__init__(self, color, "S", possible_moves)
+        Piece.__init__(self, color, "S", self.POSSIBLE_MOVES)
@@ -0,0 +1,104 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a sequential probability ratio test for deciding between two Elo hypotheses from game results.
+
+
+import math
+
+
+class Sprt:
+    """
+    Represents a sequential probability ratio test of H0: the Elo difference is elo0 against H1: it is elo1. Results are
+    added one game at a time and the log-likelihood ratio is computed with the normal approximation of the trinomial
+    win, draw and loss model. The test accepts H1 once the ratio reaches the upper bound and H0 once it reaches the lower
+    bound.
+    """
+
+    def __init__(self, elo0=0.0, elo1=10.0, alpha=0.05, beta=0.05):
+        """Initializes the test with the passed hypotheses and the false positive and false negative rates."""
+
+        self.__elo0 = elo0
+        self.__elo1 = elo1
+        self.__lower_bound = math.log(beta / (1 - alpha))
+        self.__upper_bound = math.log((1 - beta) / alpha)
+        self.__wins = 0
+        self.__draws = 0
+        self.__losses = 0
+
+    def get_bounds(self):
+        """Returns a tuple of the lower and upper log-likelihood ratio bounds."""
+
+        return self.__lower_bound, self.__upper_bound
+
+    def get_counts(self):
+        """Returns a tuple of the win, draw and loss counts."""
+
+        return self.__wins, self.__draws, self.__losses
+
+    def add_result(self, score):
+        """Adds a game with the passed score, 1 for a win, 0.5 for a draw and 0 for a loss."""
+
+        if score == 1:
+            self.__wins += 1
+        elif score == 0:
+            self.__losses += 1
+        else:
+            self.__draws += 1
+
+        return None
+
+    @staticmethod
+    def expected_score(elo):
+        """Returns the expected score for the passed Elo difference."""
+
+        return 1 / (1 + 10 ** (-elo / 400))
+
+    def get_score(self):
+        """Returns the mean score per game. Returns 0.5 if no games were added."""
+
+        game_count = self.__wins + self.__draws + self.__losses
+
+        if game_count == 0:
+            return 0.5
+
+        return (self.__wins + 0.5 * self.__draws) / game_count
+
+    def get_elo(self):
+        """Returns the Elo difference estimated from the mean score, capped at plus or minus 1000."""
+
+        score = min(max(self.get_score(), 1e-3), 1 - 1e-3)
+
+        return max(-1000.0, min(1000.0, -400 * math.log10(1 / score - 1)))
+
+    def get_llr(self):
+        """Returns the log-likelihood ratio of H1 against H0. Returns 0.0 until the results have some variance."""
+
+        game_count = self.__wins + self.__draws + self.__losses
+
+        if game_count == 0:
+            return 0.0
+
+        score = self.get_score()
+        variance = (self.__wins * (1 - score) ** 2 + self.__draws * (0.5 - score) ** 2 +
+                    self.__losses * score ** 2) / game_count
+
+        if variance == 0:
+            return 0.0
+
+        score0 = self.expected_score(self.__elo0)
+        score1 = self.expected_score(self.__elo1)
+
+        return game_count * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance)
+
+    def get_decision(self):
+        """Returns 'H1' or 'H0' if the test accepted a hypothesis and None while it continues."""
+
+        llr = self.get_llr()
+
+        if llr >= self.__upper_bound:
+            return "H1"
+
+        if llr <= self.__lower_bound:
+            return "H0"
+
+        return None
@@ -0,0 +1,336 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an opt-in profiler for the move generation stages of XiangqiGame. It counts calls, candidate
+#              moves in and out and cumulative time per stage and per piece symbol.
+
+
+import argparse
+import functools
+import json
+import threading
+import time
+
+from XiangqiGameWithImports import XiangqiGame
+
+
+class StageProfiler:
+    """
+    Represents a profiler of the XiangqiGame move generation stages. While enabled the stage methods of the XiangqiGame
+    class are replaced by wrappers that record into the profiler, so every game in the process is measured. Disabling
+    puts the original methods back, which leaves no overhead at all. Times are inclusive: a stage that calls other
+    stages also counts their time. Stages are attributed to the symbol passed to the get_valid_end_pos_array or
+    generate_end_square call that runs them, or to "-" outside of one.
+
+    make_move and the legal move generation run the fused generators, generate_end_square for the end squares of a
+    piece, get_rule_error_square for a single move and generate_attacker_square for check detection. The restriction
+    stages are only run by get_valid_end_pos_array. A generator stage records one call per generator, the squares it
+    yielded as moves out and the time spent producing them, not the time its caller spent between squares.
+    """
+
+    # stage name mapped to the argument index of its candidate array and whether it returns a tuple of arrays, or
+    # "yield" for a generator whose yielded squares are counted. stages without candidate arrays only count calls and
+    # time.
+    STAGE_DICT = {"generate_legal_square_move": (None, "yield"),
+                  "generate_end_square": (None, "yield"),
+                  "get_rule_error_square": (None, None),
+                  "move_leaves_check": (None, None),
+                  "square_attacked": (None, None),
+                  "generate_attacker_square": (None, "yield"),
+                  "get_valid_end_pos_array": (None, False),
+                  "board_restriction": (1, True),
+                  "convert_moves": (1, False),
+                  "color_restriction": (1, True),
+                  "jump_restriction": (0, True),
+                  "castle_restriction": (1, False),
+                  "elephant_restriction": (1, False),
+                  "soldier_restriction": (1, False),
+                  "cannon_restriction": (1, True),
+                  "generals_facing_restriction": (1, False),
+                  "is_in_check": (None, None),
+                  "checkmate_preventable": (None, None),
+                  "stalemate": (None, None),
+                  "make_move": (None, None)}
+
+    # stages that run the moves of one piece mapped to the argument index of its piece symbol
+    SYMBOL_STAGE_DICT = {"get_valid_end_pos_array": 1, "generate_end_square": 1}
+
+    NO_SYMBOL = "-"
+
+    # only one profiler can own the class methods at a time
+    __active = None
+
+    def __init__(self, stage_array=None):
+        """Initializes a disabled profiler of the passed stage names, every stage in STAGE_DICT if None."""
+
+        if stage_array is None:
+            stage_array = list(self.STAGE_DICT)
+
+        for stage in stage_array:
+            if stage not in self.STAGE_DICT:
+                raise ValueError("unknown stage " + stage)
+
+        self.__stage_array = stage_array
+        self.__original_dict = {}
+        self.__stat_dict = {}
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+    def is_enabled(self):
+        """Returns True if the profiler is recording. Returns False otherwise."""
+
+        return StageProfiler.__active is self
+
+    def enable(self):
+        """
+        Replaces the stage methods of XiangqiGame with recording wrappers. Raises ValueError if another profiler is
+        enabled or a stage method is already wrapped.
+        """
+
+        if StageProfiler.__active is self:
+            return None
+
+        if StageProfiler.__active is not None:
+            raise ValueError("another StageProfiler is enabled")
+
+        # methods wrapped by someone else, like an instrumenting MetricsRegistry, could not be put back in any order
+        for stage in self.__stage_array:
+            if hasattr(XiangqiGame.__dict__[stage], "__wrapped__"):
+                raise ValueError("XiangqiGame." + stage + " is already wrapped")
+
+        for stage in self.__stage_array:
+            original = XiangqiGame.__dict__[stage]
+            self.__original_dict[stage] = original
+            setattr(XiangqiGame, stage, self.wrap(stage, original))
+
+        StageProfiler.__active = self
+
+        return None
+
+    def disable(self):
+        """Puts the original stage methods of XiangqiGame back. Recorded statistics are kept."""
+
+        if StageProfiler.__active is not self:
+            return None
+
+        for stage, original in self.__original_dict.items():
+            setattr(XiangqiGame, stage, original)
+
+        self.__original_dict = {}
+        StageProfiler.__active = None
+
+        return None
+
+    def __enter__(self):
+        """Enables the profiler for a with block."""
+
+        self.enable()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disables the profiler at the end of a with block."""
+
+        self.disable()
+
+        return False
+
+    def reset(self):
+        """Clears the recorded statistics."""
+
+        with self.__lock:
+            self.__stat_dict = {}
+
+        return None
+
+    def get_symbol_stack(self):
+        """Returns the stack of piece symbols being generated on the current thread."""
+
+        symbol_stack = getattr(self.__local, "symbol_stack", None)
+
+        if symbol_stack is None:
+            symbol_stack = []
+            self.__local.symbol_stack = symbol_stack
+
+        return symbol_stack
+
+    def wrap(self, stage, original):
+        """Returns a wrapper of the passed original stage method that records into the profiler."""
+
+        input_index, output_is_tuple = self.STAGE_DICT[stage]
+        symbol_index = self.SYMBOL_STAGE_DICT.get(stage)
+        perf_counter = time.perf_counter
+        profiler = self
+
+        if output_is_tuple == "yield":
+            return self.wrap_generator(stage, original, symbol_index)
+
+        @functools.wraps(original)
+        def wrapper(game, *args, **kwargs):
+            symbol_stack = profiler.get_symbol_stack()
+            symbol = profiler.get_symbol(symbol_stack, symbol_index, args, kwargs)
+
+            if symbol_index is not None:
+                symbol_stack.append(symbol)
+
+            start_time = perf_counter()
+
+            try:
+                result = original(game, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start_time
+
+                if symbol_index is not None:
+                    symbol_stack.pop()
+
+            if input_index is not None and len(args) > input_index and args[input_index]:
+                moves_in = len(args[input_index])
+            else:
+                moves_in = 0
+
+            if output_is_tuple is None:
+                moves_out = 0
+            elif output_is_tuple:
+                moves_out = len(result[0]) if result and result[0] else 0
+            else:
+                moves_out = len(result) if result else 0
+
+            profiler.record(stage, symbol, moves_in, moves_out, elapsed)
+
+            return result
+
+        return wrapper
+
+    def wrap_generator(self, stage, original, symbol_index):
+        """
+        Returns a wrapper of the passed original generator stage method that records into the profiler once the
+        generator is exhausted or closed, timing only the steps of the generator.
+        """
+
+        perf_counter = time.perf_counter
+        profiler = self
+
+        @functools.wraps(original)
+        def wrapper(game, *args, **kwargs):
+            symbol_stack = profiler.get_symbol_stack()
+            symbol = profiler.get_symbol(symbol_stack, symbol_index, args, kwargs)
+            iterator = original(game, *args, **kwargs)
+            moves_out = 0
+            elapsed = 0.0
+
+            try:
+                while True:
+                    # the symbol is only on the stack while the generator runs, as callers run between squares
+                    if symbol_index is not None:
+                        symbol_stack.append(symbol)
+
+                    start_time = perf_counter()
+
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        elapsed += perf_counter() - start_time
+
+                        if symbol_index is not None:
+                            symbol_stack.pop()
+
+                    moves_out += 1
+                    yield item
+            finally:
+                iterator.close()
+                profiler.record(stage, symbol, 0, moves_out, elapsed)
+
+        return wrapper
+
+    def get_symbol(self, symbol_stack, symbol_index, args, kwargs):
+        """
+        Returns the piece symbol a stage call is attributed to: its own piece_symbol argument at the passed symbol_index
+        if it has one, otherwise the symbol on top of the passed symbol_stack.
+        """
+
+        if symbol_index is not None:
+            return args[symbol_index] if len(args) > symbol_index else kwargs.get("piece_symbol", self.NO_SYMBOL)
+
+        return symbol_stack[-1] if symbol_stack else self.NO_SYMBOL
+
+    def record(self, stage, symbol, moves_in, moves_out, elapsed):
+        """Adds one call of the passed stage for the passed symbol to the statistics."""
+
+        with self.__lock:
+            symbol_dict = self.__stat_dict.setdefault(stage, {})
+            stat = symbol_dict.get(symbol)
+
+            if stat is None:
+                symbol_dict[symbol] = [1, moves_in, moves_out, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += moves_in
+                stat[2] += moves_out
+                stat[3] += elapsed
+
+        return None
+
+    @staticmethod
+    def stat_to_dict(stat):
+        """Returns the report dictionary of the passed [calls, moves_in, moves_out, time] statistic."""
+
+        calls, moves_in, moves_out, elapsed = stat
+
+        return {"calls": calls,
+                "moves_in": moves_in,
+                "moves_out": moves_out,
+                "time_s": elapsed,
+                "mean_us": 1e6 * elapsed / calls if calls else 0.0}
+
+    def report(self):
+        """
+        Returns a dictionary mapping each recorded stage to its calls, candidate moves in and out, time in seconds and
+        mean time per call in microseconds, with the same values per piece symbol under "symbols".
+        """
+
+        report_dict = {}
+
+        with self.__lock:
+            for stage, symbol_dict in self.__stat_dict.items():
+                total = [0, 0, 0, 0.0]
+
+                for stat in symbol_dict.values():
+                    for index in range(4):
+                        total[index] += stat[index]
+
+                stage_report = self.stat_to_dict(total)
+                stage_report["symbols"] = {symbol: self.stat_to_dict(stat) for symbol, stat in symbol_dict.items()}
+                report_dict[stage] = stage_report
+
+        return report_dict
+
+    def to_json(self, indent=None):
+        """Returns the report as a JSON string."""
+
+        return json.dumps(self.report(), indent=indent, sort_keys=True)
+
+
+def main():
+    """Plays the passed moves with the profiler enabled and prints the report."""
+
+    parser = argparse.ArgumentParser(description="Profiles the XiangqiGame move generation stages over a sequence of "
+                                                 "moves.")
+    parser.add_argument("moves", nargs="*", default=["h3-e3", "h10-g8", "h1-g3", "i10-h10"],
+                        help="moves written as start-end, for example h3-e3")
+    args = parser.parse_args()
+
+    game = XiangqiGame()
+
+    with StageProfiler() as profiler:
+        for move in args.moves:
+            start_pos, end_pos = move.split("-")
+
+            if not game.make_move(start_pos, end_pos):
+                raise ValueError("illegal move " + move)
+
+    print(profiler.to_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
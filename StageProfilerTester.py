@@ -0,0 +1,91 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for StageProfiler
+
+import json
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from StageProfiler import StageProfiler
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for StageProfiler.py"""
+
+    def test_report(self):
+        """Tests that calls, candidate moves and symbols are recorded while enabled."""
+
+        game = XiangqiGame()
+
+        with StageProfiler() as profiler:
+            self.assertTrue(profiler.is_enabled())
+            self.assertEqual(["a2", "a3"], game.get_valid_end_pos_array("a1", "R"))
+
+        report_dict = profiler.report()
+
+        self.assertEqual(1, report_dict["get_valid_end_pos_array"]["calls"])
+        self.assertEqual(2, report_dict["get_valid_end_pos_array"]["moves_out"])
+        self.assertEqual(["R"], list(report_dict["board_restriction"]["symbols"]))
+        self.assertGreaterEqual(report_dict["board_restriction"]["moves_in"],
+                                report_dict["board_restriction"]["moves_out"])
+        self.assertEqual(report_dict, json.loads(profiler.to_json()))
+
+        profiler.reset()
+        self.assertEqual({}, profiler.report())
+
+    def test_make_move_stages(self):
+        """Tests that moves record the move generation stages that make_move runs."""
+
+        game = XiangqiGame()
+
+        with StageProfiler(["make_move", "stalemate", "get_rule_error_square", "generate_legal_square_move",
+                            "generate_end_square", "square_attacked", "generate_attacker_square"]) as profiler:
+            self.assertTrue(game.make_move("h3", "e3"))
+            self.assertTrue(game.make_move("h10", "g8"))
+
+        report_dict = profiler.report()
+
+        self.assertEqual(2, report_dict["make_move"]["calls"])
+        self.assertEqual(["-"], list(report_dict["stalemate"]["symbols"]))
+        self.assertNotIn("is_in_check", report_dict)
+
+        for stage in ("get_rule_error_square", "generate_legal_square_move", "generate_end_square", "square_attacked",
+                      "generate_attacker_square"):
+            self.assertGreater(report_dict[stage]["calls"], 0, stage)
+
+        # end squares are attributed to the piece generating them and counted as they are yielded
+        self.assertNotIn("-", report_dict["generate_end_square"]["symbols"])
+        self.assertGreater(report_dict["generate_end_square"]["moves_out"], 0)
+        self.assertGreater(report_dict["generate_legal_square_move"]["moves_out"], 0)
+
+    def test_generator_stage(self):
+        """Tests that a generator stage records the squares it yields once it is exhausted."""
+
+        game = XiangqiGame()
+
+        with StageProfiler(["generate_end_square"]) as profiler:
+            self.assertEqual(game.get_valid_end_square_array(0, "R"), list(game.generate_end_square(0, "R")))
+
+        stat = profiler.report()["generate_end_square"]["symbols"]["R"]
+
+        self.assertEqual(2, stat["calls"])
+        self.assertEqual(4, stat["moves_out"])
+
+    def test_disable_restores_methods(self):
+        """Tests that disabling puts the original methods back and that only one profiler can be enabled."""
+
+        original = XiangqiGame.__dict__["color_restriction"]
+        profiler = StageProfiler()
+        profiler.enable()
+
+        self.assertIsNot(original, XiangqiGame.__dict__["color_restriction"])
+        self.assertRaises(ValueError, StageProfiler().enable)
+
+        profiler.disable()
+
+        self.assertIs(original, XiangqiGame.__dict__["color_restriction"])
+        self.assertFalse(profiler.is_enabled())
+        self.assertRaises(ValueError, StageProfiler, ["no_such_stage"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines SVG diagrams of the board of a game of Xiangqi, assembled from a board background and piece
+#              fragments built once, and a batch mode writing a diagram of every position of a game to disk.
+
+
+import argparse
+import os
+import time
+
+from XiangqiGameWithImports import XiangqiGame
+from GameArchive import GameArchive
+from BoardRenderer import BoardRenderer
+
+
+class SvgDiagram:
+    """
+    Represents an SVG diagram of the board of a game. The board background, its lines, palaces, river and coordinates,
+    and the fragment of every piece on every square are built once and shared by every diagram, so a diagram is the
+    background, the fragments of the occupied squares and a closing tag joined together. The diagram observes the
+    game and make_move replaces only the fragments of its start and end squares.
+    """
+
+    CELL_SIZE = 40
+    MARGIN = 40
+    PIECE_RADIUS = 18
+    BOARD_COLOR = "#f0d9a4"
+    LINE_COLOR = "#5a3a1a"
+    COLOR_DICT = {"red": "#c00000", "black": "#202020"}
+
+    # shared background and piece fragments, built by the first diagram
+    __background = None
+    __fragment_dict = None
+
+    def __init__(self, game):
+        """Initializes the diagram of the current position of the passed game and makes it observe the game."""
+
+        if SvgDiagram.__background is None:
+            SvgDiagram.__background = SvgDiagram.build_background()
+            SvgDiagram.__fragment_dict = SvgDiagram.build_fragment_dict()
+
+        self.__game = game
+        self.__square_fragment_array = [""] * len(game.get_board().get_point_array())
+
+        self.update(range(len(self.__square_fragment_array)))
+        game.add_observer(self)
+
+    def get_game(self):
+        """Getter for game."""
+
+        return self.__game
+
+    @staticmethod
+    def get_coordinate_pair(file_index, rank_index):
+        """Returns the x and y coordinates of the point at the passed file_index and rank_index, rank 10 at the top."""
+
+        return SvgDiagram.MARGIN + file_index * SvgDiagram.CELL_SIZE, \
+            SvgDiagram.MARGIN + (9 - rank_index) * SvgDiagram.CELL_SIZE
+
+    @staticmethod
+    def get_line(start_pair, end_pair):
+        """Returns the SVG line from the passed start coordinates to the passed end coordinates."""
+
+        return '<line x1="%d" y1="%d" x2="%d" y2="%d"/>' % (start_pair + end_pair)
+
+    @staticmethod
+    def build_background():
+        """Returns the opening of the SVG document with the board, its lines, palaces, river and coordinates."""
+
+        coordinate_pair = SvgDiagram.get_coordinate_pair
+        line = SvgDiagram.get_line
+        width = 2 * SvgDiagram.MARGIN + 8 * SvgDiagram.CELL_SIZE
+        height = 2 * SvgDiagram.MARGIN + 9 * SvgDiagram.CELL_SIZE
+        part_array = ['<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="0 0 %d %d">'
+                      % (width, height, width, height),
+                      '<rect width="%d" height="%d" fill="%s"/>' % (width, height, SvgDiagram.BOARD_COLOR),
+                      '<g stroke="%s" stroke-width="1.5">' % SvgDiagram.LINE_COLOR]
+
+        for rank_index in range(10):
+            part_array.append(line(coordinate_pair(0, rank_index), coordinate_pair(8, rank_index)))
+
+        # the edge files cross the river, the other files stop at it
+        for file_index in range(9):
+            if file_index in (0, 8):
+                part_array.append(line(coordinate_pair(file_index, 0), coordinate_pair(file_index, 9)))
+            else:
+                part_array.append(line(coordinate_pair(file_index, 0), coordinate_pair(file_index, 4)))
+                part_array.append(line(coordinate_pair(file_index, 5), coordinate_pair(file_index, 9)))
+
+        # palace diagonals
+        for bottom_rank_index in (0, 7):
+            part_array.append(line(coordinate_pair(3, bottom_rank_index), coordinate_pair(5, bottom_rank_index + 2)))
+            part_array.append(line(coordinate_pair(5, bottom_rank_index), coordinate_pair(3, bottom_rank_index + 2)))
+
+        part_array.append('</g>')
+
+        river_y = (coordinate_pair(0, 4)[1] + coordinate_pair(0, 5)[1]) // 2
+        part_array.append('<g font-family="serif" font-size="24" fill="%s" text-anchor="middle" '
+                          'dominant-baseline="central">' % SvgDiagram.LINE_COLOR)
+        part_array.append('<text x="%d" y="%d">楚河</text>' % (coordinate_pair(2, 0)[0], river_y))
+        part_array.append('<text x="%d" y="%d">漢界</text>' % (coordinate_pair(6, 0)[0], river_y))
+        part_array.append('</g>')
+
+        part_array.append('<g font-family="sans-serif" font-size="12" fill="%s" text-anchor="middle" '
+                          'dominant-baseline="central">' % SvgDiagram.LINE_COLOR)
+
+        for file_index, file in enumerate("abcdefghi"):
+            x, y = coordinate_pair(file_index, 0)
+            part_array.append('<text x="%d" y="%d">%s</text>' % (x, y + SvgDiagram.MARGIN * 3 // 4, file))
+
+        for rank_index in range(10):
+            x, y = coordinate_pair(0, rank_index)
+            part_array.append('<text x="%d" y="%d">%d</text>' % (x - SvgDiagram.MARGIN * 3 // 4, y, rank_index + 1))
+
+        part_array.append('</g>')
+
+        return "".join(part_array)
+
+    @staticmethod
+    def build_fragment_dict():
+        """
+        Returns a dictionary from the color and symbol of every piece to the array of its fragment on every square,
+        a circle with the Chinese character of the piece.
+        """
+
+        fragment_dict = {}
+
+        for color, symbol_dict in BoardRenderer.UNICODE_SYMBOL_DICT.items():
+            piece_color = SvgDiagram.COLOR_DICT[color]
+
+            for symbol, character in symbol_dict.items():
+                fragment_array = []
+
+                for file_index in range(9):
+                    for rank_index in range(10):
+                        x, y = SvgDiagram.get_coordinate_pair(file_index, rank_index)
+                        fragment_array.append(
+                            '<g transform="translate(%d,%d)"><circle r="%d" fill="#fdf3dc" stroke="%s" '
+                            'stroke-width="2"/><text font-family="serif" font-size="22" fill="%s" '
+                            'text-anchor="middle" dominant-baseline="central">%s</text></g>'
+                            % (x, y, SvgDiagram.PIECE_RADIUS, piece_color, piece_color, character))
+
+                fragment_dict[(color, symbol)] = fragment_array
+
+        return fragment_dict
+
+    def update(self, square_array):
+        """
+        Replaces the fragments of the passed squares with the pieces now on them. Moves made with make_move of the game
+        are updated automatically. Call it after changing the board directly.
+        """
+
+        point_array = self.__game.get_board().get_point_array()
+        fragment_dict = SvgDiagram.__fragment_dict
+
+        for square in square_array:
+            piece = point_array[square].get_piece()
+
+            if piece is None:
+                self.__square_fragment_array[square] = ""
+            else:
+                self.__square_fragment_array[square] = fragment_dict[(piece.get_color(), piece.get_symbol())][square]
+
+        return None
+
+    def render(self):
+        """Returns the SVG document of the current position."""
+
+        return SvgDiagram.__background + "".join(self.__square_fragment_array) + "</svg>\n"
+
+    @staticmethod
+    def render_game(move_array, validate=True):
+        """
+        Generator that yields the SVG document of the start position and of the position after each move of the passed
+        move_array. If validate is True moves are played with make_move and a ValueError is raised for an illegal move,
+        otherwise they are applied to the board directly, as GameArchive.replay does for trusted archives.
+        """
+
+        game = XiangqiGame()
+        board = game.get_board()
+        diagram = SvgDiagram(game)
+
+        yield diagram.render()
+
+        for ply, (start_pos, end_pos) in enumerate(move_array):
+            if validate:
+                if not game.make_move(start_pos, end_pos):
+                    raise ValueError("illegal move " + start_pos + "-" + end_pos + " at ply " + str(ply))
+            else:
+                game.move_piece(start_pos, end_pos)
+                game.switch_current_player()
+                diagram.update([board.get_square_from_pos(start_pos), board.get_square_from_pos(end_pos)])
+
+            yield diagram.render()
+
+    @staticmethod
+    def write_game(move_array, directory, prefix="position", validate=True):
+        """
+        Writes the diagram of every position of the passed move_array to the passed directory as prefix_ply.svg, one
+        file at a time as it is rendered, and returns the number of files written.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        count = 0
+
+        for ply, svg in enumerate(SvgDiagram.render_game(move_array, validate)):
+            with open(os.path.join(directory, "%s_%03d.svg" % (prefix, ply)), "w", encoding="utf-8") as svg_file:
+                svg_file.write(svg)
+
+            count += 1
+
+        return count
+
+
+def main():
+    """Writes the diagrams of every position of the games of an archive, or of one game."""
+
+    parser = argparse.ArgumentParser(description="Writes SVG diagrams of every position of archived Xiangqi games.")
+    parser.add_argument("archive", help="text game archive to read the games from")
+    parser.add_argument("--output-dir", default="diagrams", help="directory to write the diagrams to")
+    parser.add_argument("--game-id", default=None, help="game to render, every game of the archive by default")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    count = 0
+
+    for game_id, _, move_array in GameArchive(args.archive).read_games():
+        if args.game_id is None or str(game_id) == args.game_id:
+            count += SvgDiagram.write_game(move_array, args.output_dir, "game_" + str(game_id), validate=False)
+
+    seconds = time.perf_counter() - start_time
+    print("{} diagrams in {:.2f} s, {:.0f} per second".format(count, seconds, count / seconds if seconds else 0))
+
+
+if __name__ == "__main__":
+    main()
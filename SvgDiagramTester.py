@@ -0,0 +1,76 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for SvgDiagram
+
+import os
+import random
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+from XiangqiGameWithImports import XiangqiGame
+from SvgDiagram import SvgDiagram
+
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for SvgDiagram.py"""
+
+    def test_start_position(self):
+        """Tests that the diagram of the starting position is an SVG document with the board and all 32 pieces."""
+
+        game = XiangqiGame()
+        root = ElementTree.fromstring(SvgDiagram(game).render())
+
+        self.assertEqual(SVG_NAMESPACE + "svg", root.tag)
+        self.assertEqual(32, len(root.findall(".//" + SVG_NAMESPACE + "circle")))
+
+        # 10 ranks, 2 edge files, 7 files split by the river and 4 palace diagonals
+        self.assertEqual(30, len(root.findall(".//" + SVG_NAMESPACE + "line")))
+
+        text_array = [text.text for text in root.iter(SVG_NAMESPACE + "text")]
+        self.assertEqual(2, text_array.count("帥") + text_array.count("將"))
+        self.assertEqual(5, text_array.count("兵"))
+        self.assertIn("楚河", text_array)
+
+    def test_incremental_render(self):
+        """Tests that the diagram after every move is the same as the diagram of the position built from scratch."""
+
+        game = XiangqiGame()
+        diagram = SvgDiagram(game)
+        a_random = random.Random(5)
+
+        for _ in range(60):
+            move_array = game.get_legal_move_array(game.get_current_player().get_color())
+
+            if game.get_game_state() != "UNFINISHED" or not move_array:
+                break
+
+            self.assertTrue(game.make_move(*a_random.choice(move_array)))
+
+            fresh_diagram = SvgDiagram(game)
+            game.remove_observer(fresh_diagram)
+            self.assertEqual(fresh_diagram.render(), diagram.render())
+
+    def test_write_game(self):
+        """Tests that the batch mode writes one diagram per position and rejects illegal moves."""
+
+        move_array = [("h3", "e3"), ("h10", "g8"), ("h1", "g3")]
+        svg_array = list(SvgDiagram.render_game(move_array))
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(4, SvgDiagram.write_game(move_array, directory, "game_1", validate=False))
+            self.assertEqual(["game_1_000.svg", "game_1_001.svg", "game_1_002.svg", "game_1_003.svg"],
+                             sorted(os.listdir(directory)))
+
+            with open(os.path.join(directory, "game_1_003.svg"), encoding="utf-8") as svg_file:
+                self.assertEqual(svg_array[3], svg_file.read())
+
+        self.assertNotEqual(svg_array[0], svg_array[1])
+
+        with self.assertRaises(ValueError):
+            list(SvgDiagram.render_game([("h3", "h5"), ("a10", "a5")]))
+
+
+if __name__ == '__main__':
+    unittest.main()
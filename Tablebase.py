@@ -0,0 +1,562 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines an endgame tablebase for the game Xiangqi. A tablebase is generated for a small material set by
+#              enumerating every placement of its pieces and solving the positions by retrograde analysis into win,
+#              draw or loss with the distance to mate in plies. Results are stored in a bit-packed file per material
+#              set and probed by position.
+
+
+import argparse
+import multiprocessing
+import os
+import struct
+import time
+
+from Board import Board
+from XiangqiGameWithImports import XiangqiGame
+from PositionCodec import PositionCodec
+
+
+class Tablebase:
+    """
+    Represents a directory of tablebase files. A material set is written as the red pieces and the black pieces
+    separated by a dash, using piece symbols and one General per side, for example 'GR-GAA'. Positions of a material set
+    are indexed by the square of each piece within its allowed squares and the side to move. Results are from the point
+    of view of the side to move.
+    """
+
+    DRAW = 0
+    WIN = 1
+    LOSS = 2
+    ILLEGAL = 3
+    RESULT_ARRAY = ["DRAW", "WIN", "LOSS", "ILLEGAL"]
+
+    HEADER = struct.Struct("<4sII")
+    MAGIC = b"XQTB"
+    VERSION = 1
+    SYMBOL_ORDER = "GAEHRCS"
+    CHUNK_SIZE = 2048
+
+    def __init__(self, directory):
+        """Initializes the tablebase stored in the passed directory."""
+
+        self.__directory = directory
+        self.__table_dict = {}
+        self.__slot_array_dict = {}
+
+    def get_directory(self):
+        """Getter for directory."""
+
+        return self.__directory
+
+    def get_path(self, material):
+        """Returns the path of the file for the passed material set."""
+
+        return os.path.join(self.__directory, Tablebase.normalize_material(material) + ".tb")
+
+    @staticmethod
+    def normalize_material(material):
+        """
+        Returns the passed material set with upper case symbols in the standard order. Raises ValueError if it does not
+        have exactly one General per side.
+        """
+
+        side_array = material.upper().split("-")
+
+        if len(side_array) != 2:
+            raise ValueError("material must be red pieces and black pieces separated by a dash: " + material)
+
+        normalized_array = []
+
+        for side in side_array:
+            if side.count("G") != 1 or any(symbol not in Tablebase.SYMBOL_ORDER for symbol in side):
+                raise ValueError("each side needs one General and only piece symbols: " + material)
+
+            normalized_array.append("".join(sorted(side, key=Tablebase.SYMBOL_ORDER.index)))
+
+        return normalized_array[0] + "-" + normalized_array[1]
+
+    @staticmethod
+    def get_material_of_board(board):
+        """Returns the normalized material set of the pieces on the passed board."""
+
+        side_dict = {"red": "", "black": ""}
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None:
+                side_dict[piece.get_color()] += piece.get_symbol()
+
+        return Tablebase.normalize_material(side_dict["red"] + "-" + side_dict["black"])
+
+    @staticmethod
+    def get_sub_material_array(material):
+        """Returns an array of the material sets reached by capturing one piece other than a General."""
+
+        red_side, black_side = Tablebase.normalize_material(material).split("-")
+        sub_material_array = []
+
+        for side_index, side in enumerate((red_side, black_side)):
+            for symbol in sorted(set(side) - {"G"}, key=Tablebase.SYMBOL_ORDER.index):
+                smaller_side = side.replace(symbol, "", 1)
+
+                if side_index == 0:
+                    sub_material_array.append(smaller_side + "-" + black_side)
+                else:
+                    sub_material_array.append(red_side + "-" + smaller_side)
+
+        return sub_material_array
+
+    @staticmethod
+    def get_domain(color, symbol):
+        """
+        Returns a sorted array of the square ids a piece with the passed color and symbol can ever stand on. Generals
+        and Advisors stay in their castle, Elephants stay on their side and Soldiers never move backwards.
+        """
+
+        board = Board()
+        domain = []
+
+        if color == "red":
+            castle_array = board.get_red_castle_array()
+            side_array = board.get_red_side_array()
+        else:
+            castle_array = board.get_black_castle_array()
+            side_array = board.get_black_side_array()
+
+        # Advisors stand on the middle and the corners of the castle, which share the parity of file and rank index
+        castle_middle_pos = castle_array[4]
+        castle_parity = (board.get_file_index_from_pos(castle_middle_pos) +
+                         board.get_rank_index_from_pos(castle_middle_pos)) % 2
+
+        for point in board.get_point_array():
+            pos = point.get_pos()
+            file_index = board.get_file_index_from_pos(pos)
+            rank_index = board.get_rank_index_from_pos(pos)
+
+            # count ranks from the own side of the board
+            if color == "red":
+                relative_rank_index = rank_index
+            else:
+                relative_rank_index = 9 - rank_index
+
+            if symbol == "G":
+                allowed = pos in castle_array
+            elif symbol == "A":
+                allowed = pos in castle_array and (file_index + rank_index) % 2 == castle_parity
+            elif symbol == "E":
+                allowed = (pos in side_array and file_index % 2 == 0 and relative_rank_index % 2 == 0 and
+                           (file_index + relative_rank_index) % 4 == 2)
+            elif symbol == "S":
+                allowed = relative_rank_index >= 5 or (relative_rank_index >= 3 and file_index % 2 == 0)
+            else:
+                allowed = True
+
+            if allowed:
+                domain.append(PositionCodec.encode_square(pos))
+
+        return domain
+
+    @staticmethod
+    def get_slot_array(material):
+        """Returns an array of (color, symbol, domain) tuples, one per piece of the passed material set."""
+
+        red_side, black_side = Tablebase.normalize_material(material).split("-")
+        slot_array = []
+
+        for color, side in (("red", red_side), ("black", black_side)):
+            for symbol in side:
+                slot_array.append((color, symbol, Tablebase.get_domain(color, symbol)))
+
+        return slot_array
+
+    @staticmethod
+    def get_position_count(material):
+        """Returns the number of indexed positions of the passed material set."""
+
+        position_count = 2
+
+        for color, symbol, domain in Tablebase.get_slot_array(material):
+            position_count *= len(domain)
+
+        return position_count
+
+    @staticmethod
+    def get_index(slot_array, board, player_color):
+        """
+        Returns the index of the passed board with the passed player_color to move within the material set described by
+        the passed slot_array. Identical pieces are assigned to their slots in square order. Returns None if a piece is
+        outside its domain or the board does not hold the material set.
+        """
+
+        square_array_dict = {}
+        square = 0
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None:
+                square_array_dict.setdefault((piece.get_color(), piece.get_symbol()), []).append(square)
+
+            square += 1
+
+        index = 0
+
+        for color, symbol, domain in slot_array:
+            square_array = square_array_dict.get((color, symbol))
+
+            if not square_array:
+                return None
+
+            square = square_array.pop(0)
+
+            if square not in domain:
+                return None
+
+            index = index * len(domain) + domain.index(square)
+
+        if any(square_array_dict.values()):
+            return None
+
+        return index * 2 + (1 if player_color == "black" else 0)
+
+    @staticmethod
+    def set_position(game, slot_array, index):
+        """
+        Sets the passed game to the position with the passed index in the material set described by the passed
+        slot_array. Returns False if two pieces share a square, True otherwise.
+        """
+
+        board = game.get_board()
+        point_array = board.get_point_array()
+        board.clear_board()
+
+        if index % 2 == 0:
+            game.set_current_player("red")
+        else:
+            game.set_current_player("black")
+
+        index //= 2
+
+        for color, symbol, domain in reversed(slot_array):
+            square = domain[index % len(domain)]
+            index //= len(domain)
+
+            if point_array[square].get_piece() is not None:
+                return False
+
+            point_array[square].set_piece(PositionCodec.PIECE_CLASS_DICT[symbol](color))
+
+        return True
+
+    def load(self, material):
+        """
+        Returns a tuple of the packed win, draw and loss bytes and the distance to mate bytes of the passed material
+        set, reading its file on first use. Returns None if the material set has not been generated.
+        """
+
+        material = Tablebase.normalize_material(material)
+
+        if material not in self.__table_dict:
+            path = self.get_path(material)
+
+            if not os.path.exists(path):
+                return None
+
+            with open(path, "rb") as table_file:
+                data = table_file.read()
+
+            magic, version, position_count = self.HEADER.unpack_from(data, 0)
+
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError("not a tablebase file: " + path)
+
+            wdl_size = (position_count + 3) // 4
+            wdl_start = self.HEADER.size
+            self.__table_dict[material] = (data[wdl_start:wdl_start + wdl_size], data[wdl_start + wdl_size:])
+
+        return self.__table_dict[material]
+
+    def get_cached_slot_array(self, material):
+        """Returns the slot array of the passed normalized material set, computing it on first use."""
+
+        if material not in self.__slot_array_dict:
+            self.__slot_array_dict[material] = Tablebase.get_slot_array(material)
+
+        return self.__slot_array_dict[material]
+
+    def probe_board(self, board, player_color):
+        """
+        Returns a tuple of the result code and the distance to mate in plies of the passed board with the passed
+        player_color to move. Returns None if the material set of the board has not been generated.
+        """
+
+        material = Tablebase.get_material_of_board(board)
+        table = self.load(material)
+
+        if table is None:
+            return None
+
+        index = Tablebase.get_index(self.get_cached_slot_array(material), board, player_color)
+
+        if index is None:
+            return Tablebase.ILLEGAL, 0
+
+        wdl_data, dtm_data = table
+        result_code = (wdl_data[index >> 2] >> ((index & 3) * 2)) & 3
+
+        return result_code, dtm_data[index]
+
+    def probe(self, game):
+        """
+        Returns a tuple of 'WIN', 'DRAW', 'LOSS' or 'ILLEGAL' for the side to move and the distance to mate in plies of
+        the current position of the passed game. Returns None if the material set has not been generated.
+        """
+
+        probe_result = self.probe_board(game.get_board(), game.get_current_player().get_color())
+
+        if probe_result is None:
+            return None
+
+        return Tablebase.RESULT_ARRAY[probe_result[0]], probe_result[1]
+
+    def expand_range(self, material, start_index, stop_index):
+        """
+        Returns an array with an entry for each index from start_index up to stop_index of the passed material set.
+        The entry is None for an illegal position, otherwise a tuple of an array of the indices reached by non capturing
+        moves and an array of the (result code, distance to mate) of the positions reached by captures.
+        """
+
+        slot_array = self.get_cached_slot_array(Tablebase.normalize_material(material))
+        game = XiangqiGame()
+        board = game.get_board()
+        entry_array = []
+
+        for index in range(start_index, stop_index):
+            if not Tablebase.set_position(game, slot_array, index):
+                entry_array.append(None)
+                continue
+
+            player_color = game.get_current_player().get_color()
+            opposing_color = game.opposing_player_color(player_color)
+
+            # positions where the Generals face or the side that just moved is in check cannot be reached
+            if game.generals_facing() or game.is_in_check(opposing_color):
+                entry_array.append(None)
+                continue
+
+            child_array = []
+            capture_result_array = []
+
+            for start_pos, end_pos in game.get_legal_move_array(player_color):
+                start_point = board.get_point_with_pos(start_pos)
+                start_piece = start_point.get_piece()
+                end_point = board.get_point_with_pos(end_pos)
+                end_piece = end_point.get_piece()
+
+                game.move_piece(start_pos, end_pos)
+
+                if end_piece is None:
+                    child_index = Tablebase.get_index(slot_array, board, opposing_color)
+
+                    if child_index is None:
+                        raise ValueError("move " + start_pos + "-" + end_pos + " leaves the indexed squares")
+
+                    child_array.append(child_index)
+                else:
+                    probe_result = self.probe_board(board, opposing_color)
+
+                    if probe_result is None:
+                        raise ValueError("missing tablebase for " + Tablebase.get_material_of_board(board))
+
+                    capture_result_array.append(probe_result)
+
+                game.reverse_move(start_point, start_piece, end_point, end_piece)
+
+            entry_array.append((child_array, capture_result_array))
+
+        return entry_array
+
+    @staticmethod
+    def expand_chunk(task):
+        """Runs expand_range for the passed (directory, material, start_index, stop_index) task in a worker process."""
+
+        directory, material, start_index, stop_index = task
+
+        return Tablebase(directory).expand_range(material, start_index, stop_index)
+
+    def generate(self, material, processes=None):
+        """
+        Generates the file of the passed material set and of every smaller material set it reaches by captures, unless
+        they exist already. Move generation is spread over the passed number of processes, all cores if None. Returns a
+        dictionary counting the positions of each result and the generation time.
+        """
+
+        material = Tablebase.normalize_material(material)
+        os.makedirs(self.__directory, exist_ok=True)
+
+        for sub_material in Tablebase.get_sub_material_array(material):
+            if not os.path.exists(self.get_path(sub_material)):
+                self.generate(sub_material, processes)
+
+        start_time = time.perf_counter()
+        position_count = Tablebase.get_position_count(material)
+        task_array = []
+
+        for start_index in range(0, position_count, self.CHUNK_SIZE):
+            task_array.append((self.__directory, material, start_index,
+                               min(position_count, start_index + self.CHUNK_SIZE)))
+
+        if processes == 1:
+            chunk_array = [Tablebase.expand_chunk(task) for task in task_array]
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                chunk_array = pool.map(Tablebase.expand_chunk, task_array)
+
+        entry_array = [entry for chunk in chunk_array for entry in chunk]
+        result_array, dtm_array = Tablebase.solve(entry_array)
+
+        self.write(material, result_array, dtm_array)
+        self.__table_dict.pop(material, None)
+
+        count_dict = {"material": material, "positions": position_count, "seconds": time.perf_counter() - start_time}
+
+        for result_code in range(4):
+            count_dict[Tablebase.RESULT_ARRAY[result_code].lower()] = result_array.count(result_code)
+
+        return count_dict
+
+    @staticmethod
+    def solve(entry_array):
+        """
+        Returns a tuple of a result code array and a distance to mate array for the passed entries of expand_range.
+        Positions are resolved from mates backwards in order of distance: a position is won once one of its moves
+        reaches a lost position and lost once all of its moves reach won positions. Unresolved positions are draws.
+        """
+
+        position_count = len(entry_array)
+        result_array = [Tablebase.DRAW] * position_count
+        dtm_array = [0] * position_count
+        resolved_array = [False] * position_count
+        parent_array = [[] for _ in range(position_count)]
+        remaining_array = [0] * position_count
+        longest_array = [-1] * position_count
+        escape_array = [False] * position_count
+        bucket_dict = {}
+        capture_win_dict = {}
+
+        for index, entry in enumerate(entry_array):
+            if entry is None:
+                result_array[index] = Tablebase.ILLEGAL
+                resolved_array[index] = True
+                continue
+
+            child_array, capture_result_array = entry
+
+            for child_index in child_array:
+                parent_array[child_index].append(index)
+
+            remaining_array[index] = len(child_array)
+            fastest_capture_win = None
+
+            for result_code, dtm in capture_result_array:
+                if result_code == Tablebase.LOSS:
+                    if fastest_capture_win is None or dtm + 1 < fastest_capture_win:
+                        fastest_capture_win = dtm + 1
+                elif result_code == Tablebase.WIN:
+                    longest_array[index] = max(longest_array[index], dtm)
+                else:
+                    escape_array[index] = True
+
+            if not child_array and not capture_result_array:
+                Tablebase.resolve(index, Tablebase.LOSS, 0, result_array, dtm_array, resolved_array, bucket_dict)
+
+            elif fastest_capture_win is not None:
+                escape_array[index] = True
+                capture_win_dict.setdefault(fastest_capture_win, []).append(index)
+
+            elif not child_array and not escape_array[index]:
+                Tablebase.resolve(index, Tablebase.LOSS, longest_array[index] + 1, result_array, dtm_array,
+                                  resolved_array, bucket_dict)
+
+        dtm = 0
+
+        while dtm <= max(list(bucket_dict) + list(capture_win_dict) + [0]):
+            for index in capture_win_dict.get(dtm, []):
+                if not resolved_array[index]:
+                    Tablebase.resolve(index, Tablebase.WIN, dtm, result_array, dtm_array, resolved_array, bucket_dict)
+
+            for index in bucket_dict.get(dtm, []):
+                for parent_index in parent_array[index]:
+                    if resolved_array[parent_index]:
+                        continue
+
+                    if result_array[index] == Tablebase.LOSS:
+                        Tablebase.resolve(parent_index, Tablebase.WIN, dtm + 1, result_array, dtm_array,
+                                          resolved_array, bucket_dict)
+                    else:
+                        remaining_array[parent_index] -= 1
+                        longest_array[parent_index] = max(longest_array[parent_index], dtm)
+
+                        if remaining_array[parent_index] == 0 and not escape_array[parent_index]:
+                            Tablebase.resolve(parent_index, Tablebase.LOSS, longest_array[parent_index] + 1,
+                                              result_array, dtm_array, resolved_array, bucket_dict)
+
+            dtm += 1
+
+        return result_array, dtm_array
+
+    @staticmethod
+    def resolve(index, result_code, dtm, result_array, dtm_array, resolved_array, bucket_dict):
+        """Sets the result of the position with the passed index and queues it by its distance to mate."""
+
+        result_array[index] = result_code
+        dtm_array[index] = dtm
+        resolved_array[index] = True
+        bucket_dict.setdefault(dtm, []).append(index)
+
+        return None
+
+    def write(self, material, result_array, dtm_array):
+        """
+        Writes the file of the passed material set. Results are packed four to a byte and distances to mate are capped
+        at 255 plies.
+        """
+
+        position_count = len(result_array)
+        wdl_data = bytearray((position_count + 3) // 4)
+
+        for index, result_code in enumerate(result_array):
+            wdl_data[index >> 2] |= result_code << ((index & 3) * 2)
+
+        dtm_data = bytes(min(255, dtm) for dtm in dtm_array)
+        path = self.get_path(material)
+
+        with open(path + ".tmp", "wb") as table_file:
+            table_file.write(self.HEADER.pack(self.MAGIC, self.VERSION, position_count))
+            table_file.write(wdl_data)
+            table_file.write(dtm_data)
+
+        os.replace(path + ".tmp", path)
+
+        return None
+
+
+def main():
+    """Generates a tablebase from the command line."""
+
+    parser = argparse.ArgumentParser(description="Generates Xiangqi endgame tablebases.")
+    parser.add_argument("directory")
+    parser.add_argument("material", nargs="+", help="material sets such as GR-GAA")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    tablebase = Tablebase(args.directory)
+
+    for material in args.material:
+        print(tablebase.generate(material, args.processes))
+
+
+if __name__ == "__main__":
+    main()
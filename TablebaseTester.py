@@ -0,0 +1,92 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for Tablebase
+
+import shutil
+import tempfile
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from Tablebase import Tablebase
+from General import General
+from Advisor import Advisor
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for Tablebase.py"""
+
+    def setUp(self):
+        """Creates a temporary tablebase directory."""
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Removes the temporary tablebase directory."""
+
+        shutil.rmtree(self.directory)
+
+    def test_normalize_material(self):
+        """Tests material normalization and sub material sets."""
+
+        self.assertEqual("GAR-GAA", Tablebase.normalize_material("rga-aag"))
+        self.assertRaises(ValueError, Tablebase.normalize_material, "R-G")
+        self.assertRaises(ValueError, Tablebase.normalize_material, "GX-G")
+        self.assertEqual(["GR-GAA", "GA-GAA", "GAR-GA"], Tablebase.get_sub_material_array("GAR-GAA"))
+
+    def test_index_round_trip(self):
+        """Tests that set_position and get_index are inverse for legal placements."""
+
+        slot_array = Tablebase.get_slot_array("GA-GA")
+        game = XiangqiGame()
+
+        for index in range(0, Tablebase.get_position_count("GA-GA"), 37):
+            if Tablebase.set_position(game, slot_array, index):
+                color = game.get_current_player().get_color()
+                self.assertEqual(index, Tablebase.get_index(slot_array, game.get_board(), color))
+
+    def test_solve(self):
+        """Tests retrograde solving of a small hand made position graph."""
+
+        # 0 has no moves, 1 moves to 0, 2 only moves to 1, 3 moves to 3 or captures into a draw, 4 is illegal,
+        # 5 captures into a lost position with distance 2
+        entry_array = [([], []), ([0], []), ([1], []), ([3], [(Tablebase.DRAW, 0)]), None,
+                       ([2], [(Tablebase.LOSS, 2)])]
+
+        result_array, dtm_array = Tablebase.solve(entry_array)
+
+        self.assertEqual([Tablebase.LOSS, Tablebase.WIN, Tablebase.LOSS, Tablebase.DRAW, Tablebase.ILLEGAL,
+                          Tablebase.WIN], result_array)
+        self.assertEqual([0, 1, 2, 0, 0, 3], dtm_array)
+
+    def test_generate_and_probe(self):
+        """Tests generation of an Advisor ending and probing it by position."""
+
+        tablebase = Tablebase(self.directory)
+        count_dict = tablebase.generate("GA-G", processes=1)
+
+        self.assertEqual(810, count_dict["positions"])
+        self.assertEqual(0, count_dict["win"])
+        self.assertEqual(0, count_dict["loss"])
+
+        game = XiangqiGame()
+        board = game.get_board()
+        board.clear_board()
+        board.get_point_with_pos("e1").set_piece(General("red"))
+        board.get_point_with_pos("d10").set_piece(General("black"))
+        board.get_point_with_pos("e2").set_piece(Advisor("red"))
+
+        self.assertEqual(("DRAW", 0), tablebase.probe(game))
+
+        # the Generals face each other, which cannot happen in a game
+        board.get_point_with_pos("e2").set_piece(None)
+        board.get_point_with_pos("d10").set_piece(None)
+        board.get_point_with_pos("e10").set_piece(General("black"))
+        board.get_point_with_pos("d1").set_piece(Advisor("red"))
+
+        self.assertEqual(("ILLEGAL", 0), tablebase.probe(game))
+
+        board.get_point_with_pos("d1").set_piece(None)
+        self.assertIsNone(Tablebase(self.directory + "/missing").probe(game))
+
+
+if __name__ == '__main__':
+    unittest.main()
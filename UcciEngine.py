@@ -0,0 +1,346 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines a UCCI protocol front-end for Engine. Commands are read line by line from an input stream and
+#              answers are written to an output stream, so the engine can be driven by Xiangqi GUIs and tournament
+#              managers over stdin and stdout.
+
+
+import argparse
+import sys
+import threading
+
+from XiangqiGameWithImports import XiangqiGame
+from Engine import Engine
+from PositionCodec import PositionCodec
+
+
+class UcciEngine:
+    """
+    Represents a UCCI session. The game and the engine are kept between commands: a position command that extends the
+    previous one only plays the new moves. Searches run on a background thread so that stop, ponderhit and quit are
+    answered while searching. UCCI squares use files a-i and ranks 0-9 from the red side, so h2 is the position h3.
+    A malformed command or an illegal move is reported on the error stream and ignored, keeping the previous position.
+    """
+
+    NAME = "XiangqiGame Engine"
+    AUTHOR = "Dominic Lupo"
+
+    # share of the remaining clock spent on one move when no moves to go are given
+    MOVES_TO_GO = 30
+
+    def __init__(self, input_stream=None, output_stream=None, engine=None, error_stream=None):
+        """
+        Initializes the session reading from input_stream, writing to output_stream and reporting ignored commands to
+        error_stream, stdin, stdout and stderr if None.
+        """
+
+        self.__input_stream = input_stream if input_stream is not None else sys.stdin
+        self.__output_stream = output_stream if output_stream is not None else sys.stdout
+        self.__error_stream = error_stream if error_stream is not None else sys.stderr
+        self.__engine = engine if engine is not None else Engine()
+        self.__game = XiangqiGame()
+        self.__fen = PositionCodec.START_FEN
+        self.__move_array = []
+        self.__output_lock = threading.Lock()
+        self.__search_thread = None
+        self.__stop_event = threading.Event()
+        self.__timer = None
+        self.__pondering = False
+        self.__ponder_budget = None
+
+    def get_game(self):
+        """Getter for game."""
+
+        return self.__game
+
+    def send(self, line):
+        """Writes the passed line to the output stream."""
+
+        with self.__output_lock:
+            self.__output_stream.write(line + "\n")
+            self.__output_stream.flush()
+
+        return None
+
+    @staticmethod
+    def ucci_to_pos(ucci_square):
+        """Returns the position for the passed UCCI square, for example h2 becomes h3. Raises ValueError if bad."""
+
+        if len(ucci_square) != 2 or ucci_square[0] not in PositionCodec.FILE_ARRAY or \
+                ucci_square[1] not in "0123456789":
+            raise ValueError("invalid UCCI square: " + ucci_square)
+
+        return ucci_square[0] + str(int(ucci_square[1]) + 1)
+
+    @staticmethod
+    def pos_to_ucci(a_pos):
+        """Returns the UCCI square for the passed position, for example h3 becomes h2."""
+
+        return a_pos[0] + str(int(a_pos[1:]) - 1)
+
+    @staticmethod
+    def parse_move(ucci_move):
+        """Returns a (start_pos, end_pos) tuple for the passed four character UCCI move. Raises ValueError if bad."""
+
+        if len(ucci_move) != 4:
+            raise ValueError("invalid UCCI move: " + ucci_move)
+
+        return UcciEngine.ucci_to_pos(ucci_move[0:2]), UcciEngine.ucci_to_pos(ucci_move[2:4])
+
+    @staticmethod
+    def format_move(move):
+        """Returns the UCCI move for the passed (start_pos, end_pos) tuple."""
+
+        return UcciEngine.pos_to_ucci(move[0]) + UcciEngine.pos_to_ucci(move[1])
+
+    def run(self):
+        """Handles commands until quit is received or the input ends."""
+
+        for line in self.__input_stream:
+            if not self.handle_command(line.strip()):
+                break
+
+        self.stop_search()
+
+        return None
+
+    def handle_command(self, line):
+        """
+        Handles the passed command line. Returns False once the session should end. A malformed command is reported on
+        the error stream and ignored, so a bad line from the GUI does not end the session.
+        """
+
+        try:
+            return self.dispatch(line)
+        except ValueError as error:
+            self.__error_stream.write("ignored command '" + line + "': " + str(error) + "\n")
+            self.__error_stream.flush()
+
+        return True
+
+    def dispatch(self, line):
+        """Handles the passed command line for handle_command. Raises ValueError for a malformed command."""
+
+        token_array = line.split()
+
+        if not token_array:
+            return True
+
+        command = token_array[0]
+
+        if command == "ucci":
+            self.send("id name " + self.NAME)
+            self.send("id author " + self.AUTHOR)
+            self.send("ucciok")
+
+        elif command == "isready":
+            self.send("readyok")
+
+        elif command == "position":
+            self.stop_search()
+            self.set_position(token_array[1:])
+
+        elif command == "go":
+            self.stop_search()
+            self.start_search(token_array[1:])
+
+        elif command == "ponderhit":
+            self.ponder_hit()
+
+        elif command == "stop":
+            self.stop_search()
+
+        elif command == "quit":
+            self.stop_search()
+            self.send("bye")
+            return False
+
+        return True
+
+    def set_position(self, token_array):
+        """
+        Handles the arguments of a position command: fen <fen> or startpos, optionally followed by moves. Raises
+        ValueError for a malformed FEN string or move or an illegal move, after restoring the previous position.
+        """
+
+        if "moves" in token_array:
+            moves_index = token_array.index("moves")
+            ucci_move_array = token_array[moves_index + 1:]
+            token_array = token_array[:moves_index]
+        else:
+            ucci_move_array = []
+
+        if token_array and token_array[0] == "fen":
+            fen = " ".join(token_array[1:])
+        else:
+            fen = PositionCodec.START_FEN
+
+        move_array = [self.parse_move(ucci_move) for ucci_move in ucci_move_array]
+
+        try:
+            # keep the warm game when the new position only adds moves to the previous one
+            if fen == self.__fen and move_array[:len(self.__move_array)] == self.__move_array:
+                new_move_array = move_array[len(self.__move_array):]
+            else:
+                PositionCodec.decode_fen(fen, self.__game)
+                new_move_array = move_array
+
+            for move in new_move_array:
+                if not self.__game.make_move(*move):
+                    raise ValueError("illegal move " + self.format_move(move))
+
+        except ValueError:
+            self.restore_position()
+            raise
+
+        self.__fen = fen
+        self.__move_array = move_array
+
+        return None
+
+    def restore_position(self):
+        """Sets the game back to the position of the last accepted position command."""
+
+        PositionCodec.decode_fen(self.__fen, self.__game)
+
+        for move in self.__move_array:
+            self.__game.make_move(*move)
+
+        return None
+
+    def get_time_budget(self, option_dict):
+        """Returns the seconds to spend on a move for the passed go options, or None if the search has no time limit."""
+
+        if "movetime" in option_dict:
+            return option_dict["movetime"] / 1000
+
+        if "time" not in option_dict:
+            return None
+
+        moves_to_go = option_dict.get("movestogo", self.MOVES_TO_GO)
+
+        return (option_dict["time"] / max(1, moves_to_go) + option_dict.get("increment", 0)) / 1000
+
+    def start_search(self, token_array):
+        """Handles the arguments of a go command and starts the search thread. Raises ValueError for a bad number."""
+
+        option_dict = {}
+        index = 0
+
+        while index < len(token_array):
+            token = token_array[index]
+
+            if token in ("ponder", "infinite", "draw"):
+                option_dict[token] = True
+            elif token in ("depth", "nodes", "time", "movetime", "increment", "movestogo") and \
+                    index + 1 < len(token_array):
+                value = token_array[index + 1]
+
+                if not value.isdigit():
+                    raise ValueError("invalid " + token + " value: " + value)
+
+                option_dict[token] = int(value)
+                index += 1
+
+            index += 1
+
+        self.__stop_event = threading.Event()
+        budget = self.get_time_budget(option_dict)
+        self.__pondering = option_dict.get("ponder", False)
+
+        if self.__pondering:
+            # the clock only starts once the expected move is played
+            self.__ponder_budget = budget
+        elif budget is not None:
+            self.start_timer(budget)
+
+        self.__search_thread = threading.Thread(target=self.search, args=(option_dict.get("depth"),
+                                                                          option_dict.get("nodes"), self.__stop_event))
+        self.__search_thread.daemon = True
+        self.__search_thread.start()
+
+        return None
+
+    def start_timer(self, budget):
+        """Starts a timer that stops the search after the passed number of seconds."""
+
+        self.__timer = threading.Timer(budget, self.__stop_event.set)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+        return None
+
+    def ponder_hit(self):
+        """Switches a pondering search to a normal search with the time budget of its go command."""
+
+        if self.__pondering:
+            self.__pondering = False
+
+            if self.__ponder_budget is not None:
+                self.start_timer(self.__ponder_budget)
+
+        return None
+
+    def search(self, depth, nodes, stop_event):
+        """Runs a search on the current game and sends info lines and the best move. Runs on the search thread."""
+
+        result = self.__engine.search(self.__game, depth=depth, nodes=nodes, stop_event=stop_event,
+                                      info_callback=self.send_info)
+
+        if result["move"] is None:
+            self.send("nobestmove")
+        else:
+            self.send("bestmove " + self.format_move(result["move"]))
+
+        return None
+
+    def send_info(self, result):
+        """Sends the info line for the passed search result."""
+
+        elapsed = result["time"]
+        nps = int(result["nodes"] / elapsed) if elapsed > 0 else 0
+
+        self.send("info depth " + str(result["depth"]) + " score " + str(result["score"]) + " nodes " +
+                  str(result["nodes"]) + " nps " + str(nps) + " time " + str(int(elapsed * 1000)) + " pv " +
+                  " ".join(self.format_move(move) for move in result["pv"]))
+
+        return None
+
+    def wait_search(self):
+        """Waits for the running search, if any, to finish on its own."""
+
+        if self.__search_thread is not None:
+            self.__search_thread.join()
+            self.__search_thread = None
+
+        return None
+
+    def stop_search(self):
+        """Stops the running search, if any, and waits for it to send its best move."""
+
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        if self.__search_thread is not None:
+            self.__stop_event.set()
+            self.__search_thread.join()
+            self.__search_thread = None
+
+        self.__pondering = False
+
+        return None
+
+
+def main():
+    """Runs a UCCI session over stdin and stdout."""
+
+    parser = argparse.ArgumentParser(description="Runs the Xiangqi engine over the UCCI protocol.")
+    parser.add_argument("--params", default=None, help="engine parameter file to load, as written by EvalTuner")
+    args = parser.parse_args()
+
+    UcciEngine(engine=Engine(param_path=args.params)).run()
+
+
+if __name__ == "__main__":
+    main()
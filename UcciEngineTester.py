@@ -0,0 +1,135 @@
+# Author: Dominic Lupo
+# Date: 10/19/2026
+# Description: Unit tests for UcciEngine and the FEN support of PositionCodec
+
+import io
+import time
+import unittest
+from XiangqiGameWithImports import XiangqiGame
+from PositionCodec import PositionCodec
+from UcciEngine import UcciEngine
+from Engine import Engine
+
+
+class TestProduct(unittest.TestCase):
+    """Contains unit tests for UcciEngine.py"""
+
+    def test_fen_round_trip(self):
+        """Tests that FEN strings are written and read back unchanged."""
+
+        game = XiangqiGame()
+        self.assertEqual(PositionCodec.START_FEN, PositionCodec.encode_fen(game))
+
+        game.make_move("h3", "e3")
+        fen = PositionCodec.encode_fen(game)
+        self.assertEqual("rnbakabnr/9/1c5c1/p1p1p1p1p/9/9/P1P1P1P1P/1C2C4/9/RNBAKABNR b - - 0 1", fen)
+        self.assertEqual(fen, PositionCodec.encode_fen(PositionCodec.decode_fen(fen)))
+
+        self.assertRaises(ValueError, PositionCodec.decode_fen, "9/9 w")
+        self.assertRaises(ValueError, PositionCodec.decode_fen,
+                          "rnbakabnr/9/1c5c1/p1p1p1p1p/9/9/P1P1P1P1P/1C5C1/9/X8 w")
+
+    def test_square_conversion(self):
+        """Tests conversion between UCCI moves and positions."""
+
+        self.assertEqual(("h3", "e3"), UcciEngine.parse_move("h2e2"))
+        self.assertEqual(("a1", "a10"), UcciEngine.parse_move("a0a9"))
+        self.assertEqual("b9c7", UcciEngine.format_move(("b10", "c8")))
+
+    def test_handshake_and_position(self):
+        """Tests the ucci handshake and that extending the position keeps the same game."""
+
+        output = io.StringIO()
+        session = UcciEngine(output_stream=output)
+
+        session.handle_command("ucci")
+        session.handle_command("isready")
+        self.assertEqual(["id name " + UcciEngine.NAME, "id author " + UcciEngine.AUTHOR, "ucciok", "readyok"],
+                         output.getvalue().splitlines())
+
+        game = session.get_game()
+        session.handle_command("position startpos moves h2e2")
+        session.handle_command("position startpos moves h2e2 h9g7")
+
+        self.assertIs(game, session.get_game())
+        self.assertEqual("H", game.get_board().get_point_with_pos("g8").get_symbol())
+        self.assertEqual("red", game.get_current_player().get_color())
+
+        session.handle_command("position fen " + PositionCodec.START_FEN + " moves b2e2")
+        self.assertEqual("C", game.get_board().get_point_with_pos("e3").get_symbol())
+        self.assertEqual("H", game.get_board().get_point_with_pos("h10").get_symbol())
+
+        self.assertFalse(session.handle_command("quit"))
+        self.assertEqual("bye", output.getvalue().splitlines()[-1])
+
+    def test_rejects_bad_commands(self):
+        """Tests that malformed commands and illegal moves are ignored and keep the previous position."""
+
+        output = io.StringIO()
+        error = io.StringIO()
+        session = UcciEngine(output_stream=output, error_stream=error)
+
+        self.assertRaises(ValueError, UcciEngine.ucci_to_pos, "zz")
+        self.assertRaises(ValueError, UcciEngine.parse_move, "h2e")
+
+        session.handle_command("position startpos moves h2e2")
+        fen = PositionCodec.encode_fen(session.get_game())
+
+        for line in ("position startpos moves h2e2 h2e2", "position startpos moves h2e2 zz00", "position fen 9/9 w",
+                     "go depth x"):
+            self.assertTrue(session.handle_command(line))
+            self.assertEqual(fen, PositionCodec.encode_fen(session.get_game()))
+
+        self.assertEqual(4, len(error.getvalue().splitlines()))
+        self.assertEqual("", output.getvalue())
+
+        session.handle_command("position startpos moves h2e2 h9g7")
+        self.assertEqual("H", session.get_game().get_board().get_point_with_pos("g8").get_symbol())
+
+    def test_go_depth(self):
+        """Tests that a depth limited search streams an info line and a best move."""
+
+        output = io.StringIO()
+        session = UcciEngine(output_stream=output, engine=Engine(depth=1))
+
+        session.handle_command("position startpos")
+        session.handle_command("go depth 1")
+        session.wait_search()
+
+        line_array = output.getvalue().splitlines()
+        self.assertTrue(line_array[0].startswith("info depth 1 score "))
+        self.assertIn(" nodes ", line_array[0])
+        self.assertIn(" nps ", line_array[0])
+        self.assertTrue(line_array[-1].startswith("bestmove "))
+
+    def test_stop_infinite_search(self):
+        """Tests that stop ends an infinite search promptly with a best move."""
+
+        output = io.StringIO()
+        session = UcciEngine(output_stream=output)
+
+        session.handle_command("position startpos")
+        session.handle_command("go infinite")
+        time.sleep(0.2)
+
+        start_time = time.perf_counter()
+        session.handle_command("stop")
+
+        self.assertLess(time.perf_counter() - start_time, 1.0)
+        self.assertTrue(output.getvalue().splitlines()[-1].startswith("bestmove "))
+
+    def test_run_reads_commands(self):
+        """Tests the command loop over streams with a node limit."""
+
+        output = io.StringIO()
+        session = UcciEngine(io.StringIO("position startpos\ngo nodes 5\nisready\nquit\n"), output)
+        session.run()
+
+        line_array = output.getvalue().splitlines()
+        self.assertIn("readyok", line_array)
+        self.assertEqual("bye", line_array[-1])
+        self.assertEqual(1, len([line for line in line_array if line.startswith("bestmove ")]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -571,5 +571,169 @@ class TestProduct(unittest.TestCase):
         self.assertEqual(True, game.make_move("a9", "d9"))
 
 
+    def test_generate_end_pos(self):
+        """Tests that generate_end_pos yields the same end positions in the same order as get_valid_end_pos_array."""
+
+        game = XiangqiGame()
+        board = game.get_board()
+        move_array = [("h3", "e3"), ("h10", "g8"), ("h1", "g3"), ("i10", "h10"), ("i1", "h1"), ("b8", "b4"),
+                      ("e3", "e7"), ("b10", "c8"), ("h1", "h7"), ("a10", "b10")]
+
+        for start_pos, end_pos in [(None, None)] + move_array:
+            if start_pos is not None:
+                self.assertEqual(True, game.make_move(start_pos, end_pos))
+
+            for color in ("red", "black"):
+                for a_pos in game.all_pieces_pos_array(color):
+                    symbol = board.get_point_with_pos(a_pos).get_symbol()
+                    self.assertEqual(game.get_valid_end_pos_array(a_pos, symbol),
+                                     list(game.generate_end_pos(a_pos, symbol)))
+
+        # a Cannon alone between the Generals and Soldiers across the river
+        board.clear_board()
+        board.get_point_with_pos("e1").set_piece(General("red"))
+        board.get_point_with_pos("e10").set_piece(General("black"))
+        board.get_point_with_pos("e5").set_piece(Cannon("red"))
+        board.get_point_with_pos("a9").set_piece(Soldier("red"))
+        board.get_point_with_pos("c10").set_piece(Soldier("red"))
+        board.get_point_with_pos("i2").set_piece(Soldier("black"))
+
+        for a_pos in ("e1", "e10", "e5", "a9", "c10", "i2"):
+            symbol = board.get_point_with_pos(a_pos).get_symbol()
+            self.assertEqual(game.get_valid_end_pos_array(a_pos, symbol), list(game.generate_end_pos(a_pos, symbol)))
+
+        self.assertEqual(["e6", "e7", "e8", "e9", "e4", "e3", "e2"], list(game.generate_end_pos("e5", "C")))
+
+
+    def test_square_moves(self):
+        """Tests the square versions of get_valid_end_pos_array, valid_move and make_move."""
+
+        game = XiangqiGame()
+        board = game.get_board()
+        h3 = board.get_square_from_pos("h3")
+        e3 = board.get_square_from_pos("e3")
+
+        self.assertEqual([board.get_square_from_pos(a_pos) for a_pos in game.get_valid_end_pos_array("h3", "C")],
+                         game.get_valid_end_square_array(h3, "C"))
+        self.assertEqual(True, game.valid_move_square(h3, e3, "red"))
+        self.assertEqual(False, game.valid_move_square(h3, e3, "black"))
+        self.assertEqual(False, game.make_move("h3", "z3"))
+        self.assertEqual(True, game.make_move_square(h3, e3))
+        self.assertEqual("C", board.get_point_with_square(e3).get_symbol())
+        self.assertEqual("black", game.get_current_player().get_color())
+        self.assertEqual([(board.get_pos_from_square(start_square), board.get_pos_from_square(end_square))
+                          for start_square, end_square in game.get_legal_square_move_array("black")],
+                         game.get_legal_move_array("black"))
+
+    def test_move_error(self):
+        """Tests the reasons returned by get_move_error and set by make_move for illegal moves."""
+
+        game = XiangqiGame()
+
+        self.assertEqual("NO_PIECE", game.get_move_error("e5", "e6", "red"))
+        self.assertEqual("WRONG_COLOR", game.get_move_error("h8", "h5", "red"))
+        self.assertEqual("OWN_PIECE", game.get_move_error("a1", "a4", "red"))
+        self.assertEqual("ILLEGAL_MOVE", game.get_move_error("b1", "b2", "red"))
+        self.assertEqual("ILLEGAL_MOVE", game.get_move_error("a1", "b2", "red"))
+        self.assertEqual("BLOCKED", game.get_move_error("a1", "a6", "red"))
+        self.assertEqual("BLOCKED", game.get_move_error("b1", "d2", "red"))
+        self.assertEqual("NO_SCREEN", game.get_move_error("b3", "b8", "red"))
+        self.assertEqual("OUTSIDE_CASTLE", game.get_move_error("d1", "c2", "red"))
+        self.assertEqual("SOLDIER_DIRECTION", game.get_move_error("e4", "e3", "red"))
+        self.assertEqual(None, game.get_move_error("h3", "h10", "red"))
+
+        self.assertEqual(False, game.make_move("h3", "z3"))
+        self.assertEqual("OFF_BOARD", game.get_last_move_error())
+        self.assertEqual(False, game.make_move("a4", "b4"))
+        self.assertEqual("SOLDIER_DIRECTION", game.get_last_move_error())
+        self.assertEqual(True, game.make_move("c1", "e3"))
+        self.assertEqual(None, game.get_last_move_error())
+        self.assertEqual(True, game.make_move("a7", "a6"))
+        self.assertEqual(True, game.make_move("e3", "c5"))
+        self.assertEqual(True, game.make_move("a6", "a5"))
+        self.assertEqual("CROSSES_RIVER", game.get_move_error("c5", "a7", "red"))
+
+        # a black Chariot checks the red General, which may not face the black General
+        game = XiangqiGame()
+        board = game.get_board()
+        board.clear_board()
+        board.get_point_with_pos("e1").set_piece(General("red"))
+        board.get_point_with_pos("d10").set_piece(General("black"))
+        board.get_point_with_pos("e9").set_piece(Chariot("black"))
+
+        self.assertEqual("IN_CHECK", game.get_move_error("e1", "e2", "red"))
+        self.assertEqual("GENERALS_FACING", game.get_move_error("e1", "d1", "red"))
+        self.assertEqual("OFF_BOARD", game.get_move_error("e1", "e0", "red"))
+        self.assertEqual(None, game.get_move_error("e1", "f1", "red"))
+
+        game.set_game_state("RED_WON")
+        self.assertEqual(False, game.make_move("e1", "f1"))
+        self.assertEqual("GAME_OVER", game.get_last_move_error())
+
+    def test_evasion_moves(self):
+        """Tests that in check only General moves, captures of the checker and blocks are generated."""
+
+        # a black Cannon on e6 checks the red General over the red Soldier on e4
+        game = XiangqiGame()
+        board = game.get_board()
+        board.get_point_with_pos("e7").set_piece(None)
+        board.get_point_with_pos("e6").set_piece(Cannon("black"))
+        square = board.get_square_from_pos
+
+        self.assertEqual(True, game.is_in_check("red"))
+        self.assertEqual([square("e6")], game.get_attacker_square_array(square("e1"), "black"))
+        self.assertEqual([square(a_pos) for a_pos in ("e5", "e4", "e3", "e2")],
+                         game.get_block_square_array(square("e6"), square("e1")))
+        self.assertEqual([("b3", "e3"), ("c1", "e3"), ("d1", "e2"), ("f1", "e2"), ("g1", "e3"), ("h3", "e3")],
+                         sorted(game.get_legal_move_array("red")))
+
+        # every move that does not leave red in check is generated
+        move_array = []
+
+        for start_square in game.all_pieces_square_array("red"):
+            for end_square in game.get_valid_end_square_array(start_square, board.get_point_array()[start_square]
+                                                              .get_symbol()):
+                if not game.move_leaves_check(start_square, end_square, "red"):
+                    move_array.append((start_square, end_square))
+
+        self.assertEqual(sorted(move_array), sorted(game.get_legal_square_move_array("red")))
+        self.assertEqual(True, game.checkmate_preventable())
+
+    def test_pin_squares(self):
+        """Tests that pieces pinned by a Chariot or a Horse and squares that would screen a Cannon are found."""
+
+        game = XiangqiGame()
+        board = game.get_board()
+        board.clear_board()
+        square = board.get_square_from_pos
+
+        for a_pos, piece in (("e1", General("red")), ("e3", Chariot("red")), ("f2", Soldier("red")),
+                             ("d10", General("black")), ("e8", Chariot("black")), ("a1", Cannon("black")),
+                             ("g2", Horse("black"))):
+            board.get_point_with_pos(a_pos).set_piece(piece)
+
+        self.assertEqual(False, game.is_in_check("red"))
+        self.assertEqual({square(a_pos) for a_pos in ("e2", "e3", "e4", "e5", "e6", "e7", "b1", "c1", "d1", "f2")},
+                         game.get_pin_square_set(square("e1"), "black"))
+
+        legal_move_array = game.get_legal_move_array("red")
+
+        self.assertIn(("e3", "e8"), legal_move_array)
+        self.assertNotIn(("e3", "d3"), legal_move_array)
+        self.assertNotIn(("f2", "f3"), legal_move_array)
+        self.assertEqual("IN_CHECK", game.get_move_error("f2", "f3", "red"))
+
+        # the same moves as simulating every move
+        move_array = []
+
+        for start_square in game.all_pieces_square_array("red"):
+            for end_square in game.get_valid_end_square_array(start_square, board.get_point_array()[start_square]
+                                                              .get_symbol()):
+                if not game.move_leaves_check(start_square, end_square, "red"):
+                    move_array.append((start_square, end_square))
+
+        self.assertEqual(move_array, game.get_legal_square_move_array("red"))
+
+
 if __name__ == '__main__':
     unittest.main()
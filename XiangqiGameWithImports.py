@@ -14,6 +14,19 @@ class XiangqiGame:
     piece restrictions and specific piece restrictions. If a move is called and is valid the move is processed. The game
     state is automatically updated to determine the winner."""
 
+    # directions of the Chariot and Cannon moves, in the order of their possible moves
+    SLIDE_STEP_ARRAY = [[1, 0], [-1, 0], [0, 1], [0, -1]]
+
+    # steps from a square to the pieces that could reach it other than along its file and rank, which are the steps of
+    # the Horse, Elephant and Advisor moves
+    ATTACK_STEP_ARRAY = [[1, 2], [2, 1], [2, -1], [1, -2], [-1, -2], [-2, -1], [-2, 1], [-1, 2],
+                         [2, 2], [2, -2], [-2, -2], [-2, 2], [1, 1], [1, -1], [-1, -1], [-1, 1]]
+
+    # reasons returned by get_move_error when a move is not legal
+    MOVE_ERROR_ARRAY = ["GAME_OVER", "OFF_BOARD", "NO_PIECE", "WRONG_COLOR", "OWN_PIECE", "ILLEGAL_MOVE", "BLOCKED",
+                        "NO_SCREEN", "OUTSIDE_CASTLE", "CROSSES_RIVER", "SOLDIER_DIRECTION", "GENERALS_FACING",
+                        "IN_CHECK"]
+
     def __init__(self):
         """
         Initializes the XiangqiGame without a winner, a board with placed starting pieces, the red player starting and
@@ -25,12 +38,42 @@ class XiangqiGame:
         self.__player_one = Player("red")
         self.__player_two = Player("black")
         self.__current_player = self.__player_one
+        self.__move_error = None
+        self.__general_square_dict = {}
+        self.__observer_array = []
 
     def get_current_player(self):
         """Getter for current_player."""
 
         return self.__current_player
 
+    def get_observer_array(self):
+        """Getter for observer_array."""
+
+        return self.__observer_array
+
+    def add_observer(self, observer):
+        """
+        Adds the passed observer, like an AttackMap or a BoardRenderer. After every move make_move calls its update
+        method with an array of the start and end squares.
+        """
+
+        self.__observer_array.append(observer)
+
+        return None
+
+    def remove_observer(self, observer):
+        """Removes the passed observer."""
+
+        self.__observer_array.remove(observer)
+
+        return None
+
+    def get_last_move_error(self):
+        """Getter for move_error, the reason the last call to make_move returned False or None if it returned True."""
+
+        return self.__move_error
+
     def get_board(self):
         """Getter for board."""
 
@@ -41,6 +84,21 @@ class XiangqiGame:
 
         return self.__game_state
 
+    def set_game_state(self, game_state):
+        """Setter for game_state."""
+
+        self.__game_state = game_state
+
+    def set_current_player(self, player_color):
+        """Sets current_player to the player with the passed player_color."""
+
+        if player_color == self.__player_one.get_color():
+            self.__current_player = self.__player_one
+        else:
+            self.__current_player = self.__player_two
+
+        return None
+
     def switch_current_player(self):
         """Switches the current player."""
 
@@ -51,6 +109,22 @@ class XiangqiGame:
 
         return None
 
+    def all_pieces_square_array(self, color):
+        """Returns an array of all squares on the board with pieces of the passed color."""
+
+        piece_square_array = []
+        square = 0
+
+        for point in self.__board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None and piece.get_color() == color:
+                piece_square_array.append(square)
+
+            square += 1
+
+        return piece_square_array
+
     def all_pieces_pos_array(self, color):
         """Returns an array of all positions on the board with pieces of the passed color."""
 
@@ -515,34 +589,207 @@ class XiangqiGame:
 
         return valid_moves
 
-    def generals_facing_restriction(self, start_pos, end_pos_array):
+    def generate_end_pos(self, start_pos, piece_symbol):
         """
-        Returns restricted_end_pos that removes end_pos from the passed start_pos and end_pos_array that cause
-        Generals to face each other.
+        Generator that yields the same end positions as get_valid_end_pos_array for the passed start_pos and
+        piece_symbol, in the same order. See generate_end_square.
         """
 
-        restricted_end_pos = []
         board = self.__board
 
-        # save start_point and start_piece
-        start_point = board.get_point_with_pos(start_pos)
-        start_piece = start_point.get_piece()
+        for end_square in self.generate_end_square(board.get_square_from_pos(start_pos), piece_symbol):
+            yield board.get_pos_from_square(end_square)
 
-        for end_pos in end_pos_array:
+    def get_valid_end_square_array(self, start_square, piece_symbol):
+        """
+        Returns an array containing valid end squares from the passed start_square and piece_symbol. All restrictions
+        limits end squares except checkmate.
+        """
 
-            # save end_point and end_piece
-            end_point = board.get_point_with_pos(end_pos)
-            end_piece = end_point.get_piece()
+        return list(self.generate_end_square(start_square, piece_symbol))
 
-            # simulate move
-            self.move_piece(start_pos, end_pos)
+    def generate_end_square(self, start_square, piece_symbol):
+        """
+        Generator that yields the squares of the end positions of get_valid_end_pos_array for the passed start_square
+        and piece_symbol, in the same order. Every restriction is applied inline while walking the moves of the piece
+        once, so no intermediate arrays are built and a caller that stops early skips the remaining moves. The board may
+        be changed between squares as long as it is restored before the next square is requested.
+        """
 
-            if self.generals_facing() is False:
-                restricted_end_pos.append(end_pos)
+        board = self.__board
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_array = board.get_rank_array()
+        rank_count = len(rank_array)
+        river_rank_index = rank_count // 2
 
-            self.reverse_move(start_point, start_piece, end_point, end_piece)
+        file_index, rank_index = board.get_index_pair(start_square)
+        piece = point_array[start_square].get_piece()
+        color = piece.get_color()
+        red_general_square = self.get_general_square("red")
 
-        return restricted_end_pos
+        # Chariots and Cannons walk each direction until they are blocked
+        if piece_symbol == "R" or piece_symbol == "C":
+            for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+                end_file_index = file_index + file_step
+                end_rank_index = rank_index + rank_step
+                screened = False
+
+                while 0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count:
+                    end_square = end_file_index * rank_count + end_rank_index
+                    end_piece = point_array[end_square].get_piece()
+
+                    if end_piece is None:
+                        if not screened and not self.generals_facing_after(start_square, end_square,
+                                                                           red_general_square):
+                            yield end_square
+
+                    elif piece_symbol == "R" or screened:
+                        if end_piece.get_color() != color and not self.generals_facing_after(start_square, end_square,
+                                                                                            red_general_square):
+                            yield end_square
+
+                        break
+
+                    # the first piece in the way of a Cannon is its screen
+                    else:
+                        screened = True
+
+                    end_file_index += file_step
+                    end_rank_index += rank_step
+
+            return
+
+        jump_array = piece.get_possible_jumps()
+        move_index = -1
+
+        for file_index_change, rank_index_change in piece.get_possible_moves():
+            move_index += 1
+            end_file_index = file_index + file_index_change
+            end_rank_index = rank_index + rank_index_change
+
+            if not (0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count):
+                continue
+
+            end_square = end_file_index * rank_count + end_rank_index
+            end_piece = point_array[end_square].get_piece()
+
+            if end_piece is not None and end_piece.get_color() == color:
+                continue
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = jump_array[move_index][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    continue
+
+            if piece_symbol == "G" or piece_symbol == "A":
+                red_castle_square_array = board.get_red_castle_square_array()
+                black_castle_square_array = board.get_black_castle_square_array()
+
+                if not (start_square in red_castle_square_array and end_square in red_castle_square_array) and \
+                        not (start_square in black_castle_square_array and end_square in black_castle_square_array):
+                    continue
+
+            elif piece_symbol == "E":
+                if (rank_index < river_rank_index) != (end_rank_index < river_rank_index):
+                    continue
+
+            elif piece_symbol == "S":
+                # ranks are compared as strings, as in soldier_restriction
+                start_rank = rank_array[rank_index]
+                end_rank = rank_array[end_rank_index]
+
+                if color == "red":
+                    soldier_across_river = rank_index >= river_rank_index
+                    forward = end_rank > start_rank
+                else:
+                    soldier_across_river = rank_index < river_rank_index
+                    forward = end_rank < start_rank
+
+                if not forward and not (end_rank == start_rank and soldier_across_river):
+                    continue
+
+            if not self.generals_facing_after(start_square, end_square, red_general_square):
+                yield end_square
+
+    def get_general_square(self, color):
+        """
+        Returns the square of the General of the passed color, or None if it is not on the board. Like
+        generals_facing, the last General found is returned. The square is remembered and returned while it still holds
+        the General, since pieces may be set on the board directly.
+        """
+
+        point_array = self.__board.get_point_array()
+        general_square = self.__general_square_dict.get(color)
+
+        if general_square is not None:
+            piece = point_array[general_square].get_piece()
+
+            if piece is not None and piece.get_symbol() == "G" and piece.get_color() == color:
+                return general_square
+
+            general_square = None
+
+        square = 0
+
+        for point in point_array:
+            piece = point.get_piece()
+
+            if piece is not None and piece.get_symbol() == "G" and piece.get_color() == color:
+                general_square = square
+
+            square += 1
+
+        self.__general_square_dict[color] = general_square
+
+        return general_square
+
+    def generals_facing_after(self, start_square, end_square, red_general_square):
+        """
+        Returns True if the Generals would face each other after the piece at the passed start_square moved to the
+        passed end_square, without making the move. Squares are indices in point_array and red_general_square is the
+        square of the red General before the move. Gives the same answer as generals_facing after the move.
+        """
+
+        point_array = self.__board.get_point_array()
+        rank_count = len(self.__board.get_rank_array())
+
+        if red_general_square == start_square:
+            red_general_square = end_square
+        elif red_general_square is None or red_general_square == end_square:
+            return False
+
+        # look from the red General towards rank 10 for the first piece
+        for square in range(red_general_square + 1, red_general_square - red_general_square % rank_count + rank_count):
+            if square == end_square:
+                return point_array[start_square].get_piece().get_symbol() == "G"
+
+            if square == start_square:
+                continue
+
+            piece = point_array[square].get_piece()
+
+            if piece is not None:
+                return piece.get_symbol() == "G"
+
+        return False
+
+    def generals_facing_restriction(self, start_pos, end_pos_array):
+        """
+        Returns restricted_end_pos that removes end_pos from the passed start_pos and end_pos_array that cause
+        Generals to face each other.
+        """
+
+        board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        red_general_square = self.get_general_square("red")
+
+        # the moves are checked with generals_facing_after instead of being simulated
+        return [end_pos for end_pos in end_pos_array
+                if not self.generals_facing_after(start_square, board.get_square_from_pos(end_pos), red_general_square)]
 
     def all_piece_restrictions(self, start_pos, a_move_change_array, a_jump_change_array):
         """
@@ -570,32 +817,311 @@ class XiangqiGame:
         """
 
         board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
 
-        # if start position does not exist return no valid end positions.
-        if board.get_point_with_pos(start_pos) is None:
+        # if a position does not exist the move is not valid.
+        if start_square is None or end_square is None:
             return False
 
-        point = board.get_point_with_pos(start_pos)
-        piece = point.get_piece()
+        return self.valid_move_square(start_square, end_square, player_color)
+
+    def valid_move_square(self, start_square, end_square, player_color):
+        """
+        Returns True if a piece located at the passed start_square is the same color as the passed player_color and can
+        move to the passed end_square.
+        """
+
+        return self.get_rule_error_square(start_square, end_square, player_color) is None
+
+    def get_move_error(self, start_pos, end_pos, player_color):
+        """
+        Returns None if the passed player_color can move the piece at the passed start_pos to the passed end_pos
+        without being left in check. Returns the reason from MOVE_ERROR_ARRAY otherwise.
+        """
+
+        board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
+
+        if start_square is None or end_square is None:
+            return "OFF_BOARD"
+
+        return self.get_move_error_square(start_square, end_square, player_color)
+
+    def get_move_error_square(self, start_square, end_square, player_color):
+        """
+        Returns None if the passed player_color can move the piece at the passed start_square to the passed end_square
+        without being left in check. Returns the reason from MOVE_ERROR_ARRAY otherwise.
+        """
+
+        rule_error = self.get_rule_error_square(start_square, end_square, player_color)
+
+        if rule_error is not None:
+            return rule_error
+
+        if self.move_leaves_check(start_square, end_square, player_color):
+            return "IN_CHECK"
+
+        return None
+
+    def move_leaves_check(self, start_square, end_square, player_color):
+        """
+        Returns True if the passed player_color is in check after the piece at the passed start_square moves to the
+        passed end_square. The move is simulated and reversed.
+        """
+
+        board = self.__board
+        start_point = board.get_point_with_square(start_square)
+        start_piece = start_point.get_piece()
+        end_point = board.get_point_with_square(end_square)
+        end_piece = end_point.get_piece()
+
+        # simulate move to check if move would cause check
+        end_point.set_piece(start_piece)
+        start_point.set_piece(None)
+
+        in_check = self.is_in_check(player_color)
+
+        self.reverse_move(start_point, start_piece, end_point, end_piece)
+
+        return in_check
+
+    def get_rule_error_square(self, start_square, end_square, player_color):
+        """
+        Returns None if the piece at the passed start_square belongs to the passed player_color and can move to the
+        passed end_square, which is the same answer as end_square being generated by generate_end_square. Returns the
+        reason from MOVE_ERROR_ARRAY otherwise. Only the one move is checked: its geometry, the squares between its
+        start and end, the castle, river and soldier rules and whether the Generals would face each other.
+        """
+
+        board = self.__board
+        point_array = board.get_point_array()
+        rank_count = len(board.get_rank_array())
+
+        piece = point_array[start_square].get_piece()
 
-        # if start position has no piece return no valid en positions.
         if piece is None:
-            return False
+            return "NO_PIECE"
 
-        piece_color = piece.get_color()
+        color = piece.get_color()
 
-        # if the piece at start_position does not have the same color as player color
-        if piece_color != player_color:
-            return False
+        if color != player_color:
+            return "WRONG_COLOR"
+
+        end_piece = point_array[end_square].get_piece()
+
+        if end_piece is not None and end_piece.get_color() == color:
+            return "OWN_PIECE"
 
         piece_symbol = piece.get_symbol()
+        file_index, rank_index = board.get_index_pair(start_square)
+        end_file_index, end_rank_index = board.get_index_pair(end_square)
+        file_index_change = end_file_index - file_index
+        rank_index_change = end_rank_index - rank_index
 
-        valid_end_pos_array = self.get_valid_end_pos_array(start_pos, piece_symbol)
+        # Chariots and Cannons move along a file or a rank and count the pieces between start and end
+        if piece_symbol == "R" or piece_symbol == "C":
+            if (file_index_change == 0) == (rank_index_change == 0):
+                return "ILLEGAL_MOVE"
 
-        if end_pos not in valid_end_pos_array:
-            return False
+            step = rank_count * ((file_index_change > 0) - (file_index_change < 0)) + \
+                (rank_index_change > 0) - (rank_index_change < 0)
+            between_count = 0
 
-        return True
+            for square in range(start_square + step, end_square, step):
+                if point_array[square].get_piece() is not None:
+                    between_count += 1
+
+            if piece_symbol == "R" or end_piece is None:
+                if between_count != 0:
+                    return "BLOCKED"
+
+            # a Cannon captures over exactly one screen
+            elif between_count != 1:
+                return "NO_SCREEN"
+
+        else:
+            move_array = piece.get_possible_moves()
+
+            if (file_index_change, rank_index_change) not in move_array:
+                return "ILLEGAL_MOVE"
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            jump_array = piece.get_possible_jumps()
+
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = \
+                    jump_array[move_array.index((file_index_change, rank_index_change))][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    return "BLOCKED"
+
+            area_error = self.get_area_error_square(piece_symbol, color, start_square, end_square)
+
+            if area_error is not None:
+                return area_error
+
+        if self.generals_facing_after(start_square, end_square, self.get_general_square("red")):
+            return "GENERALS_FACING"
+
+        return None
+
+    def get_legal_move_array(self, player_color):
+        """
+        Returns an array of (start_pos, end_pos) tuples for every move of the passed player_color that is valid and
+        does not leave the player in check.
+        """
+
+        board = self.__board
+
+        return [(board.get_pos_from_square(start_square), board.get_pos_from_square(end_square))
+                for start_square, end_square in self.get_legal_square_move_array(player_color)]
+
+    def get_legal_square_move_array(self, player_color):
+        """
+        Returns an array of (start_square, end_square) tuples for every move of the passed player_color that is valid
+        and does not leave the player in check.
+        """
+
+        return list(self.generate_legal_square_move(player_color))
+
+    def generate_legal_square_move(self, player_color):
+        """
+        Generator that yields a (start_square, end_square) tuple for every move of the passed player_color that is
+        valid and does not leave the player in check. If the player is in check only the moves of
+        generate_evasion_square_move are tried.
+        """
+
+        general_square = self.get_general_square(player_color)
+
+        if general_square is not None:
+            checker_square_array = self.get_attacker_square_array(general_square,
+                                                                  self.opposing_player_color(player_color))
+
+            if checker_square_array:
+                yield from self.generate_evasion_square_move(player_color, general_square, checker_square_array)
+                return
+
+            pin_square_set = self.get_pin_square_set(general_square, self.opposing_player_color(player_color))
+        else:
+            pin_square_set = set()
+
+        point_array = self.__board.get_point_array()
+
+        # only moves of the General, moves of pinned pieces and moves onto pin squares can put the General in check
+        for start_square in self.all_pieces_square_array(player_color):
+            simulate_all = start_square == general_square or start_square in pin_square_set
+
+            for end_square in self.generate_end_square(start_square, point_array[start_square].get_symbol()):
+                if (not simulate_all and end_square not in pin_square_set) or \
+                        not self.move_leaves_check(start_square, end_square, player_color):
+                    yield start_square, end_square
+
+    def get_pin_square_set(self, general_square, color):
+        """
+        Returns the set of pin squares of the General at the passed general_square, which is not in check, against the
+        pieces of the passed color. They are the squares between the General and a Chariot of the color with at most one
+        piece between them or a Cannon of the color with at most two, and the jump squares of a Horse or Elephant of the
+        color that could reach the General. A piece on a pin square is pinned and a piece moving onto an empty one may
+        give a Cannon its screen. Any other move, other than a move of the General, cannot put the General in check.
+        Pins by the facing Generals rule are left to generals_facing_after.
+        """
+
+        board = self.__board
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
+        file_index, rank_index = board.get_index_pair(general_square)
+        pin_square_set = set()
+
+        for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+            between_count = 0
+
+            while between_count <= 2 and 0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count:
+                start_square = start_file_index * rank_count + start_rank_index
+                piece = point_array[start_square].get_piece()
+
+                if piece is not None:
+                    if piece.get_color() == color and (piece.get_symbol() == "C" or
+                                                       (piece.get_symbol() == "R" and between_count <= 1)):
+                        pin_square_set.update(self.get_block_square_array(start_square, general_square))
+
+                    between_count += 1
+
+                start_file_index += file_step
+                start_rank_index += rank_step
+
+        for file_step, rank_step in self.ATTACK_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+
+            if not (0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count):
+                continue
+
+            start_square = start_file_index * rank_count + start_rank_index
+            piece = point_array[start_square].get_piece()
+
+            if piece is not None and piece.get_color() == color and piece.get_symbol() in ("H", "E"):
+                pin_square_set.update(self.get_block_square_array(start_square, general_square))
+
+        return pin_square_set
+
+    def generate_evasion_square_move(self, player_color, general_square, checker_square_array):
+        """
+        Generator that yields a (start_square, end_square) tuple for every move of the passed player_color that gets
+        its General at the passed general_square out of check by the pieces at the passed checker_square_array. Only
+        three kinds of moves can do that, so only they are tried: moves of the General, captures of a checking piece and
+        moves onto or off a block square of a check. A block square is between a checking Chariot or Cannon and the
+        General or the jump square of a checking Horse, so moving onto it blocks the check or gives a Cannon a second
+        screen and moving off it takes away the screen of a Cannon.
+        """
+
+        point_array = self.__board.get_point_array()
+        block_square_set = set()
+
+        for checker_square in checker_square_array:
+            block_square_set.update(self.get_block_square_array(checker_square, general_square))
+
+        target_square_array = sorted(block_square_set.union(checker_square_array))
+
+        for start_square in self.all_pieces_square_array(player_color):
+            piece_symbol = point_array[start_square].get_symbol()
+
+            if start_square == general_square or start_square in block_square_set:
+                end_square_iterable = self.generate_end_square(start_square, piece_symbol)
+            else:
+                end_square_iterable = [end_square for end_square in target_square_array
+                                       if self.get_rule_error_square(start_square, end_square, player_color) is None]
+
+            for end_square in end_square_iterable:
+                if not self.move_leaves_check(start_square, end_square, player_color):
+                    yield start_square, end_square
+
+    def get_block_square_array(self, start_square, end_square):
+        """
+        Returns an array of the squares that must be empty for the piece at the passed start_square to move to the
+        passed end_square, from the possible jumps of the piece: the squares between them for a Chariot or Cannon and
+        the jump square for a Horse or Elephant. Returns an empty array for other pieces and other moves.
+        """
+
+        board = self.__board
+        rank_count = len(board.get_rank_array())
+        piece = board.get_point_with_square(start_square).get_piece()
+        move_array = piece.get_possible_moves()
+        jump_array = piece.get_possible_jumps()
+        file_index, rank_index = board.get_index_pair(start_square)
+        end_file_index, end_rank_index = board.get_index_pair(end_square)
+        move = (end_file_index - file_index, end_rank_index - rank_index)
+
+        if jump_array is None or move not in move_array:
+            return []
+
+        return [(file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+                for jump_file_index_change, jump_rank_index_change in jump_array[move_array.index(move)]]
 
     @staticmethod
     def reverse_move(start_point, start_piece, end_point, end_piece):
@@ -610,9 +1136,16 @@ class XiangqiGame:
         """Moves the piece at the passed start_pos to the passed end_pos."""
 
         board = self.__board
-        start_point = board.get_point_with_pos(start_pos)
+
+        self.move_piece_square(board.get_square_from_pos(start_pos), board.get_square_from_pos(end_pos))
+
+    def move_piece_square(self, start_square, end_square):
+        """Moves the piece at the passed start_square to the passed end_square."""
+
+        board = self.__board
+        start_point = board.get_point_with_square(start_square)
         start_piece = start_point.get_piece()
-        end_point = board.get_point_with_pos(end_pos)
+        end_point = board.get_point_with_square(end_square)
 
         # make desired move and remove captured piece
         end_point.set_piece(start_piece)
@@ -622,29 +1155,39 @@ class XiangqiGame:
         """Returns True if the passed start_pos and end_pos is valid for a piece. Returns False otherwise."""
 
         board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
 
-        # if the game is over return False
-        if self.game_over():
+        # if a position does not exist the move is not valid.
+        if start_square is None or end_square is None:
+            self.__move_error = "OFF_BOARD"
             return False
 
-        # if the move is invalid return False
-        if self.valid_move(start_pos, end_pos, self.__current_player.get_color()) is False:
-            return False
+        return self.make_move_square(start_square, end_square)
 
-        # simulate move
-        start_point = board.get_point_with_pos(start_pos)
-        start_piece = start_point.get_piece()
-        end_point = board.get_point_with_pos(end_pos)
-        end_piece = end_point.get_piece()
+    def make_move_square(self, start_square, end_square):
+        """
+        Returns True if the passed start_square and end_square is valid for a piece. Returns False otherwise and sets
+        move_error to the reason.
+        """
+
+        # if the game is over return False
+        if self.game_over():
+            self.__move_error = "GAME_OVER"
+            return False
 
-        self.move_piece(start_pos, end_pos)
+        # if the move is invalid or causes check return False
+        self.__move_error = self.get_move_error_square(start_square, end_square, self.__current_player.get_color())
 
-        # if the move causes check return False
-        if self.is_in_check(self.__current_player.get_color()):
-            self.reverse_move(start_point, start_piece, end_point, end_piece)
+        if self.__move_error is not None:
             return False
 
         # move is valid, complete move
+        self.move_piece_square(start_square, end_square)
+
+        for observer in self.__observer_array:
+            observer.update([start_square, end_square])
+
         self.switch_current_player()
         self.update_game_state()
 
@@ -655,11 +1198,12 @@ class XiangqiGame:
 
         current_player_color = self.__current_player.get_color()
 
-        # check for checkmate
-        if self.is_in_check(current_player_color) and self.checkmate_preventable() is False:
-            self.current_player_lost()
+        # check for checkmate, the moves available in check are already known to be none or some
+        if self.is_in_check(current_player_color):
+            if self.checkmate_preventable() is False:
+                self.current_player_lost()
 
-        if self.stalemate() is True:
+        elif self.stalemate() is True:
             self.current_player_lost()
 
         return None
@@ -679,116 +1223,212 @@ class XiangqiGame:
     def stalemate(self):
         """Returns True if the current_player is in stalemate. Returns False otherwise."""
 
-        current_player_color = self.__current_player.get_color()
+        return not self.move_available(self.__current_player.get_color())
 
-        board = self.__board
-        player_color_piece_pos_array = self.all_pieces_pos_array(current_player_color)
-        move_available = False
+    def checkmate_preventable(self):
+        """Returns True if the current_player has a move that does not leave it in check. Returns False otherwise."""
 
-        # check all pieces
-        for start_pos in player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+        return self.move_available(self.__current_player.get_color())
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+    def move_available(self, player_color):
+        """Returns True if the passed player_color has a valid move that does not leave it in check."""
 
-            # simulate move to check if move would cause check
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
+        # stop at the first legal move
+        for _ in self.generate_legal_square_move(player_color):
+            return True
 
-            # check all end positions for piece
-            for end_pos in valid_end_pos_array:
+        return False
 
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+    def game_over(self):
+        """Returns True if red or black has won. Return False otherwise."""
 
-                self.move_piece(start_pos, end_pos)
+        if self.__game_state == "RED_WON" or self.__game_state == "BLACK_WON":
+            game_over = True
+        else:
+            game_over = False
 
-                if not self.is_in_check(current_player_color):
-                    move_available = True
+        return game_over
 
-                self.reverse_move(start_point, start_piece, end_point, end_piece)
+    def is_in_check(self, player_color):
+        """Returns True if the passed player_color is in check. Returns False otherwise."""
 
-        if move_available is False:
-            stalemate = True
-        else:
-            stalemate = False
+        general_square = self.get_general_square(player_color)
 
-        return stalemate
+        if general_square is None:
+            return False
 
-    def checkmate_preventable(self):
-        """TODO"""
+        # if any move from opposing player can capture passed player_color general return True
+        return self.square_attacked(general_square, self.opposing_player_color(player_color))
 
-        current_player_color = self.__current_player.get_color()
+    def square_attacked(self, square, color):
+        """Returns True if a piece of the passed color can move to the passed square."""
+
+        for _ in self.generate_attacker_square(square, color):
+            return True
+
+        return False
+
+    def get_attacker_square_array(self, square, color):
+        """Returns an array of the squares of the pieces of the passed color that can move to the passed square."""
+
+        return list(self.generate_attacker_square(square, color))
+
+    def get_area_error_square(self, piece_symbol, color, start_square, end_square):
+        """
+        Returns None if a piece with the passed piece_symbol and color may move from the passed start_square to the
+        passed end_square under the castle, river and soldier rules, the rules that only depend on the squares. Returns
+        the reason from MOVE_ERROR_ARRAY otherwise.
+        """
+
+        board = self.__board
+
+        if piece_symbol == "G" or piece_symbol == "A":
+            red_castle_square_array = board.get_red_castle_square_array()
+            black_castle_square_array = board.get_black_castle_square_array()
+
+            if not (start_square in red_castle_square_array and end_square in red_castle_square_array) and \
+                    not (start_square in black_castle_square_array and end_square in black_castle_square_array):
+                return "OUTSIDE_CASTLE"
+
+        elif piece_symbol == "E" or piece_symbol == "S":
+            rank_array = board.get_rank_array()
+            river_rank_index = len(rank_array) // 2
+            rank_index = board.get_index_pair(start_square)[1]
+            end_rank_index = board.get_index_pair(end_square)[1]
+
+            if piece_symbol == "E":
+                if (rank_index < river_rank_index) != (end_rank_index < river_rank_index):
+                    return "CROSSES_RIVER"
+
+                return None
+
+            # ranks are compared as strings, as in soldier_restriction
+            start_rank = rank_array[rank_index]
+            end_rank = rank_array[end_rank_index]
+
+            if color == "red":
+                soldier_across_river = rank_index >= river_rank_index
+                forward = end_rank > start_rank
+            else:
+                soldier_across_river = rank_index < river_rank_index
+                forward = end_rank < start_rank
+
+            if not forward and not (end_rank == start_rank and soldier_across_river):
+                return "SOLDIER_DIRECTION"
+
+        return None
+
+    def generate_attack_square(self, start_square):
+        """
+        Generator that yields the squares attacked by the piece at the passed start_square, which are the squares it
+        could capture a piece of the other color on whatever piece is there now. Squares of pieces of its own color are
+        included, since the piece defends them, and the facing Generals rule is not applied. A Cannon attacks the
+        squares after its screen up to and including the next piece.
+        """
 
         board = self.__board
-        player_color_piece_pos_array = self.all_pieces_pos_array(current_player_color)
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
 
-        for start_pos in player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+        file_index, rank_index = board.get_index_pair(start_square)
+        piece = point_array[start_square].get_piece()
+        piece_symbol = piece.get_symbol()
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+        if piece_symbol == "R" or piece_symbol == "C":
+            for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+                end_file_index = file_index + file_step
+                end_rank_index = rank_index + rank_step
+                screened = piece_symbol == "R"
 
-            for end_pos in valid_end_pos_array:
+                while 0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count:
+                    end_square = end_file_index * rank_count + end_rank_index
 
-                # simulate move
-                start_point = board.get_point_with_pos(start_pos)
-                start_piece = start_point.get_piece()
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+                    if screened:
+                        yield end_square
 
-                self.move_piece(start_pos, end_pos)
+                    if point_array[end_square].get_piece() is not None:
+                        if screened:
+                            break
 
-                if self.is_in_check(current_player_color) is False:
-                    self.reverse_move(start_point, start_piece, end_point, end_piece)
-                    return True
+                        # the first piece in the way of a Cannon is its screen
+                        screened = True
 
-                self.reverse_move(start_point, start_piece, end_point, end_piece)
+                    end_file_index += file_step
+                    end_rank_index += rank_step
 
-        return False
+            return
 
-    def game_over(self):
-        """Returns True if red or black has won. Return False otherwise."""
+        color = piece.get_color()
+        jump_array = piece.get_possible_jumps()
+        move_index = -1
 
-        if self.__game_state == "RED_WON" or self.__game_state == "BLACK_WON":
-            game_over = True
-        else:
-            game_over = False
+        for file_index_change, rank_index_change in piece.get_possible_moves():
+            move_index += 1
+            end_file_index = file_index + file_index_change
+            end_rank_index = rank_index + rank_index_change
 
-        return game_over
+            if not (0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count):
+                continue
 
-    def is_in_check(self, player_color):
-        """Returns True if the passed player_color is in check. Returns False otherwise."""
+            end_square = end_file_index * rank_count + end_rank_index
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = jump_array[move_index][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    continue
+
+            if self.get_area_error_square(piece_symbol, color, start_square, end_square) is None:
+                yield end_square
+
+    def generate_attacker_square(self, square, color):
+        """
+        Generator that yields the squares of the pieces of the passed color that can move to the passed square. Instead
+        of generating every move of the color, only the pieces that could reach the square are checked: the first two
+        pieces along each direction of its file and rank, for Chariots, Cannons, Generals and Soldiers, and the pieces a
+        Horse, Elephant or Advisor step away.
+        """
 
         board = self.__board
-        opposing_player_color = self.opposing_player_color(player_color)
-        opposing_player_color_piece_pos_array = self.all_pieces_pos_array(opposing_player_color)
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
+        file_index, rank_index = board.get_index_pair(square)
 
-        # if any move from opposing player can capture passed player_color general return True
+        for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+            piece_count = 0
 
-        # check all pieces
-        for start_pos in opposing_player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+            while piece_count < 2 and 0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count:
+                start_square = start_file_index * rank_count + start_rank_index
+                piece = point_array[start_square].get_piece()
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+                if piece is not None:
+                    piece_count += 1
 
-            # check all end positions for piece
-            for end_pos in valid_end_pos_array:
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+                    if piece.get_color() == color and self.get_rule_error_square(start_square, square, color) is None:
+                        yield start_square
 
-                if end_piece is not None:
-                    end_piece_color = end_piece.get_color()
-                    end_piece_symbol = end_piece.get_symbol()
+                start_file_index += file_step
+                start_rank_index += rank_step
 
-                    if end_piece_symbol == "G" and end_piece_color == player_color:
-                        return True
-        return False
+        for file_step, rank_step in self.ATTACK_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+
+            if not (0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count):
+                continue
+
+            start_square = start_file_index * rank_count + start_rank_index
+            piece = point_array[start_square].get_piece()
+
+            if piece is not None and piece.get_color() == color and \
+                    self.get_rule_error_square(start_square, square, color) is None:
+                yield start_square
 
     @staticmethod
     def opposing_player_color(player_color):
@@ -10,6 +10,19 @@ class XiangqiGame:
     piece restrictions and specific piece restrictions. If a move is called and is valid the move is processed. The game
     state is automatically updated to determine the winner."""
 
+    # directions of the Chariot and Cannon moves, in the order of their possible moves
+    SLIDE_STEP_ARRAY = [[1, 0], [-1, 0], [0, 1], [0, -1]]
+
+    # steps from a square to the pieces that could reach it other than along its file and rank, which are the steps of
+    # the Horse, Elephant and Advisor moves
+    ATTACK_STEP_ARRAY = [[1, 2], [2, 1], [2, -1], [1, -2], [-1, -2], [-2, -1], [-2, 1], [-1, 2],
+                         [2, 2], [2, -2], [-2, -2], [-2, 2], [1, 1], [1, -1], [-1, -1], [-1, 1]]
+
+    # reasons returned by get_move_error when a move is not legal
+    MOVE_ERROR_ARRAY = ["GAME_OVER", "OFF_BOARD", "NO_PIECE", "WRONG_COLOR", "OWN_PIECE", "ILLEGAL_MOVE", "BLOCKED",
+                        "NO_SCREEN", "OUTSIDE_CASTLE", "CROSSES_RIVER", "SOLDIER_DIRECTION", "GENERALS_FACING",
+                        "IN_CHECK"]
+
     def __init__(self):
         """
         Initializes the XiangqiGame without a winner, a board with placed starting pieces, the red player starting and
@@ -21,12 +34,42 @@ class XiangqiGame:
         self.__player_one = Player("red")
         self.__player_two = Player("black")
         self.__current_player = self.__player_one
+        self.__move_error = None
+        self.__general_square_dict = {}
+        self.__observer_array = []
 
     def get_current_player(self):
         """Getter for current_player."""
 
         return self.__current_player
 
+    def get_observer_array(self):
+        """Getter for observer_array."""
+
+        return self.__observer_array
+
+    def add_observer(self, observer):
+        """
+        Adds the passed observer, like an AttackMap or a BoardRenderer. After every move make_move calls its update
+        method with an array of the start and end squares.
+        """
+
+        self.__observer_array.append(observer)
+
+        return None
+
+    def remove_observer(self, observer):
+        """Removes the passed observer."""
+
+        self.__observer_array.remove(observer)
+
+        return None
+
+    def get_last_move_error(self):
+        """Getter for move_error, the reason the last call to make_move returned False or None if it returned True."""
+
+        return self.__move_error
+
     def get_board(self):
         """Getter for board."""
 
@@ -37,6 +80,21 @@ class XiangqiGame:
 
         return self.__game_state
 
+    def set_game_state(self, game_state):
+        """Setter for game_state."""
+
+        self.__game_state = game_state
+
+    def set_current_player(self, player_color):
+        """Sets current_player to the player with the passed player_color."""
+
+        if player_color == self.__player_one.get_color():
+            self.__current_player = self.__player_one
+        else:
+            self.__current_player = self.__player_two
+
+        return None
+
     def switch_current_player(self):
         """Switches the current player."""
 
@@ -47,6 +105,22 @@ class XiangqiGame:
 
         return None
 
+    def all_pieces_square_array(self, color):
+        """Returns an array of all squares on the board with pieces of the passed color."""
+
+        piece_square_array = []
+        square = 0
+
+        for point in self.__board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None and piece.get_color() == color:
+                piece_square_array.append(square)
+
+            square += 1
+
+        return piece_square_array
+
     def all_pieces_pos_array(self, color):
         """Returns an array of all positions on the board with pieces of the passed color."""
 
@@ -511,34 +585,207 @@ class XiangqiGame:
 
         return valid_moves
 
-    def generals_facing_restriction(self, start_pos, end_pos_array):
+    def generate_end_pos(self, start_pos, piece_symbol):
         """
-        Returns restricted_end_pos that removes end_pos from the passed start_pos and end_pos_array that cause
-        Generals to face each other.
+        Generator that yields the same end positions as get_valid_end_pos_array for the passed start_pos and
+        piece_symbol, in the same order. See generate_end_square.
         """
 
-        restricted_end_pos = []
         board = self.__board
 
-        # save start_point and start_piece
-        start_point = board.get_point_with_pos(start_pos)
-        start_piece = start_point.get_piece()
+        for end_square in self.generate_end_square(board.get_square_from_pos(start_pos), piece_symbol):
+            yield board.get_pos_from_square(end_square)
 
-        for end_pos in end_pos_array:
+    def get_valid_end_square_array(self, start_square, piece_symbol):
+        """
+        Returns an array containing valid end squares from the passed start_square and piece_symbol. All restrictions
+        limits end squares except checkmate.
+        """
 
-            # save end_point and end_piece
-            end_point = board.get_point_with_pos(end_pos)
-            end_piece = end_point.get_piece()
+        return list(self.generate_end_square(start_square, piece_symbol))
 
-            # simulate move
-            self.move_piece(start_pos, end_pos)
+    def generate_end_square(self, start_square, piece_symbol):
+        """
+        Generator that yields the squares of the end positions of get_valid_end_pos_array for the passed start_square
+        and piece_symbol, in the same order. Every restriction is applied inline while walking the moves of the piece
+        once, so no intermediate arrays are built and a caller that stops early skips the remaining moves. The board may
+        be changed between squares as long as it is restored before the next square is requested.
+        """
 
-            if self.generals_facing() is False:
-                restricted_end_pos.append(end_pos)
+        board = self.__board
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_array = board.get_rank_array()
+        rank_count = len(rank_array)
+        river_rank_index = rank_count // 2
 
-            self.reverse_move(start_point, start_piece, end_point, end_piece)
+        file_index, rank_index = board.get_index_pair(start_square)
+        piece = point_array[start_square].get_piece()
+        color = piece.get_color()
+        red_general_square = self.get_general_square("red")
 
-        return restricted_end_pos
+        # Chariots and Cannons walk each direction until they are blocked
+        if piece_symbol == "R" or piece_symbol == "C":
+            for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+                end_file_index = file_index + file_step
+                end_rank_index = rank_index + rank_step
+                screened = False
+
+                while 0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count:
+                    end_square = end_file_index * rank_count + end_rank_index
+                    end_piece = point_array[end_square].get_piece()
+
+                    if end_piece is None:
+                        if not screened and not self.generals_facing_after(start_square, end_square,
+                                                                           red_general_square):
+                            yield end_square
+
+                    elif piece_symbol == "R" or screened:
+                        if end_piece.get_color() != color and not self.generals_facing_after(start_square, end_square,
+                                                                                            red_general_square):
+                            yield end_square
+
+                        break
+
+                    # the first piece in the way of a Cannon is its screen
+                    else:
+                        screened = True
+
+                    end_file_index += file_step
+                    end_rank_index += rank_step
+
+            return
+
+        jump_array = piece.get_possible_jumps()
+        move_index = -1
+
+        for file_index_change, rank_index_change in piece.get_possible_moves():
+            move_index += 1
+            end_file_index = file_index + file_index_change
+            end_rank_index = rank_index + rank_index_change
+
+            if not (0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count):
+                continue
+
+            end_square = end_file_index * rank_count + end_rank_index
+            end_piece = point_array[end_square].get_piece()
+
+            if end_piece is not None and end_piece.get_color() == color:
+                continue
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = jump_array[move_index][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    continue
+
+            if piece_symbol == "G" or piece_symbol == "A":
+                red_castle_square_array = board.get_red_castle_square_array()
+                black_castle_square_array = board.get_black_castle_square_array()
+
+                if not (start_square in red_castle_square_array and end_square in red_castle_square_array) and \
+                        not (start_square in black_castle_square_array and end_square in black_castle_square_array):
+                    continue
+
+            elif piece_symbol == "E":
+                if (rank_index < river_rank_index) != (end_rank_index < river_rank_index):
+                    continue
+
+            elif piece_symbol == "S":
+                # ranks are compared as strings, as in soldier_restriction
+                start_rank = rank_array[rank_index]
+                end_rank = rank_array[end_rank_index]
+
+                if color == "red":
+                    soldier_across_river = rank_index >= river_rank_index
+                    forward = end_rank > start_rank
+                else:
+                    soldier_across_river = rank_index < river_rank_index
+                    forward = end_rank < start_rank
+
+                if not forward and not (end_rank == start_rank and soldier_across_river):
+                    continue
+
+            if not self.generals_facing_after(start_square, end_square, red_general_square):
+                yield end_square
+
+    def get_general_square(self, color):
+        """
+        Returns the square of the General of the passed color, or None if it is not on the board. Like
+        generals_facing, the last General found is returned. The square is remembered and returned while it still holds
+        the General, since pieces may be set on the board directly.
+        """
+
+        point_array = self.__board.get_point_array()
+        general_square = self.__general_square_dict.get(color)
+
+        if general_square is not None:
+            piece = point_array[general_square].get_piece()
+
+            if piece is not None and piece.get_symbol() == "G" and piece.get_color() == color:
+                return general_square
+
+            general_square = None
+
+        square = 0
+
+        for point in point_array:
+            piece = point.get_piece()
+
+            if piece is not None and piece.get_symbol() == "G" and piece.get_color() == color:
+                general_square = square
+
+            square += 1
+
+        self.__general_square_dict[color] = general_square
+
+        return general_square
+
+    def generals_facing_after(self, start_square, end_square, red_general_square):
+        """
+        Returns True if the Generals would face each other after the piece at the passed start_square moved to the
+        passed end_square, without making the move. Squares are indices in point_array and red_general_square is the
+        square of the red General before the move. Gives the same answer as generals_facing after the move.
+        """
+
+        point_array = self.__board.get_point_array()
+        rank_count = len(self.__board.get_rank_array())
+
+        if red_general_square == start_square:
+            red_general_square = end_square
+        elif red_general_square is None or red_general_square == end_square:
+            return False
+
+        # look from the red General towards rank 10 for the first piece
+        for square in range(red_general_square + 1, red_general_square - red_general_square % rank_count + rank_count):
+            if square == end_square:
+                return point_array[start_square].get_piece().get_symbol() == "G"
+
+            if square == start_square:
+                continue
+
+            piece = point_array[square].get_piece()
+
+            if piece is not None:
+                return piece.get_symbol() == "G"
+
+        return False
+
+    def generals_facing_restriction(self, start_pos, end_pos_array):
+        """
+        Returns restricted_end_pos that removes end_pos from the passed start_pos and end_pos_array that cause
+        Generals to face each other.
+        """
+
+        board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        red_general_square = self.get_general_square("red")
+
+        # the moves are checked with generals_facing_after instead of being simulated
+        return [end_pos for end_pos in end_pos_array
+                if not self.generals_facing_after(start_square, board.get_square_from_pos(end_pos), red_general_square)]
 
     def all_piece_restrictions(self, start_pos, a_move_change_array, a_jump_change_array):
         """
@@ -566,32 +813,311 @@ class XiangqiGame:
         """
 
         board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
 
-        # if start position does not exist return no valid end positions.
-        if board.get_point_with_pos(start_pos) is None:
+        # if a position does not exist the move is not valid.
+        if start_square is None or end_square is None:
             return False
 
-        point = board.get_point_with_pos(start_pos)
-        piece = point.get_piece()
+        return self.valid_move_square(start_square, end_square, player_color)
+
+    def valid_move_square(self, start_square, end_square, player_color):
+        """
+        Returns True if a piece located at the passed start_square is the same color as the passed player_color and can
+        move to the passed end_square.
+        """
+
+        return self.get_rule_error_square(start_square, end_square, player_color) is None
+
+    def get_move_error(self, start_pos, end_pos, player_color):
+        """
+        Returns None if the passed player_color can move the piece at the passed start_pos to the passed end_pos
+        without being left in check. Returns the reason from MOVE_ERROR_ARRAY otherwise.
+        """
+
+        board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
+
+        if start_square is None or end_square is None:
+            return "OFF_BOARD"
+
+        return self.get_move_error_square(start_square, end_square, player_color)
+
+    def get_move_error_square(self, start_square, end_square, player_color):
+        """
+        Returns None if the passed player_color can move the piece at the passed start_square to the passed end_square
+        without being left in check. Returns the reason from MOVE_ERROR_ARRAY otherwise.
+        """
+
+        rule_error = self.get_rule_error_square(start_square, end_square, player_color)
+
+        if rule_error is not None:
+            return rule_error
+
+        if self.move_leaves_check(start_square, end_square, player_color):
+            return "IN_CHECK"
+
+        return None
+
+    def move_leaves_check(self, start_square, end_square, player_color):
+        """
+        Returns True if the passed player_color is in check after the piece at the passed start_square moves to the
+        passed end_square. The move is simulated and reversed.
+        """
+
+        board = self.__board
+        start_point = board.get_point_with_square(start_square)
+        start_piece = start_point.get_piece()
+        end_point = board.get_point_with_square(end_square)
+        end_piece = end_point.get_piece()
+
+        # simulate move to check if move would cause check
+        end_point.set_piece(start_piece)
+        start_point.set_piece(None)
+
+        in_check = self.is_in_check(player_color)
+
+        self.reverse_move(start_point, start_piece, end_point, end_piece)
+
+        return in_check
+
+    def get_rule_error_square(self, start_square, end_square, player_color):
+        """
+        Returns None if the piece at the passed start_square belongs to the passed player_color and can move to the
+        passed end_square, which is the same answer as end_square being generated by generate_end_square. Returns the
+        reason from MOVE_ERROR_ARRAY otherwise. Only the one move is checked: its geometry, the squares between its
+        start and end, the castle, river and soldier rules and whether the Generals would face each other.
+        """
+
+        board = self.__board
+        point_array = board.get_point_array()
+        rank_count = len(board.get_rank_array())
+
+        piece = point_array[start_square].get_piece()
 
-        # if start position has no piece return no valid en positions.
         if piece is None:
-            return False
+            return "NO_PIECE"
 
-        piece_color = piece.get_color()
+        color = piece.get_color()
 
-        # if the piece at start_position does not have the same color as player color
-        if piece_color != player_color:
-            return False
+        if color != player_color:
+            return "WRONG_COLOR"
+
+        end_piece = point_array[end_square].get_piece()
+
+        if end_piece is not None and end_piece.get_color() == color:
+            return "OWN_PIECE"
 
         piece_symbol = piece.get_symbol()
+        file_index, rank_index = board.get_index_pair(start_square)
+        end_file_index, end_rank_index = board.get_index_pair(end_square)
+        file_index_change = end_file_index - file_index
+        rank_index_change = end_rank_index - rank_index
 
-        valid_end_pos_array = self.get_valid_end_pos_array(start_pos, piece_symbol)
+        # Chariots and Cannons move along a file or a rank and count the pieces between start and end
+        if piece_symbol == "R" or piece_symbol == "C":
+            if (file_index_change == 0) == (rank_index_change == 0):
+                return "ILLEGAL_MOVE"
 
-        if end_pos not in valid_end_pos_array:
-            return False
+            step = rank_count * ((file_index_change > 0) - (file_index_change < 0)) + \
+                (rank_index_change > 0) - (rank_index_change < 0)
+            between_count = 0
 
-        return True
+            for square in range(start_square + step, end_square, step):
+                if point_array[square].get_piece() is not None:
+                    between_count += 1
+
+            if piece_symbol == "R" or end_piece is None:
+                if between_count != 0:
+                    return "BLOCKED"
+
+            # a Cannon captures over exactly one screen
+            elif between_count != 1:
+                return "NO_SCREEN"
+
+        else:
+            move_array = piece.get_possible_moves()
+
+            if (file_index_change, rank_index_change) not in move_array:
+                return "ILLEGAL_MOVE"
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            jump_array = piece.get_possible_jumps()
+
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = \
+                    jump_array[move_array.index((file_index_change, rank_index_change))][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    return "BLOCKED"
+
+            area_error = self.get_area_error_square(piece_symbol, color, start_square, end_square)
+
+            if area_error is not None:
+                return area_error
+
+        if self.generals_facing_after(start_square, end_square, self.get_general_square("red")):
+            return "GENERALS_FACING"
+
+        return None
+
+    def get_legal_move_array(self, player_color):
+        """
+        Returns an array of (start_pos, end_pos) tuples for every move of the passed player_color that is valid and
+        does not leave the player in check.
+        """
+
+        board = self.__board
+
+        return [(board.get_pos_from_square(start_square), board.get_pos_from_square(end_square))
+                for start_square, end_square in self.get_legal_square_move_array(player_color)]
+
+    def get_legal_square_move_array(self, player_color):
+        """
+        Returns an array of (start_square, end_square) tuples for every move of the passed player_color that is valid
+        and does not leave the player in check.
+        """
+
+        return list(self.generate_legal_square_move(player_color))
+
+    def generate_legal_square_move(self, player_color):
+        """
+        Generator that yields a (start_square, end_square) tuple for every move of the passed player_color that is
+        valid and does not leave the player in check. If the player is in check only the moves of
+        generate_evasion_square_move are tried.
+        """
+
+        general_square = self.get_general_square(player_color)
+
+        if general_square is not None:
+            checker_square_array = self.get_attacker_square_array(general_square,
+                                                                  self.opposing_player_color(player_color))
+
+            if checker_square_array:
+                yield from self.generate_evasion_square_move(player_color, general_square, checker_square_array)
+                return
+
+            pin_square_set = self.get_pin_square_set(general_square, self.opposing_player_color(player_color))
+        else:
+            pin_square_set = set()
+
+        point_array = self.__board.get_point_array()
+
+        # only moves of the General, moves of pinned pieces and moves onto pin squares can put the General in check
+        for start_square in self.all_pieces_square_array(player_color):
+            simulate_all = start_square == general_square or start_square in pin_square_set
+
+            for end_square in self.generate_end_square(start_square, point_array[start_square].get_symbol()):
+                if (not simulate_all and end_square not in pin_square_set) or \
+                        not self.move_leaves_check(start_square, end_square, player_color):
+                    yield start_square, end_square
+
+    def get_pin_square_set(self, general_square, color):
+        """
+        Returns the set of pin squares of the General at the passed general_square, which is not in check, against the
+        pieces of the passed color. They are the squares between the General and a Chariot of the color with at most one
+        piece between them or a Cannon of the color with at most two, and the jump squares of a Horse or Elephant of the
+        color that could reach the General. A piece on a pin square is pinned and a piece moving onto an empty one may
+        give a Cannon its screen. Any other move, other than a move of the General, cannot put the General in check.
+        Pins by the facing Generals rule are left to generals_facing_after.
+        """
+
+        board = self.__board
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
+        file_index, rank_index = board.get_index_pair(general_square)
+        pin_square_set = set()
+
+        for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+            between_count = 0
+
+            while between_count <= 2 and 0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count:
+                start_square = start_file_index * rank_count + start_rank_index
+                piece = point_array[start_square].get_piece()
+
+                if piece is not None:
+                    if piece.get_color() == color and (piece.get_symbol() == "C" or
+                                                       (piece.get_symbol() == "R" and between_count <= 1)):
+                        pin_square_set.update(self.get_block_square_array(start_square, general_square))
+
+                    between_count += 1
+
+                start_file_index += file_step
+                start_rank_index += rank_step
+
+        for file_step, rank_step in self.ATTACK_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+
+            if not (0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count):
+                continue
+
+            start_square = start_file_index * rank_count + start_rank_index
+            piece = point_array[start_square].get_piece()
+
+            if piece is not None and piece.get_color() == color and piece.get_symbol() in ("H", "E"):
+                pin_square_set.update(self.get_block_square_array(start_square, general_square))
+
+        return pin_square_set
+
+    def generate_evasion_square_move(self, player_color, general_square, checker_square_array):
+        """
+        Generator that yields a (start_square, end_square) tuple for every move of the passed player_color that gets
+        its General at the passed general_square out of check by the pieces at the passed checker_square_array. Only
+        three kinds of moves can do that, so only they are tried: moves of the General, captures of a checking piece and
+        moves onto or off a block square of a check. A block square is between a checking Chariot or Cannon and the
+        General or the jump square of a checking Horse, so moving onto it blocks the check or gives a Cannon a second
+        screen and moving off it takes away the screen of a Cannon.
+        """
+
+        point_array = self.__board.get_point_array()
+        block_square_set = set()
+
+        for checker_square in checker_square_array:
+            block_square_set.update(self.get_block_square_array(checker_square, general_square))
+
+        target_square_array = sorted(block_square_set.union(checker_square_array))
+
+        for start_square in self.all_pieces_square_array(player_color):
+            piece_symbol = point_array[start_square].get_symbol()
+
+            if start_square == general_square or start_square in block_square_set:
+                end_square_iterable = self.generate_end_square(start_square, piece_symbol)
+            else:
+                end_square_iterable = [end_square for end_square in target_square_array
+                                       if self.get_rule_error_square(start_square, end_square, player_color) is None]
+
+            for end_square in end_square_iterable:
+                if not self.move_leaves_check(start_square, end_square, player_color):
+                    yield start_square, end_square
+
+    def get_block_square_array(self, start_square, end_square):
+        """
+        Returns an array of the squares that must be empty for the piece at the passed start_square to move to the
+        passed end_square, from the possible jumps of the piece: the squares between them for a Chariot or Cannon and
+        the jump square for a Horse or Elephant. Returns an empty array for other pieces and other moves.
+        """
+
+        board = self.__board
+        rank_count = len(board.get_rank_array())
+        piece = board.get_point_with_square(start_square).get_piece()
+        move_array = piece.get_possible_moves()
+        jump_array = piece.get_possible_jumps()
+        file_index, rank_index = board.get_index_pair(start_square)
+        end_file_index, end_rank_index = board.get_index_pair(end_square)
+        move = (end_file_index - file_index, end_rank_index - rank_index)
+
+        if jump_array is None or move not in move_array:
+            return []
+
+        return [(file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+                for jump_file_index_change, jump_rank_index_change in jump_array[move_array.index(move)]]
 
     @staticmethod
     def reverse_move(start_point, start_piece, end_point, end_piece):
@@ -606,9 +1132,16 @@ class XiangqiGame:
         """Moves the piece at the passed start_pos to the passed end_pos."""
 
         board = self.__board
-        start_point = board.get_point_with_pos(start_pos)
+
+        self.move_piece_square(board.get_square_from_pos(start_pos), board.get_square_from_pos(end_pos))
+
+    def move_piece_square(self, start_square, end_square):
+        """Moves the piece at the passed start_square to the passed end_square."""
+
+        board = self.__board
+        start_point = board.get_point_with_square(start_square)
         start_piece = start_point.get_piece()
-        end_point = board.get_point_with_pos(end_pos)
+        end_point = board.get_point_with_square(end_square)
 
         # make desired move and remove captured piece
         end_point.set_piece(start_piece)
@@ -618,29 +1151,39 @@ class XiangqiGame:
         """Returns True if the passed start_pos and end_pos is valid for a piece. Returns False otherwise."""
 
         board = self.__board
+        start_square = board.get_square_from_pos(start_pos)
+        end_square = board.get_square_from_pos(end_pos)
 
-        # if the game is over return False
-        if self.game_over():
+        # if a position does not exist the move is not valid.
+        if start_square is None or end_square is None:
+            self.__move_error = "OFF_BOARD"
             return False
 
-        # if the move is invalid return False
-        if self.valid_move(start_pos, end_pos, self.__current_player.get_color()) is False:
-            return False
+        return self.make_move_square(start_square, end_square)
 
-        # simulate move
-        start_point = board.get_point_with_pos(start_pos)
-        start_piece = start_point.get_piece()
-        end_point = board.get_point_with_pos(end_pos)
-        end_piece = end_point.get_piece()
+    def make_move_square(self, start_square, end_square):
+        """
+        Returns True if the passed start_square and end_square is valid for a piece. Returns False otherwise and sets
+        move_error to the reason.
+        """
+
+        # if the game is over return False
+        if self.game_over():
+            self.__move_error = "GAME_OVER"
+            return False
 
-        self.move_piece(start_pos, end_pos)
+        # if the move is invalid or causes check return False
+        self.__move_error = self.get_move_error_square(start_square, end_square, self.__current_player.get_color())
 
-        # if the move causes check return False
-        if self.is_in_check(self.__current_player.get_color()):
-            self.reverse_move(start_point, start_piece, end_point, end_piece)
+        if self.__move_error is not None:
             return False
 
         # move is valid, complete move
+        self.move_piece_square(start_square, end_square)
+
+        for observer in self.__observer_array:
+            observer.update([start_square, end_square])
+
         self.switch_current_player()
         self.update_game_state()
 
@@ -651,11 +1194,12 @@ class XiangqiGame:
 
         current_player_color = self.__current_player.get_color()
 
-        # check for checkmate
-        if self.is_in_check(current_player_color) and self.checkmate_preventable() is False:
-            self.current_player_lost()
+        # check for checkmate, the moves available in check are already known to be none or some
+        if self.is_in_check(current_player_color):
+            if self.checkmate_preventable() is False:
+                self.current_player_lost()
 
-        if self.stalemate() is True:
+        elif self.stalemate() is True:
             self.current_player_lost()
 
         return None
@@ -675,116 +1219,212 @@ class XiangqiGame:
     def stalemate(self):
         """Returns True if the current_player is in stalemate. Returns False otherwise."""
 
-        current_player_color = self.__current_player.get_color()
+        return not self.move_available(self.__current_player.get_color())
 
-        board = self.__board
-        player_color_piece_pos_array = self.all_pieces_pos_array(current_player_color)
-        move_available = False
+    def checkmate_preventable(self):
+        """Returns True if the current_player has a move that does not leave it in check. Returns False otherwise."""
 
-        # check all pieces
-        for start_pos in player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+        return self.move_available(self.__current_player.get_color())
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+    def move_available(self, player_color):
+        """Returns True if the passed player_color has a valid move that does not leave it in check."""
 
-            # simulate move to check if move would cause check
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
+        # stop at the first legal move
+        for _ in self.generate_legal_square_move(player_color):
+            return True
 
-            # check all end positions for piece
-            for end_pos in valid_end_pos_array:
+        return False
 
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+    def game_over(self):
+        """Returns True if red or black has won. Return False otherwise."""
 
-                self.move_piece(start_pos, end_pos)
+        if self.__game_state == "RED_WON" or self.__game_state == "BLACK_WON":
+            game_over = True
+        else:
+            game_over = False
 
-                if not self.is_in_check(current_player_color):
-                    move_available = True
+        return game_over
 
-                self.reverse_move(start_point, start_piece, end_point, end_piece)
+    def is_in_check(self, player_color):
+        """Returns True if the passed player_color is in check. Returns False otherwise."""
 
-        if move_available is False:
-            stalemate = True
-        else:
-            stalemate = False
+        general_square = self.get_general_square(player_color)
 
-        return stalemate
+        if general_square is None:
+            return False
 
-    def checkmate_preventable(self):
-        """TODO"""
+        # if any move from opposing player can capture passed player_color general return True
+        return self.square_attacked(general_square, self.opposing_player_color(player_color))
 
-        current_player_color = self.__current_player.get_color()
+    def square_attacked(self, square, color):
+        """Returns True if a piece of the passed color can move to the passed square."""
+
+        for _ in self.generate_attacker_square(square, color):
+            return True
+
+        return False
+
+    def get_attacker_square_array(self, square, color):
+        """Returns an array of the squares of the pieces of the passed color that can move to the passed square."""
+
+        return list(self.generate_attacker_square(square, color))
+
+    def get_area_error_square(self, piece_symbol, color, start_square, end_square):
+        """
+        Returns None if a piece with the passed piece_symbol and color may move from the passed start_square to the
+        passed end_square under the castle, river and soldier rules, the rules that only depend on the squares. Returns
+        the reason from MOVE_ERROR_ARRAY otherwise.
+        """
 
         board = self.__board
-        player_color_piece_pos_array = self.all_pieces_pos_array(current_player_color)
 
-        for start_pos in player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+        if piece_symbol == "G" or piece_symbol == "A":
+            red_castle_square_array = board.get_red_castle_square_array()
+            black_castle_square_array = board.get_black_castle_square_array()
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+            if not (start_square in red_castle_square_array and end_square in red_castle_square_array) and \
+                    not (start_square in black_castle_square_array and end_square in black_castle_square_array):
+                return "OUTSIDE_CASTLE"
 
-            for end_pos in valid_end_pos_array:
+        elif piece_symbol == "E" or piece_symbol == "S":
+            rank_array = board.get_rank_array()
+            river_rank_index = len(rank_array) // 2
+            rank_index = board.get_index_pair(start_square)[1]
+            end_rank_index = board.get_index_pair(end_square)[1]
 
-                # simulate move
-                start_point = board.get_point_with_pos(start_pos)
-                start_piece = start_point.get_piece()
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+            if piece_symbol == "E":
+                if (rank_index < river_rank_index) != (end_rank_index < river_rank_index):
+                    return "CROSSES_RIVER"
 
-                self.move_piece(start_pos, end_pos)
+                return None
 
-                if self.is_in_check(current_player_color) is False:
-                    self.reverse_move(start_point, start_piece, end_point, end_piece)
-                    return True
+            # ranks are compared as strings, as in soldier_restriction
+            start_rank = rank_array[rank_index]
+            end_rank = rank_array[end_rank_index]
 
-                self.reverse_move(start_point, start_piece, end_point, end_piece)
+            if color == "red":
+                soldier_across_river = rank_index >= river_rank_index
+                forward = end_rank > start_rank
+            else:
+                soldier_across_river = rank_index < river_rank_index
+                forward = end_rank < start_rank
 
-        return False
+            if not forward and not (end_rank == start_rank and soldier_across_river):
+                return "SOLDIER_DIRECTION"
 
-    def game_over(self):
-        """Returns True if red or black has won. Return False otherwise."""
+        return None
 
-        if self.__game_state == "RED_WON" or self.__game_state == "BLACK_WON":
-            game_over = True
-        else:
-            game_over = False
+    def generate_attack_square(self, start_square):
+        """
+        Generator that yields the squares attacked by the piece at the passed start_square, which are the squares it
+        could capture a piece of the other color on whatever piece is there now. Squares of pieces of its own color are
+        included, since the piece defends them, and the facing Generals rule is not applied. A Cannon attacks the
+        squares after its screen up to and including the next piece.
+        """
 
-        return game_over
+        board = self.__board
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
 
-    def is_in_check(self, player_color):
-        """Returns True if the passed player_color is in check. Returns False otherwise."""
+        file_index, rank_index = board.get_index_pair(start_square)
+        piece = point_array[start_square].get_piece()
+        piece_symbol = piece.get_symbol()
+
+        if piece_symbol == "R" or piece_symbol == "C":
+            for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+                end_file_index = file_index + file_step
+                end_rank_index = rank_index + rank_step
+                screened = piece_symbol == "R"
+
+                while 0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count:
+                    end_square = end_file_index * rank_count + end_rank_index
+
+                    if screened:
+                        yield end_square
+
+                    if point_array[end_square].get_piece() is not None:
+                        if screened:
+                            break
+
+                        # the first piece in the way of a Cannon is its screen
+                        screened = True
+
+                    end_file_index += file_step
+                    end_rank_index += rank_step
+
+            return
+
+        color = piece.get_color()
+        jump_array = piece.get_possible_jumps()
+        move_index = -1
+
+        for file_index_change, rank_index_change in piece.get_possible_moves():
+            move_index += 1
+            end_file_index = file_index + file_index_change
+            end_rank_index = rank_index + rank_index_change
+
+            if not (0 <= end_file_index < file_count and 0 <= end_rank_index < rank_count):
+                continue
+
+            end_square = end_file_index * rank_count + end_rank_index
+
+            # Horses and Elephants are blocked by a piece on their single jump position
+            if jump_array is not None:
+                jump_file_index_change, jump_rank_index_change = jump_array[move_index][0]
+                jump_square = (file_index + jump_file_index_change) * rank_count + rank_index + jump_rank_index_change
+
+                if point_array[jump_square].get_piece() is not None:
+                    continue
+
+            if self.get_area_error_square(piece_symbol, color, start_square, end_square) is None:
+                yield end_square
+
+    def generate_attacker_square(self, square, color):
+        """
+        Generator that yields the squares of the pieces of the passed color that can move to the passed square. Instead
+        of generating every move of the color, only the pieces that could reach the square are checked: the first two
+        pieces along each direction of its file and rank, for Chariots, Cannons, Generals and Soldiers, and the pieces a
+        Horse, Elephant or Advisor step away.
+        """
 
         board = self.__board
-        opposing_player_color = self.opposing_player_color(player_color)
-        opposing_player_color_piece_pos_array = self.all_pieces_pos_array(opposing_player_color)
+        point_array = board.get_point_array()
+        file_count = len(board.get_file_array())
+        rank_count = len(board.get_rank_array())
+        file_index, rank_index = board.get_index_pair(square)
 
-        # if any move from opposing player can capture passed player_color general return True
+        for file_step, rank_step in self.SLIDE_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+            piece_count = 0
 
-        # check all pieces
-        for start_pos in opposing_player_color_piece_pos_array:
-            start_point = board.get_point_with_pos(start_pos)
-            start_piece = start_point.get_piece()
-            start_piece_symbol = start_piece.get_symbol()
+            while piece_count < 2 and 0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count:
+                start_square = start_file_index * rank_count + start_rank_index
+                piece = point_array[start_square].get_piece()
 
-            valid_end_pos_array = self.get_valid_end_pos_array(start_pos, start_piece_symbol)
+                if piece is not None:
+                    piece_count += 1
 
-            # check all end positions for piece
-            for end_pos in valid_end_pos_array:
-                end_point = board.get_point_with_pos(end_pos)
-                end_piece = end_point.get_piece()
+                    if piece.get_color() == color and self.get_rule_error_square(start_square, square, color) is None:
+                        yield start_square
 
-                if end_piece is not None:
-                    end_piece_color = end_piece.get_color()
-                    end_piece_symbol = end_piece.get_symbol()
+                start_file_index += file_step
+                start_rank_index += rank_step
 
-                    if end_piece_symbol == "G" and end_piece_color == player_color:
-                        return True
-        return False
+        for file_step, rank_step in self.ATTACK_STEP_ARRAY:
+            start_file_index = file_index + file_step
+            start_rank_index = rank_index + rank_step
+
+            if not (0 <= start_file_index < file_count and 0 <= start_rank_index < rank_count):
+                continue
+
+            start_square = start_file_index * rank_count + start_rank_index
+            piece = point_array[start_square].get_piece()
+
+            if piece is not None and piece.get_color() == color and \
+                    self.get_rule_error_square(start_square, square, color) is None:
+                yield start_square
 
     @staticmethod
     def opposing_player_color(player_color):
@@ -804,38 +1444,63 @@ class XiangqiGame:
 
 
 class Board:
-    """Represents a board in the game Xiangqi."""
+    """
+    Represents a board in the game Xiangqi. The layout of the board, its files, ranks, sides, castles and squares, is
+    the same for every board, so it is built once and shared. Only the points, which hold the pieces, belong to a board.
+    """
+
+    __slots__ = ("__file_array", "__rank_array", "__red_castle_array", "__black_castle_array", "__red_side_array",
+                 "__black_side_array", "__point_array", "__square_dict", "__red_castle_square_array",
+                 "__black_castle_square_array")
+
+    # shared layout, built by the first board
+    __layout = None
 
     def __init__(self):
         """
         Initializes the points on the board and sets up special board areas red_side, black_side and castles. Sets up
-        the starting pieces on the board.
+        the starting pieces on the board. A square is the index of a point in point_array, which is
+        file_index * 10 + rank_index.
         """
 
-        self.__file_array = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
-        self.__rank_array = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
-        self.__red_castle_array = ["d1", "e1", "f1", "d2", "e2", "f2", "d3", "e3", "f3"]
-        self.__black_castle_array = ["d8", "e8", "f8", "d9", "e9", "f9", "d10", "e10", "f10"]
-        self.__red_side_array = []
-        self.__black_side_array = []
-        self.__point_array = []
+        if Board.__layout is None:
+            Board.__layout = Board.build_layout()
+
+        (self.__file_array, self.__rank_array, self.__red_castle_array, self.__black_castle_array,
+         self.__red_side_array, self.__black_side_array, self.__square_dict, self.__red_castle_square_array,
+         self.__black_castle_square_array) = Board.__layout
 
         # Append points to point array
-        for file in self.__file_array:
-            for rank in self.__rank_array:
-                self.__point_array.append(Point(file, rank))
+        self.__point_array = [Point(file, rank) for file in self.__file_array for rank in self.__rank_array]
 
-        # Append positions of red side points to red_side_array
-        for file in self.__file_array:
-            for rank in self.__rank_array[:5]:
-                self.__red_side_array.append(file + rank)
+        self.reset_pieces()
 
-        # Append positions of black side points to black_side_array
-        for file in self.__file_array:
-            for rank in self.__rank_array[5:]:
-                self.__black_side_array.append(file + rank)
+    @staticmethod
+    def build_layout():
+        """
+        Returns a tuple of the file_array, rank_array, red_castle_array, black_castle_array, red_side_array,
+        black_side_array, square_dict, red_castle_square_array and black_castle_square_array shared by every board.
+        """
 
-        self.reset_pieces()
+        file_array = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
+        rank_array = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
+        red_castle_array = ["d1", "e1", "f1", "d2", "e2", "f2", "d3", "e3", "f3"]
+        black_castle_array = ["d8", "e8", "f8", "d9", "e9", "f9", "d10", "e10", "f10"]
+        square_dict = {}
+
+        for file in file_array:
+            for rank in rank_array:
+                square_dict[file + rank] = len(square_dict)
+
+        red_castle_square_array = [square_dict[a_pos] for a_pos in red_castle_array]
+        black_castle_square_array = [square_dict[a_pos] for a_pos in black_castle_array]
+
+        # positions of the red side and black side points
+        red_side_array = [file + rank for file in file_array for rank in rank_array[:5]]
+        black_side_array = [file + rank for file in file_array for rank in rank_array[5:]]
+
+        return (file_array, rank_array, red_castle_array, black_castle_array, red_side_array, black_side_array,
+                square_dict, red_castle_square_array, black_castle_square_array)
 
     def clear_board(self):
         """Removes all pieces for the board."""
@@ -932,14 +1597,45 @@ class Board:
 
         return self.__point_array
 
+    def get_red_castle_square_array(self):
+        """Getter for red_castle_square_array."""
+
+        return self.__red_castle_square_array
+
+    def get_black_castle_square_array(self):
+        """Getter for black_castle_square_array."""
+
+        return self.__black_castle_square_array
+
+    def get_square_from_pos(self, a_pos):
+        """Returns the square of the passed position. Returns None if the position does not exist."""
+
+        return self.__square_dict.get(a_pos)
+
+    def get_pos_from_square(self, square):
+        """Returns the position of the passed square."""
+
+        return self.__point_array[square].get_pos()
+
+    def get_square(self, file_index, rank_index):
+        """Returns the square of the passed file_index and rank_index."""
+
+        return file_index * len(self.__rank_array) + rank_index
+
+    def get_index_pair(self, square):
+        """Returns a tuple of the file_index and rank_index of the passed square."""
+
+        return divmod(square, len(self.__rank_array))
+
+    def get_point_with_square(self, square):
+        """Returns the point at the passed square."""
+
+        return self.__point_array[square]
+
     def get_point(self, file, rank):
         """Return Point corresponding to passed file and rank. Returns None if point does not exist."""
 
-        for a_point in self.__point_array:
-            if (a_point.get_file() == file) and (a_point.get_rank() == rank):
-                return a_point
-
-        return None
+        return self.get_point_with_pos(file + rank)
 
     def get_point_with_pos(self, a_pos):
         """
@@ -947,14 +1643,12 @@ class Board:
         exist.
         """
 
-        file = a_pos[0]
+        square = self.__square_dict.get(a_pos)
 
-        if len(a_pos) == 2:
-            rank = a_pos[1]
-        else:
-            rank = a_pos[1] + a_pos[2]
+        if square is None:
+            return None
 
-        return self.get_point(file, rank)
+        return self.__point_array[square]
 
     def display(self):
         """Displays board with pieces and coordinates."""
@@ -1080,6 +1774,8 @@ class Board:
 class Player:
     """Represents a player in the game Xiangqi."""
 
+    __slots__ = ("__color",)
+
     def __init__(self, color):
         """Initialize the Player with the passed color."""
 
@@ -1099,6 +1795,8 @@ class Player:
 class Point:
     """Represents a point in the game Xiangqi."""
 
+    __slots__ = ("__file", "__rank", "__piece")
+
     def __init__(self, file, rank):
         """Initializes the point with the passed file and rank. Set the piece at point to None."""
 
@@ -1146,7 +1844,27 @@ class Point:
 
 
 class Piece:
-    """Represents a general piece in the game Xiangqi."""
+    """
+    Represents a general piece in the game Xiangqi. Pieces are flyweights: constructing a piece class with a color
+    returns the one instance of that class and color, which every board shares. Pieces are never changed after they are
+    created and their possible moves and jumps are tuples.
+    """
+
+    __slots__ = ("__color", "__symbol", "__possible_moves", "__possible_jumps")
+
+    # shared instances by piece class and color
+    __instance_dict = {}
+
+    def __new__(cls, color, *args):
+        """Returns the shared instance of the piece class with the passed color, creating it the first time."""
+
+        instance = Piece.__instance_dict.get((cls, color))
+
+        if instance is None:
+            instance = object.__new__(cls)
+            Piece.__instance_dict[(cls, color)] = instance
+
+        return instance
 
     def __init__(self, color, symbol, possible_moves, possible_jumps=None):
         """Initializes the piece with the passed color, symbol, possible_moves and possible_jumps."""
@@ -1185,12 +1903,14 @@ class Piece:
 class General(Piece):
     """Represents a general piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 0], [-1, 0], [0, 1], [0, -1]]
-
-        Piece.__init__(self, color, "G", possible_moves)
+        Piece.__init__(self, color, "G", self.POSSIBLE_MOVES)
 
 
 # Author: Dominic Lupo
@@ -1201,12 +1921,14 @@ class General(Piece):
 class Advisor(Piece):
     """Represents an advisor piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 1], [-1, 1], [-1, -1], [1, -1]]
-
-        Piece.__init__(self, color, "A", possible_moves)
+        Piece.__init__(self, color, "A", self.POSSIBLE_MOVES)
 
 
 # Author: Dominic Lupo
@@ -1217,13 +1939,15 @@ class Advisor(Piece):
 class Elephant(Piece):
     """Represents an elephant piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((2, 2), (2, -2), (-2, 2), (-2, -2))
+    POSSIBLE_JUMPS = (((1, 1),), ((1, -1),), ((-1, 1),), ((-1, -1),))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[2, 2], [2, -2], [-2, 2], [-2, -2]]
-        possible_jumps = [[[1, 1]], [[1, -1]], [[-1, 1]], [[-1, -1]]]
-
-        Piece.__init__(self, color, "E", possible_moves, possible_jumps)
+        Piece.__init__(self, color, "E", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
 
 
 # Author: Dominic Lupo
@@ -1234,13 +1958,15 @@ class Elephant(Piece):
 class Horse(Piece):
     """Represents a horse piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+    POSSIBLE_JUMPS = (((1, 0),), ((0, 1),), ((0, 1),), ((-1, 0),), ((-1, 0),), ((0, -1),), ((0, -1),), ((1, 0),))
+
     def __init__(self, color):
         """Initializes the piece with the passed color.."""
 
-        possible_moves = [[2, 1], [1, 2], [-1, 2], [-2, 1], [-2, -1], [-1, -2], [1, -2], [2, -1]]
-        possible_jumps = [[[1, 0]], [[0, 1]], [[0, 1]], [[-1, 0]], [[-1, 0]], [[0, -1]], [[0, -1]], [[1, 0]]]
-
-        Piece.__init__(self, color, "H", possible_moves, possible_jumps)
+        Piece.__init__(self, color, "H", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
 
 # Author: Dominic Lupo
 # Date: 03/12/20
@@ -1250,29 +1976,37 @@ class Horse(Piece):
 class Chariot(Piece):
     """Represents a chariot piece in the game Xiangqi."""
 
+    __slots__ = ()
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
+        Piece.__init__(self, color, "R", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
+
+    @staticmethod
+    def build_moves():
+        """Returns a tuple of the possible moves and the possible jumps, shared by every Chariot."""
+
         possible_moves = []
         possible_jumps = []
 
         for num in range(9):
-            possible_moves.append([num + 1, 0])
-            possible_jumps.append(self.find_jumps(num + 1, 0))
+            possible_moves.append((num + 1, 0))
+            possible_jumps.append(Chariot.find_jumps(num + 1, 0))
 
         for num in range(9):
-            possible_moves.append([-1 - num, 0])
-            possible_jumps.append(self.find_jumps(-1 - num, 0))
+            possible_moves.append((-1 - num, 0))
+            possible_jumps.append(Chariot.find_jumps(-1 - num, 0))
 
         for num in range(9):
-            possible_moves.append([0, num + 1])
-            possible_jumps.append(self.find_jumps(0, num + 1))
+            possible_moves.append((0, num + 1))
+            possible_jumps.append(Chariot.find_jumps(0, num + 1))
 
         for num in range(9):
-            possible_moves.append([0, -1 - num])
-            possible_jumps.append(self.find_jumps(0, -1 - num))
+            possible_moves.append((0, -1 - num))
+            possible_jumps.append(Chariot.find_jumps(0, -1 - num))
 
-        Piece.__init__(self, color, "R", possible_moves, possible_jumps)
+        return tuple(possible_moves), tuple(tuple(tuple(jump) for jump in jumps) for jumps in possible_jumps)
 
     @staticmethod
     def find_jumps(file_index, rank_index):
@@ -1319,6 +2053,9 @@ class Chariot(Piece):
         return None
 
 
+Chariot.POSSIBLE_MOVES, Chariot.POSSIBLE_JUMPS = Chariot.build_moves()
+
+
 # Author: Dominic Lupo
 # Date: 03/12/20
 # Description: Defines a soldier piece in the game Xiangqi. Inherits from Piece.
@@ -1327,12 +2064,14 @@ class Chariot(Piece):
 class Soldier(Piece):
     """Represents a soldier piece in the game Xiangqi."""
 
+    __slots__ = ()
+
+    POSSIBLE_MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
-        possible_moves = [[1, 0], [-1, 0], [0, 1], [0, -1]]
-
-        Piece.__init__(self, color, "S", possible_moves)
+        Piece.__init__(self, color, "S", self.POSSIBLE_MOVES)
 
 
 # Author: Dominic Lupo
@@ -1343,29 +2082,37 @@ class Soldier(Piece):
 class Chariot(Piece):
     """Represents a chariot piece in the game Xiangqi."""
 
+    __slots__ = ()
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
+        Piece.__init__(self, color, "R", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
+
+    @staticmethod
+    def build_moves():
+        """Returns a tuple of the possible moves and the possible jumps, shared by every Chariot."""
+
         possible_moves = []
         possible_jumps = []
 
         for num in range(9):
-            possible_moves.append([num + 1, 0])
-            possible_jumps.append(self.find_jumps(num + 1, 0))
+            possible_moves.append((num + 1, 0))
+            possible_jumps.append(Chariot.find_jumps(num + 1, 0))
 
         for num in range(9):
-            possible_moves.append([-1 - num, 0])
-            possible_jumps.append(self.find_jumps(-1 - num, 0))
+            possible_moves.append((-1 - num, 0))
+            possible_jumps.append(Chariot.find_jumps(-1 - num, 0))
 
         for num in range(9):
-            possible_moves.append([0, num + 1])
-            possible_jumps.append(self.find_jumps(0, num + 1))
+            possible_moves.append((0, num + 1))
+            possible_jumps.append(Chariot.find_jumps(0, num + 1))
 
         for num in range(9):
-            possible_moves.append([0, -1 - num])
-            possible_jumps.append(self.find_jumps(0, -1 - num))
+            possible_moves.append((0, -1 - num))
+            possible_jumps.append(Chariot.find_jumps(0, -1 - num))
 
-        Piece.__init__(self, color, "R", possible_moves, possible_jumps)
+        return tuple(possible_moves), tuple(tuple(tuple(jump) for jump in jumps) for jumps in possible_jumps)
 
     @staticmethod
     def find_jumps(file_index, rank_index):
@@ -1412,6 +2159,9 @@ class Chariot(Piece):
         return None
 
 
+Chariot.POSSIBLE_MOVES, Chariot.POSSIBLE_JUMPS = Chariot.build_moves()
+
+
 # Author: Dominic Lupo
 # Date: 03/12/20
 # Description: Defines a cannon piece in the game Xiangqi. Inherits from Piece.
@@ -1420,29 +2170,37 @@ class Chariot(Piece):
 class Cannon(Piece):
     """"Represents a cannon piece in the game Xiangqi."""
 
+    __slots__ = ()
+
     def __init__(self, color):
         """Initializes the piece with the passed color."""
 
+        Piece.__init__(self, color, "C", self.POSSIBLE_MOVES, self.POSSIBLE_JUMPS)
+
+    @staticmethod
+    def build_moves():
+        """Returns a tuple of the possible moves and the possible jumps, shared by every Cannon."""
+
         possible_moves = []
         possible_jumps = []
 
         for num in range(9):
-            possible_moves.append([num + 1, 0])
-            possible_jumps.append(self.find_jumps(num + 1, 0))
+            possible_moves.append((num + 1, 0))
+            possible_jumps.append(Cannon.find_jumps(num + 1, 0))
 
         for num in range(9):
-            possible_moves.append([-1 - num, 0])
-            possible_jumps.append(self.find_jumps(-1 - num, 0))
+            possible_moves.append((-1 - num, 0))
+            possible_jumps.append(Cannon.find_jumps(-1 - num, 0))
 
         for num in range(9):
-            possible_moves.append([0, num + 1])
-            possible_jumps.append(self.find_jumps(0, num + 1))
+            possible_moves.append((0, num + 1))
+            possible_jumps.append(Cannon.find_jumps(0, num + 1))
 
         for num in range(9):
-            possible_moves.append([0, -1 - num])
-            possible_jumps.append(self.find_jumps(0, -1 - num))
+            possible_moves.append((0, -1 - num))
+            possible_jumps.append(Cannon.find_jumps(0, -1 - num))
 
-        Piece.__init__(self, color, "C", possible_moves, possible_jumps)
+        return tuple(possible_moves), tuple(tuple(tuple(jump) for jump in jumps) for jumps in possible_jumps)
 
     @staticmethod
     def find_jumps(file_index, rank_index):
@@ -1488,3 +2246,6 @@ class Cannon(Piece):
 
         return None
 
+
+Cannon.POSSIBLE_MOVES, Cannon.POSSIBLE_JUMPS = Cannon.build_moves()
+
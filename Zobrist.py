@@ -0,0 +1,153 @@
+# Author: Dominic Lupo
+# Date: 10/19/26
+# Description: Defines Zobrist hashing of positions in the game Xiangqi.
+
+
+import random
+
+from PositionCodec import PositionCodec
+
+
+class Zobrist:
+    """
+    Hashes positions into 64 bit integers. Every piece code on every square and the black side to move have a fixed
+    random key, and the hash of a position is the xor of the keys present. The keys are seeded so hashes are stable
+    across processes and stored files.
+
+    A position and its mirror image, reflected across the e file, are the same position for every purpose, so caches,
+    books and indexes store them once. A hash pair holds the hash of a position and the hash of its mirror image, both
+    kept move by move with get_child_hash_pair. The canonical hash is the smaller of the two, and a position whose
+    mirror hash is the smaller one is mirrored: moves stored for its canonical hash are mirror images of its moves.
+    """
+
+    SEED = 20200312
+
+    # square id of the mirror image of every square, reflected across the e file
+    MIRROR_SQUARE_ARRAY = [PositionCodec.mirror_square(square) for square in range(PositionCodec.SQUARE_COUNT)]
+
+    # set from SEED once the class is defined
+    PIECE_KEY_ARRAY = None
+    BLACK_TO_MOVE_KEY = None
+
+    @staticmethod
+    def generate_keys(seed):
+        """Returns a tuple of the piece key array, indexed by piece code then square id, and the black to move key."""
+
+        a_random = random.Random(seed)
+        piece_key_array = []
+
+        for _ in range(15):
+            piece_key_array.append([a_random.getrandbits(64) for _ in range(PositionCodec.SQUARE_COUNT)])
+
+        return piece_key_array, a_random.getrandbits(64)
+
+    @staticmethod
+    def hash_board(board, player_color):
+        """Returns the hash of the passed board with the passed player_color to move."""
+
+        piece_key_array = Zobrist.PIECE_KEY_ARRAY
+        hash_value = 0
+        square = 0
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None:
+                hash_value ^= piece_key_array[PositionCodec.encode_piece(piece)][square]
+
+            square += 1
+
+        if player_color == "black":
+            hash_value ^= Zobrist.BLACK_TO_MOVE_KEY
+
+        return hash_value
+
+    @staticmethod
+    def hash_mirror_board(board, player_color):
+        """
+        Returns the hash of the mirror image of the passed board, reflected across the e file, with the passed
+        player_color to move.
+        """
+
+        piece_key_array = Zobrist.PIECE_KEY_ARRAY
+        mirror_square_array = Zobrist.MIRROR_SQUARE_ARRAY
+        hash_value = 0
+        square = 0
+
+        for point in board.get_point_array():
+            piece = point.get_piece()
+
+            if piece is not None:
+                hash_value ^= piece_key_array[PositionCodec.encode_piece(piece)][mirror_square_array[square]]
+
+            square += 1
+
+        if player_color == "black":
+            hash_value ^= Zobrist.BLACK_TO_MOVE_KEY
+
+        return hash_value
+
+    @staticmethod
+    def hash_game(game):
+        """Returns the hash of the current position of the passed game."""
+
+        return Zobrist.hash_board(game.get_board(), game.get_current_player().get_color())
+
+    @staticmethod
+    def hash_game_pair(game):
+        """Returns a tuple of the hash of the current position of the passed game and the hash of its mirror image."""
+
+        board = game.get_board()
+        player_color = game.get_current_player().get_color()
+
+        return Zobrist.hash_board(board, player_color), Zobrist.hash_mirror_board(board, player_color)
+
+    @staticmethod
+    def get_child_hash_pair(game, hash_pair, move):
+        """Returns the hash pair of the position reached by the passed move from the passed game with hash_pair."""
+
+        board = game.get_board()
+        start_square = PositionCodec.encode_square(move[0])
+        end_square = PositionCodec.encode_square(move[1])
+        piece_key_array = Zobrist.PIECE_KEY_ARRAY
+        mirror_square_array = Zobrist.MIRROR_SQUARE_ARRAY
+        piece_code = PositionCodec.encode_piece(board.get_point_with_square(start_square).get_piece())
+        captured_code = PositionCodec.encode_piece(board.get_point_with_square(end_square).get_piece())
+        hash_value, mirror_hash_value = hash_pair
+
+        hash_value ^= piece_key_array[piece_code][start_square] ^ piece_key_array[piece_code][end_square] ^ \
+            Zobrist.BLACK_TO_MOVE_KEY
+        mirror_hash_value ^= piece_key_array[piece_code][mirror_square_array[start_square]] ^ \
+            piece_key_array[piece_code][mirror_square_array[end_square]] ^ Zobrist.BLACK_TO_MOVE_KEY
+
+        if captured_code != 0:
+            hash_value ^= piece_key_array[captured_code][end_square]
+            mirror_hash_value ^= piece_key_array[captured_code][mirror_square_array[end_square]]
+
+        return hash_value, mirror_hash_value
+
+    @staticmethod
+    def canonicalize(hash_pair):
+        """
+        Returns a tuple of the canonical hash of the passed hash pair and True if the position is mirrored, so moves
+        stored for the canonical hash are mirror images of its moves. A symmetric position is not mirrored.
+        """
+
+        hash_value, mirror_hash_value = hash_pair
+
+        if mirror_hash_value < hash_value:
+            return mirror_hash_value, True
+
+        return hash_value, False
+
+    @staticmethod
+    def canonicalize_move(move, mirrored):
+        """Returns the passed move as stored for the canonical hash, mirrored if the position is mirrored, and back."""
+
+        if mirrored:
+            return PositionCodec.mirror_move(move)
+
+        return move
+
+
+Zobrist.PIECE_KEY_ARRAY, Zobrist.BLACK_TO_MOVE_KEY = Zobrist.generate_keys(Zobrist.SEED)